@@ -0,0 +1,96 @@
+"""Benchmarks for the MD tagging stage of the MFTE
+
+Usage:
+    python benchmarks/md_tagging_benchmark.py --path "/path/to/corpus_MFTE/POS_Tagged/"
+    python benchmarks/md_tagging_benchmark.py --synthetic_tokens 1000000
+    python benchmarks/md_tagging_benchmark.py --tagged_path "/path/to/corpus_MFTE/MFTE_Tagged/"
+
+The POS_Tagged folder of any previous MFTE run (e.g. of the BNC/COCA texts in evaluation/) can be used as input.
+"""
+import argparse
+import glob
+import os
+import sys
+import timeit
+currentdir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(currentdir), "src"))
+import MFTE
+
+def benchmark_md_tagging (input_dir: str, extended: bool = True) -> None:
+    """Runs run_process_sentence on every POS-tagged file in input_dir and prints per-token throughput
+    Args:
+        input_dir (str): dir with POS-tagged files
+        extended (bool): If extended semantic categories should be tagged
+    """
+    files = glob.glob(os.path.join(input_dir, "*.txt"))
+    if len(files) == 0:
+        print("No files to benchmark.")
+        return
+    n_tokens = 0
+    t_0 = timeit.default_timer()
+    for file in files:
+        n_tokens += len(MFTE.run_process_sentence(file, extended))
+    elapsed_time = timeit.default_timer() - t_0
+    print("Files:", len(files))
+    print("Tokens:", n_tokens)
+    print("Time spent on MD tagging (seconds):", round(elapsed_time, 3))
+    print("Throughput (tokens per second):", round(n_tokens / elapsed_time, 1))
+
+def synthetic_text (n_tokens: int) -> str:
+    """Returns a POS-tagged text of n_tokens tokens made of repeated sentences of 20 tokens, one sentence per line
+    Args:
+        n_tokens (int): number of tokens
+    Returns:
+        text (str): synthetic POS-tagged text
+    """
+    sentence = "The_DT results_NNS of_IN the_DT study_NN suggest_VBP that_IN we_PRP should_MD have_VB been_VBN told_VBN about_IN it_PRP ,_, but_CC nobody_NN did_VBD ._."
+    n_sentences = max(1, n_tokens // len(sentence.split(' ')))
+    return "\n".join([sentence] * n_sentences)
+
+def benchmark_buffering (n_tokens: int) -> None:
+    """Times get_sentences and add_buffer_spaces on synthetic texts of increasing length up to n_tokens tokens
+    The time per token should stay flat as the text grows; it grew linearly with the length of the text when the buffered list was rebuilt for every sentence.
+    Args:
+        n_tokens (int): number of tokens of the longest synthetic text
+    """
+    for fraction in (8, 4, 2, 1):
+        text = synthetic_text(n_tokens // fraction)
+        t_0 = timeit.default_timer()
+        words = MFTE.add_buffer_spaces(MFTE.get_sentences(text))
+        elapsed_time = timeit.default_timer() - t_0
+        print("Tokens:", n_tokens // fraction, "| Buffered words:", len(words), "| Time (seconds):", round(elapsed_time, 3), "| Microseconds per token:", round(elapsed_time / (n_tokens // fraction) * 1e6, 3))
+
+def benchmark_counting (tagged_dir: str) -> None:
+    """Counts the features of every MD-tagged file in tagged_dir from its text (as do_counts does for files without saved counts) and prints per-word throughput
+    Args:
+        tagged_dir (str): dir with MD-tagged files
+    """
+    files = glob.glob(os.path.join(tagged_dir, "*.txt"))
+    if len(files) == 0:
+        print("No files to benchmark.")
+        return
+    MFTE.get_word_features.cache_clear()
+    n_words = 0
+    t_0 = timeit.default_timer()
+    for file in files:
+        counts = MFTE.count_tagged_file(file)
+        n_words += counts['n_tokens']
+    elapsed_time = timeit.default_timer() - t_0
+    print("Files:", len(files))
+    print("Words:", n_words)
+    print("Time spent on counting (seconds):", round(elapsed_time, 3))
+    print("Throughput (words per second):", round(n_words / elapsed_time, 1))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmarks for the MD tagging stage of the MFTE.')
+    parser.add_argument('--path', type=str, help='path to a folder of POS-tagged files (e.g. POS_Tagged)')
+    parser.add_argument('--extended', default=True, type=MFTE.str2bool, help='enable extended mode True or False; default is True')
+    parser.add_argument('--synthetic_tokens', type=int, help='benchmark sentence buffering on synthetic texts of up to this many tokens, e.g. 1000000')
+    parser.add_argument('--tagged_path', type=str, help='benchmark feature counting on a folder of MD-tagged files (e.g. MFTE_Tagged)')
+    args = parser.parse_args()
+    if args.synthetic_tokens:
+        benchmark_buffering(args.synthetic_tokens)
+    if args.path:
+        benchmark_md_tagging(args.path, args.extended)
+    if args.tagged_path:
+        benchmark_counting(args.tagged_path)
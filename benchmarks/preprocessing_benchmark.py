@@ -0,0 +1,63 @@
+"""Benchmark of stanza_pre_processing, the text preprocessing applied before POS tagging with stanza
+
+Usage:
+    python benchmarks/preprocessing_benchmark.py --path "/path/to/corpus/" --repeat 20
+
+Every text file in the folder is joined into one large input, which is repeated --repeat times.
+The output of stanza_pre_processing is checked against sequential_stanza_pre_processing, the previous implementation with one re.sub per rule.
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import timeit
+import emoji
+currentdir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(currentdir), "src"))
+import MFTE
+
+def sequential_stanza_pre_processing (text: str) -> str:
+    """Previous implementation of stanza_pre_processing: one uncompiled re.sub per rule and a character by character emoji check
+    Args:
+        text (str): Text to preprocess
+    Returns:
+        text (str): Text after applying preprocessing
+    """
+    for pattern, replacement in MFTE.contraction_rules:
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    text = re.sub("(\\w+) *[\r\n]+ *(\\w+)", "\\1 \\2", text, flags=re.IGNORECASE)
+    text = re.sub(" {2,}", " ", text, flags=re.IGNORECASE)
+    text = re.sub("[∎]+", " ", text, flags=re.IGNORECASE)
+    text = ''.join((' '+c+' ') if c in emoji.EMOJI_DATA else c for c in text)
+    return text
+
+def benchmark_pre_processing (input_dir: str, repeat: int = 10) -> None:
+    """Times both implementations on the text files of input_dir joined and repeated, and checks that their outputs are identical
+    Args:
+        input_dir (str): dir with text files
+        repeat (int): number of times the joined text is repeated
+    """
+    files = glob.glob(os.path.join(input_dir, "*.txt"))
+    if len(files) == 0:
+        print("No files to benchmark.")
+        return
+    text = "\n".join([open(file=file, encoding='utf-8', errors="ignore").read() for file in files]) * repeat
+    print("Characters:", len(text))
+    t_0 = timeit.default_timer()
+    expected = sequential_stanza_pre_processing(text)
+    elapsed_time_sequential = timeit.default_timer() - t_0
+    t_0 = timeit.default_timer()
+    output = MFTE.stanza_pre_processing(text)
+    elapsed_time = timeit.default_timer() - t_0
+    print("Identical output:", output == expected)
+    print("Time with one re.sub per rule (seconds):", round(elapsed_time_sequential, 3))
+    print("Time with the compiled single pass (seconds):", round(elapsed_time, 3))
+    print("Speedup:", round(elapsed_time_sequential / elapsed_time, 2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark of the text preprocessing applied before POS tagging with stanza.')
+    parser.add_argument('--path', type=str, required=True, help='path to a folder of text files')
+    parser.add_argument('--repeat', default=10, type=int, help='number of times the text of the folder is repeated; default is 10')
+    args = parser.parse_args()
+    benchmark_pre_processing(args.path, args.repeat)
@@ -104,6 +104,13 @@ entry_points={
         'stanza >= 1.7.0',
         'emoji >= 2.9.0',
     ],
+
+#     '''
+#     Optional dependencies, e.g. pip install MFTE[parquet] for the Parquet and Feather tables (--output_format).
+#     '''
+    extras_require = {
+        'parquet': ['pyarrow'],
+    },
     
     python_requires='>=3.8',
 
@@ -10,6 +10,11 @@ import re
 from stanza.models.constituency.tree_reader import read_tree_file, read_trees
 from stanza.models.constituency.parse_tree import Tree
 import string
+import array
+import gc
+import json
+import mmap
+import struct
 
 def constituency_to_list_of_words (c: stanza.models.constituency.parse_tree.Tree) -> list:
     """Returns constituency node as a list of words after removing all tags and labels
@@ -39,6 +44,26 @@ def find_sub_list_starting_index_in_words_list(words: list, sub_list: list) -> i
             return i
     return None #None if the sequence is not found. Can happen if a punctuation mark exists after CC tag which will be ignored in triplet creation in get_triplets
 
+def get_sentence_spans (words: list) -> list:
+    """Returns the starting index and length of every sentence in a list of words where sentences are separated by buffer spaces (" ")
+
+    Args:
+        words (list): list of words with buffer spaces, as built by MFTE.add_buffer_spaces
+
+    Returns:
+        spans (list): list of (starting index, number of words) of each sentence, in order
+    """
+    spans = []
+    start = None
+    for index, word in enumerate(words + [" "]):
+        if word == " ":
+            if start is not None and any(words[start:index]): #empty lines are not sentences and have no tree
+                spans.append((start, index - start))
+            start = None
+        elif start is None:
+            start = index
+    return spans
+
 def get_triplets(lst: list):
     """Return triplets as (i-1, i, i+1)
 
@@ -105,98 +130,238 @@ def get_nodes_of_interest(trees: list, node: str) -> list:
         nodes_list.extend(get_nodes_from_child(tree, node))
     return nodes_list
 
-def tag_non_finite_relative_clauses(words: list, trees: list) -> list:
-    """Return words list after adding VBNRel, VBGRel tags
+# CONSTITUENCY VISITOR
+rule_families = ['participial', 'relative', 'pied_piping', 'coordination'] # the edits of each family are applied in this order, so that a word matched by several rules gets the same tags as when each family walked the trees in turn
 
-    Args:
-        words (list): list of words that is previously tagged
-        trees (list): list of trees tagged by stanza
+class ConstituencyVisitor:
+    """Walks every tree once, keeping the span of leaves of each node, and collects the edits of all rule families dispatched on the labels of the nodes
 
-    Returns:
-        words (list): list of words after adding VBNRel, VBGRel tags
+    Args:
+        words (list): list of words with buffer spaces, as built by MFTE.add_buffer_spaces
     """
-    np_trees = get_nodes_of_interest(trees, 'NP') #get all NP nodes
-    for np_tree in np_trees:
+    def __init__ (self, words: list):
+        self.words_without_tags = [w.split('_')[0] for w in words]
+        self.sentence_spans = get_sentence_spans(words)
+        self.spans = {} # id(node) -> (leaves of its tree, first leaf, end leaf, index in words of the first leaf of the tree or None if the tree is not aligned to its sentence)
+        self.edits = {family: [] for family in rule_families} # family -> list of (index, pattern, replacement)
+
+    def visit_trees (self, trees: list):
+        """Visits the trees of a file, the i-th tree being the parse of the i-th sentence
+
+        Args:
+            trees (list): list of trees tagged by stanza
+
+        Returns:
+            self (ConstituencyVisitor): the visitor, with the edits of all trees collected
+        """
+        for sentence_number, tree in enumerate(trees):
+            self.visit(tree, self.sentence_spans[sentence_number] if sentence_number < len(self.sentence_spans) else None)
+        return self
+
+    def visit (self, tree: stanza.models.constituency.parse_tree.Tree, sentence_span: tuple = None) -> None:
+        """Records the leaf span of every node of a tree, then dispatches each node in pre-order to the rules of its label
+
+        Args:
+            tree (stanza.models.constituency.parse_tree.Tree): tree of one sentence
+            sentence_span (tuple, optional): (index of the first word, number of words) of the sentence. Defaults to None.
+        """
+        leaves = []
+        nodes = []
+        first_leaf = {}
+        stack = [tree]
+        while stack: # pre-order walk
+            node = stack.pop()
+            nodes.append(node)
+            first_leaf[id(node)] = len(leaves)
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                leaves.append(node.label)
+        offset = None
+        if sentence_span is not None:
+            start, length = sentence_span
+            if leaves == self.words_without_tags[start:start + length]:
+                offset = start
+        end_leaf = {}
+        for node in reversed(nodes): # children are seen before their parent
+            end_leaf[id(node)] = end_leaf[id(node.children[-1])] if node.children else first_leaf[id(node)] + 1
+        for node in nodes:
+            self.spans[id(node)] = (leaves, first_leaf[id(node)], end_leaf[id(node)], offset)
+        for node in nodes:
+            if node.label == 'ROOT':
+                self.visit_ROOT(node)
+            elif node.label == 'NP':
+                self.visit_NP(node)
+            elif node.label == 'SBAR':
+                self.visit_SBAR(node)
+            if len(node.children) >= 2:
+                self.visit_coordination(node)
+
+    def get_words (self, node: stanza.models.constituency.parse_tree.Tree) -> list:
+        """Returns the words of a node, sliced from the leaves of its tree
+
+        Args:
+            node (stanza.models.constituency.parse_tree.Tree): visited node
+
+        Returns:
+            sub_list (list): words of the node
+        """
+        leaves, first, end, offset = self.spans[id(node)]
+        return leaves[first:end]
+
+    def get_index (self, node: stanza.models.constituency.parse_tree.Tree, parent: stanza.models.constituency.parse_tree.Tree = None) -> int:
+        """Returns the index in words of the first word of a node. When its tree is not aligned to its sentence, the words of the node (or of its parent) are searched for
+
+        Args:
+            node (stanza.models.constituency.parse_tree.Tree): visited node
+            parent (stanza.models.constituency.parse_tree.Tree, optional): node containing node, whose words are searched for instead. Defaults to None.
+
+        Returns:
+            index (int): index of the first word of the node, None if it is not found
+        """
+        leaves, first, end, offset = self.spans[id(node)]
+        if offset is not None:
+            return offset + first
+        if parent is None:
+            return self.find_words(leaves[first:end])
+        index = self.get_index(parent)
+        return None if index is None else index + first - self.spans[id(parent)][1]
+
+    def find_words (self, sub_list: list) -> int:
+        """Returns the starting index of sub_list in the words without tags, as find_sub_list_starting_index_in_words_list
+
+        Args:
+            sub_list (list): words to search for
+
+        Returns:
+            index (int): index where sub_list starts, None if it is not found
+        """
+        for i in range(len(self.words_without_tags) - len(sub_list) + 1):
+            if self.words_without_tags[i:i + len(sub_list)] == sub_list:
+                return i
+        return None
+
+    def add_edit (self, family: str, index: int, pattern: str, replacement: str) -> None:
+        """Records a re.sub to apply to words[index], if the index was found
+
+        Args:
+            family (str): rule family, one of rule_families
+            index (int): index in words
+            pattern (str): pattern to replace
+            replacement (str): replacement
+        """
+        if index is not None:
+            self.edits[family].append((index, pattern, replacement))
+
+    def apply_edits (self, words: list, families: list = rule_families) -> list:
+        """Applies the collected edits to words, family by family
+
+        Args:
+            words (list): list of words with buffer spaces, as passed to the constructor
+            families (list, optional): rule families to apply. Defaults to rule_families.
+
+        Returns:
+            words (list): list of words after adding the constituency based tags
+        """
+        for family in rule_families:
+            if family in families:
+                for index, pattern, replacement in self.edits[family]:
+                    words[index] = re.sub(pattern, replacement, words[index])
+        return words
+
+    def visit_ROOT (self, s_tree: stanza.models.constituency.parse_tree.Tree) -> None:
+        """Participial clauses: VBGCls, VBNCls"""
+        #present participial clauses (ROOT (S (S (VP (VBG Stuffing) (NP (PRP$ his) (NN mouth)) (PP (IN with) (NP (NNS cookies)))))
+        #past participial clauses (ROOT (S (S (VP (VBN Built) (PP (IN in) (NP (DT a) (JJ single) (NN week)))))
+        if len(s_tree.children) >= 1 and s_tree.children[0].label == 'S':
+            if len(s_tree.children[0].children) >= 1 and s_tree.children[0].children[0].label == 'S':
+                if len(s_tree.children[0].children[0].children) >= 1 and s_tree.children[0].children[0].children[0].label == 'VP': #first child is a VP
+                    if s_tree.children[0].children[0].children[0].children[0].label == 'VBG': #first word in the VP is VBG
+                        self.add_edit('participial', self.get_index(s_tree), "_VBG", "_VBGCls")
+                    if s_tree.children[0].children[0].children[0].children[0].label == 'VBN': #first word in the VP is VBN
+                        self.add_edit('participial', self.get_index(s_tree), "_VBN", "_VBNCls")
+
+    def visit_NP (self, np_tree: stanza.models.constituency.parse_tree.Tree) -> None:
+        """Non-finite relative clauses: VBGRel, VBNRel, and attributive VBG/VBN: JJAT"""
         #present participial relative clauses (NP (NP xxx) (VP (VBG xxxx)))
         if len(np_tree.children) > 1:
             if np_tree.children[0].label == 'NP' and np_tree.children[1].label == 'VP': #first child is NP and 2nd child a VP
                 if (np_tree.children[1].children[0].label == 'VBG'): #first word in the VP is VBG
-                    #print(np_tree)
-                    np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[1])
-                    index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                    if index:
-                        words[index] = re.sub("_VBG", "_VBGRel", words[index])
-        
+                    self.add_edit('relative', self.get_index(np_tree.children[1]), "_VBG", "_VBGRel")
+
         #past participial relative clauses (NP (NP xxx) (VP (VBN xxxx)))
         if len(np_tree.children) > 1:
             if np_tree.children[0].label == 'NP' and np_tree.children[1].label == 'VP': #first child is an NP and 2nd child is a VP
                 if np_tree.children[1].children[0].label == 'VBN': #first word in the VP is VBN
-                    #print(np_tree)
-                    np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[1])
-                    index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                    if index:
-                        words[index] = re.sub("_VBN", "_VBNRel", words[index])
+                    self.add_edit('relative', self.get_index(np_tree.children[1]), "_VBN", "_VBNRel")
 
                 elif ((np_tree.children[1].children[0].label == 'ADVP' and  np_tree.children[1].children[1].label == 'VBN')): #first child in VP is ADVP, 2nd is VBN
-                    np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[1])
-                    index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                    if index:
-                        words[index+1] = re.sub("_VBN", "_VBNRel", words[index+1]) #+1 due to the presence of adverb before the verb                   
+                    self.add_edit('relative', self.get_index(np_tree.children[1].children[1], np_tree.children[1]), "_VBN", "_VBNRel") #the verb comes after the adverb
 
                 if len(np_tree.children[1].children) > 2: #check for two VPs joined by and
                     if (np_tree.children[1].children[0].label == 'VP' and 
                     np_tree.children[1].children[1].label == 'CC' and 
                     np_tree.children[1].children[2].label == 'VP'):
                         if np_tree.children[1].children[0].children[0].label == 'VBN': #first word in the VP is VBN
-                            #print(np_tree.children[1].children[0])
-                            np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[1].children[0])
-                            #print(np_tree_list_of_words)
-                            index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                            if index:
-                                words[index] = re.sub("_VBN", "_VBNRel", words[index])
+                            self.add_edit('relative', self.get_index(np_tree.children[1].children[0]), "_VBN", "_VBNRel")
                         
                         if np_tree.children[1].children[2].children[0].label == 'VBN': #first word in the VP is VBN
-                            #print(np_tree.children[1].children[2])
-                            np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[1].children[2])
-                            #print(np_tree_list_of_words)
-                            index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                            if index:
-                                words[index] = re.sub("_VBN", "_VBNRel", words[index])
+                            self.add_edit('relative', self.get_index(np_tree.children[1].children[2]), "_VBN", "_VBNRel")
 
         #past participial relative clauses with additional items like punctuation (NP (NP xxx) (, ,) (VP (VBN xxxx))) occuring after a comma
         if len(np_tree.children) > 2:
             if np_tree.children[0].label == 'NP' and np_tree.children[1].label in string.punctuation and np_tree.children[2].label == 'VP': #first child is NP, 2nd child is punctuation and 3rd child a VP
                 if (np_tree.children[2].children[0].label == 'ADVP' and  np_tree.children[2].children[1].label == 'VBN'): #first child in VP is ADVP, 2nd is VBN
-                    np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[2])
-                    index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                    if index:
-                        words[index+1] = re.sub("_VBN", "_VBNRel", words[index+1]) #+1 due to the presence of adverb before the verb
+                    self.add_edit('relative', self.get_index(np_tree.children[2].children[1], np_tree.children[2]), "_VBN", "_VBNRel") #the verb comes after the adverb
                 
                 elif (np_tree.children[2].children[0].label == 'VBN'): ##first word in the VP is VBN
-                    np_tree_list_of_words = constituency_to_list_of_words(np_tree.children[2])
-                    index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-                    if index:
-                        words[index] = re.sub("_VBN", "_VBNRel", words[index])
+                    self.add_edit('relative', self.get_index(np_tree.children[2]), "_VBN", "_VBNRel")
 
         #VBG as attributive adjectives (NP (DT the) (JJ Indian) (VBG founding) (NNS fathers))
         labels = [c.label for c in np_tree.children]
         if any(label == 'VBG' for label in labels) and not any(label == 'VP' for label in labels):
-            np_tree_list_of_words = constituency_to_list_of_words(np_tree)
-            item_index = labels.index('VBG')
-            sub_list_index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-            if sub_list_index:
-                words[sub_list_index+item_index] = re.sub("_VBG", "_JJAT JJATother", words[sub_list_index+item_index])
+            self.add_edit('relative', self.get_index(np_tree.children[labels.index('VBG')], np_tree), "_VBG", "_JJAT JJATother")
 
         #VBN as attributive adjectives (NP (VBN perceived) (JJ diplomatic) (NN affront))
-        labels = [c.label for c in np_tree.children]
         if any(label == 'VBN' for label in labels) and not any(label == 'VP' for label in labels):
-            np_tree_list_of_words = constituency_to_list_of_words(np_tree)
-            item_index = labels.index('VBN')
-            sub_list_index = find_sub_list_starting_index_in_words_list(words, np_tree_list_of_words)
-            if sub_list_index:
-                words[sub_list_index+item_index] = re.sub("_VBN", "_JJAT JJATother", words[sub_list_index+item_index])
+            self.add_edit('relative', self.get_index(np_tree.children[labels.index('VBN')], np_tree), "_VBN", "_JJAT JJATother")
 
-    return words
+    def visit_SBAR (self, s_tree: stanza.models.constituency.parse_tree.Tree) -> None:
+        """WH pied piping clauses: WHPiPC"""
+        #WH pied piping clauses (SBAR (WHPP (IN within) (WHNP (WDT which)))
+        if len(s_tree.children) >= 1:
+            if s_tree.children[0].label == 'WHPP': #first child is a WHPP
+                if len(s_tree.children[0].children) > 1:
+                    if s_tree.children[0].children[0].label == 'IN' and s_tree.children[0].children[1].label == 'WHNP': #first word is a preposition and second word is a WH word
+                        index = self.get_index(s_tree)
+                        wh_indices = [i for i, item in enumerate(self.get_words(s_tree)) if re.search('^(who|whom|whose|which|when|why|how|what)$', item, re.IGNORECASE)]
+                        if index is not None and wh_indices:
+                            self.add_edit('pied_piping', index + wh_indices[0], "_(\\w+)\\s*(\\w+)", "_\\1 WHPiPC")
+
+    def visit_coordination (self, tree: stanza.models.constituency.parse_tree.Tree) -> None:
+        """Phrasal and clausal coordination: CCPhrs, CCCls"""
+        for CC_tree in get_triplets(tree): #CC and neighbouring nodes with node 1 and node 3 having same labels
+            if CC_tree[1].label == 'CC' and CC_tree[0].label == CC_tree[2].label:
+                if self.spans[id(CC_tree[1])][3] is not None:
+                    index = self.get_index(CC_tree[1])
+                else:
+                    index = self.find_words(self.get_words(CC_tree[1]) + self.get_words(CC_tree[2]))
+                if CC_tree[0].label == 'S' and CC_tree[2].label == 'S':
+                    self.add_edit('coordination', index, "_(\\w+)", "_CCCls")
+                elif re.search(r'^(NP|VP|JJ|RB|N|V)', CC_tree[0].label) and re.search(r'^(NP|VP|JJ|RB|N|V)', CC_tree[2].label):
+                    self.add_edit('coordination', index, "_(\\w+)", "_CCPhrs")
+
+def tag_non_finite_relative_clauses(words: list, trees: list) -> list:
+    """Return words list after adding VBNRel, VBGRel tags
+
+    Args:
+        words (list): list of words that is previously tagged
+        trees (list): list of trees tagged by stanza
+
+    Returns:
+        words (list): list of words after adding VBNRel, VBGRel tags
+    """
+    return ConstituencyVisitor(words).visit_trees(trees).apply_edits(words, ['relative'])
 
 def tag_non_finite_participial_clauses(words: list, trees: list) -> list:
     """Return words list after adding VBNCls, VBGCls tags
@@ -208,34 +373,7 @@ def tag_non_finite_participial_clauses(words: list, trees: list) -> list:
     Returns:
         words (list): list of words after adding VBGCls, VBNCls tags
     """
-    s_trees = get_nodes_of_interest(trees, 'ROOT') #get all root nodes
-    for s_tree in s_trees:
-        #present participial clauses (ROOT (S (S (VP (VBG Stuffing) (NP (PRP$ his) (NN mouth)) (PP (IN with) (NP (NNS cookies)))))
-        if len(s_tree.children) >= 1:
-            if s_tree.children[0].label == 'S':
-                if len(s_tree.children[0].children) >= 1:
-                    if s_tree.children[0].children[0].label == 'S':
-                        if len(s_tree.children[0].children[0].children) >= 1:
-                            if s_tree.children[0].children[0].children[0].label == 'VP': #first child is a VP
-                                if s_tree.children[0].children[0].children[0].children[0].label == 'VBG': #first word in the VP is VBG
-                                    s_tree_list_of_words = constituency_to_list_of_words(s_tree)
-                                    index = find_sub_list_starting_index_in_words_list(words, s_tree_list_of_words)
-                                    if index:
-                                        words[index] = re.sub("_VBG", "_VBGCls", words[index])
-
-        #past participial clauses (ROOT (S (S (VP (VBN Built) (PP (IN in) (NP (DT a) (JJ single) (NN week)))))
-        if len(s_tree.children) >= 1:
-            if s_tree.children[0].label == 'S':
-                if len(s_tree.children[0].children) >= 1:
-                    if s_tree.children[0].children[0].label == 'S':
-                        if len(s_tree.children[0].children[0].children) >= 1:
-                            if s_tree.children[0].children[0].children[0].label == 'VP': #first child is a VP
-                                if s_tree.children[0].children[0].children[0].children[0].label == 'VBN': #first word in the VP is VBN
-                                    s_tree_list_of_words = constituency_to_list_of_words(s_tree)
-                                    index = find_sub_list_starting_index_in_words_list(words, s_tree_list_of_words)
-                                    if index:
-                                        words[index] = re.sub("_VBN", "_VBNCls", words[index])
-    return words        
+    return ConstituencyVisitor(words).visit_trees(trees).apply_edits(words, ['participial'])
 
 def tag_pied_piping_wh_clauses(words: list, trees: list) -> list:
     """Return words list after adding WHPiPC tags
@@ -247,22 +385,7 @@ def tag_pied_piping_wh_clauses(words: list, trees: list) -> list:
     Returns:
         words (list): list of words after adding WHPiPC tags
     """
-    s_trees = get_nodes_of_interest(trees, 'SBAR') #get all sentence nodes
-    for s_tree in s_trees:
-        #WH pied piping clauses (SBAR (WHPP (IN within) (WHNP (WDT which)))
-        if len(s_tree.children) >= 1:
-            if s_tree.children[0].label == 'WHPP': #first child is a WHPP
-                if len(s_tree.children[0].children) > 1:
-                    if s_tree.children[0].children[0].label == 'IN' and s_tree.children[0].children[1].label == 'WHNP': #first word is a preposition and second word is a WH word
-                        #print(s_tree)
-                        s_tree_list_of_words = constituency_to_list_of_words(s_tree)
-                        #print(s_tree_list_of_words)
-                        index = find_sub_list_starting_index_in_words_list(words, s_tree_list_of_words)
-                        if index:
-                            wh_index = [i for i, item in enumerate(s_tree_list_of_words) if re.search('^(who|whom|whose|which|when|why|how|what)$', item, re.IGNORECASE)][0]
-                            words[index+wh_index] = re.sub("_(\w+)\s*(\w+)", "_\\1 WHPiPC", words[index+wh_index])
-                            #print(words[index+wh_index])
-    return words        
+    return ConstituencyVisitor(words).visit_trees(trees).apply_edits(words, ['pied_piping'])
 
 def tag_phrasal_clausal_coordination(words: list, trees: list) -> list:
     """Return words list after adding CCPhrs, CCCls tags
@@ -274,21 +397,187 @@ def tag_phrasal_clausal_coordination(words: list, trees: list) -> list:
     Returns:
         words (list): list of words after adding CCPhrs, CCCls tags
     """
-    CC_trees = []
+    return ConstituencyVisitor(words).visit_trees(trees).apply_edits(words, ['coordination'])
+
+# BINARY TREES
+# With --tree_format binary, every file of Constituency_Trees also gets a <file name>.trees file next to its bracketed text, which stays as the readable export.
+# Labels (tags and words) are interned in a header, and the nodes of all trees are stored in pre-order in flat arrays of unsigned integers,
+# each of the narrowest of 1, 2 or 4 bytes that fits its values: tree_offsets (first node of each tree), node_labels (label of each node),
+# and child_offsets and children (children of each node; like children numbers, offsets start from 0 in every tree and a tree of n nodes has n + 1 offsets).
+# The arrays are read from a memory map, so MD tagging rebuilds the trees without running the bracket parser.
+# A binary trees file that cannot be decoded (e.g. truncated, or of another version) is ignored, and the bracketed text is read instead.
+binary_trees_magic = b"MFTETREE"
+binary_trees_version = 2
+binary_trees_extension = ".trees"
+binary_trees_arrays = ['tree_offsets', 'node_labels', 'child_offsets', 'children']
+binary_trees_typecodes = ['B', 'H', 'I'] # array typecodes of 1, 2 and 4 bytes
+
+def get_binary_trees_path (trees_file_path: str) -> str:
+    """Returns the path of the binary trees of a Constituency_Trees text file
+
+    Args:
+        trees_file_path (str): path of the bracketed trees
+
+    Returns:
+        binary_trees_path (str): path of the binary trees
+    """
+    return trees_file_path + binary_trees_extension
+
+def encode_trees (trees: list) -> bytes:
+    """Returns the binary form of trees, see BINARY TREES
+
+    Args:
+        trees (list): list of trees tagged by stanza
+
+    Returns:
+        data (bytes): header and arrays
+    """
+    label_ids = {}
+    lists = {name: [] for name in binary_trees_arrays}
     for tree in trees:
-        CC_trees.extend(get_cc_and_adjacent_nodes_from_child(tree, 'CC')) #get all CC and neighbouring nodes with node 1 and node 3 having same labels
-    for CC_tree in CC_trees:
-        #print(CC_tree)
-        #print(CC_tree[0], '-----', CC_tree[1], '-----', CC_tree[2])
-        c_tree_list_of_words = constituency_to_list_of_words(str(CC_tree[1])+ " " + str(CC_tree[2]))
-        index = find_sub_list_starting_index_in_words_list(words, c_tree_list_of_words)
-        #print(c_tree_list_of_words) 
-        if index:
-            if CC_tree[0].label == 'S' and CC_tree[2].label == 'S':
-                words[index] = re.sub("_(\w+)", "_CCCls", words[index])
-            elif re.search(r'^(NP|VP|JJ|RB|N|V)', CC_tree[0].label) and re.search(r'^(NP|VP|JJ|RB|N|V)', CC_tree[2].label):
-                words[index] = re.sub("_(\w+)", "_CCPhrs", words[index])
-    return words        
+        lists['tree_offsets'].append(len(lists['node_labels']))
+        nodes = []
+        stack = [tree]
+        while stack: # pre-order walk
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+        numbers = {id(node): number for number, node in enumerate(nodes)}
+        n_children = 0
+        for node in nodes:
+            lists['node_labels'].append(label_ids.setdefault(node.label, len(label_ids)))
+            lists['child_offsets'].append(n_children)
+            lists['children'].extend(numbers[id(child)] for child in node.children)
+            n_children += len(node.children)
+        lists['child_offsets'].append(n_children)
+    lists['tree_offsets'].append(len(lists['node_labels']))
+    arrays = {}
+    for name in binary_trees_arrays:
+        largest = max(lists[name], default=0)
+        arrays[name] = array.array([typecode for typecode in binary_trees_typecodes if largest < 256 ** array.array(typecode).itemsize][0], lists[name])
+    header = json.dumps({'version': binary_trees_version, 'byteorder': sys.byteorder, 'labels': list(label_ids), 'arrays': [[arrays[name].typecode, len(arrays[name])] for name in binary_trees_arrays]}, ensure_ascii=False).encode('utf-8')
+    header += b" " * (-(len(binary_trees_magic) + 4 + len(header)) % 4) # arrays start on a 4-byte boundary
+    data = [binary_trees_magic, struct.pack("<I", len(header)), header]
+    for name in binary_trees_arrays:
+        data.append(arrays[name].tobytes())
+        data.append(b"\0" * (-len(data[-1]) % 4))
+    return b"".join(data)
+
+def decode_trees (data) -> list:
+    """Returns the trees stored by encode_trees
+
+    Args:
+        data: bytes, or a memory map, of a binary trees file
+
+    Returns:
+        trees (list): list of trees
+    """
+    with memoryview(data) as view: # released even if the data cannot be decoded, so that the memory map can be closed
+        if bytes(view[:len(binary_trees_magic)]) != binary_trees_magic:
+            raise ValueError("not a binary trees file")
+        header_length = struct.unpack("<I", view[len(binary_trees_magic):len(binary_trees_magic) + 4])[0]
+        offset = len(binary_trees_magic) + 4
+        header = json.loads(bytes(view[offset:offset + header_length]).decode('utf-8'))
+        if header['version'] != binary_trees_version:
+            raise ValueError("binary trees file of version " + str(header['version']))
+        offset += header_length
+        arrays = {}
+        for name, (typecode, length) in zip(binary_trees_arrays, header['arrays']):
+            size = array.array(typecode).itemsize * length
+            if offset + size > len(view):
+                raise ValueError("truncated binary trees file")
+            if header['byteorder'] == sys.byteorder:
+                with view[offset:offset + size].cast(typecode) as values: # read in place from the memory map
+                    arrays[name] = values.tolist()
+            else:
+                values = array.array(typecode, bytes(view[offset:offset + size]))
+                values.byteswap()
+                arrays[name] = values.tolist()
+            offset += size + (-size % 4)
+    labels = header['labels']
+    tree_offsets, node_labels, child_offsets, children = arrays['tree_offsets'], arrays['node_labels'], arrays['child_offsets'], arrays['children']
+    trees = []
+    gc_enabled = gc.isenabled()
+    gc.disable() # trees have no reference cycles, and the garbage collector would otherwise run over and over while millions of nodes are created
+    try:
+        for tree_number in range(len(tree_offsets) - 1):
+            first = tree_offsets[tree_number]
+            first_offset = first + tree_number # each tree before has one more offset than nodes
+            first_child = first - tree_number # each tree before has one less child than nodes (its root)
+            nodes = [None] * (tree_offsets[tree_number + 1] - first)
+            for node in range(len(nodes) - 1, -1, -1): # children come after their parent in pre-order
+                nodes[node] = Tree(labels[node_labels[first + node]], [nodes[child] for child in children[first_child + child_offsets[first_offset + node]:first_child + child_offsets[first_offset + node + 1]]])
+            trees.append(nodes[0])
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return trees
+
+def write_binary_trees (trees_file_path: str, trees_text: str) -> None:
+    """Writes the binary trees of a Constituency_Trees text file next to it
+
+    Args:
+        trees_file_path (str): path of the bracketed trees
+        trees_text (str): bracketed trees, one per line
+    """
+    binary_trees_path = get_binary_trees_path(trees_file_path)
+    temp_path = binary_trees_path + "." + str(os.getpid()) + ".tmp"
+    with open(file=temp_path, mode='wb') as f:
+        f.write(encode_trees(read_trees(trees_text)))
+    os.replace(temp_path, binary_trees_path) # a binary trees file is never seen half written
+
+def read_binary_trees (trees_file_path: str) -> list:
+    """Returns the trees of a binary trees file, read from a memory map
+
+    Args:
+        trees_file_path (str): path of the binary trees
+
+    Returns:
+        trees (list): list of trees
+    """
+    with open(file=trees_file_path, mode='rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return decode_trees(m)
+
+def export_binary_trees (trees_file_path: str) -> None:
+    """Writes the bracketed text of a binary trees file, e.g. if the text file was removed
+
+    Args:
+        trees_file_path (str): path of the binary trees
+    """
+    with open(file=trees_file_path[:-len(binary_trees_extension)], encoding='utf-8', mode='w') as f:
+        f.write("\n".join(str(tree) for tree in read_binary_trees(trees_file_path)))
+
+def remove_binary_trees (trees_file_path: str) -> None:
+    """Removes the binary trees of a Constituency_Trees text file, if any, e.g. when the text is written again without them
+
+    Args:
+        trees_file_path (str): path of the bracketed trees
+    """
+    try:
+        os.remove(get_binary_trees_path(trees_file_path))
+    except FileNotFoundError:
+        pass
+
+def read_constituency_trees (input_file_path: str) -> list:
+    """Returns the trees of a Constituency_Trees file, from its binary trees if they are at least as recent as the text and can be decoded
+
+    Args:
+        input_file_path (str): path of the bracketed trees
+
+    Returns:
+        trees (list): list of trees
+    """
+    binary_trees_path = get_binary_trees_path(input_file_path)
+    if os.path.exists(binary_trees_path) and (not os.path.exists(input_file_path) or os.path.getmtime(binary_trees_path) >= os.path.getmtime(input_file_path)):
+        try:
+            return read_binary_trees(binary_trees_path)
+        except (OSError, ValueError, TypeError, IndexError, KeyError, struct.error):
+            if not os.path.exists(input_file_path):
+                raise
+            print("Could not decode", binary_trees_path, "- reading the bracketed trees instead")
+    trees_text = open(file=input_file_path, mode='r', encoding='UTF-8', errors='ignore').read()
+    return read_trees(trees_text)
 
 def tag_constituency (words: list, pos_tagged_file_path: str) -> list:
     """Returns words list after adding constituency based tags VBGCls, VBNCls, VBGRel, VBNRel etc.
@@ -301,13 +590,8 @@ def tag_constituency (words: list, pos_tagged_file_path: str) -> list:
         word (list): list of words after added constituency based tags
     """
     input_file_path = pos_tagged_file_path.replace('POS_Tagged', 'Constituency_Trees') #get corresponding constituency tree file path
-    trees_text = open(file=input_file_path, mode='r', encoding='UTF-8', errors='ignore').read()
-    trees = read_trees(trees_text)
-    words = tag_non_finite_participial_clauses(words, trees)
-    words = tag_non_finite_relative_clauses(words, trees)
-    words = tag_pied_piping_wh_clauses(words, trees)
-    words = tag_phrasal_clausal_coordination(words, trees)
-    return words
+    trees = read_constituency_trees(input_file_path)
+    return ConstituencyVisitor(words).visit_trees(trees).apply_edits(words) #all rule families from one walk of each tree
 
 if __name__ == "__main__":
     words = open(file=r" ", mode='r', encoding='UTF-8', errors='ignore').read().splitlines()
@@ -4,6 +4,7 @@ import glob
 import os
 import pandas as pd
 import collections
+import functools
 import emoji
 import sys
 import os
@@ -20,6 +21,13 @@ import tqdm
 import argparse
 import Constituency_tags
 import traceback
+import queue
+import threading
+import json
+import hashlib
+import sqlite3
+import bisect
+from typing import Iterator
 
 def tag_stanford (dir_nlp: str, dir_in: str, dir_out: str) -> None:
     """Tags text files in dir_in with CoreNLPClient and writes to dir_out
@@ -102,6 +110,182 @@ def check_already_tagged_files_mfte (files: list, dir_out: str) -> list:
             print(file, 'already exists. It will not be re-tagged. Please delete all previous MFTE tagged files and restart the program to change this behaviour.')            
     return files_out
 
+# BUILD MANIFEST
+# call_MFTE keeps a manifest.json in the _MFTE folder that records, for each stage (POS_Tagged, MFTE_Tagged) and file, the fingerprint
+# of what the output was made from: the hash of the input file(s), the options of the stage and the MFTE (and stanza) version.
+# A file is tagged again when its output is missing or its fingerprint has changed, e.g. after editing a text or changing --extended.
+# Outputs made before there was a manifest for the stage are kept as they are and recorded with the current fingerprint.
+mfte_version = '1.6.0.0' # as in setup.py
+manifest_file_name = "manifest.json"
+
+def get_file_hash (path: str) -> str:
+    """Returns the SHA-256 hex digest of the content of a file
+    Args:
+        path (str): path of the file
+    Returns:
+        digest (str): hex digest
+    """
+    file_hash = hashlib.sha256()
+    with open(file=path, mode='rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+def get_fingerprint (input_paths: list, options: dict, versions: dict) -> dict:
+    """Returns the fingerprint of a stage output, as recorded in the build manifest
+    Args:
+        input_paths (list): paths of the input files the output is made from
+        options (dict): options of the stage
+        versions (dict): versions of the software used by the stage
+    Returns:
+        fingerprint (dict): hashes of the inputs, options and versions
+    """
+    return {'inputs': [get_file_hash(path) for path in input_paths], 'options': options, 'versions': versions}
+
+def read_manifest (output_main: str) -> dict:
+    """Reads the build manifest of an _MFTE folder
+    Args:
+        output_main (str): _MFTE folder
+    Returns:
+        manifest (dict): stage name -> file name -> fingerprint; empty if there is no readable manifest
+    """
+    try:
+        with open(file=output_main+manifest_file_name, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_manifest (manifest: dict, output_main: str) -> None:
+    """Writes the build manifest of an _MFTE folder, through a temporary file
+    Args:
+        manifest (dict): manifest from read_manifest
+        output_main (str): _MFTE folder
+    """
+    Path(output_main).mkdir(parents=True, exist_ok=True)
+    with open(file=output_main+manifest_file_name+".tmp", encoding='utf-8', mode='w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(output_main+manifest_file_name+".tmp", output_main+manifest_file_name)
+
+def get_output_mtimes (file: str, output_dirs: list) -> list:
+    """Returns the modification times of the outputs of a file, None for missing outputs
+    Args:
+        file (str): input file path
+        output_dirs (list): output directories of the stage
+    Returns:
+        mtimes (list): st_mtime_ns or None for each output directory
+    """
+    file_name = os.path.basename(file)
+    return [os.stat(output_dir+file_name).st_mtime_ns if os.path.exists(output_dir+file_name) else None for output_dir in output_dirs]
+
+def check_outdated_files (files: list, output_dirs: list, stage: dict, fingerprints: dict) -> list:
+    """Returns the files whose outputs are missing or were made from other inputs, options or versions (see BUILD MANIFEST)
+    Args:
+        files (list): list of file paths
+        output_dirs (list): output directories of the stage
+        stage (dict): manifest of the stage, file name -> fingerprint; outputs made before the stage had a manifest are recorded in it
+        fingerprints (dict): current fingerprint of each file
+    Returns:
+        files_out (list): files to tag
+    """
+    stage_is_new = len(stage) == 0
+    files_out = []
+    for file in files:
+        file_name = os.path.basename(file)
+        if None in get_output_mtimes(file, output_dirs):
+            files_out.append(file)
+        elif stage.get(file_name) == fingerprints[file]:
+            print(file, 'is up to date. It will not be re-tagged.')
+        elif stage_is_new:
+            stage[file_name] = fingerprints[file]
+            print(file, 'already exists. It will not be re-tagged. Delete it to re-tag it; later changes to the text or settings will be detected.')
+        else:
+            files_out.append(file)
+            print(file, 'has changed or was tagged with other settings. It will be re-tagged.')
+    return files_out
+
+def record_tagged_files (files: list, output_dirs: list, stage: dict, fingerprints: dict, mtimes_before: dict) -> None:
+    """Records in the manifest of the stage the fingerprint of the files whose outputs were all written by the stage
+    Args:
+        files (list): files that were to be tagged
+        output_dirs (list): output directories of the stage
+        stage (dict): manifest of the stage
+        fingerprints (dict): fingerprint of each file
+        mtimes_before (dict): get_output_mtimes of each file before the stage
+    """
+    for file in files:
+        mtimes = get_output_mtimes(file, output_dirs)
+        if None not in mtimes and all(mtime != mtime_before for mtime, mtime_before in zip(mtimes, mtimes_before[file])):
+            stage[os.path.basename(file)] = fingerprints[file]
+
+# PREPROCESSING
+# Contractions split by stanza_pre_processing, as (pattern, replacement), matched case-insensitively in this order.
+# They are compiled into one alternation (contraction_regex) applied in a single pass; contraction_replacements[i] is the replacement of group i+1.
+contraction_rules = [
+    ("\\bcannot\\b", "can not"),
+    ("\\bgonna\\b", "gon na"),
+    ("\\bwanna\\b", "wan na"),
+    ("\\bisn( )?('|’)?( )?t\\b|\\bin( )?(n)?( )?it\\b|\\bain('|’)?t\\b", "is n't"), # isn't, innit, ain't
+    ("\\baren( )?('|’)?( )?t\\b", "are n't"), # aren't
+    ("\\bweren( )?('|’)?( )?t\\b", "were n't"), # weren't
+    ("\\bdon( )?('|’)?( )?t\\b", "do n't"),
+    ("\\bwon( )?('|’)?( )?t\\b", "wo n't"),
+    ("\\bcan( )?('|’)?( )?t\\b", "ca n't"),
+    ("\\bdidn( )?('|’)?( )?t\\b", "did n't"),
+    ("\\bthat('|’)?( )?s\\b", "that 's"),
+    ("\\bwhat('|’)?( )?s\\b", "what 's"),
+    ("\\bit('|’)s\\b", "it 's"),
+    ("\\b(i|l)('|’)m\\b", "I 'm"),
+    ("\\byou('|’)?( )?re\\b", "your 're"),
+    ("\\bhe('|’)?( )?s\\b", "he 's"),
+    ("\\bshe('|’)?( )?s\\b", "she 's"),
+    ("\\bthey('|’)?( )?re\\b", "they 're"),
+    ("\\bi('|’)?( )?ve\\b", "I 've"),
+    ("\\bwe('|’)?( )?ve\\b", "we 've"),
+    ("\\bhe('|’)( )??d\\b", "he 'd"),
+    ("\\bshe('|’)( )?d\\b", "she 'd"),
+    ("\\bi('|’)( )?(ll|II)\\b", "I 'll"),
+    ("\\byou('|’)?( )?(ll|II)\\b", "you 'll"),
+    ("\\bhe('|’)( )?(ll|II)\\b", "he 'll"),
+    ("\\bshe('|’)?( )?(ll|II)\\b", "she 'll"),
+    ("\\bwe('|’)( )?(ll|II)\\b", "we 'll"),
+    ("\\bwe('|’)( )?d\\b", "we 'd"),
+    ("\\bit('|’)?( )?d\\b", "it 'd"),
+]
+# inner groups are made non-capturing so that match.lastindex is the number of the rule that matched,
+# and the lookahead on the first letters of the rules (c, g, w, i, a, d, t, l, y, h, s) skips the other words without trying every rule
+contraction_regex = re.compile("\\b(?=[acdghilstwy])(?:" + "|".join("(" + pattern.replace("(", "(?:") + ")" for pattern, replacement in contraction_rules) + ")", flags=re.IGNORECASE)
+contraction_replacements = [replacement for pattern, replacement in contraction_rules]
+newline_in_sentence_regex = re.compile("(\\w+) *[\\r\\n]+ *(\\w+)", flags=re.IGNORECASE)
+multiple_spaces_regex = re.compile(" {2,}")
+nonsense_characters_regex = re.compile("[∎]+")
+
+def get_emoji_regex () -> re.Pattern:
+    """Compiles a character class of every character that is an emoji on its own, as ranges of consecutive code points
+    Characters of multi-character emoji sequences (skin tones, ZWJ sequences, flags...) are matched one by one when they are emojis themselves,
+    as stanza_pre_processing has always spaced them.
+    Returns:
+        emoji_regex (re.Pattern): compiled character class
+    """
+    ranges = []
+    for code_point in sorted(ord(c) for c in emoji.EMOJI_DATA if len(c) == 1):
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+    # the lookahead on a single range rejects the characters below the first emoji (e.g. ASCII) without scanning the ranges
+    return re.compile("(?=[" + re.escape(chr(ranges[0][0])) + "-\\U0010ffff])[" + "".join(re.escape(chr(start)) if start == end else re.escape(chr(start)) + "-" + re.escape(chr(end)) for start, end in ranges) + "]")
+
+emoji_regex = get_emoji_regex()
+
+def replace_contraction (match: re.Match) -> str:
+    """Returns the replacement of the contraction rule that matched, see contraction_rules
+    Args:
+        match (re.Match): match of contraction_regex
+    Returns:
+        replacement (str): replacement text
+    """
+    return contraction_replacements[match.lastindex - 1]
+
 def stanza_pre_processing (text: str)-> str:
     """Applies preprocessing on text string before tagging it with stanza
     Args:
@@ -110,259 +294,1163 @@ def stanza_pre_processing (text: str)-> str:
         text (str): Text after applying preprocessing (mainly regular expression find and replace)
     """
     #Split cannot, gonna, wanna, innit and contracted verb forms to two words for better tagging with stanza
-    text = re.sub("\\bcannot\\b", "can not", text, flags=re.IGNORECASE)
-    text = re.sub("\\bgonna\\b", "gon na", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwanna\\b", "wan na", text, flags=re.IGNORECASE)
-    text = re.sub("\\bisn( )?('|’)?( )?t\\b|\\bin( )?(n)?( )?it\\b|\\bain('|’)?t\\b", "is n't", text, flags=re.IGNORECASE) # isn't, innit, ain't
-    text = re.sub("\\baren( )?('|’)?( )?t\\b", "are n't", text, flags=re.IGNORECASE) # aren't
-    text = re.sub("\\bweren( )?('|’)?( )?t\\b", "were n't", text, flags=re.IGNORECASE) # weren't
-    text = re.sub("\\bdon( )?('|’)?( )?t\\b", "do n't", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwon( )?('|’)?( )?t\\b", "wo n't", text, flags=re.IGNORECASE)
-    text = re.sub("\\bcan( )?('|’)?( )?t\\b", "ca n't", text, flags=re.IGNORECASE)
-    text = re.sub("\\bdidn( )?('|’)?( )?t\\b", "did n't", text, flags=re.IGNORECASE)
-    text = re.sub("\\bthat('|’)?( )?s\\b", "that 's", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwhat('|’)?( )?s\\b", "what 's", text, flags=re.IGNORECASE)
-    text = re.sub("\\bit('|’)s\\b", "it 's", text, flags=re.IGNORECASE)
-    text = re.sub("\\b(i|l)('|’)m\\b", "I 'm", text, flags=re.IGNORECASE)
-    text = re.sub("\\byou('|’)?( )?re\\b", "your 're", text, flags=re.IGNORECASE)
-    text = re.sub("\\bhe('|’)?( )?s\\b", "he 's", text, flags=re.IGNORECASE)
-    text = re.sub("\\bshe('|’)?( )?s\\b", "she 's", text, flags=re.IGNORECASE)
-    text = re.sub("\\bthey('|’)?( )?re\\b", "they 're", text, flags=re.IGNORECASE)
-    text = re.sub("\\bi('|’)?( )?ve\\b", "I 've", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwe('|’)?( )?ve\\b", "we 've", text, flags=re.IGNORECASE)
-    text = re.sub("\\bhe('|’)( )??d\\b", "he 'd", text, flags=re.IGNORECASE)
-    text = re.sub("\\bshe('|’)( )?d\\b", "she 'd", text, flags=re.IGNORECASE)
-    text = re.sub("\\bi('|’)( )?(ll|II)\\b", "I 'll", text, flags=re.IGNORECASE)
-    text = re.sub("\\byou('|’)?( )?(ll|II)\\b", "you 'll", text, flags=re.IGNORECASE)
-    text = re.sub("\\bhe('|’)( )?(ll|II)\\b", "he 'll", text, flags=re.IGNORECASE)
-    text = re.sub("\\bshe('|’)?( )?(ll|II)\\b", "she 'll", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwe('|’)( )?(ll|II)\\b", "we 'll", text, flags=re.IGNORECASE)
-    text = re.sub("\\bwe('|’)( )?d\\b", "we 'd", text, flags=re.IGNORECASE)
-    text = re.sub("\\bit('|’)?( )?d\\b", "it 'd", text, flags=re.IGNORECASE)
+    text = contraction_regex.sub(replace_contraction, text)
     #replace newlines with spaces within a sentence
-    text = re.sub("(\w+) *[\r\n]+ *(\w+)", "\\1 \\2", text, flags=re.IGNORECASE)
+    text = newline_in_sentence_regex.sub("\\1 \\2", text)
     #replace multiple spaces with 1
-    text = re.sub(" {2,}", " ", text, flags=re.IGNORECASE)
+    text = multiple_spaces_regex.sub(" ", text)
     #replace nonsense characters
-    text = re.sub("[∎]+", " ", text, flags=re.IGNORECASE)
+    text = nonsense_characters_regex.sub(" ", text)
     #add space between two emojis thanks to https://stackoverflow.com/questions/69423621/how-to-put-spaces-in-between-every-emojis
-    text = ''.join((' '+c+' ') if c in emoji.EMOJI_DATA else c for c in text)
+    text = emoji_regex.sub(" \\g<0> ", text)
     return text
 
-def process_files_list_chunk_for_stanza(files: list, nlp, dir_out: str, dir_constituency: str, extended_constituency: bool = False) -> None:
-    """Gets files list chunk from tag_stanford_stanza and tags with stanza nlp client and writes to dir out
+split_document_boundaries = [re.compile(r"\n\s*\n"), re.compile(r"\s*\n\s*"), re.compile(r"(?<=[.!?])\s+")] # paragraph, line and sentence ends, in order of preference
 
+def split_document (text: str, max_words: int) -> list:
+    """Cuts a document longer than max_words words into pieces of at most max_words words, each piece ending at the last paragraph boundary
+    that fits, or else at the last line break or sentence end (a piece with a sentence longer than max_words is cut at the first boundary after it)
+    The text within a piece is left as it is, so that stanza finds the same sentences as in the whole document except at the ends of pieces.
     Args:
-        files (list): list of files which needs tobe tagged
+        text (str): preprocessed document
+        max_words (int): maximum number of words (separated by whitespace) per piece
+    Returns:
+        pieces (list): list of pieces of text, in document order
+    """
+    word_starts = [match.start() for match in re.finditer(r"\S+", text)]
+    if len(word_starts) <= max_words:
+        return [text]
+    boundaries = [[match.span() for match in regex.finditer(text)] for regex in split_document_boundaries]
+    boundary_ends = [[end for start, end in spans] for spans in boundaries]
+    pieces = []
+    piece_start = 0
+    first_word = 0
+    while len(word_starts) - first_word > max_words:
+        limit = word_starts[first_word + max_words] # start of the first word that does not fit into the piece
+        cut = None
+        for spans, ends in zip(boundaries, boundary_ends):
+            i = bisect.bisect_right(ends, limit) - 1
+            if i >= 0 and spans[i][0] > word_starts[first_word]:
+                cut = spans[i]
+                break
+        if cut is None: # no boundary within max_words words: cut at the first one after them
+            following = [spans[i] for spans, ends in zip(boundaries, boundary_ends) for i in [bisect.bisect_right(ends, limit)] if i < len(spans)]
+            if not following:
+                break
+            cut = min(following)
+        pieces.append(text[piece_start:cut[0]])
+        piece_start = cut[1]
+        first_word = bisect.bisect_left(word_starts, piece_start)
+    pieces.append(text[piece_start:])
+    return pieces
+
+# POS CACHE
+# With a POS cache folder (--pos_cache), the output of stanza for every document is stored under a key that hashes the preprocessed text
+# together with the stanza version and processors (and --pos_batch_tokens for documents long enough to be cut into pieces), so that a document that was already tagged, in this corpus or any other, is not tagged again.
+# Each entry is a JSON file <key[:2]>/<key>.json with the tagged sentences and their constituency trees.
+
+def get_stanza_tagging_layers (extended_constituency: bool = False, selective_parsing: bool = False) -> str:
+    """Returns the stanza processors used by the MFTE
+    Args:
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        selective_parsing (bool, optional): parse candidate sentences only (see SELECTIVE PARSING). Defaults to False.
+    Returns:
+        tagging_layers (str): stanza processors, with selective_parsing_layer in place of constituency for selective parsing
+    """
+    if extended_constituency and selective_parsing:
+        return 'tokenize,pos,' + selective_parsing_layer
+    if extended_constituency:
+        return 'tokenize,pos,constituency'
+    return 'tokenize,pos'
+
+def get_pos_cache_key (text: str, tagging_layers: str, pos_batch_tokens: int = 20000) -> str:
+    """Returns the POS cache key of a preprocessed document
+    Args:
+        text (str): preprocessed document
+        tagging_layers (str): stanza processors
+        pos_batch_tokens (int, optional): maximum number of words per piece, see split_document. Defaults to 20000.
+    Returns:
+        key (str): SHA-256 hex digest of the stanza version, the processors and the text, and of pos_batch_tokens if the document is cut into pieces
+    """
+    parts = [stanza.__version__, tagging_layers, text]
+    if len(text.split()) > pos_batch_tokens: # stanza's sentences and tags at the ends of the pieces depend on where the document is cut
+        parts.append("pos_batch_tokens=" + str(pos_batch_tokens))
+    return hashlib.sha256("\0".join(parts).encode('utf-8')).hexdigest()
+
+def get_pos_cache_path (pos_cache: str, key: str) -> str:
+    """Returns the path of a POS cache entry
+    Args:
+        pos_cache (str): POS cache folder
+        key (str): key from get_pos_cache_key
+    Returns:
+        path (str): path of the entry
+    """
+    return os.path.join(pos_cache, key[:2], key + ".json")
+
+def read_pos_cache (pos_cache: str, key: str):
+    """Reads a POS cache entry
+    Args:
+        pos_cache (str): POS cache folder
+        key (str): key from get_pos_cache_key
+    Returns:
+        sentences (list), constituency_trees (list): the cached output, or None if there is no readable entry for key
+    """
+    try:
+        with open(file=get_pos_cache_path(pos_cache, key), encoding='utf-8') as f:
+            entry = json.load(f)
+        return entry['sentences'], entry['constituency_trees']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_pos_cache (pos_cache: str, key: str, sentences: list, constituency_trees: list) -> None:
+    """Writes a POS cache entry; the entry is written to a temporary file first and then renamed, so that worker processes never read a partial entry
+    Args:
+        pos_cache (str): POS cache folder
+        key (str): key from get_pos_cache_key
+        sentences (list): tagged sentences
+        constituency_trees (list): constituency trees of the sentences
+    """
+    path = get_pos_cache_path(pos_cache, key)
+    Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+    temp_path = path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+    with open(file=temp_path, encoding='utf-8', mode='w') as f:
+        json.dump({'sentences': sentences, 'constituency_trees': constituency_trees}, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+# SENTENCE CACHE
+# Corpora of short texts (SMS, tweets...) repeat the same sentences and boilerplate lines again and again. With a sentence cache
+# (--pos_sentence_cache), documents are only tokenized and split into sentences by stanza, and only the sentences that are not in the cache
+# go through the POS tagger (and the constituency parser); the stanza POS tagger and constituency parser look at one sentence at a time.
+# The cache keeps the most recently used sentences up to its size. With a POS cache folder, it is also saved there at the end of a run and
+# loaded at the start of the next one (stanza worker processes only load it).
+sentence_caches = {}
+
+class SentenceCache:
+    """Least recently used memo of the stanza output of sentences, keyed by their words
+    Args:
+        max_size (int): maximum number of sentences kept; the least recently used ones are evicted first
+    """
+    def __init__ (self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get (self, key: str):
+        """Returns the cached (tagged sentence, constituency tree) of key, or None
+        Args:
+            key (str): words of the sentence joined by get_sentence_cache_key
+        """
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put (self, key: str, value: tuple) -> None:
+        """Stores (tagged sentence, constituency tree) for key and evicts the least recently used sentences above max_size
+        Args:
+            key (str): words of the sentence joined by get_sentence_cache_key
+            value (tuple): tagged sentence as a "word_XPOS" string and its constituency tree ("" without constituency parsing)
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def load (self, path: str) -> None:
+        """Loads the sentences saved by save, if the file exists
+        Args:
+            path (str): path of the JSON file
+        """
+        try:
+            with open(file=path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, tagged_sentence, constituency_tree in entries: # from the least to the most recently used
+            self.put(key, (tagged_sentence, constituency_tree))
+
+    def save (self, path: str) -> None:
+        """Saves the sentences from the least to the most recently used, through a temporary file
+        Args:
+            path (str): path of the JSON file
+        """
+        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+        temp_path = path + "." + str(os.getpid()) + ".tmp"
+        with open(file=temp_path, encoding='utf-8', mode='w') as f:
+            json.dump([[key, value[0], value[1]] for key, value in self.entries.items()], f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+def get_sentence_cache_key (words: list) -> str:
+    """Returns the sentence cache key of a tokenized sentence
+    Args:
+        words (list): words of the sentence
+    Returns:
+        key (str): words joined by the unit separator character
+    """
+    return "\x1f".join(words)
+
+def get_sentence_cache_path (pos_cache: str, tagging_layers: str) -> str:
+    """Returns the path of the saved sentence cache in a POS cache folder, one per stanza version and processors
+    Args:
+        pos_cache (str): POS cache folder
+        tagging_layers (str): stanza processors
+    Returns:
+        path (str): path of the JSON file
+    """
+    return os.path.join(pos_cache, "sentences_" + hashlib.sha256("\0".join([stanza.__version__, tagging_layers]).encode('utf-8')).hexdigest()[:16] + ".json")
+
+def get_sentence_cache (tagging_layers: str, max_size: int, pos_cache: str = None) -> SentenceCache:
+    """Returns the sentence cache of this process for the given processors, creating it on first use (loaded from pos_cache if there is one)
+    Args:
+        tagging_layers (str): stanza processors
+        max_size (int): maximum number of sentences
+        pos_cache (str, optional): POS cache folder. Defaults to None.
+    Returns:
+        sentence_cache (SentenceCache): sentence cache
+    """
+    try:
+        sentence_cache = sentence_caches[tagging_layers]
+        sentence_cache.max_size = max_size
+    except KeyError:
+        sentence_cache = SentenceCache(max_size)
+        if pos_cache is not None:
+            sentence_cache.load(get_sentence_cache_path(pos_cache, tagging_layers))
+        sentence_caches[tagging_layers] = sentence_cache
+    return sentence_cache
+
+def tag_docs_with_stanza (in_docs: list, nlp, extended_constituency: bool = False, sentence_cache: SentenceCache = None) -> list:
+    """Tags a list of stanza.Document with stanza nlp client, going through the sentence cache if there is one
+    Args:
+        in_docs (list): list of stanza.Document
         nlp: Stanza nlp client
-        dir_out (str): Output directory
-        dir_constituency (str): Output directory for consituency trees if extended_constituency is True
         extended_constituency (bool): Boolean to include or exclude constituency trees
+        sentence_cache (SentenceCache, optional): sentence cache, None to tag whole documents. Defaults to None.
+    Returns:
+        tagged_docs (list): for each document, the list of its sentences as (tagged sentence as a "word_XPOS" string, constituency tree or "")
     """
+    if sentence_cache is None:
+        out_docs = nlp(in_docs) # Call the neural pipeline on this list of documents
+        return [[format_stanza_sentence(sentence, extended_constituency) for sentence in doc.sentences] for doc in out_docs]
+    out_docs = nlp(in_docs, processors='tokenize') # sentences and words only
+    doc_keys = []
+    tagged_sentences = {}
+    missing_sentences = {} # unique sentences that are not in the cache, in order
+    for doc in out_docs:
+        keys = []
+        for sentence in doc.sentences:
+            words = [word.text for word in sentence.words]
+            key = get_sentence_cache_key(words)
+            keys.append(key)
+            if key not in tagged_sentences and key not in missing_sentences:
+                cached = sentence_cache.get(key)
+                if cached is None:
+                    missing_sentences[key] = words
+                else:
+                    tagged_sentences[key] = cached
+        doc_keys.append(keys)
+    if missing_sentences:
+        missing_doc = stanza.Document([[{'id': i + 1, 'text': word} for i, word in enumerate(words)] for words in missing_sentences.values()])
+        missing_doc = nlp(missing_doc, processors=get_stanza_tagging_layers(extended_constituency).replace('tokenize,', '')) # POS tags (and trees) of the new sentences
+        for key, sentence in zip(missing_sentences, missing_doc.sentences):
+            tagged_sentences[key] = format_stanza_sentence(sentence, extended_constituency)
+            sentence_cache.put(key, tagged_sentences[key])
+    return [[tagged_sentences[key] for key in keys] for keys in doc_keys]
+
+def format_stanza_sentence (sentence, extended_constituency: bool = False) -> tuple:
+    """Formats a sentence tagged by stanza for the POS_Tagged and Constituency_Trees files
+    Args:
+        sentence: stanza sentence
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+    Returns:
+        tagged_sentence (str), constituency_tree (str): "word_XPOS" words joined by spaces, and the constituency tree ("" if extended_constituency is False)
+    """
+    words = []
+    for word in sentence.words:
+        words.append(word.text + '_' + word.xpos)
+    s_words = " ".join(words)
+    if extended_constituency:
+        c: stanza.models.constituency.parse_tree.Tree = sentence.constituency
+        return s_words, str(c)
+    return s_words, ""
+
+def read_files_for_stanza (files: list, pos_batch_tokens: int = 20000, extended_constituency: bool = False, pos_cache: str = None, tagging_layers: str = None) -> tuple:
+    """Reads and preprocesses a files list chunk and packs the documents into batches of pieces for stanza
+    Documents longer than pos_batch_tokens words are cut into pieces (see split_document), and the pieces are packed
+    in order into batches of at most pos_batch_tokens words, so that a very long file does not have to be held by the pipeline as a whole.
+    Documents found in the POS cache are not put into the batches.
+    Args:
+        files (list): list of files which needs tobe tagged
+        pos_batch_tokens (int, optional): maximum number of words per piece and per batch of pieces. Defaults to 20000.
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        pos_cache (str, optional): POS cache folder, None to tag every document. Defaults to None.
+        tagging_layers (str, optional): stanza processors of the POS cache keys. Defaults to None, for get_stanza_tagging_layers(extended_constituency).
+    Returns:
+        batches (list): list of batches, each a list of (index of the file in files, text of the piece)
+        cached_files (list): (file, sentences, constituency_trees) of the documents found in the POS cache
+        cache_keys (list): POS cache key of each file (None without POS cache)
+    """
+    if tagging_layers is None:
+        tagging_layers = get_stanza_tagging_layers(extended_constituency)
     print("Stanza tagger reading files")
     #batch processing of documents, 1st list of documents
     documents = [open(file=file, encoding='utf-8', errors="ignore").read() for file in files]
     print("Stanza tagger pre processing files")
     documents = [stanza_pre_processing(text) for text in documents] #Apply preprocessing
-    in_docs = [stanza.Document([], text=d) for d in documents] # Wrap each document with a stanza.Document object
+    cached_files = []
+    cache_keys = [None] * len(files)
+    batches = []
+    batch_words = 0
+    for index, d in enumerate(documents):
+        if pos_cache is not None:
+            cache_keys[index] = get_pos_cache_key(d, tagging_layers, pos_batch_tokens)
+            cached = read_pos_cache(pos_cache, cache_keys[index])
+            if cached is not None:
+                print("Stanza tagger found in the POS cache:", files[index])
+                cached_files.append((files[index], cached[0], cached[1]))
+                continue
+        for piece in split_document(d, pos_batch_tokens):
+            piece_words = len(piece.split())
+            if len(batches) == 0 or (batches[-1] and batch_words + piece_words > pos_batch_tokens):
+                batches.append([])
+                batch_words = 0
+            batches[-1].append((index, piece))
+            batch_words += piece_words
+    return batches, cached_files, cache_keys
+
+def tag_batches_with_stanza (files: list, batches: list, nlp, extended_constituency: bool = False, cache_keys: list = None, pos_cache: str = None, sentence_cache: SentenceCache = None) -> Iterator[tuple]:
+    """Tags the batches of pieces from read_files_for_stanza with stanza nlp client and yields each file as soon as all its pieces are tagged
+    The sentences of the pieces are put back together in order, and stored in the POS cache if there is one.
+    Args:
+        files (list): list of files, as given to read_files_for_stanza
+        batches (list): batches of pieces returned by read_files_for_stanza
+        nlp: Stanza nlp client
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        cache_keys (list, optional): POS cache keys returned by read_files_for_stanza. Defaults to None.
+        pos_cache (str, optional): POS cache folder, None to store nothing. Defaults to None.
+        sentence_cache (SentenceCache, optional): sentence cache (see SENTENCE CACHE), None to tag whole documents. Defaults to None.
+    Yields:
+        file (str), sentences (list), constituency_trees (list): tagged sentences as "word_XPOS" strings and their constituency trees (empty if extended_constituency is False)
+    """
+    n_pieces_left = collections.Counter([index for batch in batches for index, piece in batch])
+    s_lists = [list() for file in files]
+    constituency_lists = [list() for file in files]
     print("Stanza tagger tagging files")
-    out_docs = nlp(in_docs) # Call the neural pipeline on this list of documents
-    for index, doc in enumerate(out_docs):
-        #text = open(file=file, encoding='utf-8', errors="ignore").read()
-        file = files[index]
-        file_name = os.path.basename(file)
-        print("Stanza tagger processed:", file)
-        #Apply preprocessing
-        #text = stanza_pre_processing (text)
-        #doc = nlp(text)
-        s_list = list()
-        for sentence in doc.sentences:
-            words = []
-            for word in sentence.words:
-                words.append(word.text + '_' + word.xpos)
-            s_words = " ".join(words)
-            s_list.append(s_words)
-        s = "\n".join(s_list)
-        with open(file=dir_out+file_name, encoding='utf-8', mode='w') as f:
-            f.write(s)
-        #############################
-        ####write constituency trees#
-        #############################
-        if extended_constituency:
-            sentences_to_write = []
-            for sentence in doc.sentences:
-                c: stanza.models.constituency.parse_tree.Tree = sentence.constituency
-                sentences_to_write.append(str(c))
-            s = "\n".join(sentences_to_write)
-            with open(file=dir_constituency+file_name, encoding='utf-8', mode='w') as f:
-                f.write(s)
-
-
-def tag_stanford_stanza (dir_in: str, dir_out: str, dir_constituency: str, extended_constituency: bool = False) -> None:
-    """Tags text files in dir_in with stanza nlp client and writes to dir_out
+    for batch in batches:
+        in_docs = [stanza.Document([], text=piece) for index, piece in batch] # Wrap each piece with a stanza.Document object
+        tagged_docs = tag_docs_with_stanza(in_docs, nlp, extended_constituency, sentence_cache)
+        for (index, piece), tagged_doc in zip(batch, tagged_docs):
+            for s_words, constituency_tree in tagged_doc:
+                s_lists[index].append(s_words)
+                if extended_constituency:
+                    constituency_lists[index].append(constituency_tree)
+            n_pieces_left[index] -= 1
+            if n_pieces_left[index] == 0: # all pieces of the file are tagged
+                if pos_cache is not None:
+                    write_pos_cache(pos_cache, cache_keys[index], s_lists[index], constituency_lists[index])
+                yield files[index], s_lists[index], constituency_lists[index]
+                s_lists[index] = None
+                constituency_lists[index] = None
+
+def write_stanza_tagged_file (file: str, sentences: list, constituency_trees: list, dir_out: str, dir_constituency: str, extended_constituency: bool = False, tree_format: str = "text") -> None:
+    """Writes a file tagged by tag_batches_with_stanza to dir_out, and its constituency trees to dir_constituency if extended_constituency is True
     Args:
-        dir_in (str): dir with plain text files to be tagged
-        dir_out (str): dir to write Stanford Tagger tagged files
-        extended_constituency (bool): enable constituency tree based tagging
+        file (str): path of the input file
+        sentences (list): tagged sentences
+        constituency_trees (list): constituency trees of the sentences
+        dir_out (str): Output directory
+        dir_constituency (str): Output directory for consituency trees
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
     """
+    file_name = os.path.basename(file)
+    s = "\n".join(sentences)
+    with open(file=dir_out+file_name, encoding='utf-8', mode='w') as f:
+        f.write(s)
+    #############################
+    ####write constituency trees#
+    #############################
     if extended_constituency:
-        tagging_layers = 'tokenize,pos,constituency'
-        Path(dir_constituency).mkdir(parents=True, exist_ok=True)
-    else:
-        tagging_layers = 'tokenize,pos'
-    Path(dir_out).mkdir(parents=True, exist_ok=True)   
-    #text = open(dir+"corpus\BD-CMT274.txt").read()
-    files = glob.glob(os.path.join(dir_in,"*.txt"))
-    #check if file already exists
-    files = check_already_tagged_files_stanza(files, dir_out, dir_constituency, extended_constituency)
-    if os.path.exists(currentdir+"/stanza_resources"):
-        nlp = stanza.Pipeline('en', processors=tagging_layers, model_dir=currentdir+"/stanza_resources", download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False, use_gpu=True)
-        nlp1 = stanza.Pipeline('en', processors=tagging_layers, model_dir=currentdir+"/stanza_resources", download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False)
+        write_constituency_trees(file_name, constituency_trees, dir_constituency, tree_format)
+    print("Stanza tagger processed:", file)
+
+def write_constituency_trees (file_name: str, constituency_trees: list, dir_constituency: str, tree_format: str = "text") -> None:
+    """Writes the constituency trees of a file to dir_constituency, one per line, and in binary format as well if tree_format is "binary"
+    Args:
+        file_name (str): name of the file
+        constituency_trees (list): constituency trees of the sentences
+        dir_constituency (str): Output directory for consituency trees
+        tree_format (str, optional): "text" or "binary" (see BINARY TREES in Constituency_tags). Defaults to "text".
+    """
+    s = "\n".join(constituency_trees)
+    with open(file=dir_constituency+file_name, encoding='utf-8', mode='w') as f:
+        f.write(s)
+    if tree_format == "binary":
+        Constituency_tags.write_binary_trees(dir_constituency+file_name, s)
     else:
-        nlp = stanza.Pipeline('en', processors=tagging_layers, download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False, use_gpu=True)
-        nlp1 = stanza.Pipeline('en', processors=tagging_layers, download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False, use_gpu=False)
-    n = 10
-    if len(files) > 0:
-        files_list_of_lists = [files[i:i+n] for i in range(0,len(files),n)]
-        for index, files_chunk in enumerate(files_list_of_lists):
-            print("The corpus contains more than", str(n), "files and will therefore be divided into chunks of", str(n), "files to speed up the tagging process.\nProcessing file chunk number", index+1, "of", len(files_list_of_lists))
+        Constituency_tags.remove_binary_trees(dir_constituency+file_name) # left by a previous run in binary format, it would be read instead of the new text
+
+def process_files_list_chunk_for_stanza(files: list, nlp, dir_out: str, dir_constituency: str, extended_constituency: bool = False, pos_batch_tokens: int = 20000, pos_cache: str = None, sentence_cache: SentenceCache = None, tree_format: str = "text", tagging_layers: str = None) -> None:
+    """Gets files list chunk from tag_stanford_stanza and tags with stanza nlp client and writes to dir out
+    Reading, tagging and writing are done one after the other, see tag_stanford_stanza_pipelined for the version that overlaps them.
+
+    Args:
+        files (list): list of files which needs tobe tagged
+        nlp: Stanza nlp client
+        dir_out (str): Output directory
+        dir_constituency (str): Output directory for consituency trees if extended_constituency is True
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        pos_batch_tokens (int, optional): maximum number of words per piece and per batch of pieces, see read_files_for_stanza. Defaults to 20000.
+        pos_cache (str, optional): POS cache folder (see POS CACHE), None to tag every document. Defaults to None.
+        sentence_cache (SentenceCache, optional): sentence cache (see SENTENCE CACHE), None to tag whole documents. Defaults to None.
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
+        tagging_layers (str, optional): stanza processors of nlp, for the POS cache keys. Defaults to None, for get_stanza_tagging_layers(extended_constituency).
+    """
+    batches, cached_files, cache_keys = read_files_for_stanza(files, pos_batch_tokens, extended_constituency, pos_cache, tagging_layers)
+    for file, sentences, constituency_trees in cached_files:
+        write_stanza_tagged_file(file, sentences, constituency_trees, dir_out, dir_constituency, extended_constituency, tree_format)
+    for file, sentences, constituency_trees in tag_batches_with_stanza(files, batches, nlp, extended_constituency, cache_keys, pos_cache, sentence_cache):
+        write_stanza_tagged_file(file, sentences, constituency_trees, dir_out, dir_constituency, extended_constituency, tree_format)
+
+# STANZA PIPELINE THREADS
+# In tag_stanford_stanza, a reader thread reads and preprocesses the next files chunks while the current one is tagged,
+# and a writer thread writes the tagged files, so that the model does not wait for the disk or for preprocessing.
+# The queue between the reader and the model is bounded, so at most stanza_read_ahead chunks are held in memory ahead of the model.
+stanza_read_ahead = 2
+
+def read_stanza_chunks (files_list_of_lists: list, pos_batch_tokens: int, read_queue: queue.Queue, extended_constituency: bool = False, pos_cache: str = None, tagging_layers: str = None) -> None:
+    """Reader thread: puts (files chunk, output of read_files_for_stanza) on read_queue for every files chunk, then None
+    The output is None if the chunk could not be read, so that it is retried file by file by the consumer.
+    Args:
+        files_list_of_lists (list): files chunks from get_stanza_batches
+        pos_batch_tokens (int): maximum number of words per piece and per batch of pieces, see read_files_for_stanza
+        read_queue (queue.Queue): queue to the thread running the model
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        pos_cache (str, optional): POS cache folder, None to tag every document. Defaults to None.
+        tagging_layers (str, optional): stanza processors of the POS cache keys. Defaults to None, for get_stanza_tagging_layers(extended_constituency).
+    """
+    for files_chunk in files_list_of_lists:
+        try:
+            chunk = read_files_for_stanza(files_chunk, pos_batch_tokens, extended_constituency, pos_cache, tagging_layers)
+        except Exception:
+            traceback.print_exc()
+            chunk = None
+        read_queue.put((files_chunk, chunk))
+    read_queue.put(None)
+
+def write_stanza_files (write_queue: queue.Queue, dir_out: str, dir_constituency: str, extended_constituency: bool = False, tree_format: str = "text") -> None:
+    """Writer thread: writes the (file, sentences, constituency trees) taken from write_queue until it gets None
+    Args:
+        write_queue (queue.Queue): queue from the thread running the model
+        dir_out (str): Output directory
+        dir_constituency (str): Output directory for consituency trees
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        file, sentences, constituency_trees = item
+        try:
+            write_stanza_tagged_file(file, sentences, constituency_trees, dir_out, dir_constituency, extended_constituency, tree_format)
+        except Exception:
+            traceback.print_exc()
+            print("Could not write", file)
+
+def tag_stanford_stanza_pipelined (files_list_of_lists: list, dir_out: str, dir_constituency: str, tagging_layers: str, extended_constituency: bool = False, pos_batch_tokens: int = 20000, pos_cache: str = None, sentence_cache: SentenceCache = None, tree_format: str = "text") -> None:
+    """Tags the files chunks with the stanza pipeline of this process, reading the next chunks and writing the tagged files in two threads meanwhile
+    If a chunk fails, its files that are not tagged yet are tagged one by one, falling back to the CPU on further errors.
+    Args:
+        files_list_of_lists (list): files chunks from get_stanza_batches
+        dir_out (str): Output directory
+        dir_constituency (str): Output directory for consituency trees
+        tagging_layers (str): stanza processors, e.g. 'tokenize,pos'
+        extended_constituency (bool): Boolean to include or exclude constituency trees
+        pos_batch_tokens (int): maximum number of words per piece and per batch of pieces, see read_files_for_stanza
+        pos_cache (str, optional): POS cache folder (see POS CACHE), None to tag every document. Defaults to None.
+        sentence_cache (SentenceCache, optional): sentence cache (see SENTENCE CACHE), None to tag whole documents. Defaults to None.
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
+    """
+    read_queue = queue.Queue(maxsize=stanza_read_ahead)
+    write_queue = queue.Queue()
+    reader = threading.Thread(target=read_stanza_chunks, args=(files_list_of_lists, pos_batch_tokens, read_queue, extended_constituency, pos_cache, tagging_layers), daemon=True)
+    writer = threading.Thread(target=write_stanza_files, args=(write_queue, dir_out, dir_constituency, extended_constituency, tree_format), daemon=True)
+    reader.start()
+    writer.start()
+    try:
+        index = 0
+        while True:
+            item = read_queue.get()
+            if item is None:
+                break
+            files_chunk, chunk = item
+            index += 1
+            print("The corpus is divided into batches of up to", pos_batch_tokens, "words to speed up the tagging process.\nProcessing file chunk number", index, "of", len(files_list_of_lists))
+            tagged_files = set()
             try:
-                process_files_list_chunk_for_stanza(files_chunk, nlp, dir_out, dir_constituency, extended_constituency)
+                if chunk is None:
+                    raise ValueError("files chunk could not be read")
+                batches, cached_files, cache_keys = chunk
+                for file, sentences, constituency_trees in cached_files:
+                    write_queue.put((file, sentences, constituency_trees))
+                    tagged_files.add(file)
+                for file, sentences, constituency_trees in tag_batches_with_stanza(files_chunk, batches, get_stanza_pipeline(tagging_layers), extended_constituency, cache_keys, pos_cache, sentence_cache):
+                    write_queue.put((file, sentences, constituency_trees))
+                    tagged_files.add(file)
             except Exception:
                 traceback.print_exc()
                 print('tagging files one by one in this batch')
                 for t_file in files_chunk:
+                    if t_file in tagged_files:
+                        continue
                     t_file_chunk = [t_file]
                     try:
-                        process_files_list_chunk_for_stanza(t_file_chunk, nlp, dir_out, dir_constituency, extended_constituency)
+                        process_files_list_chunk_for_stanza(t_file_chunk, get_stanza_pipeline(tagging_layers), dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, sentence_cache, tree_format, tagging_layers)
                     except Exception:
                         traceback.print_exc()
                         print("Fallling back to CPU due to further error.")
-                        process_files_list_chunk_for_stanza(t_file_chunk, nlp1, dir_out, dir_constituency, extended_constituency)
+                        process_files_list_chunk_for_stanza(t_file_chunk, get_stanza_pipeline(tagging_layers, use_gpu=False), dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, sentence_cache, tree_format, tagging_layers)
+    finally:
+        write_queue.put(None) # the tagged files so far are written even if tagging stops
+        writer.join()
+
+# SELECTIVE PARSING
+# On the CPU the constituency parser takes most of the time of the stanza pipeline, but the rules of Constituency_tags only fire on sentences
+# with a VBG or VBN (participial and relative clauses, attributive participles), a CC (coordination) or a WH word after a preposition (pied-piping).
+# With --selective_parsing, every sentence is tokenized and POS-tagged, but only these candidate sentences go through the constituency parser.
+# The other sentences get a flat tree (ROOT (X (tag word) ...)) on which no rule fires, so the constituency based tags are the same as with full parsing
+# and the trees still line up with the sentences of the POS_Tagged files.
+selective_parsing_layer = 'selective_constituency' # stands for the constituency processor in tagging layers
+constituency_trigger_tags = {'VBG', 'VBN', 'CC'}
+wh_word_regex = re.compile('^(who|whom|whose|which|when|why|how|what)$', re.IGNORECASE) # WH words of Constituency_tags pied-piping rule
+
+def is_constituency_candidate (words: list) -> bool:
+    """Returns True if a POS-tagged sentence has the tags or words on which the rules of Constituency_tags can fire
+    Args:
+        words (list): stanza words of the sentence
+    Returns:
+        bool: True if the sentence has to be parsed
+    """
+    after_preposition = False
+    for word in words:
+        if word.xpos in constituency_trigger_tags:
+            return True
+        if after_preposition and wh_word_regex.search(word.text):
+            return True
+        if word.xpos == 'IN':
+            after_preposition = True
+    return False
+
+def get_flat_tree (words: list) -> stanza.models.constituency.parse_tree.Tree:
+    """Returns the tree given to sentences that are not parsed
+    Args:
+        words (list): stanza words of the sentence
+    Returns:
+        tree (stanza.models.constituency.parse_tree.Tree): (ROOT (X (tag word) ...))
+    """
+    Tree = stanza.models.constituency.parse_tree.Tree
+    return Tree('ROOT', [Tree('X', [Tree(word.xpos, [Tree(word.text)]) for word in words])])
+
+class SelectiveParsingPipeline:
+    """Wraps a stanza pipeline with the tokenize, pos and constituency processors so that only candidate sentences are parsed
+    Args:
+        nlp (stanza.Pipeline): stanza pipeline
+    """
+    def __init__ (self, nlp: stanza.Pipeline):
+        self.nlp = nlp
+        self.parsed = 0
+        self.skipped = 0
+
+    def __call__ (self, docs, processors: str = None):
+        """Runs the pipeline like stanza.Pipeline, the constituency processor on candidate sentences only
+        Args:
+            docs: stanza.Document or list of stanza.Document
+            processors (str, optional): comma separated processors to run. Defaults to None, for all processors.
+        Returns:
+            docs: tagged stanza.Document or list of stanza.Document
+        """
+        processors = ['tokenize', 'pos', 'constituency'] if processors is None else processors.split(',')
+        if 'constituency' not in processors:
+            return self.nlp(docs, processors=','.join(processors))
+        other_processors = [processor for processor in processors if processor != 'constituency']
+        if other_processors:
+            docs = self.nlp(docs, processors=','.join(other_processors))
+        candidates = []
+        for doc in (docs if isinstance(docs, list) else [docs]):
+            for sentence in doc.sentences:
+                if is_constituency_candidate(sentence.words):
+                    candidates.append(sentence)
+                else:
+                    sentence.constituency = get_flat_tree(sentence.words)
+        if candidates:
+            candidates_doc = stanza.Document([[{key: value for key, value in (('id', i + 1), ('text', word.text), ('upos', word.upos), ('xpos', word.xpos)) if value is not None} for i, word in enumerate(sentence.words)] for sentence in candidates])
+            candidates_doc = self.nlp(candidates_doc, processors='constituency')
+            for sentence, parsed_sentence in zip(candidates, candidates_doc.sentences):
+                sentence.constituency = parsed_sentence.constituency
+        self.parsed += len(candidates)
+        self.skipped += sum(len(doc.sentences) for doc in (docs if isinstance(docs, list) else [docs])) - len(candidates)
+        return docs
+
+# STANZA PIPELINES
+# Loading a pipeline takes a while and holds the models in memory, so pipelines are only built when first needed (e.g. the CPU pipeline
+# only after the GPU pipeline has failed) and are then kept for the lifetime of the process, so that repeated runs from the GUI reuse them.
+stanza_pipelines = {}
+
+def get_stanza_pipeline (tagging_layers: str, use_gpu: bool = True) -> stanza.Pipeline:
+    """Returns the stanza pipeline for the given processors and device, building it on first use
+    Args:
+        tagging_layers (str): stanza processors, e.g. 'tokenize,pos', or 'constituency' alone for a parser of POS-tagged sentences
+        use_gpu (bool, optional): run on the GPU if there is one. Defaults to True.
+    Returns:
+        nlp (stanza.Pipeline): cached pipeline, wrapped in a SelectiveParsingPipeline if tagging_layers has selective_parsing_layer
+    """
+    import torch
+    device = "cuda" if use_gpu and torch.cuda.is_available() else "cpu" # without a GPU, the GPU and CPU pipelines are the same
+    try:
+        return stanza_pipelines[tagging_layers, device]
+    except KeyError:
+        processors = tagging_layers.replace(selective_parsing_layer, 'constituency')
+        options = {'constituency_pretagged': True} if processors == 'constituency' else {} # parser only, for sentences that are already POS-tagged
+        if os.path.exists(currentdir+"/stanza_resources"):
+            nlp = stanza.Pipeline('en', processors=processors, model_dir=currentdir+"/stanza_resources", download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False, use_gpu=(device == "cuda"), **options)
+        else:
+            nlp = stanza.Pipeline('en', processors=processors, download_method=stanza.pipeline.core.DownloadMethod.REUSE_RESOURCES, logging_level='WARN', verbose=False, use_gpu=(device == "cuda"), **options)
+        if processors != tagging_layers:
+            nlp = SelectiveParsingPipeline(nlp)
+        stanza_pipelines[tagging_layers, device] = nlp
+        return nlp
+
+def get_selective_parsing_counts (tagging_layers: str) -> tuple:
+    """Returns how many sentences the selective parsing pipelines of this process have parsed and skipped so far
+    Args:
+        tagging_layers (str): stanza processors, e.g. 'tokenize,pos,selective_constituency'
+    Returns:
+        parsed (int), skipped (int): numbers of sentences, over the GPU and CPU pipelines
+    """
+    pipelines = [nlp for (layers, device), nlp in stanza_pipelines.items() if layers == tagging_layers and isinstance(nlp, SelectiveParsingPipeline)]
+    return sum(nlp.parsed for nlp in pipelines), sum(nlp.skipped for nlp in pipelines)
+
+stanza_batch_bytes_per_word = 6 # average size of an English word with the whitespace after it, in UTF-8 bytes
+
+def get_stanza_batches (files: list, pos_batch_tokens: int = 20000) -> list:
+    """Packs files into batches of at most pos_batch_tokens words (a file longer than that makes a batch of its own), replacing fixed chunks of 10 files
+    Files are sorted by length first, longest first, so that every batch holds documents of similar length, which keeps padding in stanza's models low,
+    and the heaviest batches are tagged first.
+    The number of words of a file is estimated from its size on disk, so that files are only read once, when they are tagged.
+    Args:
+        files (list): list of files to be tagged
+        pos_batch_tokens (int, optional): maximum number of words (separated by whitespace before stanza tokenization) per batch. Defaults to 20000.
+    Returns:
+        batches (list): list of lists of files
+    """
+    n_words = {file: os.path.getsize(file) // stanza_batch_bytes_per_word for file in files}
+    batches = []
+    batch = []
+    batch_words = 0
+    for file in sorted(files, key=n_words.get, reverse=True):
+        if batch and batch_words + n_words[file] > pos_batch_tokens:
+            batches.append(batch)
+            batch = []
+            batch_words = 0
+        batch.append(file)
+        batch_words += n_words[file]
+    if batch:
+        batches.append(batch)
+    return batches
+
+# STANZA WORKERS
+# On machines without a GPU one stanza pipeline keeps a single process busy while the other cores sit idle.
+# With pos_workers > 1, tag_stanford_stanza starts that many worker processes instead; each loads the pipeline once on the CPU,
+# with torch limited to its share of the cores, and is then fed chunks of files from the pool's task queue until all files are tagged.
+stanza_worker_nlp = None # pipeline of the current stanza worker process
+stanza_worker_sentence_cache = None # sentence cache of the current stanza worker process
+stanza_worker_tagging_layers = None # stanza processors of the pipeline of the current stanza worker process
+
+def init_stanza_worker (tagging_layers: str, torch_threads: int, pos_sentence_cache: int = 0, pos_cache: str = None) -> None:
+    """Pool initializer of the stanza workers: loads the CPU pipeline once per worker process
+    Args:
+        tagging_layers (str): stanza processors, e.g. 'tokenize,pos'
+        torch_threads (int): number of threads torch may use in this worker
+        pos_sentence_cache (int, optional): size of the sentence cache of the worker (see SENTENCE CACHE), 0 for none. Defaults to 0.
+        pos_cache (str, optional): POS cache folder from which the sentence cache is loaded. Defaults to None.
+    """
+    global stanza_worker_nlp, stanza_worker_sentence_cache, stanza_worker_tagging_layers
+    import torch
+    torch.set_num_threads(torch_threads)
+    stanza_worker_nlp = get_stanza_pipeline(tagging_layers, use_gpu=False)
+    stanza_worker_tagging_layers = tagging_layers
+    if pos_sentence_cache > 0:
+        stanza_worker_sentence_cache = get_sentence_cache(tagging_layers, pos_sentence_cache, pos_cache)
+
+def process_files_list_chunk_in_stanza_worker (chunk_with_dirs: tuple) -> str:
+    """Tags a chunk of files with the pipeline of the current stanza worker, file by file if the chunk as a whole fails
+    Args:
+        chunk_with_dirs (tuple): files chunk, dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache and tree_format, as for process_files_list_chunk_for_stanza
+    Returns:
+        str: message for the progress output
+    """
+    files_chunk, dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, tree_format = chunk_with_dirs
+    try:
+        process_files_list_chunk_for_stanza(files_chunk, stanza_worker_nlp, dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, stanza_worker_sentence_cache, tree_format, stanza_worker_tagging_layers)
+    except Exception:
+        traceback.print_exc()
+        print('tagging files one by one in this batch')
+        for t_file in files_chunk:
+            try:
+                process_files_list_chunk_for_stanza([t_file], stanza_worker_nlp, dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, stanza_worker_sentence_cache, tree_format, stanza_worker_tagging_layers)
+            except Exception:
+                traceback.print_exc()
+                print("Could not tag:", t_file)
+    return "Stanza tagger processed chunk of " + str(len(files_chunk)) + " files"
+
+def tag_stanford_stanza_parallel (files: list, dir_out: str, dir_constituency: str, tagging_layers: str, extended_constituency: bool = False, pos_workers: int = 2, pos_batch_tokens: int = 20000, pos_cache: str = None, pos_sentence_cache: int = 0, tree_format: str = "text") -> None:
+    """Tags files on the CPU with a pool of stanza worker processes (see STANZA WORKERS)
+    Args:
+        files (list): list of files to be tagged
+        dir_out (str): dir to write Stanford Tagger tagged files
+        dir_constituency (str): Output directory for consituency trees if extended_constituency is True
+        tagging_layers (str): stanza processors, e.g. 'tokenize,pos'
+        extended_constituency (bool): enable constituency tree based tagging
+        pos_workers (int): number of worker processes
+        pos_batch_tokens (int): maximum number of words per batch of files, see get_stanza_batches
+        pos_cache (str, optional): POS cache folder (see POS CACHE), None to tag every document. Defaults to None.
+        pos_sentence_cache (int, optional): size of the sentence cache of each worker (see SENTENCE CACHE), 0 for none. Defaults to 0.
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
+    """
+    files_list_of_lists = get_stanza_batches(files, pos_batch_tokens)
+    chunks_with_dirs = [(files_chunk, dir_out, dir_constituency, extended_constituency, pos_batch_tokens, pos_cache, tree_format) for files_chunk in files_list_of_lists]
+    torch_threads = max(1, int(multiprocessing.cpu_count() / pos_workers)) # the workers share the cores instead of each starting one thread per core
+    print("Tagging", len(files), "files in", len(files_list_of_lists), "batches of up to", pos_batch_tokens, "words with", pos_workers, "stanza worker processes")
+    with multiprocessing.Pool(pos_workers, initializer=init_stanza_worker, initargs=(tagging_layers, torch_threads, pos_sentence_cache, pos_cache)) as pool:
+        for s in tqdm.tqdm(pool.imap_unordered(process_files_list_chunk_in_stanza_worker, chunks_with_dirs), total=len(chunks_with_dirs)):
+            print(s)
+
+# CONSTITUENCY WORKERS
+# With parse_workers > 1, tag_stanford_stanza first tags the files with tokenize and pos only (on the GPU or with pos_workers processes),
+# and then parses the tagged sentences of the POS_Tagged files with the constituency parser on the CPU in parse_workers processes.
+# By then torch has run the POS tagger in the main process, whose thread pools must not be forked, so the parsing is done by a parser process
+# started afresh (spawned): it loads a parser-only pipeline (no tokenizer or POS tagger), and forks the workers before the parser has run,
+# so that they share its memory copy-on-write instead of each loading the model. The sentences are sent to the workers in tasks of
+# constituency_task_sentences sentences, and the trees come back in order, so each file of Constituency_Trees is written as soon as all its sentences are parsed.
+# Without fork (Windows), the sentences are parsed in the parser process itself.
+constituency_task_sentences = 200
+constituency_worker_nlp = None # parser of the parser process, inherited by the forked constituency workers
+xpos_to_upos = { # UPOS of the XPOS tags of the POS_Tagged files, for constituency models that read UPOS (the English models read XPOS)
+    'CC': 'CCONJ', 'CD': 'NUM', 'DT': 'DET', 'EX': 'PRON', 'FW': 'X', 'IN': 'ADP', 'JJ': 'ADJ', 'JJR': 'ADJ', 'JJS': 'ADJ', 'LS': 'X', 'MD': 'AUX',
+    'NN': 'NOUN', 'NNS': 'NOUN', 'NNP': 'PROPN', 'NNPS': 'PROPN', 'PDT': 'DET', 'POS': 'PART', 'PRP': 'PRON', 'PRP$': 'PRON', 'RB': 'ADV', 'RBR': 'ADV',
+    'RBS': 'ADV', 'RP': 'ADP', 'SYM': 'SYM', 'TO': 'PART', 'UH': 'INTJ', 'VB': 'VERB', 'VBD': 'VERB', 'VBG': 'VERB', 'VBN': 'VERB', 'VBP': 'VERB',
+    'VBZ': 'VERB', 'WDT': 'PRON', 'WP': 'PRON', 'WP$': 'PRON', 'WRB': 'ADV', '$': 'SYM', '#': 'SYM', ',': 'PUNCT', '.': 'PUNCT', ':': 'PUNCT',
+    '``': 'PUNCT', "''": 'PUNCT', '-LRB-': 'PUNCT', '-RRB-': 'PUNCT', 'HYPH': 'PUNCT', 'NFP': 'PUNCT', 'ADD': 'X', 'AFX': 'ADJ', 'GW': 'X', 'XX': 'X',
+}
+
+def read_pos_tagged_sentences (file: str) -> list:
+    """Returns the sentences of a POS_Tagged file as lists of (word, tag)
+    Words are separated by spaces and end with _TAG; stanza tokens with spaces in them (e.g. "New York_NNP") are put back together.
+    Args:
+        file (str): path of the POS-tagged file
+    Returns:
+        sentences (list): list of lists of (word, tag), without empty lines; the tag is None for trailing text without a tag
+    """
+    text = open(file=file, encoding='utf-8', errors="ignore").read()
+    sentences = []
+    for line in re.split("[\r\n]+", text):
+        if not line:
+            continue
+        sentence = []
+        pieces = []
+        for piece in line.split(' '):
+            pieces.append(piece)
+            if '_' in piece: # last piece of a token
+                word, tag = ' '.join(pieces).rsplit('_', 1)
+                sentence.append((word, tag))
+                pieces = []
+        if pieces:
+            sentence.append((' '.join(pieces), None))
+        sentences.append(sentence)
+    return sentences
+
+def parse_tagged_sentences (sentences: list, nlp) -> tuple:
+    """Parses POS-tagged sentences with the constituency processor of nlp
+    The words get the XPOS tags of the POS_Tagged files, and the UPOS tags that go with them (see xpos_to_upos).
+    Args:
+        sentences (list): list of lists of (word, tag)
+        nlp: stanza pipeline with the constituency processor, or SelectiveParsingPipeline
+    Returns:
+        constituency_trees (list), parsed (int), skipped (int): constituency trees of the sentences, and the numbers of sentences parsed and skipped by selective parsing
+    """
+    if len(sentences) == 0:
+        return [], 0, 0
+    doc = stanza.Document([[{key: value for key, value in (('id', i + 1), ('text', word), ('upos', xpos_to_upos.get(tag, 'X') if tag is not None else None), ('xpos', tag)) if value is not None} for i, (word, tag) in enumerate(sentence)] for sentence in sentences])
+    counts_before = (nlp.parsed, nlp.skipped) if isinstance(nlp, SelectiveParsingPipeline) else (0, 0)
+    doc = nlp(doc, processors='constituency')
+    counts = (nlp.parsed, nlp.skipped) if isinstance(nlp, SelectiveParsingPipeline) else (len(sentences), 0)
+    return [str(sentence.constituency) for sentence in doc.sentences], counts[0] - counts_before[0], counts[1] - counts_before[1]
+
+def init_constituency_worker (torch_threads: int) -> None:
+    """Pool initializer of the constituency workers: limits the threads of torch, the parser is inherited from the parser process
+    Args:
+        torch_threads (int): number of threads torch may use in this worker
+    """
+    import torch
+    torch.set_num_threads(torch_threads)
+
+def parse_in_constituency_worker (sentences: list) -> tuple:
+    """Parses a task of sentences with the parser inherited from the parser process
+    Args:
+        sentences (list): list of lists of (word, tag)
+    Returns:
+        tuple: as parse_tagged_sentences
+    """
+    return parse_tagged_sentences(sentences, constituency_worker_nlp)
 
+def parse_constituency_files (file_names: list, dir_pos: str, dir_constituency: str, parse_layers: str, parse_workers: int = 2, tree_format: str = "text") -> None:
+    """Body of the parser process of parse_constituency_parallel: loads the parser and parses the POS_Tagged files with parse_workers forked workers
+    Args:
+        file_names (list): names of the POS-tagged files in dir_pos
+        dir_pos (str): dir of the POS-tagged files
+        dir_constituency (str): Output directory for consituency trees
+        parse_layers (str): 'constituency', or selective_parsing_layer for selective parsing
+        parse_workers (int, optional): number of worker processes. Defaults to 2.
+        tree_format (str, optional): "text" or "binary" (see BINARY TREES in Constituency_tags). Defaults to "text".
+    """
+    global constituency_worker_nlp
+    sentences = [read_pos_tagged_sentences(dir_pos+file_name) for file_name in file_names]
+    tasks = []
+    task_files = [] # index of the file of each task
+    for index, file_sentences in enumerate(sentences):
+        for start in range(0, max(1, len(file_sentences)), constituency_task_sentences):
+            tasks.append(file_sentences[start:start + constituency_task_sentences])
+            task_files.append(index)
+    constituency_worker_nlp = get_stanza_pipeline(parse_layers, use_gpu=False) # loaded, but not run, before the workers are forked
+    if "fork" in multiprocessing.get_all_start_methods():
+        pool = multiprocessing.get_context("fork").Pool(parse_workers, initializer=init_constituency_worker, initargs=(max(1, int(multiprocessing.cpu_count() / parse_workers)),))
+        results = pool.imap(parse_in_constituency_worker, tasks) # in order
+    else:
+        print("Processes cannot be forked on this system, the constituency trees are parsed in one process")
+        pool = None
+        results = map(parse_in_constituency_worker, tasks)
+    print("Parsing", sum(len(file_sentences) for file_sentences in sentences), "sentences of", len(file_names), "files with", parse_workers if pool is not None else 1, "constituency worker processes")
+    parsed = skipped = 0
+    file_trees = []
+    try:
+        for task_number, (trees, task_parsed, task_skipped) in enumerate(tqdm.tqdm(results, total=len(tasks))):
+            file_trees.extend(trees)
+            parsed += task_parsed
+            skipped += task_skipped
+            if task_number + 1 == len(tasks) or task_files[task_number + 1] != task_files[task_number]: # last task of the file
+                write_constituency_trees(file_names[task_files[task_number]], file_trees, dir_constituency, tree_format)
+                file_trees = []
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    if skipped > 0:
+        print("Selective parsing:", parsed, "sentences parsed,", skipped, "skipped")
+
+def parse_constituency_parallel (files: list, dir_pos: str, dir_constituency: str, tagging_layers: str, parse_workers: int = 2, tree_format: str = "text") -> None:
+    """Parses the POS_Tagged files of files in a spawned parser process with parse_workers forked workers sharing one parser (see CONSTITUENCY WORKERS)
+    Args:
+        files (list): list of input files, whose POS-tagged files are in dir_pos
+        dir_pos (str): dir of the POS-tagged files
+        dir_constituency (str): Output directory for consituency trees
+        tagging_layers (str): stanza processors with the constituency processor, e.g. 'tokenize,pos,constituency'
+        parse_workers (int, optional): number of worker processes. Defaults to 2.
+        tree_format (str, optional): "text" or "binary" (see BINARY TREES in Constituency_tags). Defaults to "text".
+    """
+    file_names = [os.path.basename(file) for file in files if os.path.exists(dir_pos+os.path.basename(file))] # files that could not be POS-tagged are left out
+    parse_layers = selective_parsing_layer if selective_parsing_layer in tagging_layers.split(',') else 'constituency'
+    parser_process = multiprocessing.get_context("spawn").Process(target=parse_constituency_files, args=(file_names, dir_pos, dir_constituency, parse_layers, parse_workers, tree_format))
+    parser_process.start()
+    parser_process.join()
+    if parser_process.exitcode != 0:
+        raise RuntimeError("constituency parser process failed with exit code " + str(parser_process.exitcode))
+
+def tag_stanford_stanza (dir_in: str, dir_out: str, dir_constituency: str, extended_constituency: bool = False, pos_workers: int = 1, pos_batch_tokens: int = 20000, pos_cache: str = None, pos_sentence_cache: int = 0, manifest: dict = None, tree_format: str = "text", selective_parsing: bool = False, parse_workers: int = 1) -> None:
+    """Tags text files in dir_in with stanza nlp client and writes to dir_out
+    Args:
+        dir_in (str): dir with plain text files to be tagged
+        dir_out (str): dir to write Stanford Tagger tagged files
+        extended_constituency (bool): enable constituency tree based tagging
+        pos_workers (int, optional): number of CPU worker processes; with more than 1, files are tagged on the CPU by tag_stanford_stanza_parallel. Defaults to 1.
+        pos_batch_tokens (int, optional): maximum number of words per batch of files, see get_stanza_batches. Defaults to 20000.
+        pos_cache (str, optional): POS cache folder shared between runs and corpora (see POS CACHE), None to tag every document. Defaults to None.
+        pos_sentence_cache (int, optional): maximum number of sentences in the sentence cache (see SENTENCE CACHE), 0 to tag whole documents. Defaults to 0.
+        manifest (dict, optional): build manifest (see BUILD MANIFEST); without it, files are tagged only if their output does not exist yet. Defaults to None.
+        tree_format (str, optional): "text" for bracketed trees only, "binary" to also write them in the binary format of Constituency_tags (see BINARY TREES). Defaults to "text".
+        selective_parsing (bool, optional): with extended_constituency, parse only the sentences on which the constituency rules can fire (see SELECTIVE PARSING). Defaults to False.
+        parse_workers (int, optional): number of CPU worker processes for constituency parsing; with more than 1, sentences are parsed after POS tagging by parse_constituency_parallel. Defaults to 1.
+    """
+    tagging_layers = get_stanza_tagging_layers(extended_constituency, selective_parsing)
+    parse_after_pos = extended_constituency and parse_workers > 1 # see CONSTITUENCY WORKERS
+    pos_extended_constituency = extended_constituency and not parse_after_pos
+    pos_tagging_layers = get_stanza_tagging_layers(pos_extended_constituency, selective_parsing)
+    if extended_constituency:
+        Path(dir_constituency).mkdir(parents=True, exist_ok=True)
+    Path(dir_out).mkdir(parents=True, exist_ok=True)   
+    #text = open(dir+"corpus\BD-CMT274.txt").read()
+    files = glob.glob(os.path.join(dir_in,"*.txt"))
+    output_dirs = [dir_out, dir_constituency] if extended_constituency else [dir_out]
+    if manifest is None:
+        #check if file already exists
+        files = check_already_tagged_files_stanza(files, dir_out, dir_constituency, extended_constituency)
+    else:
+        stage = manifest.setdefault("POS_Tagged", {})
+        options = {'processors': tagging_layers}
+        if extended_constituency and tree_format != "text": # so that files tagged before are re-tagged to get binary trees
+            options['tree_format'] = tree_format
+        fingerprints = {file: get_fingerprint([file], options, {'MFTE': mfte_version, 'stanza': stanza.__version__}) for file in files}
+        files = check_outdated_files(files, output_dirs, stage, fingerprints)
+        mtimes_before = {file: get_output_mtimes(file, output_dirs) for file in files}
+    if pos_workers > 1 and len(files) > 0:
+        tag_stanford_stanza_parallel(files, dir_out, dir_constituency, pos_tagging_layers, pos_extended_constituency, pos_workers, pos_batch_tokens, pos_cache, pos_sentence_cache, tree_format)
+    elif len(files) > 0:
+        files_list_of_lists = get_stanza_batches(files, pos_batch_tokens)
+        sentence_cache = get_sentence_cache(pos_tagging_layers, pos_sentence_cache, pos_cache) if pos_sentence_cache > 0 else None
+        parsed_before, skipped_before = get_selective_parsing_counts(pos_tagging_layers)
+        tag_stanford_stanza_pipelined(files_list_of_lists, dir_out, dir_constituency, pos_tagging_layers, pos_extended_constituency, pos_batch_tokens, pos_cache, sentence_cache, tree_format)
+        if selective_parsing and pos_extended_constituency:
+            parsed, skipped = get_selective_parsing_counts(pos_tagging_layers)
+            print("Selective parsing:", parsed - parsed_before, "sentences parsed,", skipped - skipped_before, "skipped")
+        if sentence_cache is not None:
+            print("Sentence cache:", sentence_cache.hits, "sentences reused,", sentence_cache.misses, "tagged")
+            if pos_cache is not None:
+                sentence_cache.save(get_sentence_cache_path(pos_cache, pos_tagging_layers))
     else:
         print("No files to tag.")
+    if parse_after_pos and len(files) > 0:
+        parse_constituency_parallel(files, dir_out, dir_constituency, tagging_layers, parse_workers, tree_format)
+    if manifest is not None:
+        record_tagged_files(files, output_dirs, stage, fingerprints, mtimes_before)
+
+# RULE TABLE
+# process_sentence and process_sentence_extended use several hundred distinct patterns, many of them built from long dictionary lists.
+# That is more than the re module's internal cache holds, so patterns used to be recompiled over and over again.
+# Every pattern is now compiled once, on first use, and kept in this module-level table for the lifetime of the process.
+# Patterns built from the dictionary lists are compiled at import instead (see RULE CONSTANTS), so that they are not concatenated on every call.
+compiled_rules = {}
+
+def get_compiled_rule (pattern: str, flags: int = 0) -> re.Pattern:
+    """Returns the compiled pattern from the rule table, compiling and storing it on first use
+    Args:
+        pattern (str): regular expression as written in the tagging rules
+        flags (int, optional): re flags, e.g. re.IGNORECASE. Defaults to 0.
+    Returns:
+        compiled_rule (re.Pattern): compiled regular expression
+    """
+    try:
+        return compiled_rules[pattern, flags]
+    except KeyError:
+        compiled_rule = compiled_rules[pattern, flags] = re.compile(pattern, flags)
+        return compiled_rule
+
+def rule_search (pattern: str, string: str, flags: int = 0):
+    """Drop-in replacement for re.search which uses the rule table
+    Args:
+        pattern (str): regular expression
+        string (str): word_TAG string to be searched
+        flags (int, optional): re flags. Defaults to 0.
+    Returns:
+        re.Match or None
+    """
+    try:
+        return compiled_rules[pattern, flags].search(string)
+    except KeyError:
+        return get_compiled_rule(pattern, flags).search(string)
 
-        
-def process_sentence (words: list, extended: bool = False) -> list:
-    """Retunrs words list tagged
+def rule_sub (pattern: str, repl: str, string: str) -> str:
+    """Drop-in replacement for re.sub which uses the rule table
     Args:
-        words (list): list of words with sentences separated with at least 20 spaces
-        extended (bool, optional): extend to add NNP if True. Defaults to False.
+        pattern (str): regular expression
+        repl (str): replacement string
+        string (str): word_TAG string to be modified
     Returns:
-        words (list): words list after tagging
+        str: string after replacement
+    """
+    try:
+        return compiled_rules[pattern, 0].sub(repl, string)
+    except KeyError:
+        return get_compiled_rule(pattern).sub(repl, string)
+
+# TOKENS
+# Tagged tokens are "word_TAG" strings, optionally followed by extra MFTE tags separated by spaces (e.g. "is_VPRT BEMA").
+# Rules that only need the word, its lowercased form or the presence of extra tags used to re-derive them from the string with split and regex calls.
+# parse_token splits each distinct token string once into a Token whose fields are then compared directly; the strings themselves remain what is tagged and written.
+class Token:
+    """Parsed tagged token
+    Attributes:
+        word (str): word before the first _
+        lower (str): lowercased word
+        extra (tuple): extra tags after the first space; empty if the token has no space
+        lexicon (int): bitset of the dictionary lists (see LEXICON INDEX) the lowercased word belongs to
     """
-    # DICTIONARY LISTS
+    __slots__ = ("word", "lower", "extra", "lexicon")
 
-    have = "have_V|has_V|ve_V|had_V|having_V|hath_|s_VBZ|d_V" # ELF: added s_VBZ, added d_VBD, e.g. "he's got, he's been and he'd been" ELF: Also removed all the apostrophes in Nini's lists because they don't work in combination with \\b in regex as used extensively in this script.
-    
-    do ="do_V|does_V|did_V|done_V|doing_V|doing_P|done_P" 
+    def __init__(self, text: str) -> None:
+        self.word = text.split('_', 1)[0]
+        self.lower = self.word.lower()
+        self.extra = tuple(text.split(' ')[1:])
+        self.lexicon = lexicon_index.get(self.lower, 0)
+
+parsed_tokens = {}
+parsed_tokens_max = 50000 # the cache is emptied when it grows beyond this many distinct token strings, which keeps it to a few tens of MB in every worker process
+
+def parse_token (text: str) -> Token:
+    """Returns the parsed Token of a tagged token string, parsing and caching it on first use
+    Args:
+        text (str): word_TAG string, e.g. "is_VPRT BEMA"
+    Returns:
+        token (Token): parsed token
+    """
+    try:
+        return parsed_tokens[text]
+    except KeyError:
+        if len(parsed_tokens) >= parsed_tokens_max:
+            parsed_tokens.clear()
+        token = parsed_tokens[text] = Token(text)
+        return token
+
+# DICTIONARY LISTS
+
+have = "have_V|has_V|ve_V|had_V|having_V|hath_|s_VBZ|d_V" # ELF: added s_VBZ, added d_VBD, e.g. "he's got, he's been and he'd been" ELF: Also removed all the apostrophes in Nini's lists because they don't work in combination with \\b in regex as used extensively in this script.
+
+do ="do_V|does_V|did_V|done_V|doing_V|doing_P|done_P" 
 
-    be = "be_V|am_V|is_V|are_V|was_V|were_V|been_V|being_V|s_VBZ|m_V|re_V|been_P|being_P" # ELF: removed apostrophes and added "been_P" to account for the verb "be" when tagged as occurrences of passive or perfect forms (PASS and PEAS tags).
+be = "be_V|am_V|is_V|are_V|was_V|were_V|been_V|being_V|s_VBZ|m_V|re_V|been_P|being_P" # ELF: removed apostrophes and added "been_P" to account for the verb "be" when tagged as occurrences of passive or perfect forms (PASS and PEAS tags).
 
-    who = "what_|where_|when_|how_|whether_|why_|whoever_|whomever_|whichever_|wherever_|whenever_|whatever_" # ELF: Removed "however" from Nini/Biber's original list.
+who = "what_|where_|when_|how_|whether_|why_|whoever_|whomever_|whichever_|wherever_|whenever_|whatever_" # ELF: Removed "however" from Nini/Biber's original list.
 
-    wp = "who_|whom_|whose_|which_"
+wp = "who_|whom_|whose_|which_"
 
-    # ELF: added this list for new WH-question variable:  
-    whw = "what_|where_|when_|how_|why_|who_|whom_|whose_|which_" 
+# ELF: added this list for new WH-question variable:  
+whw = "what_|where_|when_|how_|why_|who_|whom_|whose_|which_" 
 
-    preposition = "about_|against_|amid_|amidst_|among_|amongst_|at_|between_|by_|despite_|during_|except_|for_|from_|in_|into_|minus_|of_|off_|on_|onto_|opposite_|out_|per_|plus_|pro_|than_|through_|throughout_|thru_|toward_|towards_|upon_|versus_|via_|with_|within_|without_" # ELF: removed "besides".
+preposition = "about_|against_|amid_|amidst_|among_|amongst_|at_|between_|by_|despite_|during_|except_|for_|from_|in_|into_|minus_|of_|off_|on_|onto_|opposite_|out_|per_|plus_|pro_|than_|through_|throughout_|thru_|toward_|towards_|upon_|versus_|via_|with_|within_|without_" # ELF: removed "besides".
 
-    # ELF: Added this new list but it currently not in use.
-    #particles =
-    #"about|above|across|ahead|along|apart|around|aside|at|away|back|behind|between|by|down|forward|from|in|into|off|on|out|over|past|through|to|together|under|up|upon|with|without" 
+# ELF: Added this new list but it currently not in use.
+#particles =
+#"about|above|across|ahead|along|apart|around|aside|at|away|back|behind|between|by|down|forward|from|in|into|off|on|out|over|past|through|to|together|under|up|upon|with|without" 
 
-    # ELF: The next three lists of semantic categories of verbs are taken from Biber 1988; however, the current version of the script uses the verb semantic categories from Biber 2006 instead, but the following three lists are still used for some variables, e.g. THATD.
-    public = "acknowledge_V|acknowledged_V|acknowledges_V|acknowledging_V|add_V|adds_V|adding_V|added_V|admit_V|admits_V|admitting_V|admitted_V|affirm_V|affirms_V|affirming_V|affirmed_V|agree_V|agrees_V|agreeing_V|agreed_V|allege_V|alleges_V|alleging_V|alleged_V|announce_V|announces_V|announcing_V|announced_V|argue_V|argues_V|arguing_V|argued_V|assert_V|asserts_V|asserting_V|asserted_V|bet_V|bets_V|betting_V|boast_V|boasts_V|boasting_V|boasted_V|certify_V|certifies_V|certifying_V|certified_V|claim_V|claims_V|claiming_V|claimed_V|comment_V|comments_V|commenting_V|commented_V|complain_V|complains_V|complaining_V|complained_V|concede_V|concedes_V|conceding_V|conceded_V|confess_V|confesses_V|confessing_V|confessed_V|confide_V|confides_V|confiding_V|confided_V|confirm_V|confirms_V|confirming_V|confirmed_V|contend_V|contends_V|contending_V|contended_V|convey_V|conveys_V|conveying_V|conveyed_V|declare_V|declares_V|declaring_V|declared_V|deny_V|denies_V|denying_V|denied_V|disclose_V|discloses_V|disclosing_V|disclosed_V|exclaim_V|exclaims_V|exclaiming_V|exclaimed_V|explain_V|explains_V|explaining_V|explained_V|forecast_V|forecasts_V|forecasting_V|forecasted_V|foretell_V|foretells_V|foretelling_V|foretold_V|guarantee_V|guarantees_V|guaranteeing_V|guaranteed_V|hint_V|hints_V|hinting_V|hinted_V|insist_V|insists_V|insisting_V|insisted_V|maintain_V|maintains_V|maintaining_V|maintained_V|mention_V|mentions_V|mentioning_V|mentioned_V|object_V|objects_V|objecting_V|objected_V|predict_V|predicts_V|predicting_V|predicted_V|proclaim_V|proclaims_V|proclaiming_V|proclaimed_V|promise_V|promises_V|promising_V|promised_V|pronounce_V|pronounces_V|pronouncing_V|pronounced_V|prophesy_V|prophesies_V|prophesying_V|prophesied_V|protest_V|protests_V|protesting_V|protested_V|remark_V|remarks_V|remarking_V|remarked_V|repeat_V|repeats_V|repeating_V|repeated_V|reply_V|replies_V|replying_V|replied_V|report_V|reports_V|reporting_V|reported_V|say_V|says_V|saying_V|said_V|state_V|states_V|stating_V|stated_V|submit_V|submits_V|submitting_V|submitted_V|suggest_V|suggests_V|suggesting_V|suggested_V|swear_V|swears_V|swearing_V|swore_V|sworn_V|testify_V|testifies_V|testifying_V|testified_V|vow_V|vows_V|vowing_V|vowed_V|warn_V|warns_V|warning_V|warned_V|write_V|writes_V|writing_V|wrote_V|written_V"
-    private = "accept_V|accepts_V|accepting_V|accepted_V|anticipate_V|anticipates_V|anticipating_V|anticipated_V|ascertain_V|ascertains_V|ascertaining_V|ascertained_V|assume_V|assumes_V|assuming_V|assumed_V|believe_V|believes_V|believing_V|believed_V|calculate_V|calculates_V|calculating_V|calculated_V|check_V|checks_V|checking_V|checked_V|conclude_V|concludes_V|concluding_V|concluded_V|conjecture_V|conjectures_V|conjecturing_V|conjectured_V|consider_V|considers_V|considering_V|considered_V|decide_V|decides_V|deciding_V|decided_V|deduce_V|deduces_V|deducing_V|deduced_V|deem_V|deems_V|deeming_V|deemed_V|demonstrate_V|demonstrates_V|demonstrating_V|demonstrated_V|determine_V|determines_V|determining_V|determined_V|discern_V|discerns_V|discerning_V|discerned_V|discover_V|discovers_V|discovering_V|discovered_V|doubt_V|doubts_V|doubting_V|doubted_V|dream_V|dreams_V|dreaming_V|dreamt_V|dreamed_V|ensure_V|ensures_V|ensuring_V|ensured_V|establish_V|establishes_V|establishing_V|established_V|estimate_V|estimates_V|estimating_V|estimated_V|expect_V|expects_V|expecting_V|expected_V|fancy_V|fancies_V|fancying_V|fancied_V|fear_V|fears_V|fearing_V|feared_V|feel_V|feels_V|feeling_V|felt_V|find_V|finds_V|finding_V|found_V|foresee_V|foresees_V|foreseeing_V|foresaw_V|forget_V|forgets_V|forgetting_V|forgot_V|forgotten_V|gather_V|gathers_V|gathering_V|gathered_V|guess_V|guesses_V|guessing_V|guessed_V|hear_V|hears_V|hearing_V|heard_V|hold_V|holds_V|holding_V|held_V|hope_V|hopes_V|hoping_V|hoped_V|imagine_V|imagines_V|imagining_V|imagined_V|imply_V|implies_V|implying_V|implied_V|indicate_V|indicates_V|indicating_V|indicated_V|infer_V|infers_V|inferring_V|inferred_V|insure_V|insures_V|insuring_V|insured_V|judge_V|judges_V|judging_V|judged_V|know_V|knows_V|knowing_V|knew_V|known_V|learn_V|learns_V|learning_V|learnt_V|learned_V|mean_V|means_V|meaning_V|meant_V|note_V|notes_V|noting_V|noted_V|notice_V|notices_V|noticing_V|noticed_V|observe_V|observes_V|observing_V|observed_V|perceive_V|perceives_V|perceiving_V|perceived_V|presume_V|presumes_V|presuming_V|presumed_V|presuppose_V|presupposes_V|presupposing_V|presupposed_V|pretend_V|pretend_V|pretending_V|pretended_V|prove_V|proves_V|proving_V|proved_V|realize_V|realise_V|realising_V|realizing_V|realises_V|realizes_V|realised_V|realized_V|reason_V|reasons_V|reasoning_V|reasoned_V|recall_V|recalls_V|recalling_V|recalled_V|reckon_V|reckons_V|reckoning_V|reckoned_V|recognize_V|recognise_V|recognizes_V|recognises_V|recognizing_V|recognising_V|recognized_V|recognised_V|reflect_V|reflects_V|reflecting_V|reflected_V|remember_V|remembers_V|remembering_V|remembered_V|reveal_V|reveals_V|revealing_V|revealed_V|see_V|sees_V|seeing_V|saw_V|seen_V|sense_V|senses_V|sensing_V|sensed_V|show_V|shows_V|showing_V|showed_V|shown_V|signify_V|signifies_V|signifying_V|signified_V|suppose_V|supposes_V|supposing_V|supposed_V|suspect_V|suspects_V|suspecting_V|suspected_V|think_V|thinks_V|thinking_V|thought_V|understand_V|understands_V|understanding_V|understood_V"
-    suasive = "agree_V|agrees_V|agreeing_V|agreed_V|allow_V|allows_V|allowing_V|allowed_V|arrange_V|arranges_V|arranging_V|arranged_V|ask_V|asks_V|asking_V|asked_V|beg_V|begs_V|begging_V|begged_V|command_V|commands_V|commanding_V|commanded_V|concede_V|concedes_V|conceding_V|conceded_V|decide_V|decides_V|deciding_V|decided_V|decree_V|decrees_V|decreeing_V|decreed_V|demand_V|demands_V|demanding_V|demanded_V|desire_V|desires_V|desiring_V|desired_V|determine_V|determines_V|determining_V|determined_V|enjoin_V|enjoins_V|enjoining_V|enjoined_V|ensure_V|ensures_V|ensuring_V|ensured_V|entreat_V|entreats_V|entreating_V|entreated_V|grant_V|grants_V|granting_V|granted_V|insist_V|insists_V|insisting_V|insisted_V|instruct_V|instructs_V|instructing_V|instructed_V|intend_V|intends_V|intending_V|intended_V|move_V|moves_V|moving_V|moved_V|ordain_V|ordains_V|ordaining_V|ordained_V|order_V|orders_V|ordering_V|ordered_V|pledge_V|pledges_V|pledging_V|pledged_V|pray_V|prays_V|praying_V|prayed_V|prefer_V|prefers_V|preferring_V|preferred_V|pronounce_V|pronounces_V|pronouncing_V|pronounced_V|propose_V|proposes_V|proposing_V|proposed_V|recommend_V|recommends_V|recommending_V|recommended_V|request_V|requests_V|requesting_V|requested_V|require_V|requires_V|requiring_V|required_V|resolve_V|resolves_V|resolving_V|resolved_V|rule_V|rules_V|ruling_V|ruled_V|stipulate_V|stipulates_V|stipulating_V|stipulated_V|suggest_V|suggests_V|suggesting_V|suggested_V|urge_V|urges_V|urging_V|urged_V|vote_V|votes_V|voting_V|voted_V"
+# ELF: The next three lists of semantic categories of verbs are taken from Biber 1988; however, the current version of the script uses the verb semantic categories from Biber 2006 instead, but the following three lists are still used for some variables, e.g. THATD.
+public = "acknowledge_V|acknowledged_V|acknowledges_V|acknowledging_V|add_V|adds_V|adding_V|added_V|admit_V|admits_V|admitting_V|admitted_V|affirm_V|affirms_V|affirming_V|affirmed_V|agree_V|agrees_V|agreeing_V|agreed_V|allege_V|alleges_V|alleging_V|alleged_V|announce_V|announces_V|announcing_V|announced_V|argue_V|argues_V|arguing_V|argued_V|assert_V|asserts_V|asserting_V|asserted_V|bet_V|bets_V|betting_V|boast_V|boasts_V|boasting_V|boasted_V|certify_V|certifies_V|certifying_V|certified_V|claim_V|claims_V|claiming_V|claimed_V|comment_V|comments_V|commenting_V|commented_V|complain_V|complains_V|complaining_V|complained_V|concede_V|concedes_V|conceding_V|conceded_V|confess_V|confesses_V|confessing_V|confessed_V|confide_V|confides_V|confiding_V|confided_V|confirm_V|confirms_V|confirming_V|confirmed_V|contend_V|contends_V|contending_V|contended_V|convey_V|conveys_V|conveying_V|conveyed_V|declare_V|declares_V|declaring_V|declared_V|deny_V|denies_V|denying_V|denied_V|disclose_V|discloses_V|disclosing_V|disclosed_V|exclaim_V|exclaims_V|exclaiming_V|exclaimed_V|explain_V|explains_V|explaining_V|explained_V|forecast_V|forecasts_V|forecasting_V|forecasted_V|foretell_V|foretells_V|foretelling_V|foretold_V|guarantee_V|guarantees_V|guaranteeing_V|guaranteed_V|hint_V|hints_V|hinting_V|hinted_V|insist_V|insists_V|insisting_V|insisted_V|maintain_V|maintains_V|maintaining_V|maintained_V|mention_V|mentions_V|mentioning_V|mentioned_V|object_V|objects_V|objecting_V|objected_V|predict_V|predicts_V|predicting_V|predicted_V|proclaim_V|proclaims_V|proclaiming_V|proclaimed_V|promise_V|promises_V|promising_V|promised_V|pronounce_V|pronounces_V|pronouncing_V|pronounced_V|prophesy_V|prophesies_V|prophesying_V|prophesied_V|protest_V|protests_V|protesting_V|protested_V|remark_V|remarks_V|remarking_V|remarked_V|repeat_V|repeats_V|repeating_V|repeated_V|reply_V|replies_V|replying_V|replied_V|report_V|reports_V|reporting_V|reported_V|say_V|says_V|saying_V|said_V|state_V|states_V|stating_V|stated_V|submit_V|submits_V|submitting_V|submitted_V|suggest_V|suggests_V|suggesting_V|suggested_V|swear_V|swears_V|swearing_V|swore_V|sworn_V|testify_V|testifies_V|testifying_V|testified_V|vow_V|vows_V|vowing_V|vowed_V|warn_V|warns_V|warning_V|warned_V|write_V|writes_V|writing_V|wrote_V|written_V"
+private = "accept_V|accepts_V|accepting_V|accepted_V|anticipate_V|anticipates_V|anticipating_V|anticipated_V|ascertain_V|ascertains_V|ascertaining_V|ascertained_V|assume_V|assumes_V|assuming_V|assumed_V|believe_V|believes_V|believing_V|believed_V|calculate_V|calculates_V|calculating_V|calculated_V|check_V|checks_V|checking_V|checked_V|conclude_V|concludes_V|concluding_V|concluded_V|conjecture_V|conjectures_V|conjecturing_V|conjectured_V|consider_V|considers_V|considering_V|considered_V|decide_V|decides_V|deciding_V|decided_V|deduce_V|deduces_V|deducing_V|deduced_V|deem_V|deems_V|deeming_V|deemed_V|demonstrate_V|demonstrates_V|demonstrating_V|demonstrated_V|determine_V|determines_V|determining_V|determined_V|discern_V|discerns_V|discerning_V|discerned_V|discover_V|discovers_V|discovering_V|discovered_V|doubt_V|doubts_V|doubting_V|doubted_V|dream_V|dreams_V|dreaming_V|dreamt_V|dreamed_V|ensure_V|ensures_V|ensuring_V|ensured_V|establish_V|establishes_V|establishing_V|established_V|estimate_V|estimates_V|estimating_V|estimated_V|expect_V|expects_V|expecting_V|expected_V|fancy_V|fancies_V|fancying_V|fancied_V|fear_V|fears_V|fearing_V|feared_V|feel_V|feels_V|feeling_V|felt_V|find_V|finds_V|finding_V|found_V|foresee_V|foresees_V|foreseeing_V|foresaw_V|forget_V|forgets_V|forgetting_V|forgot_V|forgotten_V|gather_V|gathers_V|gathering_V|gathered_V|guess_V|guesses_V|guessing_V|guessed_V|hear_V|hears_V|hearing_V|heard_V|hold_V|holds_V|holding_V|held_V|hope_V|hopes_V|hoping_V|hoped_V|imagine_V|imagines_V|imagining_V|imagined_V|imply_V|implies_V|implying_V|implied_V|indicate_V|indicates_V|indicating_V|indicated_V|infer_V|infers_V|inferring_V|inferred_V|insure_V|insures_V|insuring_V|insured_V|judge_V|judges_V|judging_V|judged_V|know_V|knows_V|knowing_V|knew_V|known_V|learn_V|learns_V|learning_V|learnt_V|learned_V|mean_V|means_V|meaning_V|meant_V|note_V|notes_V|noting_V|noted_V|notice_V|notices_V|noticing_V|noticed_V|observe_V|observes_V|observing_V|observed_V|perceive_V|perceives_V|perceiving_V|perceived_V|presume_V|presumes_V|presuming_V|presumed_V|presuppose_V|presupposes_V|presupposing_V|presupposed_V|pretend_V|pretend_V|pretending_V|pretended_V|prove_V|proves_V|proving_V|proved_V|realize_V|realise_V|realising_V|realizing_V|realises_V|realizes_V|realised_V|realized_V|reason_V|reasons_V|reasoning_V|reasoned_V|recall_V|recalls_V|recalling_V|recalled_V|reckon_V|reckons_V|reckoning_V|reckoned_V|recognize_V|recognise_V|recognizes_V|recognises_V|recognizing_V|recognising_V|recognized_V|recognised_V|reflect_V|reflects_V|reflecting_V|reflected_V|remember_V|remembers_V|remembering_V|remembered_V|reveal_V|reveals_V|revealing_V|revealed_V|see_V|sees_V|seeing_V|saw_V|seen_V|sense_V|senses_V|sensing_V|sensed_V|show_V|shows_V|showing_V|showed_V|shown_V|signify_V|signifies_V|signifying_V|signified_V|suppose_V|supposes_V|supposing_V|supposed_V|suspect_V|suspects_V|suspecting_V|suspected_V|think_V|thinks_V|thinking_V|thought_V|understand_V|understands_V|understanding_V|understood_V"
+suasive = "agree_V|agrees_V|agreeing_V|agreed_V|allow_V|allows_V|allowing_V|allowed_V|arrange_V|arranges_V|arranging_V|arranged_V|ask_V|asks_V|asking_V|asked_V|beg_V|begs_V|begging_V|begged_V|command_V|commands_V|commanding_V|commanded_V|concede_V|concedes_V|conceding_V|conceded_V|decide_V|decides_V|deciding_V|decided_V|decree_V|decrees_V|decreeing_V|decreed_V|demand_V|demands_V|demanding_V|demanded_V|desire_V|desires_V|desiring_V|desired_V|determine_V|determines_V|determining_V|determined_V|enjoin_V|enjoins_V|enjoining_V|enjoined_V|ensure_V|ensures_V|ensuring_V|ensured_V|entreat_V|entreats_V|entreating_V|entreated_V|grant_V|grants_V|granting_V|granted_V|insist_V|insists_V|insisting_V|insisted_V|instruct_V|instructs_V|instructing_V|instructed_V|intend_V|intends_V|intending_V|intended_V|move_V|moves_V|moving_V|moved_V|ordain_V|ordains_V|ordaining_V|ordained_V|order_V|orders_V|ordering_V|ordered_V|pledge_V|pledges_V|pledging_V|pledged_V|pray_V|prays_V|praying_V|prayed_V|prefer_V|prefers_V|preferring_V|preferred_V|pronounce_V|pronounces_V|pronouncing_V|pronounced_V|propose_V|proposes_V|proposing_V|proposed_V|recommend_V|recommends_V|recommending_V|recommended_V|request_V|requests_V|requesting_V|requested_V|require_V|requires_V|requiring_V|required_V|resolve_V|resolves_V|resolving_V|resolved_V|rule_V|rules_V|ruling_V|ruled_V|stipulate_V|stipulates_V|stipulating_V|stipulated_V|suggest_V|suggests_V|suggesting_V|suggested_V|urge_V|urges_V|urging_V|urged_V|vote_V|votes_V|voting_V|voted_V"
 
-    # Days of the week ELF: Added to include them in normal noun (NN) count rather than NNP (currently not in use)
-    #days = "(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|Mon\.+|Tue\.+|Wed\.+|Thu\.+|Fri\.+|Sat\.+|Sun\.+)"
+# Days of the week ELF: Added to include them in normal noun (NN) count rather than NNP (currently not in use)
+#days = "(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|Mon\.+|Tue\.+|Wed\.+|Thu\.+|Fri\.+|Sat\.+|Sun\.+)"
 
-    # Months ELF: Added to include them in normal noun (NN) count rather than NNP (currently not in use)
-    #months = "(January|Jan|February|Feb|March|Mar|April|Apr|May|May|June|Jun|July|Jul|August|Aug|September|Sep|October|Oct|November|Nov|December|Dec)"
+# Months ELF: Added to include them in normal noun (NN) count rather than NNP (currently not in use)
+#months = "(January|Jan|February|Feb|March|Mar|April|Apr|May|May|June|Jun|July|Jul|August|Aug|September|Sep|October|Oct|November|Nov|December|Dec)"
 
-    # Stative verbs  
-    # ELF: This is a new list which was added on DS's suggestion to count JPRED adjectives more accurately. Predicative adjectives are now identified by exclusion (= adjectives not identified as attributive adjectives) but this dictionary remains useful to disambiguate between PASS and PEAS when the auxiliary is "'s".
-    v_stative = "(appear|appears|appeared|feel|feels|feeling|felt|look|looks|looking|looked|become|becomes|became|becoming|get|gets|getting|got|go|goes|going|gone|went|grow|grows|growing|grown|prove|proves|proven|remain|remains|remaining|remained|seem|seems|seemed|shine|shines|shined|shone|smell|smells|smelt|smelled|sound|sounds|sounded|sounding|stay|staying|stayed|stays|taste|tastes|tasted|turn|turns|turning|turned)"
+# Stative verbs  
+# ELF: This is a new list which was added on DS's suggestion to count JPRED adjectives more accurately. Predicative adjectives are now identified by exclusion (= adjectives not identified as attributive adjectives) but this dictionary remains useful to disambiguate between PASS and PEAS when the auxiliary is "'s".
+v_stative = "(appear|appears|appeared|feel|feels|feeling|felt|look|looks|looking|looked|become|becomes|became|becoming|get|gets|getting|got|go|goes|going|gone|went|grow|grows|growing|grown|prove|proves|proven|remain|remains|remaining|remained|seem|seems|seemed|shine|shines|shined|shone|smell|smells|smelt|smelled|sound|sounds|sounded|sounding|stay|staying|stayed|stays|taste|tastes|tasted|turn|turns|turning|turned)"
 
-    # Function words
-    # EFL: Added in order to calculate a content to function word ratio to capture lexical density
-    function_words = "(a|about|above|after|again|ago|ai|all|almost|along|already|also|although|always|am|among|an|and|another|any|anybody|anything|anywhere|are|are|around|as|at|back|be|been|before|being|below|beneath|beside|between|beyond|billion|billionth|both|but|by|can|can|could|cos|cuz|did|do|does|doing|done|down|during|each|eight|eighteen|eighteenth|eighth|eightieth|eighty|either|eleven|eleventh|else|enough|even|ever|every|everybody|everyone|everything|everywhere|except|far|few|fewer|fifteen|fifteenth|fifth|fiftieth|fifty|first|five|for|fortieth|forty|four|fourteen|fourteenth|fourth|from|get|gets|getting|got|had|has|have|having|he|hence|her|here|hers|herself|him|himself|his|hither|how|however|hundred|hundredth|i|if|in|into|is|it|its|itself|just|last|less|many|may|me|might|million|millionth|mine|more|most|much|must|my|myself|near|near|nearby|nearly|neither|never|next|nine|nineteen|nineteenth|ninetieth|ninety|ninth|no|nobody|none|noone|nor|not|nothing|now|nowhere|of|off|often|on|once|one|only|or|other|others|ought|our|ours|ourselves|out|over|quite|rather|round|second|seven|seventeen|seventeenth|seventh|seventieth|seventy|shall|sha|she|should|since|six|sixteen|sixteenth|sixth|sixtieth|sixty|so|some|somebody|someone|something|sometimes|somewhere|soon|still|such|ten|tenth|than|that|that|the|their|theirs|them|themselves|then|thence|there|therefore|these|they|third|thirteen|thirteenth|thirtieth|thirty|this|thither|those|though|thousand|thousandth|three|thrice|through|thus|till|to|today|tomorrow|too|towards|twelfth|twelve|twentieth|twenty|twice|two|under|underneath|unless|until|up|us|very|was|we|were|what|when|whence|where|whereas|which|while|whither|who|whom|whose|why|will|with|within|without|wo|would|yes|yesterday|yet|you|your|yours|yourself|yourselves|'re|'ve|n't|'ll|'twas|'em|y'|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|a|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|1|2|3|4|5|6|7|8|9|0)"
+# Function words
+# EFL: Added in order to calculate a content to function word ratio to capture lexical density
+function_words = "(a|about|above|after|again|ago|ai|all|almost|along|already|also|although|always|am|among|an|and|another|any|anybody|anything|anywhere|are|are|around|as|at|back|be|been|before|being|below|beneath|beside|between|beyond|billion|billionth|both|but|by|can|can|could|cos|cuz|did|do|does|doing|done|down|during|each|eight|eighteen|eighteenth|eighth|eightieth|eighty|either|eleven|eleventh|else|enough|even|ever|every|everybody|everyone|everything|everywhere|except|far|few|fewer|fifteen|fifteenth|fifth|fiftieth|fifty|first|five|for|fortieth|forty|four|fourteen|fourteenth|fourth|from|get|gets|getting|got|had|has|have|having|he|hence|her|here|hers|herself|him|himself|his|hither|how|however|hundred|hundredth|i|if|in|into|is|it|its|itself|just|last|less|many|may|me|might|million|millionth|mine|more|most|much|must|my|myself|near|near|nearby|nearly|neither|never|next|nine|nineteen|nineteenth|ninetieth|ninety|ninth|no|nobody|none|noone|nor|not|nothing|now|nowhere|of|off|often|on|once|one|only|or|other|others|ought|our|ours|ourselves|out|over|quite|rather|round|second|seven|seventeen|seventeenth|seventh|seventieth|seventy|shall|sha|she|should|since|six|sixteen|sixteenth|sixth|sixtieth|sixty|so|some|somebody|someone|something|sometimes|somewhere|soon|still|such|ten|tenth|than|that|that|the|their|theirs|them|themselves|then|thence|there|therefore|these|they|third|thirteen|thirteenth|thirtieth|thirty|this|thither|those|though|thousand|thousandth|three|thrice|through|thus|till|to|today|tomorrow|too|towards|twelfth|twelve|twentieth|twenty|twice|two|under|underneath|unless|until|up|us|very|was|we|were|what|when|whence|where|whereas|which|while|whither|who|whom|whose|why|will|with|within|without|wo|would|yes|yesterday|yet|you|your|yours|yourself|yourselves|'re|'ve|n't|'ll|'twas|'em|y'|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|a|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|1|2|3|4|5|6|7|8|9|0)"
 
 
+# RULE CONSTANTS
+# Patterns of process_sentence that are built from the dictionary lists above, concatenated and compiled once here instead of on every call.
+wp_who_rule = re.compile("\\b(" + wp + ")|\\b(" + who + ")", re.IGNORECASE)
+to_as_preposition_next_rule = re.compile("_IN|_CD|_DT|_JJ|_WPS|_NN|_NNP|_PDT|_PRP|_WDT|(\\b(" + wp + "))|_WRB|_\W", re.IGNORECASE)
+be_rule = re.compile("\\b(" + be + ")", re.IGNORECASE)
+be_case_sensitive_rule = re.compile("\\b(" + be + ")")
+do_rule = re.compile("\\b(" + do + ")", re.IGNORECASE)
+preposition_or_to_rule = re.compile("\\b(" + preposition + ")|\\bto_TO", re.IGNORECASE)
+wh_word_rule = re.compile("(\\b(" + wp + "))|(\\b" + who + ")|(\\b" + whw + ")", re.IGNORECASE)
+auxiliary_rule = re.compile("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", re.IGNORECASE)
+modal_doaux_have_be_rule = re.compile("_MD|DOAUX|(\\b(" + have + "))|(\\b(" + be + "))", re.IGNORECASE)
+have_rule = re.compile("\\b(" + have + ")", re.IGNORECASE)
+whw_rule = re.compile("\\b(" + whw + ")", re.IGNORECASE)
+make_not_for_you_be_rule = re.compile("\\bmakes_|\\bmake_|\\bmade_|\\bmaking_|\\bnot|_\\bfor_|\\byou_|\\b(" + be + ")|\\bfor_", re.IGNORECASE)
+please_thank_doaux_be_rule = re.compile("\\bplease_|\\bthank_| DOAUX|\\b(" + be + ")", re.IGNORECASE)
+determiner_or_who_rule = re.compile("_DT|_QUAN|_CD|_J|_PRP|(\\b(" + who + "))", re.IGNORECASE)
+be_or_m_rule = re.compile("\\b(" + be + ")|'m_V", re.IGNORECASE)
+
+def process_sentence (words: list, extended: bool = False) -> list:
+    """Retunrs words list tagged
+    Args:
+        words (list): list of words with sentences separated with at least 20 spaces
+        extended (bool, optional): extend to add NNP if True. Defaults to False.
+    Returns:
+        words (list): words list after tagging
+    """
     # QUICK CORRECTIONS OF POS TAGGER OUTPUT
     for index, x in enumerate(words):
         #skip if space
         if x != " ":
             # Shakir: Check if word is alphanumeric, then check if they are Roman letters, add FU if not Roman letters
-            if re.search(r'\w+', words[index].split('_')[0], re.IGNORECASE): #if word (before _) has letters
-                if not re.search(r'[A-Za-z0-9]+', words[index].split('_')[0]): #if word (before _) has no Roman letters
-                    words[index] = re.sub("_(\w+)", "_FU", words[index]) #tag as FU or foreign word            
+            if rule_search(r'\w+', parse_token(words[index]).word, re.IGNORECASE): #if word (before _) has letters
+                if not rule_search(r'[A-Za-z0-9]+', parse_token(words[index]).word): #if word (before _) has no Roman letters
+                    words[index] = rule_sub("_(\w+)", "_FU", words[index]) #tag as FU or foreign word            
             # Shakir: new feature in MFTE python @mentions
             # Frequent in e-language and now tagged as a new feature category, thus correcting tags such as JJ to NN
-            if ((re.search("@_", words[index-1]) and re.search("\\b[a-zA-Z0-9]{3,}_", words[index])) or # ELF: Added this line because the evalation showed that the POS-tagger sometimes parses the @ symbol as a separate token 
-            (re.search(r"^@\S\S+_", words[index], re.IGNORECASE))):
-                words[index] = re.sub("_(\w+)", "_NN NNMention", words[index])
+            if ((rule_search("@_", words[index-1]) and rule_search("\\b[a-zA-Z0-9]{3,}_", words[index])) or # ELF: Added this line because the evalation showed that the POS-tagger sometimes parses the @ symbol as a separate token 
+            (rule_search(r"^@\S\S+_", words[index], re.IGNORECASE))):
+                words[index] = rule_sub("_(\w+)", "_NN NNMention", words[index])
 
             # Changes the two tags that have a problematic "$" symbol in the Stanford tagset
-            if (re.search("PRP\\$", words[index])):                 
-                words[index] = re.sub("PRP.", "PRPS", words[index])
+            if (rule_search("PRP\\$", words[index])):                 
+                words[index] = rule_sub("PRP.", "PRPS", words[index])
                 
-            if (re.search("WP\\$", words[index])): 
-                words[index] = re.sub("WP.", "WPS", words[index]) 
+            if (rule_search("WP\\$", words[index])): 
+                words[index] = rule_sub("WP.", "WPS", words[index]) 
 
             # ELF: Correction of a few specific symbols identified as adjectives, cardinal numbers, prepositions and foreign words by the Stanford Tagger.
             # These are instead re-tagged as symbols so they don't count as tokens for the TTR and per-word normalisation basis.
             # Removal of all LS (list symbol) tags except those that denote numbers
-            if (re.search("&amp_|<_JJ|>_JJ|\^_FW|>_JJ|§_CD|=_JJ|\*_|\W+_LS|[a-zA-Z]+_LS|@+_|\\b%_|#_NN", words[index])): 
-                words[index] = re.sub("_\w+", "_SYM", words[index]) 
+            if (rule_search("&amp_|<_JJ|>_JJ|\^_FW|>_JJ|§_CD|=_JJ|\*_|\W+_LS|[a-zA-Z]+_LS|@+_|\\b%_|#_NN", words[index])): 
+                words[index] = rule_sub("_\w+", "_SYM", words[index]) 
 
             # ELF: Correction of cardinal numbers without spaces and list numbers as numbers rather than LS
             # Removal of the LS (list symbol) tags that denote numbers
-            if (re.search("\\b[0-9]+th_|\\b[0-9]+nd_|\\b[0-9]+rd_|[0-9]+_LS|\\b[0-9]+\\._", words[index])): 
-                words[index] = re.sub("_\w+", "_CD", words[index]) 
+            if (rule_search("\\b[0-9]+th_|\\b[0-9]+nd_|\\b[0-9]+rd_|[0-9]+_LS|\\b[0-9]+\\._", words[index])): 
+                words[index] = rule_sub("_\w+", "_CD", words[index]) 
                 
             # ELF: Correct "innit" and "init" (frequently tagged as a noun by the Stanford Tagger) to pronoun "it" (these are later on also counted as question tags if they are followed by a question mark)
             # ELF: These lines are no longer necessary with the stanza tagger because we have to split and "re-write" in(n)it before POS-tagging.
-            #if (re.search("\\binnit_", words[index])): 
-             #   words[index] = re.sub("_\w+", "_PIT", words[index]) 
-            #if (re.search("\\binit_", words[index])): 
-             #   words[index] = re.sub("_\w+", "_PIT", words[index]) 	
+            #if (rule_search("\\binnit_", words[index])): 
+             #   words[index] = rule_sub("_\w+", "_PIT", words[index]) 
+            #if (rule_search("\\binit_", words[index])): 
+             #   words[index] = rule_sub("_\w+", "_PIT", words[index]) 	
 
             # ELF: Correction of the pre- affix frequently tagged as a noun by the POS tagger (stanza)
-            if (re.search("\\bpre_", words[index])): 
-                words[index] = re.sub("_\w+", "_AFX", words[index]) 
+            if (rule_search("\\bpre_", words[index])): 
+                words[index] = rule_sub("_\w+", "_AFX", words[index]) 
 
             # ADDITIONAL TAGS FOR INTERNET REGISTERS
 
             # ELF: New feature for emoji
             # Shakir replaced Elen's regex solution with the emoji module in the Python version of the MFTE
-            if (emoji.is_emoji(words[index].split('_')[0])):
-                words[index] = re.sub("_\S+", "_EMO", words[index])
+            if (emoji.is_emoji(parse_token(words[index]).word)):
+                words[index] = rule_sub("_\S+", "_EMO", words[index])
 
             # ELF: New feature for hashtags
-            if ((re.search("#_", words[index-1]) and re.search("\\b[a-zA-Z0-9]{3,}_", words[index])) or # ELF: Added this line because the evalation showed that the POS-tagger sometimes parses the # symbol as a separate token 
-                (re.search("#[a-zA-Z0-9]{3,}_", words[index]))):
-                words[index] = re.sub("_\w+", "_HST", words[index])
+            if ((rule_search("#_", words[index-1]) and rule_search("\\b[a-zA-Z0-9]{3,}_", words[index])) or # ELF: Added this line because the evalation showed that the POS-tagger sometimes parses the # symbol as a separate token 
+                (rule_search("#[a-zA-Z0-9]{3,}_", words[index]))):
+                words[index] = rule_sub("_\w+", "_HST", words[index])
 
             # ELF: New feature for web links
             # Note that the aim of this regex is *not* to extract all *valid* URLs but rather all strings that were intended to be/look like a URL or a URL-like string!
             # Inspired by: https://mathiasbynens.be/demo/url-regex
             # Designed to favour higher precision over recall.
 
-            if ((re.search("\\b(https?:\/\/www\.|https?:\/\/)?\w+([\-\.\+=&\?]{1}\w+)*\.[a-z]{2,5}(:[0-9]{1,5})?(\/.*)?", words[index], re.IGNORECASE)) or
-                (re.search("<link\/?>", words[index])) or
-                (re.search("_ADD\\b", words[index])) or # Stanza tag for e-mail addresses?
-                (re.search("\\b\w+\.(com|net|co\.uk|au|us|gov|org)\\b", words[index]))):
-                words[index] = re.sub("_[\w+\-\.\+=&\/\?]+", "_URL", words[index])
+            if ((rule_search("\\b(https?:\/\/www\.|https?:\/\/)?\w+([\-\.\+=&\?]{1}\w+)*\.[a-z]{2,5}(:[0-9]{1,5})?(\/.*)?", words[index], re.IGNORECASE)) or
+                (rule_search("<link\/?>", words[index])) or
+                (rule_search("_ADD\\b", words[index])) or # Stanza tag for e-mail addresses?
+                (rule_search("\\b\w+\.(com|net|co\.uk|au|us|gov|org)\\b", words[index]))):
+                words[index] = rule_sub("_[\w+\-\.\+=&\/\?]+", "_URL", words[index])
 
             # BASIC TAG NEEDED FOR MORE COMPLEX TAGS
             # Negation
-            if (re.search("\\bnot_|\\bn't_|\\bn’t_|\\bnt_RB", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_XX0", words[index])
+            if (rule_search("\\bnot_|\\bn't_|\\bn’t_|\\bnt_RB", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_XX0", words[index])
 
     # SLIGHTLY MORE COMPLEX CORRECTIONS OF POS TAGGER OUTPUT
 
@@ -378,52 +1466,52 @@ def process_sentence (words: list, extended: bool = False) -> list:
         # For emoticons parsed as one token by the POS tagger:
         # Extended the regex to include strings including more than one non-alphanumeric character tagged as NFP by the POS tagger.
         # The following were removed because they occur fairly frequently in academic writing ;-RRB-_ and -RRB-:_
-            if (re.search(":-RRB-_|:d_|:-LRB-_|:p_|:--RRB-_|:-RSB-_|\\bd:_|:'-LRB-_|:--LRB-_|:-d_|:-LSB-_|-LSB-:_|:-p_|:\/_|:P_|:D_|=-RRB-_|=-LRB-_|:-D_|:-RRB--RRB-_|:O_|:]_|:-LRB--LRB-_|:o_|:-O_|:-o_|;--RRB-_|;-\*|':--RRB--LRB-_|:-B_|8--RRB-_|=\|_|:-\|_|<3_|<\/3_|:P_|;P_|\\bOrz_|\\borz_|\\bXD_|\\bxD_|\\bUwU_|;-\)_|;-\*_|:-\(_|:-\)|;-\(_|:-\(\(_|:-\)\)_|:--\(_|:--\)_|\(ツ|\\b8-\)_|\S\S+_NFP", words[j]) and not re.search("@!_|\.\.\.", words[j])):
-                words[j] = re.sub("_\S+", "_EMO", words[j])
+            if (rule_search(":-RRB-_|:d_|:-LRB-_|:p_|:--RRB-_|:-RSB-_|\\bd:_|:'-LRB-_|:--LRB-_|:-d_|:-LSB-_|-LSB-:_|:-p_|:\/_|:P_|:D_|=-RRB-_|=-LRB-_|:-D_|:-RRB--RRB-_|:O_|:]_|:-LRB--LRB-_|:o_|:-O_|:-o_|;--RRB-_|;-\*|':--RRB--LRB-_|:-B_|8--RRB-_|=\|_|:-\|_|<3_|<\/3_|:P_|;P_|\\bOrz_|\\borz_|\\bXD_|\\bxD_|\\bUwU_|;-\)_|;-\*_|:-\(_|:-\)|;-\(_|:-\(\(_|:-\)\)_|:--\(_|:--\)_|\(ツ|\\b8-\)_|\S\S+_NFP", words[j]) and not rule_search("@!_|\.\.\.", words[j])):
+                words[j] = rule_sub("_\S+", "_EMO", words[j])
 
             # Correct double punctuation such as ?! and !? (often tagged by the POS-tagger as a noun or foreign word) 
-            if (re.search("[\?\!]{2,15}", words[j])):
-                words[j] = re.sub("_(\W+)", "_.", words[j])
-                words[j] = re.sub("_(\w+)", "_.", words[j])
+            if (rule_search("[\?\!]{2,15}", words[j])):
+                words[j] = rule_sub("_(\W+)", "_.", words[j])
+                words[j] = rule_sub("_(\w+)", "_.", words[j])
 
             # CORRECTION OF "TO" AS PREPOSITION 
             # ELF: Added "to" followed by a punctuation mark, e.g. "What are you up to?"
-            if (re.search("\\bto_", words[j], re.IGNORECASE) and re.search("_IN|_CD|_DT|_JJ|_WPS|_NN|_NNP|_PDT|_PRP|_WDT|(\\b(" + wp + "))|_WRB|_\W", words[j+1], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_IN", words[j])
+            if (rule_search("\\bto_", words[j], re.IGNORECASE) and to_as_preposition_next_rule.search(words[j+1])):
+                words[j] = rule_sub("_\w+", "_IN", words[j])
 
             # ELF: Correction of: "I dunno"
-            if (re.search("\\bdu_", words[j], re.IGNORECASE) and re.search("\\bn_", words[j+1]) and re.search("\\bno_", words[j+2])): 
-                    words[j] = re.sub("_\w+", "_VPRT", words[j])
-                    words[j+1] = re.sub("_\w+", "_XX0", words[j+1])
-                    words[j+2] = re.sub("_\w+", "_VB", words[j+2])
+            if (rule_search("\\bdu_", words[j], re.IGNORECASE) and rule_search("\\bn_", words[j+1]) and rule_search("\\bno_", words[j+2])): 
+                    words[j] = rule_sub("_\w+", "_VPRT", words[j])
+                    words[j+1] = rule_sub("_\w+", "_XX0", words[j+1])
+                    words[j+2] = rule_sub("_\w+", "_VB", words[j+2])
 
             # ELF: Correction of "have" in inverted questions in the present perfect:
-            if (re.search("\\bhave_VB", words[j], re.IGNORECASE) and re.search("_PRP", words[j+1]) and re.search("_VBN|_VBD", words[j+2])):
-                words[j] = re.sub("_\w+", "_VPRT", words[j])
+            if (rule_search("\\bhave_VB", words[j], re.IGNORECASE) and rule_search("_PRP", words[j+1]) and rule_search("_VBN|_VBD", words[j+2])):
+                words[j] = rule_sub("_\w+", "_VPRT", words[j])
 
             # ELF: Correction of falsely tagged "'s" following "there". 
-            if (re.search("\\bthere_EX", words[j-1], re.IGNORECASE) and re.search("_POS", words[j])):
-                words[j] = re.sub("_\w+", "_VPRT", words[j])
+            if (rule_search("\\bthere_EX", words[j-1], re.IGNORECASE) and rule_search("_POS", words[j])):
+                words[j] = rule_sub("_\w+", "_VPRT", words[j])
 
             # ELF: Correction of most problematic spoken language particles
             # ELF: DMA is a new variable. It is important for it to be high up because lots of DMA's are marked as nouns by the POS-tagger which messes up other variables further down the line otherwise. 
             # More complex DMAs are tagged further down.
-            if (re.search("\\banyway|\\bdamn_|\\bgoodness_|\\bgosh_|\\byeah_|\\byep_|\\byes_|\\bnope_|\\bright_UH|\\bwhatever_|\\bdamn_RB|\\blol_|\\bIMO_|\\bomg_|\\bwtf_", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_DMA", words[j])
+            if (rule_search("\\banyway|\\bdamn_|\\bgoodness_|\\bgosh_|\\byeah_|\\byep_|\\byes_|\\bnope_|\\bright_UH|\\bwhatever_|\\bdamn_RB|\\blol_|\\bIMO_|\\bomg_|\\bwtf_", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_DMA", words[j])
 
             # ELF: FPUH is a new variable.
             # Aims to tags interjections and filled pauses.
-            if ((re.search("\\baw+_|\\bow_|\\boh+_|\\beh+_|\\ber+_|\\berm+_|\\bmmm+_|\\bum+_|\\b[hu]{2,}_|\\bmhm+|\\bhi+_|\\bhey+_|\\bby+e+_|\\b[ha]{2,}_|\\b[he]{2,}_|\\b[wo]{3,}p?s*_|\\b[oi]{2,}_|\\bouch_|\\bhum+_", words[j], re.IGNORECASE)) or
+            if ((rule_search("\\baw+_|\\bow_|\\boh+_|\\beh+_|\\ber+_|\\berm+_|\\bmmm+_|\\bum+_|\\b[hu]{2,}_|\\bmhm+|\\bhi+_|\\bhey+_|\\bby+e+_|\\b[ha]{2,}_|\\b[he]{2,}_|\\b[wo]{3,}p?s*_|\\b[oi]{2,}_|\\bouch_|\\bhum+_", words[j], re.IGNORECASE)) or
             # Also added "hm+" on Peter's suggestion but made sure that this was case sensitive to avoid mistagging Her Majesty ;-)
-                (re.search("\\bhm+|\\bHm+", words[j])) or
-                (re.search("\\bmm_", words[j], re.IGNORECASE) and not re.search("_CD|[0-9]{1,}_", words[j-1]))): # ELF: Hopefully excluding "mm" in the sense of millimetres
-                words[j] = re.sub("_(\w+)", "_FPUH", words[j])
+                (rule_search("\\bhm+|\\bHm+", words[j])) or
+                (rule_search("\\bmm_", words[j], re.IGNORECASE) and not rule_search("_CD|[0-9]{1,}_", words[j-1]))): # ELF: Hopefully excluding "mm" in the sense of millimetres
+                words[j] = rule_sub("_(\w+)", "_FPUH", words[j])
 
             # ELF: Added a new "bin" variable for "so" as tagged as a preposition (IN) or adverb (RB) by the POS-tagger 
             # because it most often does not seem to be a preposition/conjunct (but rather a filler, amplifier, etc.) and should therefore not be added to the preposition count.
 
-            if (re.search("\\bso_IN|\\bso_RB", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_SO", words[j])
+            if (rule_search("\\bso_IN|\\bso_RB", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_SO", words[j])
 
             # Tags quantifiers 
             # ELF: Note that this variable is used to identify several other features. 
@@ -431,14 +1519,14 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # ELF: Added "more" and "less" when tagged by the POS-tagger as adjectives (JJ.*).
             # ELF: Also added "load(s) of" and "heaps of" on DS's recommendation
             # ELF: Getting rid of the POS-tagger predeterminer (PDT) category and now counting all those as quantifiers (QUAN)
-            if ((re.search("_PDT", words[j], re.IGNORECASE)) or 
-            (re.search("\\ball_|\\bany_|\\bbillions_|\\bboth_|\\bdozens_|\\beach_|\\benough_|\\bevery_|\\bfew_|\\bhalf_|hundreds_|\\bmany_|\\bmillions_|\\bmore_JJ|\\bmuch_|\\bplenty_|\\bseveral_|\\bsome_|\\blots_|\\bloads_|\\bheaps_|\\bless_JJ|\\bloada_|thousands_|\\bwee_|\\bzillions_", words[j], re.IGNORECASE))or
-            (re.search("\\bload_|\\bcouple_", words[j], re.IGNORECASE) and re.search("\\bof_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bmost_", words[j], re.IGNORECASE) and re.search("\\bof_|\W+|_N|_J", words[j+1], re.IGNORECASE)) or
-            (re.search("\\ba_", words[j-1], re.IGNORECASE) and re.search("\\blot_|\\bbit_|\\blittle_|\\btad_", words[j], re.IGNORECASE)) or # ELF: Added "a lot (of)" and removed NULL tags
-            (re.search("\\bof_", words[j+1], re.IGNORECASE) and re.search("\\blot_|\\bbit_|\\blittle_|\\btad_", words[j], re.IGNORECASE)) or # ELF: Added "a lot (of)" and removed NULL tags
-            (re.search("\\ba_", words[j-2], re.IGNORECASE) and re.search("\\blot_|\\bbit_", words[j], re.IGNORECASE))): # ELF: Added this line to account for "a little bit", "a whole lot", etc.
-                words[j] = re.sub("_\w+", "_QUAN", words[j])
+            if ((rule_search("_PDT", words[j], re.IGNORECASE)) or 
+            (rule_search("\\ball_|\\bany_|\\bbillions_|\\bboth_|\\bdozens_|\\beach_|\\benough_|\\bevery_|\\bfew_|\\bhalf_|hundreds_|\\bmany_|\\bmillions_|\\bmore_JJ|\\bmuch_|\\bplenty_|\\bseveral_|\\bsome_|\\blots_|\\bloads_|\\bheaps_|\\bless_JJ|\\bloada_|thousands_|\\bwee_|\\bzillions_", words[j], re.IGNORECASE))or
+            (rule_search("\\bload_|\\bcouple_", words[j], re.IGNORECASE) and rule_search("\\bof_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bmost_", words[j], re.IGNORECASE) and rule_search("\\bof_|\W+|_N|_J", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\ba_", words[j-1], re.IGNORECASE) and rule_search("\\blot_|\\bbit_|\\blittle_|\\btad_", words[j], re.IGNORECASE)) or # ELF: Added "a lot (of)" and removed NULL tags
+            (rule_search("\\bof_", words[j+1], re.IGNORECASE) and rule_search("\\blot_|\\bbit_|\\blittle_|\\btad_", words[j], re.IGNORECASE)) or # ELF: Added "a lot (of)" and removed NULL tags
+            (rule_search("\\ba_", words[j-2], re.IGNORECASE) and rule_search("\\blot_|\\bbit_", words[j], re.IGNORECASE))): # ELF: Added this line to account for "a little bit", "a whole lot", etc.
+                words[j] = rule_sub("_\w+", "_QUAN", words[j])
                    
     #---------------------------------------------------
     # COMPLEX TAGS
@@ -452,30 +1540,30 @@ def process_sentence (words: list, extended: bool = False) -> list:
         # --> but it does not include "now" (since it's already a time adverbial), "please" (included in politeness), "quite" or "sort of" (hedges). 
         # Also added: "nope", "I guess", "mind you", "whatever" and "damn" (if not a verb and not already tagged as an emphatic).
 
-            if ((re.search("\\bno_", words[j], re.IGNORECASE) and not re.search("_V", words[j]) and not re.search("_J|_NN|\\bless_", words[j+1])) or # This avoid a conflict with the synthetic negation variable and leaves the "no" in "I dunno" as a present tense verb form and "no" from "no one".
-            (re.search("_\W|_FPUH|_DMA", words[j-1]) and re.search("\\bright_|\\bokay_|\\bok_", words[j], re.IGNORECASE)) or # Right and okay immediately proceeded by a punctuation mark, a filler word or a simple DMA (tagged earlier on)
-            (not re.search("\\bas_|\\bhow_|\\bvery_|\\breally_|\\bso_|\\bquite_|_V|_XX0", words[j-1], re.IGNORECASE) and re.search("\\bwell_JJ|\\bwell_RB|\\bwell_NNP|\\bwell_UH", words[j], re.IGNORECASE) and not re.search("_JJ|_RB|-_", words[j+1])) or # Includes all forms of "well" except as a singular noun assuming that the others are mistags of DMA well's by the POS-tagger.
-            (not re.search("\\bmakes_|\\bmake_|\\bmade_|\\bmaking_|\\bnot|_\\bfor_|\\byou_|\\b(" + be + ")|\\bfor_", words[j-1], re.IGNORECASE) and re.search("\\bsure_JJ|\\bsure_RB", words[j], re.IGNORECASE)) or # This excludes MAKE sure, BE sure, not sure, and for sure
-            (re.search("\\bof_", words[j-1], re.IGNORECASE) and re.search("\\bcourse_", words[j], re.IGNORECASE)) or
-            (re.search("\\ball_", words[j-1], re.IGNORECASE) and re.search("\\bright_", words[j], re.IGNORECASE)) or
-            (re.search("\\bmind_", words[j], re.IGNORECASE) and re.search("\\byou_", words[j+1], re.IGNORECASE))): 
+            if ((rule_search("\\bno_", words[j], re.IGNORECASE) and not rule_search("_V", words[j]) and not rule_search("_J|_NN|\\bless_", words[j+1])) or # This avoid a conflict with the synthetic negation variable and leaves the "no" in "I dunno" as a present tense verb form and "no" from "no one".
+            (rule_search("_\W|_FPUH|_DMA", words[j-1]) and rule_search("\\bright_|\\bokay_|\\bok_", words[j], re.IGNORECASE)) or # Right and okay immediately proceeded by a punctuation mark, a filler word or a simple DMA (tagged earlier on)
+            (not rule_search("\\bas_|\\bhow_|\\bvery_|\\breally_|\\bso_|\\bquite_|_V|_XX0", words[j-1], re.IGNORECASE) and rule_search("\\bwell_JJ|\\bwell_RB|\\bwell_NNP|\\bwell_UH", words[j], re.IGNORECASE) and not rule_search("_JJ|_RB|-_", words[j+1])) or # Includes all forms of "well" except as a singular noun assuming that the others are mistags of DMA well's by the POS-tagger.
+            (not make_not_for_you_be_rule.search(words[j-1]) and rule_search("\\bsure_JJ|\\bsure_RB", words[j], re.IGNORECASE)) or # This excludes MAKE sure, BE sure, not sure, and for sure
+            (rule_search("\\bof_", words[j-1], re.IGNORECASE) and rule_search("\\bcourse_", words[j], re.IGNORECASE)) or
+            (rule_search("\\ball_", words[j-1], re.IGNORECASE) and rule_search("\\bright_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bmind_", words[j], re.IGNORECASE) and rule_search("\\byou_", words[j+1], re.IGNORECASE))): 
 
-                words[j] = re.sub("_\w+", "_DMA", words[j])
+                words[j] = rule_sub("_\w+", "_DMA", words[j])
 
         #--------------------------------------------------
 
             # Tags attribute adjectives (JJAT) (see additional loop further down the line for additional JJAT cases that rely on these JJAT tags)
 
-            if ((re.search("_JJ", words[j]) and re.search("_JJ|_NN|_CD", words[j+1])) or
-            (re.search("_DT", words[j-1]) and re.search("_JJ", words[j]))):
-                words[j] = re.sub("_\w+", "_JJAT", words[j])
+            if ((rule_search("_JJ", words[j]) and rule_search("_JJ|_NN|_CD", words[j+1])) or
+            (rule_search("_DT", words[j-1]) and rule_search("_JJ", words[j]))):
+                words[j] = rule_sub("_\w+", "_JJAT", words[j])
 
             #----------------------------------------------------    
             
             # Manually add okay as a predicative adjective (JJPR) because "okay" and "ok" are often tagged as foreign words by the POS-tagger. All other predicative adjectives are tagged at the very end.
 
-            if (re.search("\\b(" + be + ")", words[j-1], re.IGNORECASE) and re.search("\\bok_|okay_", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_JJPR", words[j])
+            if (be_rule.search(words[j-1]) and rule_search("\\bok_|okay_", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_JJPR", words[j])
 
             #---------------------------------------------------
 
@@ -483,74 +1571,74 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # ELF: This is a new variable.
             # ELF: added the exception that "that" should not be a determiner. Also added "in that" and "to the extent that" on DS's advice.  
 
-            if ((re.search("\\bsuch_", words[j-1], re.IGNORECASE) and re.search("\\bthat_", words[j]) and not re.search("_DT", words[j])) or
-            (re.search("\\bsuch_|\\binasmuch__|\\bforasmuch_|\\binsofar_|\\binsomuch", words[j-1], re.IGNORECASE) and re.search("\\bas_", words[j])) or
-            (re.search("\\bso_", words[j-2], re.IGNORECASE) and re.search("\\blong_", words[j-1]) and re.search("\\bas_", words[j])) or
-            (re.search("\\bin_IN", words[j-1], re.IGNORECASE) and re.search("\\bthat_", words[j]) and not re.search("_DT", words[j])) or
-            (re.search("\\bto_", words[j-3], re.IGNORECASE) and re.search("\\bthe_", words[j-2]) and re.search("\\bextent_", words[j-1]) and re.search("\\bthat_", words[j])) or
-            (re.search("\\bin_", words[j-1], re.IGNORECASE) and re.search("\\bparticular_|\\bconclusion_|\\bsum_|\\bsummary_|\\bfact_|\\bbrief_", words[j], re.IGNORECASE)) or
-            (re.search("\\bto_", words[j-1], re.IGNORECASE) and re.search("\\bsummarise_|\\bsummarize_", words[j], re.IGNORECASE) and re.search(",_", words[j])) or
-            (re.search("\\bin_", words[j-1], re.IGNORECASE) and re.search("\\bshort_", words[j], re.IGNORECASE) and re.search(",_", words[j])) or
-            (re.search("\\bfor_", words[j-1], re.IGNORECASE) and re.search("\\bexample_|\\binstance_", words[j], re.IGNORECASE)) or
-            (re.search("\\bsimilarly_|\\baccordingly_", words[j], re.IGNORECASE) and re.search(",_", words[j+1])) or
-            (re.search("\\bin_", words[j-2], re.IGNORECASE) and re.search("\\bany_", words[j-1], re.IGNORECASE) and re.search("\\bevent_|\\bcase_", words[j], re.IGNORECASE)) or
-            (re.search("\\bin_", words[j-2], re.IGNORECASE) and re.search("\\bother_", words[j-1], re.IGNORECASE) and re.search("\\bwords_", words[j]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ELAB", words[j])
-
-            if (re.search("\\beg_|\\be\.g\._|etc\.?_|\\bi\.e\._|\\bcf\.?_|\\blikewise_|\\bnamely_|\\bviz\.?_", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_ELAB", words[j])
+            if ((rule_search("\\bsuch_", words[j-1], re.IGNORECASE) and rule_search("\\bthat_", words[j]) and not rule_search("_DT", words[j])) or
+            (rule_search("\\bsuch_|\\binasmuch__|\\bforasmuch_|\\binsofar_|\\binsomuch", words[j-1], re.IGNORECASE) and rule_search("\\bas_", words[j])) or
+            (rule_search("\\bso_", words[j-2], re.IGNORECASE) and rule_search("\\blong_", words[j-1]) and rule_search("\\bas_", words[j])) or
+            (rule_search("\\bin_IN", words[j-1], re.IGNORECASE) and rule_search("\\bthat_", words[j]) and not rule_search("_DT", words[j])) or
+            (rule_search("\\bto_", words[j-3], re.IGNORECASE) and rule_search("\\bthe_", words[j-2]) and rule_search("\\bextent_", words[j-1]) and rule_search("\\bthat_", words[j])) or
+            (rule_search("\\bin_", words[j-1], re.IGNORECASE) and rule_search("\\bparticular_|\\bconclusion_|\\bsum_|\\bsummary_|\\bfact_|\\bbrief_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bto_", words[j-1], re.IGNORECASE) and rule_search("\\bsummarise_|\\bsummarize_", words[j], re.IGNORECASE) and rule_search(",_", words[j])) or
+            (rule_search("\\bin_", words[j-1], re.IGNORECASE) and rule_search("\\bshort_", words[j], re.IGNORECASE) and rule_search(",_", words[j])) or
+            (rule_search("\\bfor_", words[j-1], re.IGNORECASE) and rule_search("\\bexample_|\\binstance_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bsimilarly_|\\baccordingly_", words[j], re.IGNORECASE) and rule_search(",_", words[j+1])) or
+            (rule_search("\\bin_", words[j-2], re.IGNORECASE) and rule_search("\\bany_", words[j-1], re.IGNORECASE) and rule_search("\\bevent_|\\bcase_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bin_", words[j-2], re.IGNORECASE) and rule_search("\\bother_", words[j-1], re.IGNORECASE) and rule_search("\\bwords_", words[j]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ELAB", words[j])
+
+            if (rule_search("\\beg_|\\be\.g\._|etc\.?_|\\bi\.e\._|\\bcf\.?_|\\blikewise_|\\bnamely_|\\bviz\.?_", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_ELAB", words[j])
 
             #---------------------------------------------------
 
             # Tags coordinators (CC)
             # ELF: This is a new variable.
             # ELF: added as well (as), as well, in fact, accordingly, thereby, also, by contrast, besides, further_RB, in comparison, instead (not followed by "of").
-            if ((re.search("\\bwhile_IN|\\bwhile_RB|\\bwhilst_|\\bwhereupon_|\\bwhereas_|\\bwhereby_|\\bthereby_|\\balso_|\\bbesides_|\\bfurther_RB|\\binstead_|\\bmoreover_|\\bfurthermore_|\\badditionally_|\\bhowever_|\\binstead_|\\bibid\._|\\bibid_|\\bconversly_", words[j], re.IGNORECASE)) or 
-            (re.search("\\binasmuch__|\\bforasmuch_|\\binsofar_|\\binsomuch", words[j], re.IGNORECASE) and re.search("\\bas_", words[j+1], re.IGNORECASE)) or
-            (re.search("_\W", words[j-1], re.IGNORECASE) and re.search("\\bhowever_", words[j], re.IGNORECASE)) or
-            (re.search("\\bas_", words[j], re.IGNORECASE) and re.search("_VBN|\\bthough_", words[j+1])) or # E.g., as described, as seen in, as though...
-            (re.search("_\W", words[j+1], re.IGNORECASE) and re.search("\\bhowever_", words[j], re.IGNORECASE)) or
-            (re.search("\\bor_", words[j-1], re.IGNORECASE) and re.search("\\brather_", words[j], re.IGNORECASE)) or
-            (not re.search("\\bleast_", words[j-1], re.IGNORECASE) and re.search("\\bas_", words[j], re.IGNORECASE) and re.search("\\bwell_", words[j+1], re.IGNORECASE)) or # Excludes "at least as well" but includes "as well as"
-            (re.search("_\W", words[j-1]) and re.search("\\belse_|\\baltogether_|\\brather_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_CC", words[j])
+            if ((rule_search("\\bwhile_IN|\\bwhile_RB|\\bwhilst_|\\bwhereupon_|\\bwhereas_|\\bwhereby_|\\bthereby_|\\balso_|\\bbesides_|\\bfurther_RB|\\binstead_|\\bmoreover_|\\bfurthermore_|\\badditionally_|\\bhowever_|\\binstead_|\\bibid\._|\\bibid_|\\bconversly_", words[j], re.IGNORECASE)) or 
+            (rule_search("\\binasmuch__|\\bforasmuch_|\\binsofar_|\\binsomuch", words[j], re.IGNORECASE) and rule_search("\\bas_", words[j+1], re.IGNORECASE)) or
+            (rule_search("_\W", words[j-1], re.IGNORECASE) and rule_search("\\bhowever_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bas_", words[j], re.IGNORECASE) and rule_search("_VBN|\\bthough_", words[j+1])) or # E.g., as described, as seen in, as though...
+            (rule_search("_\W", words[j+1], re.IGNORECASE) and rule_search("\\bhowever_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bor_", words[j-1], re.IGNORECASE) and rule_search("\\brather_", words[j], re.IGNORECASE)) or
+            (not rule_search("\\bleast_", words[j-1], re.IGNORECASE) and rule_search("\\bas_", words[j], re.IGNORECASE) and rule_search("\\bwell_", words[j+1], re.IGNORECASE)) or # Excludes "at least as well" but includes "as well as"
+            (rule_search("_\W", words[j-1]) and rule_search("\\belse_|\\baltogether_|\\brather_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_CC", words[j])
             
             # Second loop for coordinators
-            if ((re.search("\\bby_", words[j-1], re.IGNORECASE) and re.search("\\bcontrast_|\\bcomparison_", words[j], re.IGNORECASE)) or
-            (re.search("\\bin_", words[j-1], re.IGNORECASE) and re.search("\\bcomparison_|\\bcontrast_|\\baddition_", words[j], re.IGNORECASE)) or
-            (re.search("\\bon_", words[j-2], re.IGNORECASE) and re.search("\\bthe_", words[j-1]) and re.search("\\bcontrary_", words[j], re.IGNORECASE)) or
-            (re.search("\\bon_", words[j-3], re.IGNORECASE) and re.search("\\bthe_", words[j-2]) and re.search("\\bone_|\\bother_", words[j-1], re.IGNORECASE) and re.search("\\bhand_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_\\1 CC", words[j])
+            if ((rule_search("\\bby_", words[j-1], re.IGNORECASE) and rule_search("\\bcontrast_|\\bcomparison_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bin_", words[j-1], re.IGNORECASE) and rule_search("\\bcomparison_|\\bcontrast_|\\baddition_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bon_", words[j-2], re.IGNORECASE) and rule_search("\\bthe_", words[j-1]) and rule_search("\\bcontrary_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bon_", words[j-3], re.IGNORECASE) and rule_search("\\bthe_", words[j-2]) and rule_search("\\bone_|\\bother_", words[j-1], re.IGNORECASE) and rule_search("\\bhand_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_\\1 CC", words[j])
         
             #---------------------------------------------------
 
             # Tags causal conjunctions     
             # ELF added: cos, cus, coz, cuz and 'cause (a form spotted in one textbook of the TEC!) plus all the complex forms below.
             # ELF: Note that this operationalisation does not attempt to include "for".
-            if ((re.search("\\bbecause_|\\bcos_|\\bcos\._|\\bcus_|\\bcuz_|\\bcoz_|\\b'cause_", words[j], re.IGNORECASE)) or
-            (re.search("\\bconsequently_|\\bhence_|\\btherefore_", words[j], re.IGNORECASE)) or
-            (re.search("\\bthanks_", words[j], re.IGNORECASE) and re.search("\\bto_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bthus_", words[j], re.IGNORECASE) and not re.search("\\bfar_", words[j+1], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_CUZ", words[j])
-
-            if ((re.search("\\bin_", words[j-1], re.IGNORECASE) and re.search("\\bconsequence_", words[j], re.IGNORECASE)) or
-            (re.search("\\bsuch_|\\bso_", words[j-1], re.IGNORECASE) and re.search("\\bthat_", words[j]) and not re.search("_DT", words[j])) or
-            (re.search("\\bas_", words[j-2], re.IGNORECASE) and re.search("\\ba_", words[j-1], re.IGNORECASE) and re.search("\\bresult_|\\bconsequence_", words[j], re.IGNORECASE)) or
-            (re.search("\\bon_", words[j-2], re.IGNORECASE) and re.search("\\baccount_", words[j-1], re.IGNORECASE) and re.search("\\bof_", words[j], re.IGNORECASE)) or
-            (re.search("\\bfor_", words[j-2], re.IGNORECASE) and re.search("\\bthat_|\\bthis_", words[j-1], re.IGNORECASE) and re.search("\\bpurpose_", words[j], re.IGNORECASE)) or
-            (re.search("\\bto_", words[j-2], re.IGNORECASE) and re.search("\\bthat_|\\bthis_", words[j-1], re.IGNORECASE) and re.search("\\bend_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_\\1 CUZ", words[j])
+            if ((rule_search("\\bbecause_|\\bcos_|\\bcos\._|\\bcus_|\\bcuz_|\\bcoz_|\\b'cause_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bconsequently_|\\bhence_|\\btherefore_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bthanks_", words[j], re.IGNORECASE) and rule_search("\\bto_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bthus_", words[j], re.IGNORECASE) and not rule_search("\\bfar_", words[j+1], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_CUZ", words[j])
+
+            if ((rule_search("\\bin_", words[j-1], re.IGNORECASE) and rule_search("\\bconsequence_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bsuch_|\\bso_", words[j-1], re.IGNORECASE) and rule_search("\\bthat_", words[j]) and not rule_search("_DT", words[j])) or
+            (rule_search("\\bas_", words[j-2], re.IGNORECASE) and rule_search("\\ba_", words[j-1], re.IGNORECASE) and rule_search("\\bresult_|\\bconsequence_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bon_", words[j-2], re.IGNORECASE) and rule_search("\\baccount_", words[j-1], re.IGNORECASE) and rule_search("\\bof_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bfor_", words[j-2], re.IGNORECASE) and rule_search("\\bthat_|\\bthis_", words[j-1], re.IGNORECASE) and rule_search("\\bpurpose_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bto_", words[j-2], re.IGNORECASE) and rule_search("\\bthat_|\\bthis_", words[j-1], re.IGNORECASE) and rule_search("\\bend_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_\\1 CUZ", words[j])
 
             #---------------------------------------------------
 
             # Tags conditional conjunctions
             # ELF: added "lest" on DS's suggestion. Added "whether" on PU's suggestion.
-            if (re.search("\\bif_|\\bunless_|\\blest_|\\botherwise_|\\bwhether_", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_COND", words[j])
+            if (rule_search("\\bif_|\\bunless_|\\blest_|\\botherwise_|\\bwhether_", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_COND", words[j])
 
-            if ((re.search("\\bas_", words[j-2], re.IGNORECASE) and re.search("\\blong_", words[j-1]) and re.search("\\bas_", words[j])) or
-            (re.search("\\bin_", words[j-2], re.IGNORECASE) and re.search("\\bthat_", words[j-1]) and re.search("\\bcase_", words[j]))):
-                words[j] = re.sub("_(\w+)", "_\\1 COND", words[j])
+            if ((rule_search("\\bas_", words[j-2], re.IGNORECASE) and rule_search("\\blong_", words[j-1]) and rule_search("\\bas_", words[j])) or
+            (rule_search("\\bin_", words[j-2], re.IGNORECASE) and rule_search("\\bthat_", words[j-1]) and rule_search("\\bcase_", words[j]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 COND", words[j])
 
             #---------------------------------------------------
 
@@ -559,66 +1647,66 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # Added: so many, so much, so little, so + VERB, damn + ADJ, least, bloody, fuck, fucking, damn, super and dead + ADJ.
             # Added a differentiation between "most" as as QUAN ("most of") and EMPH.
             # Improved the accuracy of DO + verb by specifying a base form (_VB) so as to avoid: "Did they do_EMPH stuffed_VBN crust?".
-            if ((re.search("\\bmost_DT", words[j], re.IGNORECASE)) or
-            (re.search("\\bmost_", words[j], re.IGNORECASE) and re.search("_J|_VBN|_VBG", words[j+1])) or
-            (re.search("\\breal_|\\bdead_|\\bdamn_|\\bfuck|\\bshit|\\bsuper_", words[j], re.IGNORECASE) and re.search("_J|_RB", words[j+1])) or
-            (re.search("\\breally_|\\btruly_|\\bbloody_|\\bpretty_|\\bmore_", words[j], re.IGNORECASE) and re.search("_J|_RB|_V|_MD", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bso_", words[j], re.IGNORECASE) and re.search("_J|\\bmany_|\\bmuch_|\\blittle_|_RB", words[j+1], re.IGNORECASE) and not re.search("\\bfar_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bfar_|\\bway_", words[j], re.IGNORECASE) and re.search("_J|_RB", words[j+1]) and not re.search("\\baway_", words[j+1], re.IGNORECASE) and not re.search("\\bso_|\\bthus_", words[j-1], re.IGNORECASE)) or
-            (not re.search("\\bof_", words[j-1], re.IGNORECASE) and re.search("\\bsuch_", words[j], re.IGNORECASE) and re.search("\\ba_|\\ban_", words[j+1], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_EMPH", words[j])
-
-            if ((re.search("\\bloads_", words[j], re.IGNORECASE) and not re.search("\\bof_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bfor_", words[j], re.IGNORECASE) and re.search("\\bsure_", words[j+1], re.IGNORECASE))): 
-                words[j] = re.sub("_(\w+)", "_\\1 EMPH", words[j])
-
-            if (re.search("\\b(" + do + ")", words[j], re.IGNORECASE) and re.search("_VB\\b", words[j+1])):                
-                words[j] = re.sub("_(\w+)", "_\\1 DOAUX EMPH", words[j])
+            if ((rule_search("\\bmost_DT", words[j], re.IGNORECASE)) or
+            (rule_search("\\bmost_", words[j], re.IGNORECASE) and rule_search("_J|_VBN|_VBG", words[j+1])) or
+            (rule_search("\\breal_|\\bdead_|\\bdamn_|\\bfuck|\\bshit|\\bsuper_", words[j], re.IGNORECASE) and rule_search("_J|_RB", words[j+1])) or
+            (rule_search("\\breally_|\\btruly_|\\bbloody_|\\bpretty_|\\bmore_", words[j], re.IGNORECASE) and rule_search("_J|_RB|_V|_MD", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bso_", words[j], re.IGNORECASE) and rule_search("_J|\\bmany_|\\bmuch_|\\blittle_|_RB", words[j+1], re.IGNORECASE) and not rule_search("\\bfar_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bfar_|\\bway_", words[j], re.IGNORECASE) and rule_search("_J|_RB", words[j+1]) and not rule_search("\\baway_", words[j+1], re.IGNORECASE) and not rule_search("\\bso_|\\bthus_", words[j-1], re.IGNORECASE)) or
+            (not rule_search("\\bof_", words[j-1], re.IGNORECASE) and rule_search("\\bsuch_", words[j], re.IGNORECASE) and rule_search("\\ba_|\\ban_", words[j+1], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_EMPH", words[j])
+
+            if ((rule_search("\\bloads_", words[j], re.IGNORECASE) and not rule_search("\\bof_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bfor_", words[j], re.IGNORECASE) and rule_search("\\bsure_", words[j+1], re.IGNORECASE))): 
+                words[j] = rule_sub("_(\w+)", "_\\1 EMPH", words[j])
+
+            if (do_rule.search(words[j]) and rule_search("_VB\\b", words[j+1])):                
+                words[j] = rule_sub("_(\w+)", "_\\1 DOAUX EMPH", words[j])
             #---------------------------------------------------
 
             # Feature from the MAT/Biber Tagger.
             # Tags phrasal coordination with "and", "or" and "nor". 
             # ELF: Not currently in use due to poor precision and recall (see Perl MFTE performance evaluation).
-            #if ((re.search("\\band_|\\bor_|&_|\\bnor_", words[j], re.IGNORECASE)) and
-            # ((re.search("_RB", words[j-1]) and re.search("_RB", words[j+1])) or
-            #(re.search("_J", words[j-1]) and re.search("_J", words[j+1])) or
-            #(re.search("_V", words[j-1]) and re.search("_V", words[j+1])) or
-            #(re.search("_CD", words[j-1]) and re.search("_CD", words[j+1])) or
-            #(re.search("_NN", words[j-1]) and re.search("_NN|whatever_|_DT", words[j+1])))):
-            #   words[j] = re.sub("_\w+", "_PHC", words[j])
+            #if ((rule_search("\\band_|\\bor_|&_|\\bnor_", words[j], re.IGNORECASE)) and
+            # ((rule_search("_RB", words[j-1]) and rule_search("_RB", words[j+1])) or
+            #(rule_search("_J", words[j-1]) and rule_search("_J", words[j+1])) or
+            #(rule_search("_V", words[j-1]) and rule_search("_V", words[j+1])) or
+            #(rule_search("_CD", words[j-1]) and rule_search("_CD", words[j+1])) or
+            #(rule_search("_NN", words[j-1]) and rule_search("_NN|whatever_|_DT", words[j+1])))):
+            #   words[j] = rule_sub("_\w+", "_PHC", words[j])
 
             #---------------------------------------------------
 
             # Tags auxiliary DO ELF: I added this variable which replaces the MAT's/Biber tagger's "pro-verb" DO variable. 
             # Later on, all DO verbs not tagged as DOAUX are tagged as ACT (if using the extended tagset).
-            if (re.search("\\bdo_V|\\bdoes_V|\\bdid_V", words[j], re.IGNORECASE) and not re.search("to_", words[j-1]) and not re.search("to_", words[j+1])): # This excludes DO + VB\\b which have already been tagged as emphatics (DO_EMPH) and "to do" constructions
-                if ((re.search("_VB\\b", words[j+2])) or # did you hurt yourself? Didn't look? 
-                (re.search("-_,| $", words[j-1]) and not re.search("\\bdo_V", words[j], re.IGNORECASE)) or # Sentence starting with Did or Does (Do is potentially a VIMP)
-                (re.search("_VB\\b", words[j+3])) or # didn't it hurt?
-                (re.search("_\W", words[j+1])) or # You did?
-                (re.search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_|_XX0", words[j+1], re.IGNORECASE) and re.search("_\\.|_VB\\b", words[j+2])) or # ELF: Added to include question tags such as: "do you?"" or "He didn't!""
-                (re.search("_XX0", words[j+1]) and re.search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_|_VB\\b", words[j+2], re.IGNORECASE)) or # Allows for question tags such as: didn't you? as well as negated forms such as: did not like
-                (re.search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_", words[j+1], re.IGNORECASE) and re.search("\\?_\\.", words[j+3])) or # ELF: Added to include question tags such as: did you not? did you really?
-                (re.search("(\\b(" + wp + "))|(\\b" + who + ")|(\\b" + whw + ")", words[j-1], re.IGNORECASE))):
-                    words[j] = re.sub("_(\w+)", "_\\1 DOAUX", words[j])
+            if (rule_search("\\bdo_V|\\bdoes_V|\\bdid_V", words[j], re.IGNORECASE) and not rule_search("to_", words[j-1]) and not rule_search("to_", words[j+1])): # This excludes DO + VB\\b which have already been tagged as emphatics (DO_EMPH) and "to do" constructions
+                if ((rule_search("_VB\\b", words[j+2])) or # did you hurt yourself? Didn't look? 
+                (rule_search("-_,| $", words[j-1]) and not rule_search("\\bdo_V", words[j], re.IGNORECASE)) or # Sentence starting with Did or Does (Do is potentially a VIMP)
+                (rule_search("_VB\\b", words[j+3])) or # didn't it hurt?
+                (rule_search("_\W", words[j+1])) or # You did?
+                (rule_search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_|_XX0", words[j+1], re.IGNORECASE) and rule_search("_\\.|_VB\\b", words[j+2])) or # ELF: Added to include question tags such as: "do you?"" or "He didn't!""
+                (rule_search("_XX0", words[j+1]) and rule_search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_|_VB\\b", words[j+2], re.IGNORECASE)) or # Allows for question tags such as: didn't you? as well as negated forms such as: did not like
+                (rule_search("\\bI_|\\byou_|\\bhe_|\\bshe_|\\bit_|\\bwe_|\\bthey_", words[j+1], re.IGNORECASE) and rule_search("\\?_\\.", words[j+3])) or # ELF: Added to include question tags such as: did you not? did you really?
+                (wh_word_rule.search(words[j-1]))):
+                    words[j] = rule_sub("_(\w+)", "_\\1 DOAUX", words[j])
                 
         #---------------------------------------------------
 
         # ELF: Regex for question tags. New variable.
-            if ((not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("_MD|\\bdid_|\\bhad_", words[j-3], re.IGNORECASE) and re.search("_XX0", words[j-2]) and re.search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("\\?_\\.", words[j])) or # couldn't he?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("_MD|\\bdid_|\\bhad_|\\bdo_", words[j-2], re.IGNORECASE) and re.search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_|\\byou_", words[j-1]) and re.search("\\?_\\.", words[j])) or # did they?
-            (not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("\\bis_|\\bdoes_|\\bwas|\\bhas|\\bdo_", words[j-3], re.IGNORECASE) and re.search("_XX0", words[j-2]) and re.search("\\bit_|\\bshe_|\\bhe_|\\bthey_", words[j-1], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # isn't it?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("\\bis_|\\bdoes_|\\bwas|\\bhas_", words[j-2], re.IGNORECASE) and re.search("\\bit_|\\bshe_|\\bhe_", words[j-1], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # has she?
-            (not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-3], re.IGNORECASE) and re.search("_XX0", words[j-2]) and re.search("\\byou_|\\bwe_|\\bthey_", words[j-1], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # haven't you?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-2], re.IGNORECASE) and re.search("\\byou_|\\bwe_|\\bthey_", words[j-1], re.IGNORECASE) and re.search("\\?_\\.", words[j])) or # were you?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("_MD|\\bdid_|\\bhad_|\\bdo_", words[j-1], re.IGNORECASE) and re.search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_|\\byou_", words[j-2]) and re.search("\\?_\\.", words[j])) or # they did?
-            (not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("\\bis_|\\bdoes_|\\bwas|\\bhas|\\bdo_", words[j-2], re.IGNORECASE) and re.search("_XX0", words[j-1]) and re.search("\\bit_|\\bshe_|\\bhe_|\\bthey_", words[j-3], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # it isn't?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("\\bis_|\\bdoes_|\\bwas|\\bhas_", words[j-1], re.IGNORECASE) and re.search("\\bit_|\\bshe_|\\bhe_", words[j-2], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # she has?
-            (not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-2], re.IGNORECASE) and re.search("_XX0", words[j-1]) and re.search("\\byou_|\\bwe_|\\bthey_", words[j-3], re.IGNORECASE) and re.search("\\?_\\.", words[j]))  or # you haven't?
-            (not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-1], re.IGNORECASE) and re.search("\\byou_|\\bwe_|\\bthey_", words[j-2], re.IGNORECASE) and re.search("\\?_\\.", words[j]))): # you were?
-            #(not re.search("\\b(" + whw + ")", words[j-2], re.IGNORECASE) and re.search("\\binnit_|\\binit_", words[j-1]) and re.search("\\?_\\.", words[j]))): # innit? init?
-
-                words[j] = re.sub("_(\W+)", "_\\1 QUTAG", words[j])
+            if ((not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and rule_search("_MD|\\bdid_|\\bhad_", words[j-3], re.IGNORECASE) and rule_search("_XX0", words[j-2]) and rule_search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and rule_search("\\?_\\.", words[j])) or # couldn't he?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("_MD|\\bdid_|\\bhad_|\\bdo_", words[j-2], re.IGNORECASE) and rule_search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_|\\byou_", words[j-1]) and rule_search("\\?_\\.", words[j])) or # did they?
+            (not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and rule_search("\\bis_|\\bdoes_|\\bwas|\\bhas|\\bdo_", words[j-3], re.IGNORECASE) and rule_search("_XX0", words[j-2]) and rule_search("\\bit_|\\bshe_|\\bhe_|\\bthey_", words[j-1], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # isn't it?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("\\bis_|\\bdoes_|\\bwas|\\bhas_", words[j-2], re.IGNORECASE) and rule_search("\\bit_|\\bshe_|\\bhe_", words[j-1], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # has she?
+            (not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and rule_search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-3], re.IGNORECASE) and rule_search("_XX0", words[j-2]) and rule_search("\\byou_|\\bwe_|\\bthey_", words[j-1], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # haven't you?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-2], re.IGNORECASE) and rule_search("\\byou_|\\bwe_|\\bthey_", words[j-1], re.IGNORECASE) and rule_search("\\?_\\.", words[j])) or # were you?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("_MD|\\bdid_|\\bhad_|\\bdo_", words[j-1], re.IGNORECASE) and rule_search("_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_|\\byou_", words[j-2]) and rule_search("\\?_\\.", words[j])) or # they did?
+            (not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and rule_search("\\bis_|\\bdoes_|\\bwas|\\bhas|\\bdo_", words[j-2], re.IGNORECASE) and rule_search("_XX0", words[j-1]) and rule_search("\\bit_|\\bshe_|\\bhe_|\\bthey_", words[j-3], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # it isn't?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("\\bis_|\\bdoes_|\\bwas|\\bhas_", words[j-1], re.IGNORECASE) and rule_search("\\bit_|\\bshe_|\\bhe_", words[j-2], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # she has?
+            (not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and rule_search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-2], re.IGNORECASE) and rule_search("_XX0", words[j-1]) and rule_search("\\byou_|\\bwe_|\\bthey_", words[j-3], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))  or # you haven't?
+            (not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and rule_search("\\bdo_|\\bwere_|\\bare_|\\bhave_", words[j-1], re.IGNORECASE) and rule_search("\\byou_|\\bwe_|\\bthey_", words[j-2], re.IGNORECASE) and rule_search("\\?_\\.", words[j]))): # you were?
+            #(not rule_search("\\b(" + whw + ")", words[j-2], re.IGNORECASE) and rule_search("\\binnit_|\\binit_", words[j-1]) and rule_search("\\?_\\.", words[j]))): # innit? init?
+
+                words[j] = rule_sub("_(\W+)", "_\\1 QUTAG", words[j])
 
 
             #---------------------------------------------------    
@@ -627,19 +1715,19 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # Note that, at this stage in the script, DT still includes demonstrative pronouns which is good. 
             # Also _P, at this stage, only includes PRP, and PPS (i.e., not yet any of the new verb variables which should not be captured here)
             
-            if ((not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-3], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-2], re.IGNORECASE) and re.search("_P|_NN|_DT|_CD|_DMA", words[j-1]) and re.search("\\?_\\.$", words[j])) or  # Are they there? It is him?
-            (not re.search("\\b(" + whw + ")", words[j-6], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-4], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-3], re.IGNORECASE) and re.search("_P|_NN|_DT|_CD|_DMA", words[j-2]) and re.search("\\?_\\.$", words[j])) or # Can you tell him?
-            (not re.search("\\b(" + whw + ")", words[j-7], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-6], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-5], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-4], re.IGNORECASE) and re.search("_P|_NN|_DT_CD|_DMA", words[j-3]) and re.search("\\?_\\.$", words[j])) or # Did her boss know that?
-            (not re.search("\\b(" + whw + ")", words[j-8], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-7], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-6], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-5], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-4]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-9], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-8], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-7], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-6], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-5]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-10], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-9], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-8], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-7], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-6]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-11], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-10], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-9], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-8], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-7]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-12], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-11], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-10], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-9], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-8]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-13], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-12], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-11], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-10], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-9]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-14], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-13], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-12], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-11], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-10]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-15], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-14], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-13], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-12], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-11]) and re.search("\\?_\\.$", words[j])) or
-            (not re.search("\\b(" + whw + ")", words[j-16], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-15], re.IGNORECASE) and not re.search("\\b(" + whw + ")", words[j-14], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j-13], re.IGNORECASE) and re.search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-12]) and re.search("\\?_\\.$", words[j]))):
-                words[j] = re.sub("_(\W+)", "_\\1 YNQU", words[j])
+            if ((not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and not whw_rule.search(words[j-3]) and auxiliary_rule.search(words[j-2]) and rule_search("_P|_NN|_DT|_CD|_DMA", words[j-1]) and rule_search("\\?_\\.$", words[j])) or  # Are they there? It is him?
+            (not whw_rule.search(words[j-6]) and not whw_rule.search(words[j-5]) and not whw_rule.search(words[j-4]) and auxiliary_rule.search(words[j-3]) and rule_search("_P|_NN|_DT|_CD|_DMA", words[j-2]) and rule_search("\\?_\\.$", words[j])) or # Can you tell him?
+            (not whw_rule.search(words[j-7]) and not whw_rule.search(words[j-6]) and not whw_rule.search(words[j-5]) and auxiliary_rule.search(words[j-4]) and rule_search("_P|_NN|_DT_CD|_DMA", words[j-3]) and rule_search("\\?_\\.$", words[j])) or # Did her boss know that?
+            (not whw_rule.search(words[j-8]) and not whw_rule.search(words[j-7]) and not whw_rule.search(words[j-6]) and auxiliary_rule.search(words[j-5]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-4]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-9]) and not whw_rule.search(words[j-8]) and not whw_rule.search(words[j-7]) and auxiliary_rule.search(words[j-6]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-5]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-10]) and not whw_rule.search(words[j-9]) and not whw_rule.search(words[j-8]) and auxiliary_rule.search(words[j-7]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-6]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-11]) and not whw_rule.search(words[j-10]) and not whw_rule.search(words[j-9]) and auxiliary_rule.search(words[j-8]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-7]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-12]) and not whw_rule.search(words[j-11]) and not whw_rule.search(words[j-10]) and auxiliary_rule.search(words[j-9]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-8]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-13]) and not whw_rule.search(words[j-12]) and not whw_rule.search(words[j-11]) and auxiliary_rule.search(words[j-10]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-9]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-14]) and not whw_rule.search(words[j-13]) and not whw_rule.search(words[j-12]) and auxiliary_rule.search(words[j-11]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-10]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-15]) and not whw_rule.search(words[j-14]) and not whw_rule.search(words[j-13]) and auxiliary_rule.search(words[j-12]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-11]) and rule_search("\\?_\\.$", words[j])) or
+            (not whw_rule.search(words[j-16]) and not whw_rule.search(words[j-15]) and not whw_rule.search(words[j-14]) and auxiliary_rule.search(words[j-13]) and rule_search("_P|_NN|_DT|_XX0|_CD|_DMA", words[j-12]) and rule_search("\\?_\\.$", words[j]))):
+                words[j] = rule_sub("_(\W+)", "_\\1 YNQU", words[j])
 
             #---------------------------------------------------
 
@@ -648,105 +1736,105 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # This regex now tags the past participles rather than the verb BE. It also allows for mistagging of -ed past participle forms as VBD by the POS tagger.
             # ELF: I am including most "'s_VBZ" as a possible form of the verb BE here but later on overriding many instances as part of the PEAS variable.    
 
-            if (re.search("_VBN|ed_VBD|en_VBD", words[j])): # Also accounts for past participle forms ending in "ed" and "en" mistagged as past tense forms (VBD) by the POS-tagger
+            if (rule_search("_VBN|ed_VBD|en_VBD", words[j])): # Also accounts for past participle forms ending in "ed" and "en" mistagged as past tense forms (VBD) by the POS-tagger
 
-                if ((re.search("\\b(" + be + ")", words[j-1], re.IGNORECASE)) or # is eaten 
-                #(re.search("s_VBZ", words[j-1], re.IGNORECASE) and re.search("\\bby_", words[j+1])) or # This line enables the passive to be preferred over present perfect if immediately followed by a "by"
-                (re.search("_RB|_XX0|_CC", words[j-1]) and re.search("\\b(" + be + ")", words[j-2], re.IGNORECASE)) or # isn't eaten 
-                (re.search("_RB|_XX0|_CC", words[j-1]) and re.search("_RB|_XX0", words[j-2]) and re.search("\\b(" + be + ")", words[j-3], re.IGNORECASE) and not re.search("\\bs_VBZ", words[j-3])) or # isn't really eaten
-                (re.search("_NN|_PRP|_CC", words[j-1]) and re.search("\\b(" + be + ")", words[j-2], re.IGNORECASE))or # is it eaten
-                (re.search("_RB|_XX0|_CC", words[j-1]) and re.search("_NN|_PRP", words[j-2]) and re.search("\\b(" + be + ")", words[j-3], re.IGNORECASE) and not re.search("\\bs_VBZ", words[j-3]))): # was she not failed?
-                    words[j] = re.sub("_\w+", "_PASS", words[j])
+                if ((be_rule.search(words[j-1])) or # is eaten 
+                #(rule_search("s_VBZ", words[j-1], re.IGNORECASE) and rule_search("\\bby_", words[j+1])) or # This line enables the passive to be preferred over present perfect if immediately followed by a "by"
+                (rule_search("_RB|_XX0|_CC", words[j-1]) and be_rule.search(words[j-2])) or # isn't eaten 
+                (rule_search("_RB|_XX0|_CC", words[j-1]) and rule_search("_RB|_XX0", words[j-2]) and be_rule.search(words[j-3]) and not rule_search("\\bs_VBZ", words[j-3])) or # isn't really eaten
+                (rule_search("_NN|_PRP|_CC", words[j-1]) and be_rule.search(words[j-2]))or # is it eaten
+                (rule_search("_RB|_XX0|_CC", words[j-1]) and rule_search("_NN|_PRP", words[j-2]) and be_rule.search(words[j-3]) and not rule_search("\\bs_VBZ", words[j-3]))): # was she not failed?
+                    words[j] = rule_sub("_\w+", "_PASS", words[j])
 
             # ELF: Added a new variable for GET-passives
-            if (re.search("_VBD|_VBN", words[j])):
-                if ((re.search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-1], re.IGNORECASE)) or
-                (re.search("_NN|_PRP|_RB", words[j-1]) and re.search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-2], re.IGNORECASE)) or # She got it cleaned, got immediately arrested
-                (re.search("_NN", words[j-1]) and re.search("_DT|_NN", words[j-2]) and re.search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-3], re.IGNORECASE))): # She got the car cleaned
-                    words[j] = re.sub("_\w+", "_PGET", words[j])
+            if (rule_search("_VBD|_VBN", words[j])):
+                if ((rule_search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-1], re.IGNORECASE)) or
+                (rule_search("_NN|_PRP|_RB", words[j-1]) and rule_search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-2], re.IGNORECASE)) or # She got it cleaned, got immediately arrested
+                (rule_search("_NN", words[j-1]) and rule_search("_DT|_NN", words[j-2]) and rule_search("\\bget_V|\\bgets_V|\\bgot_V|\\bgetting_V", words[j-3], re.IGNORECASE))): # She got the car cleaned
+                    words[j] = rule_sub("_\w+", "_PGET", words[j])
 
             #---------------------------------------------------
 
             # ELF: Added the new variable GOING TO, which allows for one intervening word between TO and the infinitive
             # Shakir: Added case insensitive flags for "going" and "gon"
             
-            if ((re.search("\\bgoing_VBG", words[j], re.IGNORECASE) and re.search("\\bto_TO", words[j+1]) and re.search("\_VB", words[j+2])) or
-            (re.search("\\bgoing_VBG", words[j], re.IGNORECASE) and re.search("\\bto_TO", words[j+1]) and re.search("\_VB", words[j+3])) or
-            (re.search("\\bgon_VBG", words[j], re.IGNORECASE) and re.search("\\bna_", words[j+1]) and re.search("\_VB", words[j+2])) or
-            (re.search("\\bgon_VBG", words[j], re.IGNORECASE) and re.search("\\bna_", words[j+1]) and re.search("\_VB", words[j+3]))):
-                words[j] = re.sub("_\w+", "_GTO", words[j])
+            if ((rule_search("\\bgoing_VBG", words[j], re.IGNORECASE) and rule_search("\\bto_TO", words[j+1]) and rule_search("\_VB", words[j+2])) or
+            (rule_search("\\bgoing_VBG", words[j], re.IGNORECASE) and rule_search("\\bto_TO", words[j+1]) and rule_search("\_VB", words[j+3])) or
+            (rule_search("\\bgon_VBG", words[j], re.IGNORECASE) and rule_search("\\bna_", words[j+1]) and rule_search("\_VB", words[j+2])) or
+            (rule_search("\\bgon_VBG", words[j], re.IGNORECASE) and rule_search("\\bna_", words[j+1]) and rule_search("\_VB", words[j+3]))):
+                words[j] = rule_sub("_\w+", "_GTO", words[j])
 
             #----------------------------------------------------
 
             # Tags synthetic negation 
             # ELF: Merged this category with Biber's original analytic negation category (XX0)
             # Hence had to move it further down in the script so it doesn't interfere with other complex tags
-            if ((re.search("\\bno_", words[j], re.IGNORECASE) and re.search("_J|_NN|\\blonger_|\\bmore_|\\bneed_|\\bdoubt_|\\bpoint_|\\breason_|\\bsuch_|\\bproblem_|\\bmatter_|\\bmeans_", words[j+1])) or
-            (re.search("\\bneither_", words[j], re.IGNORECASE)) or
-            (re.search("\\bnor_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_XX0", words[j])
+            if ((rule_search("\\bno_", words[j], re.IGNORECASE) and rule_search("_J|_NN|\\blonger_|\\bmore_|\\bneed_|\\bdoubt_|\\bpoint_|\\breason_|\\bsuch_|\\bproblem_|\\bmatter_|\\bmeans_", words[j+1])) or
+            (rule_search("\\bneither_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bnor_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_XX0", words[j])
 
             # Added a loop to tag "no one" and "each other" as a QUPR
-            if ((re.search("\\bno_", words[j], re.IGNORECASE) and re.search("\\bone_", words[j+1])) or
-            (re.search("\\beach_", words[j], re.IGNORECASE) and re.search("\\bother_", words[j+1])) or
-            (re.search("\\bone_", words[j], re.IGNORECASE) and re.search("\\banother_", words[j+1]))):
-                words[j+1] = re.sub("_(\w+)", "_QUPR", words[j+1])
+            if ((rule_search("\\bno_", words[j], re.IGNORECASE) and rule_search("\\bone_", words[j+1])) or
+            (rule_search("\\beach_", words[j], re.IGNORECASE) and rule_search("\\bother_", words[j+1])) or
+            (rule_search("\\bone_", words[j], re.IGNORECASE) and rule_search("\\banother_", words[j+1]))):
+                words[j+1] = rule_sub("_(\w+)", "_QUPR", words[j+1])
 
             #---------------------------------------------------
 
             # Tags split infinitives
             # ELF: merged this variable with split auxiliaries due to very low counts. Also removed "_AMPLIF|_DOWNTON" from these lists which Nini had but which made no sense because AMP and DWNT are a) tagged with shorter acronyms and b) this happens in future loops so RB does the job here. However, RB does not suffice for "n't" and not so I added _XX0 to the regex.
-            if ((re.search("\\bto_", words[j], re.IGNORECASE) and re.search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and re.search("_V", words[j+2])) or
-            (re.search("\\bto_", words[j], re.IGNORECASE) and re.search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and re.search("_RB|_XX0", words[j+2]) and re.search("_V", words[j+3])) or
+            if ((rule_search("\\bto_", words[j], re.IGNORECASE) and rule_search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and rule_search("_V", words[j+2])) or
+            (rule_search("\\bto_", words[j], re.IGNORECASE) and rule_search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and rule_search("_RB|_XX0", words[j+2]) and rule_search("_V", words[j+3])) or
 
             # Tags split auxiliaries - ELF: merged this variable with split infinitives due to very low counts. 
             # ELF: Also changed all forms of DO to auxiliary DOs only 
-            (re.search("_MD|DOAUX|(\\b(" + have + "))|(\\b(" + be + "))", words[j], re.IGNORECASE) and re.search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|\\ball_", words[j+1], re.IGNORECASE) and re.search("_V|_P", words[j+2])) or
-            (re.search("_MD|DOAUX|(\\b(" + have + "))|(\\b(" + be + "))", words[j], re.IGNORECASE) and re.search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and re.search("_RB|_XX0", words[j+2]) and re.search("_V", words[j+3]))):
-                words[j] = re.sub("_(\w+)", "_\\1 SPLIT", words[j])
+            (modal_doaux_have_be_rule.search(words[j]) and rule_search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|\\ball_", words[j+1], re.IGNORECASE) and rule_search("_V|_P", words[j+2])) or
+            (modal_doaux_have_be_rule.search(words[j]) and rule_search("_RB|\\bjust_|\\breally_|\\bmost_|\\bmore_|_XX0|\\ball_", words[j+1], re.IGNORECASE) and rule_search("_RB|_XX0", words[j+2]) and rule_search("_V", words[j+3]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 SPLIT", words[j])
 
             #---------------------------------------------------
 
             # ELF: Attempted to add an alternative stranded "prepositions/particles"
             # This is currently not in use because it's too inaccurate.
-            #if (re.search("\\b(" + particles + ")_IN|\\b(" + particles + ")_RP|\\b(" + particles + ")_RB|to_TO", words[j], re.IGNORECASE) and re.search("_\W", words[j+1])):
-            # words[j] = re.sub("_(\w+)", "_\\1 [STPR]", words[j])
+            #if (rule_search("\\b(" + particles + ")_IN|\\b(" + particles + ")_RP|\\b(" + particles + ")_RB|to_TO", words[j], re.IGNORECASE) and rule_search("_\W", words[j+1])):
+            # words[j] = rule_sub("_(\w+)", "_\\1 [STPR]", words[j])
 
             # Tags stranded prepositions
             # ELF: completely changed Nini's regex because it relied on PIN which is no longer a variable in use in the MFTE.
             # ELF: Remains a problematic feature with a fairly low recall and precision. 
-            if (re.search("\\b(" + preposition + ")|\\bto_TO", words[j], re.IGNORECASE) and not re.search("_R", words[j]) and re.search("_\.", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 STPR", words[j])
+            if (preposition_or_to_rule.search(words[j]) and not rule_search("_R", words[j]) and rule_search("_\.", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 STPR", words[j])
 
             #---------------------------------------------------
             # Tags imperatives (in a rather crude way - check the evaluation for recall and precision rates). 
             # ELF: This is a new variable in the MFTE.
-            if ((re.search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $|\\bplease_|\\bPlease_|_-LRB-", words[j-1]) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX|\\b(" + be + ")", words[j], re.IGNORECASE) and not re.search("\\bI_|\\byou_|\\bwe_|\\bthey_|_NNP", words[j+1], re.IGNORECASE)) or # E.g., "This is a task. Do it." # Added _SYM and _FW because imperatives often start with bullet points which are not always recognised as such. Also added _EMO for texts that use emoji/emoticons instead of punctuation.
-            (re.search("_-LRB-", words[j-1]) and re.search("see_VB\\b", words[j])) or # Addition for academic English e.g., (see Le Foll 2023: 23–25)
-            #(re.search("_\W|_EMO|_FW|_SYM", words[j-2])  and not re.search("_,", words[j-2]) and not re.search("_MD", words[j-1]) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX|\\b(" + be + ")", words[j], re.IGNORECASE) and not re.search("\\bI_|\\byou_|\\bwe_|\\bthey_|\\b_NNP", words[j+1], re.IGNORECASE)) or # Allows for one intervening token between end of previous sentence and imperative verb, e.g., "Just do it!". This line is not recommended for the Spoken BNC2014 and any texts with not particularly good punctuation.
-            (re.search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $", words[j-2]) and re.search("_RB|_CC|_DMA", words[j-1]) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX|\\b(" + be + ")", words[j], re.IGNORECASE) and not re.search("\\bI_|\\byou_|\\bwe_|\\bthey_|_NNP", words[j+1])) or # "Listen carefully. Then fill the gaps."
-            #(re.search("\\bPractise_|\\bMake_|\\bComplete_|\\bMatch_|\\bRead_|\\bChoose_|\\bWrite_|\\bListen_|\\bDraw_|\\bExplain_|\\bThink_|\\bCheck_|\\bDiscuss_", words[j])) or # Most frequent imperatives that start sentences in the Textbook English Corpus (TEC) (except "Answer" since it is genuinely also frequently used as a noun)
-            (re.search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $|\\bplease_|\\bPlease_", words[j-1]) and re.search("\\bdo_", words[j], re.IGNORECASE) and re.search("_XX0", words[j+1]) and re.search("_VB\\b", words[j+2], re.IGNORECASE)) or # Do not write. Don't listen.
-            (re.search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $", words[j-2]) and re.search("_RB|_CC|_DMA", words[j-1]) and re.search("\\bdo_", words[j], re.IGNORECASE) and re.search("_XX0", words[j+1]) and re.search("_VB\\b", words[j+2], re.IGNORECASE))): # Do not write. Don't listen.
-            #(re.search("\\bwork_", words[j], re.IGNORECASE) and re.search("\\bin_", words[j+1], re.IGNORECASE) and re.search("\\bpairs_", words[j+2], re.IGNORECASE))): # Work in pairs because it occurs 700+ times in the Textbook English Corpus (TEC) and "work" is always incorrectly tagged as a noun there.
-                words[j] = re.sub("_\w+", "_VIMP", words[j]) 
+            if ((rule_search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $|\\bplease_|\\bPlease_|_-LRB-", words[j-1]) and rule_search("_VB\\b", words[j]) and not please_thank_doaux_be_rule.search(words[j]) and not rule_search("\\bI_|\\byou_|\\bwe_|\\bthey_|_NNP", words[j+1], re.IGNORECASE)) or # E.g., "This is a task. Do it." # Added _SYM and _FW because imperatives often start with bullet points which are not always recognised as such. Also added _EMO for texts that use emoji/emoticons instead of punctuation.
+            (rule_search("_-LRB-", words[j-1]) and rule_search("see_VB\\b", words[j])) or # Addition for academic English e.g., (see Le Foll 2023: 23–25)
+            #(rule_search("_\W|_EMO|_FW|_SYM", words[j-2])  and not rule_search("_,", words[j-2]) and not rule_search("_MD", words[j-1]) and rule_search("_VB\\b", words[j]) and not rule_search("\\bplease_|\\bthank_| DOAUX|\\b(" + be + ")", words[j], re.IGNORECASE) and not rule_search("\\bI_|\\byou_|\\bwe_|\\bthey_|\\b_NNP", words[j+1], re.IGNORECASE)) or # Allows for one intervening token between end of previous sentence and imperative verb, e.g., "Just do it!". This line is not recommended for the Spoken BNC2014 and any texts with not particularly good punctuation.
+            (rule_search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $", words[j-2]) and rule_search("_RB|_CC|_DMA", words[j-1]) and rule_search("_VB\\b", words[j]) and not please_thank_doaux_be_rule.search(words[j]) and not rule_search("\\bI_|\\byou_|\\bwe_|\\bthey_|_NNP", words[j+1])) or # "Listen carefully. Then fill the gaps."
+            #(rule_search("\\bPractise_|\\bMake_|\\bComplete_|\\bMatch_|\\bRead_|\\bChoose_|\\bWrite_|\\bListen_|\\bDraw_|\\bExplain_|\\bThink_|\\bCheck_|\\bDiscuss_", words[j])) or # Most frequent imperatives that start sentences in the Textbook English Corpus (TEC) (except "Answer" since it is genuinely also frequently used as a noun)
+            (rule_search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $|\\bplease_|\\bPlease_", words[j-1]) and rule_search("\\bdo_", words[j], re.IGNORECASE) and rule_search("_XX0", words[j+1]) and rule_search("_VB\\b", words[j+2], re.IGNORECASE)) or # Do not write. Don't listen.
+            (rule_search("_\\.|:|-_NFP|_EMO|_FW|_SYM|_HST| $", words[j-2]) and rule_search("_RB|_CC|_DMA", words[j-1]) and rule_search("\\bdo_", words[j], re.IGNORECASE) and rule_search("_XX0", words[j+1]) and rule_search("_VB\\b", words[j+2], re.IGNORECASE))): # Do not write. Don't listen.
+            #(rule_search("\\bwork_", words[j], re.IGNORECASE) and rule_search("\\bin_", words[j+1], re.IGNORECASE) and rule_search("\\bpairs_", words[j+2], re.IGNORECASE))): # Work in pairs because it occurs 700+ times in the Textbook English Corpus (TEC) and "work" is always incorrectly tagged as a noun there.
+                words[j] = rule_sub("_\w+", "_VIMP", words[j]) 
             
-            if ((re.search("_VIMP", words[j-2]) and re.search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE)) or
-            (re.search("_VIMP", words[j-3]) and re.search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE)) or
-            (re.search("_VIMP", words[j-4]) and re.search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and re.search("_VB\\b", words[j]) and not re.search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_VIMP", words[j]) # This accounts for, e.g., "read (carefully/the text) and listen"
+            if ((rule_search("_VIMP", words[j-2]) and rule_search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and rule_search("_VB\\b", words[j]) and not rule_search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE)) or
+            (rule_search("_VIMP", words[j-3]) and rule_search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and rule_search("_VB\\b", words[j]) and not rule_search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE)) or
+            (rule_search("_VIMP", words[j-4]) and rule_search("\\band_|\\bor_|,_|&_", words[j-1], re.IGNORECASE) and rule_search("_VB\\b", words[j]) and not rule_search("\\bplease_|\\bthank_| DOAUX", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_VIMP", words[j]) # This accounts for, e.g., "read (carefully/the text) and listen"
 
             #---------------------------------------------------
 
             # Tags 'that' adjective complements. 
             # ELF: added the _IN tag onto the "that" to improve accuracy but currently not in use because it still proves too error-prone.
-            #if (re.search("_J", words[j-1]) and re.search("\\bthat_IN", words[j], re.IGNORECASE)):
-            # words[j] = re.sub("_\w+", "_THAC", words[j])
+            #if (rule_search("_J", words[j-1]) and rule_search("\\bthat_IN", words[j], re.IGNORECASE)):
+            # words[j] = rule_sub("_\w+", "_THAC", words[j])
 
             # ELF: tags other adjective complements. It's important that WHQU comes afterwards.
             # ELF: also currently not in use because of the high percentage of tagging errors.
-            #if (re.search("_J", words[j-1]) and re.search("\\bwho_|\\bwhat_WP|\\bwhere_|\\bwhy_|\\bhow_|\\bwhich_", words[j], re.IGNORECASE)):
-            # words[j] = re.sub("_\w+", "_WHAC", words[j])
+            #if (rule_search("_J", words[j-1]) and rule_search("\\bwho_|\\bwhat_WP|\\bwhere_|\\bwhy_|\\bhow_|\\bwhich_", words[j], re.IGNORECASE)):
+            # words[j] = rule_sub("_\w+", "_WHAC", words[j])
 
             #---------------------------------------------------
 
@@ -756,71 +1844,71 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # Thorough manual checks are therefore still highly recommended before using the counts of these variables!
             
             # That-subordinate clauses other than relatives according to the POS-tagger  
-            if (re.search("\\bthat_IN", words[j], re.IGNORECASE) and not re.search("_\W", words[j+1])):
-                words[j] = re.sub("_\w+", "_THSC", words[j])
+            if (rule_search("\\bthat_IN", words[j], re.IGNORECASE) and not rule_search("_\W", words[j+1])):
+                words[j] = rule_sub("_\w+", "_THSC", words[j])
 
             # That-relative clauses according to the POS-tagger  
-            if (re.search("\\bthat_WDT", words[j], re.IGNORECASE) and not re.search("_\W", words[j+1])):
-                words[j] = re.sub("_\w+", "_THRC", words[j])
+            if (rule_search("\\bthat_WDT", words[j], re.IGNORECASE) and not rule_search("_\W", words[j+1])):
+                words[j] = rule_sub("_\w+", "_THRC", words[j])
 
             # Subordinate clauses with WH-words. 
             # ELF: New variable in the MFTE.
-            if (re.search("\\b(" + wp + ")|\\b(" + who + ")", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_WHSC", words[j])
+            if (wp_who_rule.search(words[j])):
+                words[j] = rule_sub("_\w+", "_WHSC", words[j])
 
             #---------------------------------------------------
             # Tags hedges 
             # ELF: added "kinda" and "sorta" and corrected the "sort of" and "kind of" lines in Nini's original script which had the word-2 part negated.
             # Also added apparently, conceivably, perhaps, possibly, presumably, probably, roughly and somewhat.
-            if ((re.search("\\bmaybe_|allegedly_|apparently_|conceivably_|perhaps_|\\bpossibly_|presumably_|\\bprobably_|purportedly_|\\broughly_|somewhat_|\\bpredictably_", words[j], re.IGNORECASE)) or
-            (re.search("\\baround_|\\babout_", words[j], re.IGNORECASE) and re.search("_CD|_QUAN|_$|_SYM", words[j+1], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_HDG", words[j])
+            if ((rule_search("\\bmaybe_|allegedly_|apparently_|conceivably_|perhaps_|\\bpossibly_|presumably_|\\bprobably_|purportedly_|\\broughly_|somewhat_|\\bpredictably_", words[j], re.IGNORECASE)) or
+            (rule_search("\\baround_|\\babout_", words[j], re.IGNORECASE) and rule_search("_CD|_QUAN|_$|_SYM", words[j+1], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_HDG", words[j])
 
-            if ((re.search("\\bat_", words[j-1], re.IGNORECASE) and re.search("\\babout_", words[j], re.IGNORECASE)) or
-            (re.search("\\bsomething_", words[j-1], re.IGNORECASE) and re.search("\\blike_", words[j], re.IGNORECASE)) or
-            (not re.search("_DT|_QUAN|_CD|_J|_PRP|(\\b(" + who + "))", words[j-2], re.IGNORECASE) and re.search("\\bsort_", words[j-1], re.IGNORECASE) and re.search("\\bof_", words[j], re.IGNORECASE)) or
-            (not re.search("_DT|_QUAN|_CD|_J|_PRP|(\\b(" + who + "))", words[j-2], re.IGNORECASE) and re.search("\\bkind_NN", words[j-1], re.IGNORECASE) and re.search("\\bof_", words[j], re.IGNORECASE)) or
-            (not re.search("_DT|_QUAN|_CD|_J|_PRP|(\\b(" + who + "))", words[j-1], re.IGNORECASE) and re.search("\\bkinda_|\\bsorta_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_\\1 HDG", words[j])
+            if ((rule_search("\\bat_", words[j-1], re.IGNORECASE) and rule_search("\\babout_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bsomething_", words[j-1], re.IGNORECASE) and rule_search("\\blike_", words[j], re.IGNORECASE)) or
+            (not determiner_or_who_rule.search(words[j-2]) and rule_search("\\bsort_", words[j-1], re.IGNORECASE) and rule_search("\\bof_", words[j], re.IGNORECASE)) or
+            (not determiner_or_who_rule.search(words[j-2]) and rule_search("\\bkind_NN", words[j-1], re.IGNORECASE) and rule_search("\\bof_", words[j], re.IGNORECASE)) or
+            (not determiner_or_who_rule.search(words[j-1]) and rule_search("\\bkinda_|\\bsorta_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_\\1 HDG", words[j])
 
-            if (re.search("\\bmore_", words[j-2], re.IGNORECASE) and re.search("\\bor_", words[j-1], re.IGNORECASE) and re.search("\\bless_", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_QUAN HDG", words[j])
-                words[j-2] = re.sub("\w+", "_QUAN", words[j-2])
+            if (rule_search("\\bmore_", words[j-2], re.IGNORECASE) and rule_search("\\bor_", words[j-1], re.IGNORECASE) and rule_search("\\bless_", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_QUAN HDG", words[j])
+                words[j-2] = rule_sub("\w+", "_QUAN", words[j-2])
 
             #Shakir: multiword likelihood adverbs to HDG
-            if (re.search("\\b(in)_", words[j-1], re.IGNORECASE) and re.search("\\b(most)_", words[j], re.IGNORECASE) and re.search("\\b(cases|instances)_", words[j+1], re.IGNORECASE)):
-                words[j] = re.sub("_(\w+)", "_\\1 HDG", words[j])
+            if (rule_search("\\b(in)_", words[j-1], re.IGNORECASE) and rule_search("\\b(most)_", words[j], re.IGNORECASE) and rule_search("\\b(cases|instances)_", words[j+1], re.IGNORECASE)):
+                words[j] = rule_sub("_(\w+)", "_\\1 HDG", words[j])
             #---------------------------------------------------
 
             # Tags politeness markers
             # ELF new variables for: thanks, thank you, ta, please, mind_VB, excuse_V, sorry, apology and apologies.
-            if ((re.search("\\bthank_", words[j], re.IGNORECASE) and re.search("\\byou", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bsorry_|\\bexcuse_V|\\bapology_|\\bapologies_|\\bplease_|\\bcheers_", words[j], re.IGNORECASE)) or
-            (re.search("\\bthanks_", words[j], re.IGNORECASE) and not re.search("\\bto_", words[j+1], re.IGNORECASE)) or # Avoids the confusion with the conjunction "thanks to"
-            (not re.search("\\bgot_", words[j-1], re.IGNORECASE) and re.search("\\bta_", words[j], re.IGNORECASE)) or # Avoids confusion with gotta
-            (re.search("\\bI_|\\bwe_", words[j-2], re.IGNORECASE) and re.search("\\b(" + be + ")", words[j-1], re.IGNORECASE) and re.search("\\bwonder_V|\\bwondering_", words[j], re.IGNORECASE)) or
-            (re.search("\\byou_|_XX0", words[j-1], re.IGNORECASE) and re.search("\\bmind_V", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_\\1 POLITE", words[j])
+            if ((rule_search("\\bthank_", words[j], re.IGNORECASE) and rule_search("\\byou", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bsorry_|\\bexcuse_V|\\bapology_|\\bapologies_|\\bplease_|\\bcheers_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bthanks_", words[j], re.IGNORECASE) and not rule_search("\\bto_", words[j+1], re.IGNORECASE)) or # Avoids the confusion with the conjunction "thanks to"
+            (not rule_search("\\bgot_", words[j-1], re.IGNORECASE) and rule_search("\\bta_", words[j], re.IGNORECASE)) or # Avoids confusion with gotta
+            (rule_search("\\bI_|\\bwe_", words[j-2], re.IGNORECASE) and be_rule.search(words[j-1]) and rule_search("\\bwonder_V|\\bwondering_", words[j], re.IGNORECASE)) or
+            (rule_search("\\byou_|_XX0", words[j-1], re.IGNORECASE) and rule_search("\\bmind_V", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_\\1 POLITE", words[j])
 
             # Tags HAVE GOT constructions
             # ELF: New variable. Added a tag for "have got" constructions, overriding the PEAS and PASS constructions.
-            if (re.search("\\bgot", words[j], re.IGNORECASE)):
-
-                if ((re.search("\\b(" + have + ")", words[j-1], re.IGNORECASE)) or # have got
-                (re.search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE)) or # have not got
-                (re.search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and re.search("_RB|_XX0|_EMPH|_DMA", words[j-2]) and re.search("\\b(" + have + ")", words[j-3], re.IGNORECASE)) or # haven't they got
-                (re.search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE)) or # has he got?
-                (re.search("_XX0|_RB|_EMPH|_DMA", words[j-1]) and re.search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-2]) and re.search("\\b(" + have + ")", words[j-3], re.IGNORECASE))): # hasn't he got?
-                    words[j] = re.sub("_\w+", "_HGOT", words[j])
+            if (rule_search("\\bgot", words[j], re.IGNORECASE)):
+
+                if ((have_rule.search(words[j-1])) or # have got
+                (rule_search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and have_rule.search(words[j-2])) or # have not got
+                (rule_search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and rule_search("_RB|_XX0|_EMPH|_DMA", words[j-2]) and have_rule.search(words[j-3])) or # haven't they got
+                (rule_search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and have_rule.search(words[j-2])) or # has he got?
+                (rule_search("_XX0|_RB|_EMPH|_DMA", words[j-1]) and rule_search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-2]) and have_rule.search(words[j-3]))): # hasn't he got?
+                    words[j] = rule_sub("_\w+", "_HGOT", words[j])
             
-                if (re.search("\\b(" + have + ")", words[j-1], re.IGNORECASE) and re.search("_VBD|_VBN", words[j+1])):
-                    words[j] = re.sub("_(\w+)", "_PEAS", words[j])
-                    words[j+1] = re.sub("_(\w+)", "_PGET", words[j+1])
+                if (have_rule.search(words[j-1]) and rule_search("_VBD|_VBN", words[j+1])):
+                    words[j] = rule_sub("_(\w+)", "_PEAS", words[j])
+                    words[j+1] = rule_sub("_(\w+)", "_PGET", words[j+1])
                 # Correction for: got + past participle (e.g., she has got arrested)
 
-                if (re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE) and re.search("_RB|_XX0|_EMPH|_DMA", words[j-1], re.IGNORECASE) and re.search("_VBD|_VBN", words[j+1])):
-                    words[j] = re.sub("_(\w+)", "_PEAS", words[j])
-                    words[j+1] = re.sub("_(\w+)", "_PGET", words[j+1])
+                if (have_rule.search(words[j-2]) and rule_search("_RB|_XX0|_EMPH|_DMA", words[j-1], re.IGNORECASE) and rule_search("_VBD|_VBN", words[j+1])):
+                    words[j] = rule_sub("_(\w+)", "_PEAS", words[j])
+                    words[j+1] = rule_sub("_(\w+)", "_PGET", words[j+1])
                     # Correction for: not/n't got + past participle
 
             #---------------------------------------------------
@@ -837,56 +1925,56 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # ELF: rewrote this new operationalisation because Biber/Nini's code relied on a full stop appearing before the question word. 
             # This new operationalisation requires a question word (from a much shorter list taken from the COBUILD that Nini's/Biber's list) that is not followed by another question word and then a question mark within 15 words. 
 
-            if ((re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_", words[j+1]))  or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j+1], re.IGNORECASE) and re.search("\\?_\\.", words[j+2])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j+1], re.IGNORECASE) and re.search("\\?_\\.", words[j+3])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\b(" + be + ")|\\b(" + have + ")|\\b(" + do + ")|_MD", words[j+1], re.IGNORECASE) and re.search("\\?_\\.", words[j+4])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+2])) or # Who cares?
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+3])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+4])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+5])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+6])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+7])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+8])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+9])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+10])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+11])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+12])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+13])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+14])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+15])) or
-            (re.search("\\b(" + whw + ")", words[j], re.IGNORECASE) and re.search("\\?_\\.$", words[j+16]))):
-                words[j] = re.sub("(\w+)_\w+", "\\1_WHQU", words[j])
-
-            if ((re.search("\\b(" + whw + ")", words[j-1], re.IGNORECASE) and re.search("\\?_", words[j]))  or
-            (re.search("_WHQU", words[j-2]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-3]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-4]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-5]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-6]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-7]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-8]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-9]) and re.search("\\?_\\.", words[j])) or
-            (re.search("_WHQU", words[j-10]) and re.search("\\?_\\.", words[j])) or        
-            (re.search("_WHQU", words[j-11]) and re.search("\\?_\\.", words[j])) or 
-            (re.search("_WHQU", words[j-12]) and re.search("\\?_\\.", words[j])) or        
-            (re.search("_WHQU", words[j-13]) and re.search("\\?_\\.", words[j])) or        
-            (re.search("_WHQU", words[j-14]) and re.search("\\?_\\.", words[j])) or        
-            (re.search("_WHQU", words[j-15]) and re.search("\\?_\\.", words[j]))):        
-                words[j] = re.sub("_\\.$", "_. WQ", words[j]) # This line will add a dummy WQ tag (will not be counted in the final tables of counts) to allow for remaining question marks (except those immediately preceeded by an FPUH to be assigned the YNQU tag)
-                words[j] = re.sub("_\\. YNQU", "_. WQ", words[j]) # This line should erase any YNQU tags that have (probably) been wrongly assigned
-                words[j] = re.sub("_\\. QUTAG", "_. WQ", words[j]) # This line should erase any QUTAG tags that have (probably) been wrongly assigned
+            if ((whw_rule.search(words[j]) and rule_search("\\?_", words[j+1]))  or
+            (whw_rule.search(words[j]) and auxiliary_rule.search(words[j+1]) and rule_search("\\?_\\.", words[j+2])) or
+            (whw_rule.search(words[j]) and auxiliary_rule.search(words[j+1]) and rule_search("\\?_\\.", words[j+3])) or
+            (whw_rule.search(words[j]) and auxiliary_rule.search(words[j+1]) and rule_search("\\?_\\.", words[j+4])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+2])) or # Who cares?
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+3])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+4])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+5])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+6])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+7])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+8])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+9])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+10])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+11])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+12])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+13])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+14])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+15])) or
+            (whw_rule.search(words[j]) and rule_search("\\?_\\.$", words[j+16]))):
+                words[j] = rule_sub("(\w+)_\w+", "\\1_WHQU", words[j])
+
+            if ((whw_rule.search(words[j-1]) and rule_search("\\?_", words[j]))  or
+            (rule_search("_WHQU", words[j-2]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-3]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-4]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-5]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-6]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-7]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-8]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-9]) and rule_search("\\?_\\.", words[j])) or
+            (rule_search("_WHQU", words[j-10]) and rule_search("\\?_\\.", words[j])) or        
+            (rule_search("_WHQU", words[j-11]) and rule_search("\\?_\\.", words[j])) or 
+            (rule_search("_WHQU", words[j-12]) and rule_search("\\?_\\.", words[j])) or        
+            (rule_search("_WHQU", words[j-13]) and rule_search("\\?_\\.", words[j])) or        
+            (rule_search("_WHQU", words[j-14]) and rule_search("\\?_\\.", words[j])) or        
+            (rule_search("_WHQU", words[j-15]) and rule_search("\\?_\\.", words[j]))):        
+                words[j] = rule_sub("_\\.$", "_. WQ", words[j]) # This line will add a dummy WQ tag (will not be counted in the final tables of counts) to allow for remaining question marks (except those immediately preceeded by an FPUH to be assigned the YNQU tag)
+                words[j] = rule_sub("_\\. YNQU", "_. WQ", words[j]) # This line should erase any YNQU tags that have (probably) been wrongly assigned
+                words[j] = rule_sub("_\\. QUTAG", "_. WQ", words[j]) # This line should erase any QUTAG tags that have (probably) been wrongly assigned
             
         #---------------------------------------------------
 
             # Tags remaining attribute adjectives (JJAT)
-            if ((re.search("_JJAT", words[j-2]) and re.search("\\band_", words[j-1], re.IGNORECASE) and re.search("_JJ", words[j])) or
-            (re.search("_JJ", words[j]) and re.search("\\band_", words[j+1], re.IGNORECASE) and re.search("_JJAT", words[j+2])) or
-            (re.search("_JJAT", words[j-2]) and re.search(",_,", words[j-1]) and re.search("_JJ", words[j])) or
-            (re.search("_JJ", words[j]) and re.search(",_,", words[j+1]) and re.search("_JJAT", words[j+2])) or
-            (re.search("_JJ", words[j]) and re.search(",_,", words[j+1]) and re.search("\\band_", words[j+2]) and re.search("_JJAT", words[j+3])) or
-            (re.search("_JJAT", words[j-3]) and re.search(",_,", words[j-2]) and re.search("\\band_", words[j-1]) and re.search("_JJ", words[j]))):
-                words[j] = re.sub("_\w+", "_JJAT", words[j])
+            if ((rule_search("_JJAT", words[j-2]) and rule_search("\\band_", words[j-1], re.IGNORECASE) and rule_search("_JJ", words[j])) or
+            (rule_search("_JJ", words[j]) and rule_search("\\band_", words[j+1], re.IGNORECASE) and rule_search("_JJAT", words[j+2])) or
+            (rule_search("_JJAT", words[j-2]) and rule_search(",_,", words[j-1]) and rule_search("_JJ", words[j])) or
+            (rule_search("_JJ", words[j]) and rule_search(",_,", words[j+1]) and rule_search("_JJAT", words[j+2])) or
+            (rule_search("_JJ", words[j]) and rule_search(",_,", words[j+1]) and rule_search("\\band_", words[j+2]) and rule_search("_JJAT", words[j+3])) or
+            (rule_search("_JJAT", words[j-3]) and rule_search(",_,", words[j-2]) and rule_search("\\band_", words[j-1]) and rule_search("_JJ", words[j]))):
+                words[j] = rule_sub("_\w+", "_JJAT", words[j])
 
             #---------------------------------------------------
 
@@ -895,48 +1983,48 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # I tried to avoid as many errors as possible with 's being either BE (= passive) or HAS (= perfect aspect) but this is not perfect. 
             # Note that "'s got" and "'s used to" are tagged separately. 
             # It's also worth noting that lemmatisation would likely not help much here either because spot checks with Sketch Engine's lemmatiser show that lemmatisers do a terrible job at this, too!
-            if ((re.search("ed_VBD|_VBN", words[j]) and re.search("\\b(" + have + ")", words[j-1], re.IGNORECASE)) or # have eaten
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_RB|_XX0|_EMPH|_PRP|_DMA|_CC", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE)) or # have not eaten
-            (re.search("\\bbeen_PASS|\\bhad_PASS|\\bdone_PASS|\\b(" + v_stative + ")_PASS", words[j], re.IGNORECASE) and re.search("\\bs_VBZ", words[j-1], re.IGNORECASE)) or # This ensures that 's + past participle combinations which are unlikely to be passives are overwritten here as PEAS
-            (re.search("\\bbeen_PASS|\\bhad_PASS|\\bdone_PASS|\\b(" + v_stative + ")_PASS", words[j], re.IGNORECASE) and re.search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and re.search("\\bs_VBZ", words[j-2], re.IGNORECASE)) or # This ensures that 's + not/ADV + past participle combinations which are unlikely to be passives are overwritten here as PEAS
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_RB|_XX0|_EMPH|_CC", words[j-2]) and re.search("\\b(" + have + ")", words[j-3], re.IGNORECASE)) or # haven't really eaten, haven't you noticed?
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE)) or # has he eaten?
-            (re.search("\\b(" + have + ")", words[j-1], re.IGNORECASE) and re.search("ed_VBD|_VBN", words[j]) and re.search("_P", words[j+1])) or # has been told or has got arrested
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_P", words[j+1]) and re.search("_XX0|_RB|_EMPH|_DMA|_CC", words[j-1]) and re.search("_XX0|_RB|_EMPH", words[j-2]) and re.search("\\b(" + have + ")", words[j-3], re.IGNORECASE)) or #hasn't really been told
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_PASS", words[j+1]) and re.search("_XX0|_RB|_EMPH|_DMA|_CC", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE)) or # hasn't been told
-            (re.search("ed_VBD|_VBN", words[j]) and re.search("_XX0|_EMPH|_DMA|_CC", words[j+1]) and re.search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("\\b(" + have + ")", words[j-2], re.IGNORECASE))): # hasn't he eaten?
-                    words[j] = re.sub("_\w+", "_PEAS", words[j])
+            if ((rule_search("ed_VBD|_VBN", words[j]) and have_rule.search(words[j-1])) or # have eaten
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_RB|_XX0|_EMPH|_PRP|_DMA|_CC", words[j-1]) and have_rule.search(words[j-2])) or # have not eaten
+            ((rule_search("\\bbeen_PASS|\\bhad_PASS|\\bdone_PASS", words[j], re.IGNORECASE) or lexicon_search(words[j], "v_stative", "PASS")) and rule_search("\\bs_VBZ", words[j-1], re.IGNORECASE)) or # This ensures that 's + past participle combinations which are unlikely to be passives are overwritten here as PEAS
+            ((rule_search("\\bbeen_PASS|\\bhad_PASS|\\bdone_PASS", words[j], re.IGNORECASE) or lexicon_search(words[j], "v_stative", "PASS")) and rule_search("_RB|_XX0|_EMPH|_DMA", words[j-1]) and rule_search("\\bs_VBZ", words[j-2], re.IGNORECASE)) or # This ensures that 's + not/ADV + past participle combinations which are unlikely to be passives are overwritten here as PEAS
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_RB|_XX0|_EMPH|_CC", words[j-2]) and have_rule.search(words[j-3])) or # haven't really eaten, haven't you noticed?
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and have_rule.search(words[j-2])) or # has he eaten?
+            (have_rule.search(words[j-1]) and rule_search("ed_VBD|_VBN", words[j]) and rule_search("_P", words[j+1])) or # has been told or has got arrested
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_P", words[j+1]) and rule_search("_XX0|_RB|_EMPH|_DMA|_CC", words[j-1]) and rule_search("_XX0|_RB|_EMPH", words[j-2]) and have_rule.search(words[j-3])) or #hasn't really been told
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_PASS", words[j+1]) and rule_search("_XX0|_RB|_EMPH|_DMA|_CC", words[j-1]) and have_rule.search(words[j-2])) or # hasn't been told
+            (rule_search("ed_VBD|_VBN", words[j]) and rule_search("_XX0|_EMPH|_DMA|_CC", words[j+1]) and rule_search("_NN|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and have_rule.search(words[j-2]))): # hasn't he eaten?
+                    words[j] = rule_sub("_\w+", "_PEAS", words[j])
 
             # This corrects some of the 'd wrongly identified as a modal "would" by the POS-tagger 
-            if (re.search("'d_MD", words[j-1], re.IGNORECASE) and re.search("_VBN", words[j])): # He'd eaten
-                words[j-1] = re.sub("_\w+", "_VBD", words[j-1])
-                words[j] = re.sub("_\w+", "_PEAS", words[j])
+            if (rule_search("'d_MD", words[j-1], re.IGNORECASE) and rule_search("_VBN", words[j])): # He'd eaten
+                words[j-1] = rule_sub("_\w+", "_VBD", words[j-1])
+                words[j] = rule_sub("_\w+", "_PEAS", words[j])
 
-            if (re.search("'d_MD", words[j-1], re.IGNORECASE) and re.search("_RB|_EMPH", words[j]) and re.search("_VBN", words[j+1])): # She'd never been
-                words[j-1] = re.sub("_\w+", "_VBD", words[j-1])
-                words[j+1] = re.sub("_\w+", "_PEAS", words[j+1])
+            if (rule_search("'d_MD", words[j-1], re.IGNORECASE) and rule_search("_RB|_EMPH", words[j]) and rule_search("_VBN", words[j+1])): # She'd never been
+                words[j-1] = rule_sub("_\w+", "_VBD", words[j-1])
+                words[j+1] = rule_sub("_\w+", "_PEAS", words[j+1])
 
             # This corrects some of the 'd wrongly identified as a modal "would" by the POS-tagger 
-            if (re.search("\\bbetter_", words[j]) and re.search("'d_MD", words[j-1], re.IGNORECASE)):
-                words[j-1] = re.sub("_\w+", "_VBD", words[j-1])
+            if (rule_search("\\bbetter_", words[j]) and rule_search("'d_MD", words[j-1], re.IGNORECASE)):
+                words[j-1] = rule_sub("_\w+", "_VBD", words[j-1])
 
-            if (re.search("_VBN|ed_VBD|en_VBD", words[j]) and re.search("\\band_|\\bor_", words[j-1], re.IGNORECASE) and re.search("_PASS", words[j-2])): # This accounts for the second passive form in phrases such as "they were selected and extracted"
-                words[j] = re.sub("_\w+", "_PASS", words[j])
+            if (rule_search("_VBN|ed_VBD|en_VBD", words[j]) and rule_search("\\band_|\\bor_", words[j-1], re.IGNORECASE) and rule_search("_PASS", words[j-2])): # This accounts for the second passive form in phrases such as "they were selected and extracted"
+                words[j] = rule_sub("_\w+", "_PASS", words[j])
 
-            if (re.search("_PEAS", words[j]) and re.search("\\band_|\\bor_", words[j-1], re.IGNORECASE) and re.search("_VBN", words[j-2])): # This accounts for the second passive form in phrases such as "they were selected and extracted"
-                words[j] = re.sub("_\w+", "_PEAS", words[j+2])
+            if (rule_search("_PEAS", words[j]) and rule_search("\\band_|\\bor_", words[j-1], re.IGNORECASE) and rule_search("_VBN", words[j-2])): # This accounts for the second passive form in phrases such as "they were selected and extracted"
+                words[j] = rule_sub("_\w+", "_PEAS", words[j+2])
 
             # ELF: Added a "used to" variable, overriding the PEAS and PASS constructions. 
             # Not currently in use due to very low precision (see tagger performance evaluation).
-            #if (re.search("\\bused_", words[j], re.IGNORECASE) and re.search("\\bto_", words[j+1])):
-            # words[j] = re.sub("_\w+", "_USEDTO", words[j])
+            #if (rule_search("\\bused_", words[j], re.IGNORECASE) and rule_search("\\bto_", words[j+1])):
+            # words[j] = rule_sub("_\w+", "_USEDTO", words[j])
             #
 
             # ELF: tags "able to" constructions. New variable
-            if ((re.search("\\b(" + be + ")", words[j-1]) and re.search("\\bable_J|\\bunable_J", words[j], re.IGNORECASE) and re.search("\\bto_", words[j+1])) or
-            (re.search("\\b(" + be + ")", words[j-2]) and re.search("\\bable_J|\\bunable_J", words[j], re.IGNORECASE) and re.search("\\bto_", words[j+1]))):
-                words[j-1] = re.sub("_(\w+)", "_\\1 BEMA", words[j-1])
-                words[j] = re.sub("_\w+", "_ABLE", words[j])
+            if ((be_case_sensitive_rule.search(words[j-1]) and rule_search("\\bable_J|\\bunable_J", words[j], re.IGNORECASE) and rule_search("\\bto_", words[j+1])) or
+            (be_case_sensitive_rule.search(words[j-2]) and rule_search("\\bable_J|\\bunable_J", words[j], re.IGNORECASE) and rule_search("\\bto_", words[j+1]))):
+                words[j-1] = rule_sub("_(\w+)", "_\\1 BEMA", words[j-1])
+                words[j] = rule_sub("_\w+", "_ABLE", words[j])
 
         #---------------------------------------------------
 
@@ -948,22 +2036,22 @@ def process_sentence (words: list, extended: bool = False) -> list:
 
         if value != " ":
 
-            if (re.search("_VBG", words[j])):
-                if ((re.search("\\b(" + be + ")", words[j-1], re.IGNORECASE)) or # am eating
-                (re.search("_RB|_XX0|_EMPH|_CC|_DMA", words[j-1]) and re.search("\\b(" + be + ")|'m_V", words[j-2], re.IGNORECASE)) or # am not eating
-                (re.search("_RB|_XX0|_EMPH|_CC|_DMA", words[j-1]) and re.search("_RB|_XX0|_EMPH|_CC", words[j-2]) and re.search("\\b(" + be + ")", words[j-3], re.IGNORECASE)) or # am not really eating
-                (re.search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("\\b(" + be + ")", words[j-2], re.IGNORECASE)) or # am I eating
-                (re.search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and re.search("_XX0|_EMPH|_RB", words[j-2]) and re.search("\\b(" + be + ")", words[j-3], re.IGNORECASE)) or # aren't I eating?
-                (re.search("_XX0|_EMPH", words[j-1]) and re.search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-2]) and re.search("\\b(" + be + ")", words[j-3], re.IGNORECASE))): # am I not eating
-                    words[j] = re.sub("_\w+", "_PROG", words[j])
+            if (rule_search("_VBG", words[j])):
+                if ((be_rule.search(words[j-1])) or # am eating
+                (rule_search("_RB|_XX0|_EMPH|_CC|_DMA", words[j-1]) and be_or_m_rule.search(words[j-2])) or # am not eating
+                (rule_search("_RB|_XX0|_EMPH|_CC|_DMA", words[j-1]) and rule_search("_RB|_XX0|_EMPH|_CC", words[j-2]) and be_rule.search(words[j-3])) or # am not really eating
+                (rule_search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and be_rule.search(words[j-2])) or # am I eating
+                (rule_search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-1]) and rule_search("_XX0|_EMPH|_RB", words[j-2]) and be_rule.search(words[j-3])) or # aren't I eating?
+                (rule_search("_XX0|_EMPH", words[j-1]) and rule_search("_NN|_PRP|\\bi_|\\bwe_|\\bhe_|\\bshe_|\\bit_P|\\bthey_", words[j-2]) and be_rule.search(words[j-3]))): # am I not eating
+                    words[j] = rule_sub("_\w+", "_PROG", words[j])
 
             #---------------------------------------------------
 
             # ELF: Added a new variable for quotative uses of like (BE + like)
             # ELF: However, QLIKE is currently not in use due to relatively low precision and recall (see MFTE perl performance evaluation).
             
-            #if (re.search("\\b(" + be + ")", words[j-1]) and re.search("\\blike_IN|\\blike_JJ", words[j], re.IGNORECASE) and not re.search("_NN|_J|_DT|_\.|_,|_IN", words[j+1])):
-            #words[j] = re.sub("_\w+", "_QLIKE", words[j])
+            #if (rule_search("\\b(" + be + ")", words[j-1]) and rule_search("\\blike_IN|\\blike_JJ", words[j], re.IGNORECASE) and not rule_search("_NN|_J|_DT|_\.|_,|_IN", words[j+1])):
+            #words[j] = rule_sub("_\w+", "_QLIKE", words[j])
 
             #---------------------------------------------------
 
@@ -972,8 +2060,8 @@ def process_sentence (words: list, extended: bool = False) -> list:
             # In conversation, like also frequently acts as a filler or interjection or as part of the quotative phrase BE+like. 
             # Recall and precision were too low (see MFTE perl evaluation) 
             
-            if (re.search("\\blike_IN|\\blike_JJ|\\blike_UH|\\blike_RP", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_LIKE", words[j])
+            if (rule_search("\\blike_IN|\\blike_JJ|\\blike_UH|\\blike_RP", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_LIKE", words[j])
 
     #---------------------------------------------------
 
@@ -984,17 +2072,17 @@ def process_sentence (words: list, extended: bool = False) -> list:
     for j, value in enumerate(words):
         if value != " ":
             # BEAUX:
-            if (re.search("\\b(" + be + ")", words[j], re.IGNORECASE) and not re.search(" BEMA", words[j]) and not re.search("_EX", words[j-1]) and not re.search("_EX", words[j-2])): 
-                if ((re.search("_PROG|_GTO|_PASS|_VBN|_VBG|_QUTAG", words[j+1])) or # am going / are given 
-                (re.search("_PROG|_GTO|_PASS|_QUTAG", words[j+2])) or  
-                (re.search("_PROG|_GTO|_PASS", words[j+3]))):  
-                    words[j] = re.sub("_(\w+)", "_\\1 BEAUX", words[j])
+            if (be_rule.search(words[j]) and not rule_search(" BEMA", words[j]) and not rule_search("_EX", words[j-1]) and not rule_search("_EX", words[j-2])): 
+                if ((rule_search("_PROG|_GTO|_PASS|_VBN|_VBG|_QUTAG", words[j+1])) or # am going / are given 
+                (rule_search("_PROG|_GTO|_PASS|_QUTAG", words[j+2])) or  
+                (rule_search("_PROG|_GTO|_PASS", words[j+3]))):  
+                    words[j] = rule_sub("_(\w+)", "_\\1 BEAUX", words[j])
 
     # If BE is not an auxilliary (as defined above) or part of a there + BE construction, it is tagged as a main verb (BEMA)
     for j, value in enumerate(words):
         if value != " ":
-            if (re.search("\\b(" + be + ")", words[j], re.IGNORECASE) and not re.search("BEAUX|BEMA", words[j]) and not re.search("_EX", words[j-1]) and not re.search("_EX", words[j-2])):
-                words[j] = re.sub("_(\w+)", "_\\1 BEMA", words[j])
+            if (be_rule.search(words[j]) and not rule_search("BEAUX|BEMA", words[j]) and not rule_search("_EX", words[j-1]) and not rule_search("_EX", words[j-2])):
+                words[j] = rule_sub("_(\w+)", "_\\1 BEMA", words[j])
 
     #---------------------------------------------------
     
@@ -1006,15 +2094,15 @@ def process_sentence (words: list, extended: bool = False) -> list:
 
         if value != " ":
 
-            if (re.search("\\bthat_DT|\\bthis_DT|\\bthese_DT|\\bthose_DT|\\bthat_IN|\\bthat_WDT", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_DEMO", words[j])
+            if (rule_search("\\bthat_DT|\\bthis_DT|\\bthese_DT|\\bthose_DT|\\bthat_IN|\\bthat_WDT", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_DEMO", words[j])
             
-            if (re.search(" BEMA", words[j-1]) and re.search("_J", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_JJPR", words[j])
+            if (rule_search(" BEMA", words[j-1]) and rule_search("_J", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_JJPR", words[j])
         
         # Final loop for strings of three JJAT, e.g., to tag "long" in: "This is a long, complicated and tedious script."
-            if (re.search("_JJ", words[j]) and re.search(",_,", words[j+1]) and re.search("_JJAT", words[j+2])):
-                words[j] = re.sub("_\w+", "_JJAT", words[j])
+            if (rule_search("_JJ", words[j]) and rule_search(",_,", words[j+1]) and rule_search("_JJAT", words[j+2])):
+                words[j] = rule_sub("_\w+", "_JJAT", words[j])
 
     #---------------------------------------------------
     # Tags subordinator "that" omission 
@@ -1026,10 +2114,10 @@ def process_sentence (words: list, extended: bool = False) -> list:
     for j, value in enumerate(words):
 
         if value != " ":
-            if ((re.search("\\b((" + public + ")|(" + private + ")|(" + suasive + "))", words[j], re.IGNORECASE) and re.search("_DEMO|_PRP|_N|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and re.search("_MD|_V", words[j+2])) or
-            (re.search("\\b((" + public + ")|(" + private + ")|(" + suasive + "))", words[j], re.IGNORECASE) and re.search("_J|_RB|_DT|_QUAN|_CD|_PRP|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and re.search("_N|_CD", words[j+2]) and re.search("_MD|_V", words[j+3])) or
-            (re.search("\\b((" + public + ")|(" + private + ")|(" + suasive + "))", words[j], re.IGNORECASE) and re.search("_J|_RB|_DT|_QUAN|_CD|_PRP|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and re.search("_J", words[j+2]) and re.search("_N", words[j+3]) and re.search("_MD|_V", words[j+4]))):
-                words[j] = re.sub("_(\w+)", "_\\1 THATD", words[j])
+            if ((lexicon_search(words[j], "public|private|suasive", "V") and rule_search("_DEMO|_PRP|_N|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and rule_search("_MD|_V", words[j+2])) or
+            (lexicon_search(words[j], "public|private|suasive", "V") and rule_search("_J|_RB|_DT|_QUAN|_CD|_PRP|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and rule_search("_N|_CD", words[j+2]) and rule_search("_MD|_V", words[j+3])) or
+            (lexicon_search(words[j], "public|private|suasive", "V") and rule_search("_J|_RB|_DT|_QUAN|_CD|_PRP|\\bhe_|\\bshe_|\\bI_|\\bi_|\\byou_|\\bwe_|\\bthey_|\\bit_", words[j+1]) and rule_search("_J", words[j+2]) and rule_search("_N", words[j+3]) and rule_search("_MD|_V", words[j+4]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 THATD", words[j])
 
     #---------------------------------------------------
 
@@ -1039,9 +2127,9 @@ def process_sentence (words: list, extended: bool = False) -> list:
     for j, value in enumerate(words):  
 
         if value != " ":
-            if ((re.search("\\bits_|\\bitself_", words[j], re.IGNORECASE)) or
-            (re.search("\\bit_|\\bIt_|\\bIT_P", words[j]))):
-                words[j] = re.sub("_\w+", "_PIT", words[j])
+            if ((rule_search("\\bits_|\\bitself_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bit_|\\bIt_|\\bIT_P", words[j]))):
+                words[j] = rule_sub("_\w+", "_PIT", words[j])
 
         #---------------------------------------------------
 
@@ -1056,20 +2144,20 @@ def process_sentence (words: list, extended: bool = False) -> list:
 
         if value != " ":
 
-            if (re.search("\\bI_P|\\bme_|\\bmy_|\\bmyself_|\\bmine_|\\bi_SYM|\\bi_FW", words[j], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_PP1S", words[j])
+            if (rule_search("\\bI_P|\\bme_|\\bmy_|\\bmyself_|\\bmine_|\\bi_SYM|\\bi_FW", words[j], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_PP1S", words[j])
 
-            if ((re.search("\\bwe_|\\bour_|\\bourselves_|\\bours_|\\b's_PRP", words[j], re.IGNORECASE)) or
-            (re.search("\\bus_P|\\bUs_P", words[j]))):
-                words[j] = re.sub("_\w+", "_PP1P", words[j])
+            if ((rule_search("\\bwe_|\\bour_|\\bourselves_|\\bours_|\\b's_PRP", words[j], re.IGNORECASE)) or
+            (rule_search("\\bus_P|\\bUs_P", words[j]))):
+                words[j] = rule_sub("_\w+", "_PP1P", words[j])
 
-            if (re.search("\\blet_", words[j], re.IGNORECASE) and not re.search("_PRP", words[j-1], re.IGNORECASE) and re.search("'s_|\\bus_|_POS", words[j+1], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_VIMP", words[j])
-                words[j+1] = re.sub("_\w+", "_PP1P", words[j+1])
+            if (rule_search("\\blet_", words[j], re.IGNORECASE) and not rule_search("_PRP", words[j-1], re.IGNORECASE) and rule_search("'s_|\\bus_|_POS", words[j+1], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_VIMP", words[j])
+                words[j+1] = rule_sub("_\w+", "_PP1P", words[j+1])
 
-            if (re.search("\\blet_", words[j], re.IGNORECASE) and not re.search("_PRP", words[j-1], re.IGNORECASE) and re.search("\\bme_", words[j+1], re.IGNORECASE)):
-                words[j] = re.sub("_\w+", "_VIMP", words[j])
-                words[j+1] = re.sub("_\w+", "_PP1S", words[j+1])
+            if (rule_search("\\blet_", words[j], re.IGNORECASE) and not rule_search("_PRP", words[j-1], re.IGNORECASE) and rule_search("\\bme_", words[j+1], re.IGNORECASE)):
+                words[j] = rule_sub("_\w+", "_VIMP", words[j])
+                words[j+1] = rule_sub("_\w+", "_PP1S", words[j+1])
 
     #---------------------------------------------------
 
@@ -1081,51 +2169,51 @@ def process_sentence (words: list, extended: bool = False) -> list:
         # Note that Nini had already added "THO" to Biber's list.
         # ELF added: despite, albeit, yet, except that, in spite of, granted that, granted + punctuation, no matter + WH-words, regardless of + WH-word. 
         # Also added: nevertheless, nonetheless and notwithstanding and whereas, which Biber had as "other adverbial subordinators" (OSUB, a category ELF removed).
-            if ((re.search("\\balthough_|\\btho_|\\bdespite|\\balbeit_|nevertheless_|nonetheless_|notwithstanding_|\\bwhereas_", words[j], re.IGNORECASE)) or
-            (re.search("\\bexcept_", words[j], re.IGNORECASE) and re.search("\\bthat_", words[j+1], re.IGNORECASE)) or    	
-            (re.search("\\bgranted_", words[j], re.IGNORECASE) and re.search("\\bthat_|_,", words[j+1], re.IGNORECASE)) or		
-            (re.search("\\bregardless_|\\birregardless_", words[j], re.IGNORECASE) and re.search("\\bof_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\beven_", words[j-1], re.IGNORECASE) and re.search("\\bif_", words[j], re.IGNORECASE)) or
-            (re.search("\\byet_|\\bstill_", words[j], re.IGNORECASE) and re.search("_,", words[j+1], re.IGNORECASE)) or
-            (not re.search("\\bas_", words[j-1], re.IGNORECASE) and re.search("\\bthough_", words[j], re.IGNORECASE)) or
-            (re.search("\\byet_|\\bgranted_|\\bstill_", words[j], re.IGNORECASE) and re.search("_\W", words[j-1], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_CONC", words[j])
-
-            if ((re.search("\\bno_", words[j-1], re.IGNORECASE) and re.search("\\bmatter_", words[j], re.IGNORECASE) and re.search("\\b(" + whw + ")", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bin_", words[j-1], re.IGNORECASE) and re.search("\\bspite_", words[j]) and re.search("\\bof_", words[j+1]))):
-                words[j] = re.sub("_(\w+)", "_\\1 CONC", words[j])
+            if ((rule_search("\\balthough_|\\btho_|\\bdespite|\\balbeit_|nevertheless_|nonetheless_|notwithstanding_|\\bwhereas_", words[j], re.IGNORECASE)) or
+            (rule_search("\\bexcept_", words[j], re.IGNORECASE) and rule_search("\\bthat_", words[j+1], re.IGNORECASE)) or    	
+            (rule_search("\\bgranted_", words[j], re.IGNORECASE) and rule_search("\\bthat_|_,", words[j+1], re.IGNORECASE)) or		
+            (rule_search("\\bregardless_|\\birregardless_", words[j], re.IGNORECASE) and rule_search("\\bof_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\beven_", words[j-1], re.IGNORECASE) and rule_search("\\bif_", words[j], re.IGNORECASE)) or
+            (rule_search("\\byet_|\\bstill_", words[j], re.IGNORECASE) and rule_search("_,", words[j+1], re.IGNORECASE)) or
+            (not rule_search("\\bas_", words[j-1], re.IGNORECASE) and rule_search("\\bthough_", words[j], re.IGNORECASE)) or
+            (rule_search("\\byet_|\\bgranted_|\\bstill_", words[j], re.IGNORECASE) and rule_search("_\W", words[j-1], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_CONC", words[j])
+
+            if ((rule_search("\\bno_", words[j-1], re.IGNORECASE) and rule_search("\\bmatter_", words[j], re.IGNORECASE) and whw_rule.search(words[j+1])) or
+            (rule_search("\\bin_", words[j-1], re.IGNORECASE) and rule_search("\\bspite_", words[j]) and rule_search("\\bof_", words[j+1]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 CONC", words[j])
 
             #---------------------------------------------------
             # Tags place adverbials 
             # ELF: added all the words from "downwind" onwards and excluded "there" tagged as an existential "there" as in "there are probably lots of bugs in this script". Also restricted above, around, away, behind, below, beside, inside and outside to adverb forms only.
-            if (re.search("\\baboard_|\\babove_RB|\\babroad_|\\bacross_RB|\\bahead_|\\banywhere_|\\balongside_|\\baround_RB|\\bashore_|\\bastern_|\\baway_RB|\\bbackwards?|\\bbehind_RB|\\bbelow_RB|\\bbeneath_|\\bbeside_RB|\\bdownhill_|\\bdownstairs_|\\bdownstream_|\\bdownwards_|\\beast_|\\bhereabouts_|\\bindoors_|\\binland_|\\binshore_|\\binside_RB|\\blocally_|\\bnear_|\\bnearby_|\\bnorth_|\\bnowhere_|\\boutdoors_|\\boutside_RB|\\boverboard_|\\boverland_|\\boverseas_|\\bsouth_|\\bunderfoot_|\\bunderground_|\\bunderneath_|\\buphill_|\\bupstairs_|\\bupstream_|\\bupwards?|\\bwest_|\\bdownwind|\\beastwards?|\\bwestwards?|\\bnorthwards?|\\bsouthwards?|\\belsewhere|\\beverywhere|\\bhere_|\\boffshore|\\bsomewhere|\\bthereabouts?|\\bfar_RB|\\bfarther_|\\bthere_RB|\\bonline_|\\boffline_N", words[j], re.IGNORECASE) 
-            and not re.search("_NNP", words[j])):
-                words[j] = re.sub("_\w+", "_PLACE", words[j])
+            if (rule_search("\\baboard_|\\babove_RB|\\babroad_|\\bacross_RB|\\bahead_|\\banywhere_|\\balongside_|\\baround_RB|\\bashore_|\\bastern_|\\baway_RB|\\bbackwards?|\\bbehind_RB|\\bbelow_RB|\\bbeneath_|\\bbeside_RB|\\bdownhill_|\\bdownstairs_|\\bdownstream_|\\bdownwards_|\\beast_|\\bhereabouts_|\\bindoors_|\\binland_|\\binshore_|\\binside_RB|\\blocally_|\\bnear_|\\bnearby_|\\bnorth_|\\bnowhere_|\\boutdoors_|\\boutside_RB|\\boverboard_|\\boverland_|\\boverseas_|\\bsouth_|\\bunderfoot_|\\bunderground_|\\bunderneath_|\\buphill_|\\bupstairs_|\\bupstream_|\\bupwards?|\\bwest_|\\bdownwind|\\beastwards?|\\bwestwards?|\\bnorthwards?|\\bsouthwards?|\\belsewhere|\\beverywhere|\\bhere_|\\boffshore|\\bsomewhere|\\bthereabouts?|\\bfar_RB|\\bfarther_|\\bthere_RB|\\bonline_|\\boffline_N", words[j], re.IGNORECASE) 
+            and not rule_search("_NNP", words[j])):
+                words[j] = rule_sub("_\w+", "_PLACE", words[j])
 
-            if (re.search("\\bthere_P", words[j], re.IGNORECASE) and re.search("_MD", words[j+1])): # Correction of there + modals, e.g. there might be that option which are frequently not recognised as instances of there_EX by the POS-tagger
-                words[j] = re.sub("_\w+", "_EX", words[j])
+            if (rule_search("\\bthere_P", words[j], re.IGNORECASE) and rule_search("_MD", words[j+1])): # Correction of there + modals, e.g. there might be that option which are frequently not recognised as instances of there_EX by the POS-tagger
+                words[j] = rule_sub("_\w+", "_EX", words[j])
 
             #---------------------------------------------------
             # Tags time adverbials 
             # ELF: Added already, so far, thus far, yet (if not already tagged as CONC above) and ago. Restricted after and before to adverb forms only.
-            if ((re.search("\\bago_|\\bafter_RB|\\bafterwards_|\\bagain_|\\balready_|anytime_|\\banymore_|\\bbefore_RB|\\bbeforehand_|\\bbriefly_|\\bcurrently_|\\bearlier_RB|\\bearly_RB|\\beventually_|\\bformerly_|immediately_|\\binitially_|\\binstantly_|\\bforeever_|\\blate_RB|\\blately_|\\blater_RB|momentarily_|\\bnow_|\\bnowadays_|originally_|overnight_|\\bpresently_|previously_|\\brecently_|\\bsomeday_|\\bshortly_|simultaneously_|\\bsooner_|\\bsubsequently_|\\bsuddenly|\\btoday_|\\bto-day_|\\btomorrow_|\\bto-morrow_|\\btonight_|\\bto-night_|\\byesterday_|\\byet_RB|\\bam_RB|\\bam_NN|\\bpm_NN|\\bpm_RB", words[j], re.IGNORECASE)) or
-            (re.search("\\bsoon_", words[j], re.IGNORECASE) and not re.search("\\bas_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bprior_", words[j], re.IGNORECASE) and re.search("\\bto_", words[j+1], re.IGNORECASE)) or
-            (re.search("\\bso_|\\bthus_", words[j-1], re.IGNORECASE) and re.search("\\bfar_", words[j], re.IGNORECASE) and not re.search("_J|_RB", words[j+1], re.IGNORECASE))):
-                words[j] = re.sub("_\w+", "_TIME", words[j])
+            if ((rule_search("\\bago_|\\bafter_RB|\\bafterwards_|\\bagain_|\\balready_|anytime_|\\banymore_|\\bbefore_RB|\\bbeforehand_|\\bbriefly_|\\bcurrently_|\\bearlier_RB|\\bearly_RB|\\beventually_|\\bformerly_|immediately_|\\binitially_|\\binstantly_|\\bforeever_|\\blate_RB|\\blately_|\\blater_RB|momentarily_|\\bnow_|\\bnowadays_|originally_|overnight_|\\bpresently_|previously_|\\brecently_|\\bsomeday_|\\bshortly_|simultaneously_|\\bsooner_|\\bsubsequently_|\\bsuddenly|\\btoday_|\\bto-day_|\\btomorrow_|\\bto-morrow_|\\btonight_|\\bto-night_|\\byesterday_|\\byet_RB|\\bam_RB|\\bam_NN|\\bpm_NN|\\bpm_RB", words[j], re.IGNORECASE)) or
+            (rule_search("\\bsoon_", words[j], re.IGNORECASE) and not rule_search("\\bas_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bprior_", words[j], re.IGNORECASE) and rule_search("\\bto_", words[j+1], re.IGNORECASE)) or
+            (rule_search("\\bso_|\\bthus_", words[j-1], re.IGNORECASE) and rule_search("\\bfar_", words[j], re.IGNORECASE) and not rule_search("_J|_RB", words[j+1], re.IGNORECASE))):
+                words[j] = rule_sub("_\w+", "_TIME", words[j])
 
             #---------------------------------------------------
 
     for j, value in enumerate(words):
         if value != " ":
             # Adds "NEED to" and "HAVE to" to the list of necessity (semi-)modals  
-            if (re.search("\\bneed_V|\\bneeds_V|\\bneeded_V|\\bhave_V|\\bhas_V|\\bhad_V|\\bhad_P|\\bhaving_V", words[j], re.IGNORECASE) and re.search("\\bto_TO", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_MDNE", words[j])
+            if (rule_search("\\bneed_V|\\bneeds_V|\\bneeded_V|\\bhave_V|\\bhas_V|\\bhad_V|\\bhad_P|\\bhaving_V", words[j], re.IGNORECASE) and rule_search("\\bto_TO", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_MDNE", words[j])
 
             # EFL: Tag remaining YNQU questions
             # This loop assumes that any question marks that have yet to be tagged as YNQU, WHQU or QUTAG by this stage are in fact yes-no questions.
-            if (re.search("\\?_\\.", words[j]) and not re.search("YNQU|WQ|QUTAG", words[j]) and not re.search("_UH|_FPUH|_DMA", words[j-1])):
-                words[j] = re.sub("(_\\.)", "\\1 YNQU", words[j]) 
+            if (rule_search("\\?_\\.", words[j]) and not rule_search("YNQU|WQ|QUTAG", words[j]) and not rule_search("_UH|_FPUH|_DMA", words[j-1])):
+                words[j] = rule_sub("(_\\.)", "\\1 YNQU", words[j]) 
         
     #--------------------------------------------------- 
     # BASIC TAGS THAT HAVE TO BE TAGGED AT THE END TO AVOID CLASHES WITH MORE COMPLEX REGEX ABOVE
@@ -1134,105 +2222,105 @@ def process_sentence (words: list, extended: bool = False) -> list:
         if x != " ":
 
         # Tags amplifiers 
-            if (re.search("\\babsolutely_|\\baltogether_|\\bdefinitely_|\\bcompletely_|\\benormously_|\\bentirely_|\\bespecially_|\\bextremely_|\\bextraordinarily_|\\bfully_|\\bgreatly_|\\bhighly_|\\bintensely_|\\bparticularly_|\\bperfectly_|\\bsorely_|\\bstrongly_|\\bthoroughly_|\\btotally_|\\butterly_|\\bvery_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_AMP", words[index])
+            if (rule_search("\\babsolutely_|\\baltogether_|\\bdefinitely_|\\bcompletely_|\\benormously_|\\bentirely_|\\bespecially_|\\bextremely_|\\bextraordinarily_|\\bfully_|\\bgreatly_|\\bhighly_|\\bintensely_|\\bparticularly_|\\bperfectly_|\\bsorely_|\\bstrongly_|\\bthoroughly_|\\btotally_|\\butterly_|\\bvery_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_AMP", words[index])
 
             # Tags downtoners
             # ELF: Added "less" as an adverb (note that "less" as an adjective is tagged as a quantifier further up)
-            if (re.search("\\balmost_|\\bbarely_|\\bhardly_|\\bless_JJ|\\bmerely_|\\bmildly_|\\bnearly_|\\bonly_|\\bpartially_|\\bpartly_|\\bpractically_|\\bscarcely_|\\bsolely_|\\bslightly_|\\bsomewhat_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_DWNT", words[index])
+            if (rule_search("\\balmost_|\\bbarely_|\\bhardly_|\\bless_JJ|\\bmerely_|\\bmildly_|\\bnearly_|\\bonly_|\\bpartially_|\\bpartly_|\\bpractically_|\\bscarcely_|\\bsolely_|\\bslightly_|\\bsomewhat_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_DWNT", words[index])
 
             # Corrects EMO tags
             # ELF: Correction of emoticon issues to do with the Stanford tags for brackets including hyphens
-            if (re.search("_EMO(.)*-", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_EMO(.)*-", "_EMO", words[index])
+            if (rule_search("_EMO(.)*-", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_EMO(.)*-", "_EMO", words[index])
 
             # Tags quantifier references 
             # ELF: Added any, removed nowhere (which is now place). "no one" is also tagged for at an earlier stage to avoid collisions with the XX0 variable.
-            if (re.search("\\banybody_|\\banyone_|\\banything_|\\beverybody_|\\beveryone_|\\beverything_|\\bnobody_|\\bnone_|\\bnothing_|\\bsomebody_|\\bsomeone_|\\bsomething_|\\bnoone_|\\bno-one_|\\bothers_", words[index], re.IGNORECASE)):      
-                words[index] = re.sub("_\w+", "_QUPR", words[index])
+            if (rule_search("\\banybody_|\\banyone_|\\banything_|\\beverybody_|\\beveryone_|\\beverything_|\\bnobody_|\\bnone_|\\bnothing_|\\bsomebody_|\\bsomeone_|\\bsomething_|\\bnoone_|\\bno-one_|\\bothers_", words[index], re.IGNORECASE)):      
+                words[index] = rule_sub("_\w+", "_QUPR", words[index])
 
             # Tags gerunds 
             # ELF: Not currently in use because of doubts about the usefulness of this category (cf. Herbst 2016 in Applied Construction Grammar) + high rate of false positives with Biber's/Nini's operationalisation of the variable.
-            #if ((re.search("ing_NN", words[index], re.IGNORECASE) and re.search("\w{10,}", words[index])) or
-            # (re.search("ings_NN", words[index], re.IGNORECASE) and re.search("\w{11,}", words[index]))):
-                #words[index] = re.sub("_\w+", "_GER", words[index])
+            #if ((rule_search("ing_NN", words[index], re.IGNORECASE) and rule_search("\w{10,}", words[index])) or
+            # (rule_search("ings_NN", words[index], re.IGNORECASE) and rule_search("\w{11,}", words[index]))):
+                #words[index] = rule_sub("_\w+", "_GER", words[index])
 
             # Tags predicative adjectives (JJPR) by joining all kinds of JJ (but not JJAT, see earlier loop)
-            if (re.search("_JJS|_JJR|_JJ\\b", words[index])):
-                words[index] = re.sub("_\w+", "_JJPR", words[index])
+            if (rule_search("_JJS|_JJR|_JJ\\b", words[index])):
+                words[index] = rule_sub("_\w+", "_JJPR", words[index])
 
             # Tags total adverbs by joining all kinds of RB (but not those already tagged as HDG, FREQ, AMP, DWNTN, EMPH, ELAB, EXTD, TIME, PLACE...).
-            if (re.search("_RBS|_RBR|_WRB", words[index])):
-                words[index] = re.sub("_\w+", "_RB", words[index])
+            if (rule_search("_RBS|_RBR|_WRB", words[index])):
+                words[index] = rule_sub("_\w+", "_RB", words[index])
 
             # Tags present tenses
-            if (re.search("_VBP|_VBZ", words[index])):
-                words[index] = re.sub("_\w+", "_VPRT", words[index])
+            if (rule_search("_VBP|_VBZ", words[index])):
+                words[index] = rule_sub("_\w+", "_VPRT", words[index])
 
             # Tags second person references - ADDED "THOU", "THY", "THEE", "THYSELF" ELF: added nominal possessive pronoun (yours), added u, ur, ye and y' (for y'all).
-            if (re.search("\\byou_|\\byour_|\\byourself_|\\byourselves_|\\bthy_|\\bthee_|\\bthyself_|\\bthou_|\\byours_|\\bur_|\\bu_PRP|\\bye_PRP|\\by'_|\\bthine_|\\bya_PRP", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_PP2", words[index])
+            if (rule_search("\\byou_|\\byour_|\\byourself_|\\byourselves_|\\bthy_|\\bthee_|\\bthyself_|\\bthou_|\\byours_|\\bur_|\\bu_PRP|\\bye_PRP|\\by'_|\\bthine_|\\bya_PRP", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_PP2", words[index])
 
             # Tags third person reference 
             # ELF: added themself in singular (cf. https://www.lexico.com/grammar/themselves-or-themself), added nominal possessive pronoun forms (hers, theirs), also added em_PRP for 'em.
             # ELF: Subdivided Biber's category into "they" references (PP3t), "she" references (PP3f) and "he" references (PP3m).
-            if (re.search("\\bthey_|\\bthem_|\\btheir_|\\bthemselves_|\\btheirs_|\W+em_PRP|\\bthemself_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_PP3t", words[index])
+            if (rule_search("\\bthey_|\\bthem_|\\btheir_|\\bthemselves_|\\btheirs_|\W+em_PRP|\\bthemself_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_PP3t", words[index])
 
-            if (re.search("\\bshe_|\\bher_|\\bhers_|\\bherself_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_PP3f", words[index])
+            if (rule_search("\\bshe_|\\bher_|\\bhers_|\\bherself_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_PP3f", words[index])
 
-            if (re.search("\\bhe_|\\bhim_|\\bhis_|\\bhimself_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_PP3m", words[index])
+            if (rule_search("\\bhe_|\\bhim_|\\bhis_|\\bhimself_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_PP3m", words[index])
 
             # Tags "can" modals 
             # ELF: added _MD onto all of these. And ca_MD which was missing for can't.
-            if (re.search("\\bcan_MD|\\bca_MD|\\bcannot_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDCA", words[index])
+            if (rule_search("\\bcan_MD|\\bca_MD|\\bcannot_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDCA", words[index])
 
             # Tags "could" modals
-            if (re.search("\\bcould_MD", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDCO", words[index])
+            if (rule_search("\\bcould_MD", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDCO", words[index])
 
             # Tags necessity modals
             # ELF: added _MD onto all of these to increase precision.
-            if (re.search("\\bought_MD|\\bshould_MD|\\bmust_MD|\\bneed_MD", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDNE", words[index])
+            if (rule_search("\\bought_MD|\\bshould_MD|\\bmust_MD|\\bneed_MD", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDNE", words[index])
 
             # Tags "may/might" modals
             # ELF: added _MD onto all of these to increase precision.
-            if (re.search("\\bmay_MD|\\bmight_MD", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDMM", words[index])
+            if (rule_search("\\bmay_MD|\\bmight_MD", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDMM", words[index])
 
             # Tags will/shall modals. 
             # ELF: New variable replacing Biber's PRMD.
-            if (re.search("\\bwill_MD|'ll_MD|\\bshall_|\\bsha_|\W+ll_|'II_|\\bll_MD", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDWS", words[index])
+            if (rule_search("\\bwill_MD|'ll_MD|\\bshall_|\\bsha_|\W+ll_|'II_|\\bll_MD", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDWS", words[index])
 
             # Tags would as a modal. 
             # ELF: New variable replacing PRMD.
-            if (re.search("\\bwould_|'d_MD|\\bwo_MD|\\bd_MD|\W+d_MD", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_\w+", "_MDWO", words[index])
+            if (rule_search("\\bwould_|'d_MD|\\bwo_MD|\\bd_MD|\W+d_MD", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_\w+", "_MDWO", words[index])
 
             #----------------------------------------
             # Tags verbal contractions
-            if (re.search("'\w+_V|\\bn't_XX0|'ll_|'d_|\\bnt_XX0", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 CONT", words[index])
+            if (rule_search("'\w+_V|\\bn't_XX0|'ll_|'d_|\\bnt_XX0", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_(\w+)", "_\\1 CONT", words[index])
 
             # tags the remaining interjections and filled pauses. 
             # ELF: added variable
             # Note: it is important to keep this variable towards the end because some UH tags need to first be overridden by other variables such as politeness (please) and pragmatic markers (yes). 
-            if (re.search("_UH", words[index])):
-                words[index] = re.sub("_(\w+)", "_FPUH", words[index])
+            if (rule_search("_UH", words[index])):
+                words[index] = rule_sub("_(\w+)", "_FPUH", words[index])
 
             # ELF: added variable: tags adverbs of frequency (list from COBUILD p. 270 but removed "mainly").
-            if (re.search("\\busually_|\\balways_|\\boftens?_|oftentimes_|\\bonce_|\\btwice_|\\bgenerally|\\bnormally|\\btraditionally|\\bagain_|\\bconstantly|\\bcontinually|\\bfrequently|\\bforever_|\\bever_|\\bnever_|\\binfrequently|\\bintermittently|\\boccasionally|\\bperiodically|\\brarely_|\\bregularly|\\brepeatedly|\\bseldom|\\bsometimes|\\bsporadically|daily_|weekly_|monthly_|yearly_", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_FREQ", words[index])
+            if (rule_search("\\busually_|\\balways_|\\boftens?_|oftentimes_|\\bonce_|\\btwice_|\\bgenerally|\\bnormally|\\btraditionally|\\bagain_|\\bconstantly|\\bcontinually|\\bfrequently|\\bforever_|\\bever_|\\bnever_|\\binfrequently|\\bintermittently|\\boccasionally|\\bperiodically|\\brarely_|\\bregularly|\\brepeatedly|\\bseldom|\\bsometimes|\\bsporadically|daily_|weekly_|monthly_|yearly_", words[index], re.IGNORECASE)):
+                words[index] = rule_sub("_(\w+)", "_FREQ", words[index])
 
             # ELF: remove the TO category which was needed for the identification of other features put overlaps with VB
-            if (re.search("_TO", words[index])):
-                words[index] = re.sub("_(\w+)", "_IN", words[index])
+            if (rule_search("_TO", words[index])):
+                words[index] = rule_sub("_(\w+)", "_IN", words[index])
 
         #---------------------------------------------------
 
@@ -1246,37 +2334,239 @@ def process_sentence (words: list, extended: bool = False) -> list:
             
             # ELF: New variable noun compounds
             # Shakir: Added space to prevent tag overlaps
-            if (re.search("\\b.{3,}_NN", words[j]) and re.search("\\b(.{2,}_NN|.{2,}_NNS)\\b", words[j+1]) and not re.search("NCOMP", words[j]) and not re.search(" ", words[j])): 
-                words[j+1] = re.sub("_(\w+)", "_\\1 NCOMP", words[j+1])
+            if (rule_search("\\b.{3,}_NN", words[j]) and rule_search("\\b(.{2,}_NN|.{2,}_NNS)\\b", words[j+1]) and not rule_search("NCOMP", words[j]) and not parse_token(words[j]).extra): 
+                words[j+1] = rule_sub("_(\w+)", "_\\1 NCOMP", words[j+1])
 
             # ELF: Added the NN-NN pattern for hyphenated noun compounds such as home-office. 
             # Limited the first noun to five characters at least to avoid catching prefixes and parts of chemical formulae mistagged as NN
-            if (re.search("\\b.{5,}_NN", words[j]) and re.search("-_HYPH\\b", words[j+1]) and re.search("\\b.{3,}_NN", words[j+2]) and not re.search("NCOMP", words[j]) and not re.search(" ", words[j])):
-                words[j+2] = re.sub("_(\w+)", "_\\1 NCOMP", words[j+2])
+            if (rule_search("\\b.{5,}_NN", words[j]) and rule_search("-_HYPH\\b", words[j+1]) and rule_search("\\b.{3,}_NN", words[j+2]) and not rule_search("NCOMP", words[j]) and not parse_token(words[j]).extra):
+                words[j+2] = rule_sub("_(\w+)", "_\\1 NCOMP", words[j+2])
 
             # Shakir: if extended is True keep proper noun distinction
             if extended:
-                if (re.search("_NNP|_NNPS", words[j])):
-                    words[j] = re.sub("_\w+", "_NN NNP", words[j])
+                if (rule_search("_NNP|_NNPS", words[j])):
+                    words[j] = rule_sub("_\w+", "_NN NNP", words[j])
 
             # Tags total nouns by joining plurals together with singulars including of proper nouns.            
-            if (re.search("_NN|_NNS|_NNP|_NNPS", words[j])):
-                words[j] = re.sub("_\w+", "_NN", words[j])
+            if (rule_search("_NN|_NNS|_NNP|_NNPS", words[j])):
+                words[j] = rule_sub("_\w+", "_NN", words[j])
 
             # Shakir: fixed it tagged as PRP 
-            if (re.search("(It|its?|itself)_PRP\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_PIT", words[j])
+            if (rule_search("(It|its?|itself)_PRP\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_PIT", words[j])
 
             # Shakir: additional variable to catch any remaining MD tags
-            if (re.search("_MD\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_MDother", words[j])
+            if (rule_search("_MD\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_MDother", words[j])
             
             # Shakir: additional variable to catch any remaining PRPS and PRP tags
-            if (re.search("_(PRPS|PRP)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_PPother", words[j])        
+            if (rule_search("_(PRPS|PRP)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_PPother", words[j])        
 
     return words
 
+# DICTIONARY LISTS
+
+# The following lists are based on the verb semantic categories used in Biber 2006.
+
+# Activity verbs 
+# ELF: removed GET and GO due to high polysemy and corrected the "evercise" typo found in Biber 2006.
+vb_act = "(accompanied|accompanies|accompany|accompanying|acquire|acquired|acquires|acquiring|add|added|adding|adds|advance|advanced|advances|advancing|applied|applies|apply|applying|arrange|arranged|arranges|arranging|ate|beat|beaten|beating|beats|behave|behaved|behaves|behaving|borrow|borrowed|borrowing|borrows|bought|bring|bringing|brings|brought|burn|burned|burning|burns|burnt|buy|buying|buys|came|carried|carries|carry|carrying|catch|catches|catching|caught|check|checked|checking|checks|clean|cleaned|cleaner|cleanest|cleaning|cleans|climb|climbed|climbing|climbs|combine|combined|combines|combining|come|comes|coming|control|controlled|controlling|controls|cover|covered|covering|covers|defend|defended|defending|defends|deliver|delivered|delivering|delivers|did|dig|digging|digs|divide|divided|divides|dividing|do|does|doing|done|dug|earn|earned|earning|earns|eat|eaten|eating|eats|encounter|encountered|encountering|encounters|engage|engaged|engages|engaging|exercise|exercised|exercises|exercising|expand|expanded|expanding|expands|explore|explored|explores|exploring|extend|extended|extending|extends|fix|fixed|fixes|fixing|follow|followed|following|follows|form|formed|forming|forms|gave|give|given|gives|giving|hang|hanged|hanging|hangs|held|hold|holding|holds|hung|join|joined|joining|joins|lain|lay|leave|leaves|leaving|left|lie|lied|lies|lose|loses|losing|lost|lying|made|make|makes|making|meet|meets|met|move|moved|moves|moving|obtain|obtain|obtained|obtaining|obtains|open|opened|opening|opens|paid|pass|passed|passes|passing|pay|paying|pays|pick|picked|picking|picks|play|played|playing|plays|produce|produced|produces|producing|provide|provided|provides|providing|pull|pulled|pulling|pulls|put|puts|putting|ran|reach|reached|reaches|reaching|receive|received|receives|receiving|reduce|reduced|reduces|reducing|repeat|repeated|repeating|repeats|run|running|runs|sat|save|saved|saves|saving|sell|selling|sells|send|sending|sends|sent|shake|shaken|shakes|shaking|share|shared|shares|sharing|shook|show|showed|showing|shown|shows|sit|sits|sitting|smile|smiled|smiles|smiling|sold|spend|spending|spends|spent|stare|stared|stares|staring|take|taken|takes|taking|threw|throw|throwing|thrown|throws|took|tried|tries|try|trying|turn|turned|turning|turns|use|used|uses|using|visit|visited|visiting|visits|wait|waited|waiting|waits|walk|walked|walking|walks|watch|watched|watches|watching|wear|wearing|wears|win|winning|wins|won|wore|work|worked|working|works|worn)"
+# Communication verbs 
+# ELF: corrected a typo for "descibe" and added its other forms, removed "spake" as a form of SPEAK, removed some adjective forms like "fitter, fittest", etc.
+# In addition, British spellings and the verbs "AGREE, ASSERT, BEG, CONFIDE, COMMAND, DISAGREE, OBJECT, PLEDGE, PRONOUNCE, PLEAD, REPORT, TESTIFY, VOW" (taken from the public and suasive lists above) were added. "MEAN" which was originally assigned to the mental verb list was added to the communication list, instead.
+vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
+
+# Mental verbs
+# ELF: Added British spellings, removed AFFORD and FIND. Removed DESERVE which is also on Biber's (2006) existential list. Added wan to account for wanna tokenised as wan na.
+vb_mental =	"(see|sees|seeing|saw|seen|know|knows|knowing|knew|known|think|thinks|thinking|thought|want|wan|wants|wanting|wanted|need|needs|needing|needed|feel|feels|feeling|felt|like|likes|liking|liked|hear|hears|hearing|heard|remember|remembers|remembering|remembered|believe|believes|believing|believed|read|reads|reading|consider|considers|considering|considered|suppose|supposes|supposing|supposed|listen|listens|listening|listened|love|loves|loving|loved|wonder|wonders|wondering|wondered|understand|understands|understood|expect|expects|expecting|expected|hope|hopes|hoping|hoped|assume|assumes|assuming|assumed|determine|determines|determining|determined|agree|agrees|agreeing|agreed|bear|bears|bearing|bore|borne|care|cares|caring|cared|choose|chooses|choosing|chose|chosen|compare|compares|comparing|compared|decide|decides|deciding|decided|discover|discovers|discovering|discovered|doubt|doubts|doubting|doubted|enjoy|enjoys|enjoying|enjoyed|examine|examines|examining|examined|face|faces|facing|faced|forget|forgets|forgetting|forgot|forgotten|hate|hates|hating|hated|identify|identifies|identifying|identified|imagine|imagines|imagining|imagined|intend|intends|intending|intended|learn|learns|learning|learned|learnt|miss|misses|missing|missed|mind|minds|minding|notice|notices|noticing|noticed|plan|plans|planning|planned|prefer|prefers|preferring|preferred|prove|proves|proving|proved|proven|realize|realizes|realizing|realized|recall|recalls|recalling|recalled|recognize|recognizes|recognizing|recognized|recognise|recognises|recognising|recognised|regard|regards|regarding|regarded|suffer|suffers|suffering|suffered|wish|wishes|wishing|wished|worry|worries|worrying|worried|accept|accepts|accepting|accepted|appreciate|appreciates|appreciating|appreciated|approve|approves|approving|approved|assess|assesses|assessing|assessed|blame|blames|blaming|blamed|bother|bothers|bothering|bothered|calculate|calculates|calculating|calculated|conclude|concludes|concluding|concluded|celebrate|celebrates|celebrating|celebrated|confirm|confirms|confirming|confirmed|count|counts|counting|counted|dare|dares|daring|dared|detect|detects|detecting|detected|dismiss|dismisses|dismissing|dismissed|distinguish|distinguishes|distinguishing|distinguished|experience|experiences|experiencing|experienced|fear|fears|fearing|feared|forgive|forgives|forgiving|forgave|forgiven|guess|guesses|guessing|guessed|ignore|ignores|ignoring|ignored|impress|impresses|impressing|impressed|interpret|interprets|interpreting|interpreted|judge|judges|judging|judged|justify|justifies|justifying|justified|observe|observes|observing|observed|perceive|perceives|perceiving|perceived|predict|predicts|predicting|predicted|pretend|pretends|pretending|pretended|reckon|reckons|reckoning|reckoned|remind|reminds|reminding|reminded|satisfy|satisfies|satisfying|satisfied|solve|solves|solving|solved|study|studies|studying|studied|suspect|suspects|suspecting|suspected|trust|trusts|trusting|trusted)"
+
+# Facilitation or causation verbs
+vb_cause = "(help|helps|helping|helped|let|lets|letting|allow|allows|allowing|allowed|affect|affects|affecting|affected|cause|causes|causing|caused|enable|enables|enabling|enabled|ensure|ensures|ensuring|ensured|force|forces|forcing|forced|prevent|prevents|preventing|prevented|assist|assists|assisting|assisted|guarantee|guarantees|guaranteeing|guaranteed|influence|influences|influencing|influenced|permit|permits|permitting|permitted|require|requires|requiring|required)"
+
+# Occurrence verbs
+vb_occur = "(become|becomes|becoming|became|happen|happens|happening|happened|change|changes|changing|changed|die|dies|dying|died|grow|grows|grew|grown|growing|develop|develops|developing|developed|arise|arises|arising|arose|arisen|emerge|emerges|emerging|emerged|fall|falls|falling|fell|fallen|increase|increases|increasing|increased|last|lasts|lasting|lasted|rise|rises|rising|rose|risen|disappear|disappears|disappearing|disappeared|flow|flows|flowing|flowed|shine|shines|shining|shone|shined|sink|sinks|sank|sunk|sunken|sinking|slip|slips|slipping|slipped|occur|occurs|occurring|occurred)"
+
+# Existence or relationship verbs ELF: Does not include the copular BE as in Biber (2006). LOOK was also removed due to too high polysemy. 
+vb_exist =	"(seem|seems|seeming|seemed|stand|stands|standing|stood|stay|stays|staid|stayed|staying|live|lives|living|lived|appear|appears|appearing|appeared|include|includes|including|included|involve|involves|involving|involved|contain|contains|containing|contained|exist|exists|existing|existed|indicate|indicates|indicating|indicated|concern|concerns|concerning|concerned|constitute|constitutes|constituting|constituted|define|defines|defining|defined|derive|derives|deriving|derived|illustrate|illustrates|illustrating|illustrated|imply|implies|implying|implied|lack|lacks|lacking|lacked|owe|owes|owing|owed|own|owns|owning|owned|possess|possesses|possessing|possessed|suit|suits|suiting|suited|vary|varies|varying|varied|fit|fits|fitting|fitted|matter|matters|mattering|mattered|reflect|reflects|reflecting|reflected|relate|relates|relating|related|remain|remains|remaining|remained|reveal|reveals|revealing|revealed|sound|sounds|sounding|sounded|tend|tends|tending|tended|represent|represents|representing|represented|deserve|deserves|deserving|deserved)"
+
+# Aspectual verbs
+vb_aspect =	"(start|starts|starting|started|keep|keeps|keeping|kept|stop|stops|stopping|stopped|begin|begins|beginning|began|begun|complete|completes|completing|completed|end|ends|ending|ended|finish|finishes|finishing|finished|cease|ceases|ceasing|ceased|continue|continues|continuing|continued)"
+
+# Shakir: noun, adj, adv semantic categories from Biber 2006
+nn_human = "(family|families|guy|guys|individual|individuals|kid|kids|man|men|manager|managers|member|members|parent|parents|teacher|teachers|child|children|people|peoples|person|people|student|students|woman|women|animal|animals|applicant|applicants|author|authors|baby|babies|boy|boys|client|clients|consumer|consumers|critic|critics|customer|customers|doctor|doctors|employee|employees|employer|employers|father|fathers|female|females|friend|friends|girl|girls|god|gods|historian|historians|husband|husbands|American|Americans|Indian|Indians|instructor|instructors|king|kings|leader|leaders|male|males|mother|mothers|owner|owners|president|presidents|professor|professors|researcher|researchers|scholar|scholars|speaker|speakers|species|supplier|suppliers|undergraduate|undergraduates|user|users|wife|wives|worker|workers|writer|writers|accountant|accountants|adult|adults|adviser|advisers|agent|agents|aide|aides|ancestor|ancestors|anthropologist|anthropologists|archaeologist|archaeologists|artist|artists|artiste|artistes|assistant|assistants|associate|associates|attorney|attorneys|audience|audiences|auditor|auditors|bachelor|bachelors|bird|birds|boss|bosses|brother|brothers|buddha|buddhas|buyer|buyers|candidate|candidates|cat|cats|citizen|citizens|colleague|colleagues|collector|collectors|competitor|competitors|counselor|counselors|daughter|daughters|deer|defendant|defendants|designer|designers|developer|developers|director|directors|driver|drivers|economist|economists|engineer|engineers|executive|executives|expert|experts|farmer|farmers|feminist|feminists|freshman|freshmen|ecologist|ecologists|hero|heroes|host|hosts|hunter|hunters|immigrant|immigrants|infant|infants|investor|investors|jew|jews|judge|judges|lady|ladies|lawyer|lawyers|learner|learners|listener|listeners|maker|makers|manufacturer|manufacturers|miller|millers|minister|ministers|mom|moms|monitor|monitors|monkey|monkeys|neighbor|neighbors|neighbour|neighbours|observer|observers|officer|officers|official|officials|participant|participants|partner|partners|patient|patients|personnel|personnels|peer|peers|physician|physicians|plaintiff|plaintiffs|player|players|poet|poets|police|polices|processor|processors|professional|professionals|provider|providers|psychologist|psychologists|resident|residents|respondent|respondents|schizophrenic|schizophrenics|scientist|scientists|secretary|secretaries|server|servers|shareholder|shareholders|sikh|sikhs|sister|sisters|slave|slaves|son|sons|spouse|spouses|supervisor|supervisors|theorist|theorists|tourist|tourists|victim|victims|faculty|faculties|dean|deans|engineer|engineers|reader|readers|couple|couples|graduate|graduates)"
+nn_cog = "(analysis|analyses|decision|decisions|experience|experiences|assessment|assessments|calculation|calculations|conclusion|conclusions|consequence|consequences|consideration|considerations|evaluation|evaluations|examination|examinations|expectation|expectations|observation|observations|recognition|recognitions|relation|relations|understanding|understandings|hypothesis|hypotheses|ability|abilities|assumption|assumptions|attention|attentions|attitude|attitudes|belief|beliefs|concentration|concentrations|concern|concerns|consciousness|consciousnesses|concept|concepts|fact|facts|idea|ideas|knowledge|knowledges|look|looks|need|needs|reason|reasons|sense|senses|view|views|theory|theories|desire|desires|emotion|emotions|feeling|feelings|judgement|judgements|memory|memories|notion|notions|opinion|opinions|perception|perceptions|perspective|perspectives|possibility|possibilities|probability|probabilities|responsibility|responsibilities|thought|thoughts)"
+nn_concrete = "(tank|tanks|stick|sticks|target|targets|strata|stratas|telephone|telephones|string|strings|telescope|telescopes|sugar|sugars|ticket|tickets|syllabus|syllabuses|tip|tips|salt|salts|tissue|tissues|screen|screens|tooth|teeth|sculpture|sculptures|sphere|spheres|seawater|seawaters|spot|spots|ship|ships|steam|steams|silica|silicas|steel|steels|slide|slides|stem|stems|snow|snows|sodium|mud|muds|solid|solids|mushroom|mushrooms|gift|gifts|muscle|muscles|glacier|glaciers|tube|tubes|gun|guns|nail|nails|handbook|handbooks|newspaper|newspapers|handout|handouts|node|nodes|instrument|instruments|notice|notices|knot|knots|novel|novels|lava|lavas|page|pages|food|foods|transcript|transcripts|leg|legs|eye|eyes|lemon|lemons|brain|brains|magazine|magazines|device|devices|magnet|magnets|oak|oaks|manual|manuals|package|packages|marker|markers|peak|peaks|match|matches|pen|pens|metal|metals|pencil|pencils|block|blocks|pie|pies|board|boards|pipe|pipes|heart|hearts|load|loads|paper|papers|transistor|transistors|modem|modems|book|books|mole|moles|case|cases|motor|motors|computer|computers|mound|mounds|dollar|dollars|mouth|mouths|hand|hands|movie|movies|flower|flowers|object|objects|foot|feet|table|tables|frame|frames|water|waters|vessel|vessels|arm|arms|visa|visas|bar|bars|grain|grains|bed|beds|hair|hairs|body|bodies|head|heads|box|boxes|ice|ices|car|cars|item|items|card|cards|journal|journals|chain|chains|key|keys|chair|chairs|window|windows|vehicle|vehicles|leaf|leaves|copy|copies|machine|machines|document|documents|mail|mails|door|doors|map|maps|dot|dots|phone|phones|drug|drugs|picture|pictures|truck|trucks|piece|pieces|tape|tapes|note|notes|liquid|liquids|wire|wires|equipment|equipments|wood|woods|fiber|fibers|plant|plants|fig|figs|resistor|resistors|film|films|sand|sands|file|files|score|scores|seat|seats|belt|belts|sediment|sediments|boat|boats|seed|seeds|bone|bones|soil|soils|bubble|bubbles|bud|buds|water|waters|bulb|bulbs|portrait|portraits|bulletin|bulletins|step|steps|shell|shells|stone|stones|cake|cakes|tree|trees|camera|cameras|video|videos|face|faces|wall|walls|acid|acids|alcohol|alcohols|cap|caps|aluminium|aluminiums|clay|clays|artifact|artifacts|clock|clocks|rain|rains|clothing|clothings|asteroid|asteroids|club|clubs|automobile|automobiles|comet|comets|award|awards|sheet|sheets|bag|bags|branch|branches|ball|balls|copper|coppers|banana|bananas|counter|counters|band|bands|cover|covers|wheel|wheels|crop|crops|drop|drops|crystal|crystals|basin|basins|cylinder|cylinders|bell|bells|desk|desks|dinner|dinners|pole|poles|button|buttons|pot|pots|disk|disks|pottery|potteries|drain|drains|radio|radios|drink|drinks|reactor|reactors|drawing|drawings|retina|retinas|dust|dusts|ridge|ridges|edge|edges|ring|rings|engine|engines|ripple|ripples|plate|plates|game|games|cent|cents|post|posts|envelope|envelopes|rock|rocks|filter|filters|root|roots|finger|fingers|slope|slopes|fish|fish|space|spaces|fruit|fruits|statue|statues|furniture|furnitures|textbook|textbooks|gap|gaps|tool|tools|gate|gates|train|trains|gel|gels|deposit|deposits|chart|charts|mixture|mixtures)"
+nn_technical = "(cell|cells|unit|units|gene|genes|wave|waves|ion|ions|bacteria|bacterias|electron|electrons|chromosome|chromosomes|element|elements|cloud|clouds|sample|samples|isotope|isotopes|schedule|schedules|neuron|neurons|software|softwares|nuclei|nucleus|solution|solutions|nucleus|nuclei|atom|atoms|ray|rays|margin|margins|virus|viruses|mark|marks|hydrogen|hydrogens|mineral|minerals|internet|internets|molecule|molecules|mineral|minerals|organism|organisms|message|messages|oxygen|oxygens|paragraph|paragraphs|particle|particles|sentence|sentences|play|plays|star|stars|poem|poems|thesis|theses|proton|protons|unit|units|web|webs|layer|layers|center|centers|centre|centres|matter|matters|chapter|chapters|square|squares|data|circle|circles|equation|equations|compound|compounds|exam|exams|letter|letters|bill|bills|page|pages|component|components|statement|statements|diagram|diagrams|word|words|dna|angle|angles|fire|fires|carbon|carbons|formula|formulas|graph|graphs|iron|irons|lead|leads|jury|juries|light|lights|list|lists)"
+nn_place = "(apartment|apartments|interior|interiors|bathroom|bathrooms|moon|moons|bay|bays|museum|museums|bench|benches|neighborhood|neighborhoods|neighbourhood|neighbourhoods|bookstore|bookstores|opposite|opposites|border|borders|orbit|orbits|cave|caves|orbital|orbitals|continent|continents|outside|outsides|delta|deltas|parallel|parallels|desert|deserts|passage|passages|estuary|estuaries|pool|pools|factory|factories|prison|prisons|farm|farms|restaurant|restaurants|forest|forests|sector|sectors|habitat|habitats|shaft|shafts|hell|hells|shop|shops|hemisphere|hemispheres|southwest|hill|hills|station|stations|hole|holes|territory|territories|horizon|horizons|road|roads|bottom|bottoms|store|stores|boundary|boundaries|stream|streams|building|buildings|top|tops|campus|campuses|valley|valleys|canyon|canyons|village|villages|coast|coasts|city|cities|county|counties|country|countries|court|courts|earth|earths|front|fronts|environment|environments|district|districts|field|fields|floor|floors|market|markets|lake|lakes|office|offices|land|lands|organization|organizations|lecture|lectures|place|places|left|lefts|room|rooms|library|libraries|area|areas|location|locations|class|classes|middle|middles|classroom|classrooms|mountain|mountains|ground|grounds|north|norths|hall|halls|ocean|oceans|park|parks|planet|planets|property|properties|region|regions|residence|residences|river|rivers)"
+nn_quant = "(cycle|cycles|rate|rates|date|dates|second|seconds|frequency|frequencies|section|sections|future|futures|semester|semesters|half|halves|temperature|temperatures|height|heights|today|todays|number|numbers|amount|amounts|week|weeks|age|ages|day|days|century|centuries|part|parts|energy|energies|lot|lots|heat|heats|term|terms|hour|hours|time|times|month|months|mile|miles|period|periods|moment|moments|morning|mornings|volume|volumes|per|weekend|weekends|percentage|percentages|weight|weights|portion|portions|minute|minutes|quantity|quantities|percent|percents|quarter|quarters|length|lengths|ratio|ratios|measure|measures|summer|summers|meter|meters|volt|volts|voltage|voltages)"
+nn_group = "(airline|airlines|institute|institutes|colony|colonies|bank|banks|flight|flights|church|churches|hotel|hotels|firm|firms|hospital|hospitals|household|households|college|colleges|institution|institutions|house|houses|lab|labs|laboratory|laboratories|community|communities|company|companies|government|governments|university|universities|school|schools|home|homes|congress|congresses|committee|committees)"
+nn_abstract_process = "(action|actions|activity|activities|application|applications|argument|arguments|development|developments|education|educations|effect|effects|function|functions|method|methods|research|researches|result|results|process|processes|accounting|accountings|achievement|achievements|addition|additions|administration|administrations|approach|approaches|arrangement|arrangements|assignment|assignments|competition|competitions|construction|constructions|consumption|consumptions|contribution|contributions|counseling|counselings|criticism|criticisms|definition|definitions|discrimination|discriminations|description|descriptions|discussion|discussions|distribution|distributions|division|divisions|eruption|eruptions|evolution|evolutions|exchange|exchanges|exercise|exercises|experiment|experiments|explanation|explanations|expression|expressions|formation|formations|generation|generations|graduation|graduations|management|managements|marketing|marketings|marriage|marriages|mechanism|mechanisms|meeting|meetings|operation|operations|orientation|orientations|performance|performances|practice|practices|presentation|presentations|procedure|procedures|production|productions|progress|progresses|reaction|reactions|registration|registrations|regulation|regulations|revolution|revolutions|selection|selections|session|sessions|strategy|strategies|teaching|teachings|technique|techniques|tradition|traditions|training|trainings|transition|transitions|treatment|treatments|trial|trials|act|acts|agreement|agreements|attempt|attempts|attendance|attendances|birth|births|break|breaks|claim|claims|comment|comments|comparison|comparisons|conflict|conflicts|deal|deals|death|deaths|debate|debates|demand|demands|answer|answers|control|controls|flow|flows|service|services|work|works|test|tests|use|uses|war|wars|change|changes|question|questions|study|studies|talk|talks|task|tasks|trade|trades|transfer|transfers|admission|admissions|design|designs|detail|details|dimension|dimensions|direction|directions|disorder|disorders|diversity|diversities|economy|economies|emergency|emergencies|emphasis|emphases|employment|employments|equilibrium|equilibriums|equity|equities|error|errors|expense|expenses|facility|facilities|failure|failures|fallacy|fallacies|feature|features|format|formats|freedom|freedoms|fun|funs|gender|genders|goal|goals|grammar|grammars|health|healths|heat|heats|help|helps|identity|identities|image|images|impact|impacts|importance|importances|influence|influences|input|inputs|labor|labors|leadership|leaderships|link|links|manner|manners|math|maths|matrix|matrices|meaning|meanings|music|musics|network|networks|objective|objectives|opportunity|opportunities|option|options|origin|origins|output|outputs|past|pasts|pattern|patterns|phase|phases|philosophy|philosophies|plan|plans|potential|potentials|prerequisite|prerequisites|presence|presences|principle|principles|success|successes|profile|profiles|profit|profits|proposal|proposals|psychology|psychologies|quality|qualities|quiz|quizzes|race|races|reality|realities|religion|religions|resource|resources|respect|respects|rest|rests|return|returns|risk|risks|substance|substances|scene|scenes|security|securities|series|series|set|sets|setting|settings|sex|sexes|shape|shapes|share|shares|show|shows|sign|signs|signal|signals|sort|sorts|sound|sounds|spring|springs|stage|stages|standard|standards|start|starts|stimulus|stimuli|strength|strengths|stress|stresses|style|styles|support|supports|survey|surveys|symbol|symbols|topic|topics|track|tracks|trait|traits|trouble|troubles|truth|truths|variation|variations|variety|varieties|velocity|velocities|version|versions|whole|wholes|action|actions|account|accounts|condition|conditions|culture|cultures|end|ends|factor|factors|grade|grades|interest|interests|issue|issues|job|jobs|kind|kinds|language|languages|law|laws|level|levels|life|lives|model|models|name|names|nature|natures|order|orders|policy|policies|position|positions|power|powers|pressure|pressures|relationship|relationships|requirement|requirements|role|roles|rule|rules|science|sciences|side|sides|situation|situations|skill|skills|source|sources|structure|structures|subject|subjects|type|types|information|informations|right|rights|state|states|system|systems|value|values|way|ways|address|addresses|absence|absences|advantage|advantages|aid|aids|alternative|alternatives|aspect|aspects|authority|authorities|axis|axes|background|backgrounds|balance|balances|base|bases|beginning|beginnings|benefit|benefits|bias|biases|bond|bonds|capital|capitals|care|cares|career|careers|cause|causes|characteristic|characteristics|charge|charges|check|checks|choice|choices|circuit|circuits|circumstance|circumstances|climate|climates|code|codes|color|colors|column|columns|combination|combinations|complex|complexes|connection|connections|constant|constants|constraint|constraints|contact|contacts|content|contents|contract|contracts|context|contexts|contrast|contrasts|crime|crimes|criteria|criterias|cross|crosses|current|currents|curriculum|curriculums|curve|curves|debt|debts|density|densities)"
+advl_nonfact = "(confidentially|frankly|generally|honestly|mainly|technically|truthfully|typically|reportedly|primarily|usually)"
+advl_att = "(amazingly|astonishingly|conveniently|curiously|hopefully|fortunately|importantly|ironically|rightly|sadly|surprisingly|unfortunately)"
+advl_fact = "(actually|always|certainly|definitely|indeed|inevitably|never|obviously|really|undoubtedly|nodoubt|ofcourse|infact)"
+advl_likely = "(apparently|evidently|perhaps|possibly|predictably|probably|roughly|maybe)"
+jj_size = "(big|deep|heavy|huge|long|large|little|short|small|thin|wide|narrow)"
+jj_time = "(annual|daily|early|late|new|old|recent|young|weekly|monthly)"
+jj_color = "(black|white|dark|bright|blue|brown|green|gr[ae]y|red|orange|yellow|purple|pink)"
+jj_eval = "(bad|beautiful|best|fine|good|great|lovely|nice|poor)"
+jj_relation = "(additional|average|chief|complete|different|direct|entire|external|final|following|general|initial|internal|left|main|maximum|necessary|original|particular|previous|primary|public|similar|single|standard|top|various|same)"
+jj_topic = "(chemical|commercial|environmental|human|industrial|legal|medical|mental|official|oral|phonetic|political|sexual|social|ventral|visual)"
+jj_att_other = "(afraid|amazed|(un)?aware|concerned|disappointed|encouraged|glad|happy|hopeful|pleased|shocked|surprised|worried)"
+jj_epist_other = "(apparent|certain|clear|confident|convinced|correct|evident|false|impossible|inevitable|obvious|positive|right|sure|true|well-known|doubtful|likely|possible|probable|unlikely)"
+comm_vb_other = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
+fact_vb_other = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
+likely_vb_other = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
+att_vb_other = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
+
+# Shakir: vocabulary lists for that, wh and to clauses governed by semantic classes of verbs, nouns, adjectives
+th_vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
+th_vb_att = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
+th_vb_fact = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
+th_vb_likely = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
+to_vb_desire = "(agreeing|agreed|agree|agrees|chooses|chosen|choose|choosing|chose|decide|deciding|decided|decides|hate|hates|hating|hated|hesitated|hesitates|hesitate|hesitating|hoped|hope|hopes|hoping|intended|intend|intending|intends|likes|liked|like|liking|loving|loves|love|loved|means|meaning|meant|mean|needs|need|needing|needed|planning|plan|planned|plans|preferred|prefer|preferring|prefers|prepares|prepare|preparing|prepared|refuses|refusing|refuse|refused|wanting|want|wants|wanted|wishes|wished|wish|wishing)"
+to_vb_effort = "(allowing|allowed|allow|allows|attempting|attempted|attempts|attempt|enables|enabled|enabling|enable|encourages|encouraging|encouraged|encourage|fails|fail|failing|failed|help|helping|helps|helped|instructs|instructed|instruct|instructing|managing|managed|manage|manages|oblige|obligate|obliged|obligates|obliging|obligating|obliges|obligated|order|ordering|orders|ordered|permitted|permits|permit|permitting|persuaded|persuades|persuade|persuading|prompts|prompting|prompted|prompt|requiring|requisitions|requisitioning|required|requires|requisition|requisitioned|require|sought|seeking|seeks|seek|try|trying|tries|tried)"
+to_vb_prob = "(appear|appeared|appears|appearing|happens|happened|happen|happening|seemed|seems|seem|seeming|tending|tends|tended|tend)"
+to_vb_speech = "(asks|ask|asking|asked|claiming|claims|claim|claimed|invite|inviting|invited|invites|promising|promised|promise|promises|reminding|remind|reminded|reminds|requesting|request|requests|requested|saying|say|said|says|teaches|teaching|taught|teach|tell|tells|telling|told|urging|urges|urged|urge|warning|warn|warned|warns)"
+to_vb_mental = "(assumed|assumes|assume|assuming|believing|believes|believe|believed|considered|considers|consider|considering|expecting|expects|expected|expect|find|found|finding|finds|forgetting|forget|forgets|forgot|forgotten|imagine|imagined|imagining|imagines|judge|adjudicates|adjudicate|judges|judged|knowing|knows|known|know|knew|learnt|learning|learns|learn|presumes|presuming|presumed|presume|pretend|pretends|pretended|pretending|remembered|remember|remembers|remembering|supposing|suppose|supposes|supposed)"
+wh_vb_att = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
+wh_vb_fact = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
+wh_vb_likely = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
+wh_vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
+th_jj_att = "(afraid|amazed|(un)?aware|concerned|disappointed|encouraged|glad|happy|hopeful|pleased|shocked|surprised|worried)"
+th_jj_fact = "(apparent|certain|clear|confident|convinced|correct|evident|false|impossible|inevitable|obvious|positive|right|sure|true|well-known)"
+th_jj_likely = "(doubtful|likely|possible|probable|unlikely)"
+th_jj_eval = "(amazing|appropriate|conceivable|crucial|essential|fortunate|imperative|inconceivable|incredible|interesting|lucky|necessary|nice|noteworthy|odd|ridiculous|strange|surprising|unacceptable|unfortunate)"
+th_nn_nonfact = "(comment|comments|news|news|proposal|proposals|proposition|propositions|remark|remarks|report|reports|requirement|requirements)"
+th_nn_att = "(grounds|ground|hope|hopes|reason|reasons|view|views|thought|thoughts)"
+th_nn_fact = "(assertion|assertions|conclusion|conclusions|conviction|convictions|discovery|discoveries|doubt|doubts|fact|facts|knowledge|knowledges|observation|observations|principle|principles|realization|realizations|result|results|statement|statements)"
+th_nn_likely = "(assumption|assumptions|belief|beliefs|claim|claims|contention|contentions|feeling|feelings|hypothesis|hypotheses|idea|ideas|implication|implications|impression|impressions|notion|notions|opinion|opinions|possibility|possibilities|presumption|presumptions|suggestion|suggestions)"
+to_jj_certain = "(apt|certain|due|guaranteed|liable|likely|prone|unlikely|sure)"
+to_jj_able = "(anxious|(un)?able|careful|determined|eager|eligible|hesitant|inclined|obliged|prepared|ready|reluctant|(un)?willing)"
+to_jj_affect = "(afraid|ashamed|disappointed|embarrassed|glad|happy|pleased|proud|puzzled|relieved|sorry|surprised|worried)"
+to_jj_ease = "(difficult|easier|easy|hard|(im)?possible|tough)"
+to_jj_eval = "(bad|worse|(in)?appropriate|good|better|best|convenient|essential|important|interesting|necessary|nice|reasonable|silly|smart|stupid|surprising|useful|useless|unreasonable|wise|wrong)"
+to_nn_stance_all = "(agreement|agreements|decision|decisions|desire|desires|failure|failures|inclination|inclinations|intention|intentions|obligation|obligations|opportunity|opportunities|plan|plans|promise|promises|proposal|proposals|reluctance|reluctances|responsibility|responsibilities|right|rights|tendency|tendencies|threat|threats|wish|wishes|willingness|willingnesses)"
+nn_stance_pp = "(assertion|assertions|conclusion|conclusions|conviction|convictions|discovery|discoveries|doubt|doubts|fact|facts|knowledge|knowledges|observation|observations|principle|principles|realization|realizations|result|results|statement|statements|assumption|assumptions|belief|beliefs|claim|claims|contention|contentions|feeling|feelings|hypothesis|hypotheses|idea|ideas|implication|implications|impression|impressions|notion|notions|opinion|opinions|possibility|possibilities|presumption|presumptions|suggestion|suggestions|grounds|ground|hope|hopes|reason|reasons|view|views|thought|thoughts|comment|comments|news|news|proposal|proposals|proposition|propositions|remark|remarks|report|reports|requirement|requirements|agreement|agreements|decision|decisions|desire|desires|failure|failures|inclination|inclinations|intention|intentions|obligation|obligations|opportunity|opportunities|plan|plans|promise|promises|reluctance|reluctances|responsibility|responsibilities|right|rights|tendency|tendencies|threat|threats|wish|wishes|willingness|willingnesses)"
+
+# LEXICON INDEX
+# The semantic word lists above used to be tested against every token as case-insensitive regex alternations of up to 600 words.
+# They are now expanded once into a dictionary from lowercased word to a bitset of the lists the word belongs to, so that a token costs one dictionary lookup.
+# The public, private and suasive lists (Biber 1988) carry their "_V" in every entry, which is stripped here and checked as a tag instead.
+lexicon_word_lists = {"public": "(" + public.replace("_V", "") + ")", "private": "(" + private.replace("_V", "") + ")", "suasive": "(" + suasive.replace("_V", "") + ")", "v_stative": v_stative,
+    "vb_act": vb_act, "vb_comm": vb_comm, "vb_mental": vb_mental, "vb_cause": vb_cause, "vb_occur": vb_occur, "vb_exist": vb_exist, "vb_aspect": vb_aspect,
+    "nn_human": nn_human, "nn_cog": nn_cog, "nn_concrete": nn_concrete, "nn_technical": nn_technical, "nn_place": nn_place, "nn_quant": nn_quant, "nn_group": nn_group, "nn_abstract_process": nn_abstract_process,
+    "advl_nonfact": advl_nonfact, "advl_att": advl_att, "advl_fact": advl_fact, "advl_likely": advl_likely,
+    "jj_size": jj_size, "jj_time": jj_time, "jj_color": jj_color, "jj_eval": jj_eval, "jj_relation": jj_relation, "jj_topic": jj_topic, "jj_att_other": jj_att_other, "jj_epist_other": jj_epist_other,
+    "comm_vb_other": comm_vb_other, "fact_vb_other": fact_vb_other, "likely_vb_other": likely_vb_other, "att_vb_other": att_vb_other,
+    "th_vb_comm": th_vb_comm, "th_vb_att": th_vb_att, "th_vb_fact": th_vb_fact, "th_vb_likely": th_vb_likely,
+    "to_vb_desire": to_vb_desire, "to_vb_effort": to_vb_effort, "to_vb_prob": to_vb_prob, "to_vb_speech": to_vb_speech, "to_vb_mental": to_vb_mental,
+    "wh_vb_att": wh_vb_att, "wh_vb_fact": wh_vb_fact, "wh_vb_likely": wh_vb_likely, "wh_vb_comm": wh_vb_comm,
+    "th_jj_att": th_jj_att, "th_jj_fact": th_jj_fact, "th_jj_likely": th_jj_likely, "th_jj_eval": th_jj_eval,
+    "th_nn_nonfact": th_nn_nonfact, "th_nn_att": th_nn_att, "th_nn_fact": th_nn_fact, "th_nn_likely": th_nn_likely,
+    "to_jj_certain": to_jj_certain, "to_jj_able": to_jj_able, "to_jj_affect": to_jj_affect, "to_jj_ease": to_jj_ease, "to_jj_eval": to_jj_eval,
+    "to_nn_stance_all": to_nn_stance_all, "nn_stance_pp": nn_stance_pp}
+
+def expand_word_list (pattern: str) -> list:
+    """Returns every word matched by a dictionary list, e.g. "(gr[ae]y|(un)?aware)" gives grey, gray, unaware and aware
+    Args:
+        pattern (str): dictionary list made of alternations, groups, optional groups and character classes
+    Returns:
+        words (list): list of words matched by the pattern
+    """
+    def parse_alternation(position: int) -> tuple:
+        alternatives = []
+        words, position = parse_sequence(position)
+        alternatives.extend(words)
+        while position < len(pattern) and pattern[position] == '|':
+            words, position = parse_sequence(position + 1)
+            alternatives.extend(words)
+        return alternatives, position
+
+    def parse_sequence(position: int) -> tuple:
+        words = ['']
+        while position < len(pattern) and pattern[position] not in '|)':
+            if pattern[position] == '(':
+                options, position = parse_alternation(position + 1)
+                position += 1 # skip )
+            elif pattern[position] == '[':
+                end = pattern.index(']', position)
+                options = list(pattern[position + 1:end])
+                position = end + 1
+            else:
+                options = [pattern[position]]
+                position += 1
+            if position < len(pattern) and pattern[position] == '?':
+                options = options + ['']
+                position += 1
+            words = [word + option for word in words for option in options]
+        return words, position
+
+    words, position = parse_alternation(0)
+    return words
+
+def build_lexicon_index (word_lists: dict) -> tuple:
+    """Returns the lexicon index and the bit assigned to each word list
+    Args:
+        word_lists (dict): list name as key and dictionary list pattern as value
+    Returns:
+        lexicon_index (dict): lowercased word as key and bitset of word lists as value
+        lexicon_bits (dict): list name as key and its bit as value
+    """
+    lexicon_index = {}
+    lexicon_bits = {}
+    for bit, (name, pattern) in enumerate(word_lists.items()):
+        lexicon_bits[name] = 1 << bit
+        for word in expand_word_list(pattern):
+            lexicon_index[word.lower()] = lexicon_index.get(word.lower(), 0) | lexicon_bits[name]
+    return lexicon_index, lexicon_bits
+
+lexicon_index, lexicon_bits = build_lexicon_index(lexicon_word_lists)
+lexicon_masks = {}
+word_start = re.compile(r"\b(?=\w)")
+
+def lexicon_search (token: str, list_names: str, tag: str) -> bool:
+    """Dictionary lookup equivalent to rule_search("\\b(" + word_list + ")_" + tag, token, re.IGNORECASE)
+    Args:
+        token (str): word_TAG string to be searched
+        list_names (str): name of the word list, or several names separated by | (e.g. "public|private|suasive")
+        tag (str): regular expression the tag must start with, e.g. "N" or "JJAT|JJPR"
+    Returns:
+        bool: True if the word (or a part of it starting after a non-word character, as with \\b) belongs to one of the lists and is followed by the tag
+    """
+    try:
+        mask = lexicon_masks[list_names]
+    except KeyError:
+        mask = 0
+        for name in list_names.split('|'):
+            mask |= lexicon_bits[name]
+        lexicon_masks[list_names] = mask
+    if not token.isascii():
+        # re.IGNORECASE also folds a few non-ASCII letters onto ASCII ones (e.g. the long s), so such tokens keep using the regular expression
+        word_list = "|".join(lexicon_word_lists[name] for name in list_names.split('|'))
+        return rule_search("\\b(" + word_list + ")_(?:" + tag + ")", token, re.IGNORECASE) is not None
+    parsed = parse_token(token)
+    underscore = len(parsed.word)
+    if underscore == len(token):
+        return False
+    if parsed.word.isalnum() and token.find('_', underscore + 1) == -1:
+        # word_TAG token with a single _: the word is checked on its parsed field before the tag
+        return bool(parsed.lexicon & mask) and get_compiled_rule(tag, re.IGNORECASE).match(token, underscore + 1) is not None
+    tag_rule = get_compiled_rule(tag, re.IGNORECASE)
+    while underscore != -1:
+        if tag_rule.match(token, underscore + 1):
+            word = token[:underscore]
+            if word.isalnum():
+                if lexicon_index.get(word.lower(), 0) & mask:
+                    return True
+            else:
+                for start in word_start.finditer(word):
+                    if lexicon_index.get(word[start.start():].lower(), 0) & mask:
+                        return True
+        underscore = token.find('_', underscore + 1)
+    return False
+
+
 def process_sentence_extended (words: list) -> list:
     """Returns words list tagged with Biber's (2006) additional semantic categories
     Args:
@@ -1284,90 +2574,6 @@ def process_sentence_extended (words: list) -> list:
     Returns:
         words (list): list of tagged words with tags applied
     """
-    # DICTIONARY LISTS
-
-    # The following lists are based on the verb semantic categories used in Biber 2006.
-    
-    # Activity verbs 
-    # ELF: removed GET and GO due to high polysemy and corrected the "evercise" typo found in Biber 2006.
-    vb_act = "(accompanied|accompanies|accompany|accompanying|acquire|acquired|acquires|acquiring|add|added|adding|adds|advance|advanced|advances|advancing|applied|applies|apply|applying|arrange|arranged|arranges|arranging|ate|beat|beaten|beating|beats|behave|behaved|behaves|behaving|borrow|borrowed|borrowing|borrows|bought|bring|bringing|brings|brought|burn|burned|burning|burns|burnt|buy|buying|buys|came|carried|carries|carry|carrying|catch|catches|catching|caught|check|checked|checking|checks|clean|cleaned|cleaner|cleanest|cleaning|cleans|climb|climbed|climbing|climbs|combine|combined|combines|combining|come|comes|coming|control|controlled|controlling|controls|cover|covered|covering|covers|defend|defended|defending|defends|deliver|delivered|delivering|delivers|did|dig|digging|digs|divide|divided|divides|dividing|do|does|doing|done|dug|earn|earned|earning|earns|eat|eaten|eating|eats|encounter|encountered|encountering|encounters|engage|engaged|engages|engaging|exercise|exercised|exercises|exercising|expand|expanded|expanding|expands|explore|explored|explores|exploring|extend|extended|extending|extends|fix|fixed|fixes|fixing|follow|followed|following|follows|form|formed|forming|forms|gave|give|given|gives|giving|hang|hanged|hanging|hangs|held|hold|holding|holds|hung|join|joined|joining|joins|lain|lay|leave|leaves|leaving|left|lie|lied|lies|lose|loses|losing|lost|lying|made|make|makes|making|meet|meets|met|move|moved|moves|moving|obtain|obtain|obtained|obtaining|obtains|open|opened|opening|opens|paid|pass|passed|passes|passing|pay|paying|pays|pick|picked|picking|picks|play|played|playing|plays|produce|produced|produces|producing|provide|provided|provides|providing|pull|pulled|pulling|pulls|put|puts|putting|ran|reach|reached|reaches|reaching|receive|received|receives|receiving|reduce|reduced|reduces|reducing|repeat|repeated|repeating|repeats|run|running|runs|sat|save|saved|saves|saving|sell|selling|sells|send|sending|sends|sent|shake|shaken|shakes|shaking|share|shared|shares|sharing|shook|show|showed|showing|shown|shows|sit|sits|sitting|smile|smiled|smiles|smiling|sold|spend|spending|spends|spent|stare|stared|stares|staring|take|taken|takes|taking|threw|throw|throwing|thrown|throws|took|tried|tries|try|trying|turn|turned|turning|turns|use|used|uses|using|visit|visited|visiting|visits|wait|waited|waiting|waits|walk|walked|walking|walks|watch|watched|watches|watching|wear|wearing|wears|win|winning|wins|won|wore|work|worked|working|works|worn)"
-    # Communication verbs 
-    # ELF: corrected a typo for "descibe" and added its other forms, removed "spake" as a form of SPEAK, removed some adjective forms like "fitter, fittest", etc.
-    # In addition, British spellings and the verbs "AGREE, ASSERT, BEG, CONFIDE, COMMAND, DISAGREE, OBJECT, PLEDGE, PRONOUNCE, PLEAD, REPORT, TESTIFY, VOW" (taken from the public and suasive lists above) were added. "MEAN" which was originally assigned to the mental verb list was added to the communication list, instead.
-    vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
-
-    # Mental verbs
-    # ELF: Added British spellings, removed AFFORD and FIND. Removed DESERVE which is also on Biber's (2006) existential list. Added wan to account for wanna tokenised as wan na.
-    vb_mental =	"(see|sees|seeing|saw|seen|know|knows|knowing|knew|known|think|thinks|thinking|thought|want|wan|wants|wanting|wanted|need|needs|needing|needed|feel|feels|feeling|felt|like|likes|liking|liked|hear|hears|hearing|heard|remember|remembers|remembering|remembered|believe|believes|believing|believed|read|reads|reading|consider|considers|considering|considered|suppose|supposes|supposing|supposed|listen|listens|listening|listened|love|loves|loving|loved|wonder|wonders|wondering|wondered|understand|understands|understood|expect|expects|expecting|expected|hope|hopes|hoping|hoped|assume|assumes|assuming|assumed|determine|determines|determining|determined|agree|agrees|agreeing|agreed|bear|bears|bearing|bore|borne|care|cares|caring|cared|choose|chooses|choosing|chose|chosen|compare|compares|comparing|compared|decide|decides|deciding|decided|discover|discovers|discovering|discovered|doubt|doubts|doubting|doubted|enjoy|enjoys|enjoying|enjoyed|examine|examines|examining|examined|face|faces|facing|faced|forget|forgets|forgetting|forgot|forgotten|hate|hates|hating|hated|identify|identifies|identifying|identified|imagine|imagines|imagining|imagined|intend|intends|intending|intended|learn|learns|learning|learned|learnt|miss|misses|missing|missed|mind|minds|minding|notice|notices|noticing|noticed|plan|plans|planning|planned|prefer|prefers|preferring|preferred|prove|proves|proving|proved|proven|realize|realizes|realizing|realized|recall|recalls|recalling|recalled|recognize|recognizes|recognizing|recognized|recognise|recognises|recognising|recognised|regard|regards|regarding|regarded|suffer|suffers|suffering|suffered|wish|wishes|wishing|wished|worry|worries|worrying|worried|accept|accepts|accepting|accepted|appreciate|appreciates|appreciating|appreciated|approve|approves|approving|approved|assess|assesses|assessing|assessed|blame|blames|blaming|blamed|bother|bothers|bothering|bothered|calculate|calculates|calculating|calculated|conclude|concludes|concluding|concluded|celebrate|celebrates|celebrating|celebrated|confirm|confirms|confirming|confirmed|count|counts|counting|counted|dare|dares|daring|dared|detect|detects|detecting|detected|dismiss|dismisses|dismissing|dismissed|distinguish|distinguishes|distinguishing|distinguished|experience|experiences|experiencing|experienced|fear|fears|fearing|feared|forgive|forgives|forgiving|forgave|forgiven|guess|guesses|guessing|guessed|ignore|ignores|ignoring|ignored|impress|impresses|impressing|impressed|interpret|interprets|interpreting|interpreted|judge|judges|judging|judged|justify|justifies|justifying|justified|observe|observes|observing|observed|perceive|perceives|perceiving|perceived|predict|predicts|predicting|predicted|pretend|pretends|pretending|pretended|reckon|reckons|reckoning|reckoned|remind|reminds|reminding|reminded|satisfy|satisfies|satisfying|satisfied|solve|solves|solving|solved|study|studies|studying|studied|suspect|suspects|suspecting|suspected|trust|trusts|trusting|trusted)"
-
-    # Facilitation or causation verbs
-    vb_cause = "(help|helps|helping|helped|let|lets|letting|allow|allows|allowing|allowed|affect|affects|affecting|affected|cause|causes|causing|caused|enable|enables|enabling|enabled|ensure|ensures|ensuring|ensured|force|forces|forcing|forced|prevent|prevents|preventing|prevented|assist|assists|assisting|assisted|guarantee|guarantees|guaranteeing|guaranteed|influence|influences|influencing|influenced|permit|permits|permitting|permitted|require|requires|requiring|required)"
-
-    # Occurrence verbs
-    vb_occur = "(become|becomes|becoming|became|happen|happens|happening|happened|change|changes|changing|changed|die|dies|dying|died|grow|grows|grew|grown|growing|develop|develops|developing|developed|arise|arises|arising|arose|arisen|emerge|emerges|emerging|emerged|fall|falls|falling|fell|fallen|increase|increases|increasing|increased|last|lasts|lasting|lasted|rise|rises|rising|rose|risen|disappear|disappears|disappearing|disappeared|flow|flows|flowing|flowed|shine|shines|shining|shone|shined|sink|sinks|sank|sunk|sunken|sinking|slip|slips|slipping|slipped|occur|occurs|occurring|occurred)"
-
-    # Existence or relationship verbs ELF: Does not include the copular BE as in Biber (2006). LOOK was also removed due to too high polysemy. 
-    vb_exist =	"(seem|seems|seeming|seemed|stand|stands|standing|stood|stay|stays|staid|stayed|staying|live|lives|living|lived|appear|appears|appearing|appeared|include|includes|including|included|involve|involves|involving|involved|contain|contains|containing|contained|exist|exists|existing|existed|indicate|indicates|indicating|indicated|concern|concerns|concerning|concerned|constitute|constitutes|constituting|constituted|define|defines|defining|defined|derive|derives|deriving|derived|illustrate|illustrates|illustrating|illustrated|imply|implies|implying|implied|lack|lacks|lacking|lacked|owe|owes|owing|owed|own|owns|owning|owned|possess|possesses|possessing|possessed|suit|suits|suiting|suited|vary|varies|varying|varied|fit|fits|fitting|fitted|matter|matters|mattering|mattered|reflect|reflects|reflecting|reflected|relate|relates|relating|related|remain|remains|remaining|remained|reveal|reveals|revealing|revealed|sound|sounds|sounding|sounded|tend|tends|tending|tended|represent|represents|representing|represented|deserve|deserves|deserving|deserved)"
-
-    # Aspectual verbs
-    vb_aspect =	"(start|starts|starting|started|keep|keeps|keeping|kept|stop|stops|stopping|stopped|begin|begins|beginning|began|begun|complete|completes|completing|completed|end|ends|ending|ended|finish|finishes|finishing|finished|cease|ceases|ceasing|ceased|continue|continues|continuing|continued)"
-
-    # Shakir: noun, adj, adv semantic categories from Biber 2006
-    nn_human = "(family|families|guy|guys|individual|individuals|kid|kids|man|men|manager|managers|member|members|parent|parents|teacher|teachers|child|children|people|peoples|person|people|student|students|woman|women|animal|animals|applicant|applicants|author|authors|baby|babies|boy|boys|client|clients|consumer|consumers|critic|critics|customer|customers|doctor|doctors|employee|employees|employer|employers|father|fathers|female|females|friend|friends|girl|girls|god|gods|historian|historians|husband|husbands|American|Americans|Indian|Indians|instructor|instructors|king|kings|leader|leaders|male|males|mother|mothers|owner|owners|president|presidents|professor|professors|researcher|researchers|scholar|scholars|speaker|speakers|species|supplier|suppliers|undergraduate|undergraduates|user|users|wife|wives|worker|workers|writer|writers|accountant|accountants|adult|adults|adviser|advisers|agent|agents|aide|aides|ancestor|ancestors|anthropologist|anthropologists|archaeologist|archaeologists|artist|artists|artiste|artistes|assistant|assistants|associate|associates|attorney|attorneys|audience|audiences|auditor|auditors|bachelor|bachelors|bird|birds|boss|bosses|brother|brothers|buddha|buddhas|buyer|buyers|candidate|candidates|cat|cats|citizen|citizens|colleague|colleagues|collector|collectors|competitor|competitors|counselor|counselors|daughter|daughters|deer|defendant|defendants|designer|designers|developer|developers|director|directors|driver|drivers|economist|economists|engineer|engineers|executive|executives|expert|experts|farmer|farmers|feminist|feminists|freshman|freshmen|ecologist|ecologists|hero|heroes|host|hosts|hunter|hunters|immigrant|immigrants|infant|infants|investor|investors|jew|jews|judge|judges|lady|ladies|lawyer|lawyers|learner|learners|listener|listeners|maker|makers|manufacturer|manufacturers|miller|millers|minister|ministers|mom|moms|monitor|monitors|monkey|monkeys|neighbor|neighbors|neighbour|neighbours|observer|observers|officer|officers|official|officials|participant|participants|partner|partners|patient|patients|personnel|personnels|peer|peers|physician|physicians|plaintiff|plaintiffs|player|players|poet|poets|police|polices|processor|processors|professional|professionals|provider|providers|psychologist|psychologists|resident|residents|respondent|respondents|schizophrenic|schizophrenics|scientist|scientists|secretary|secretaries|server|servers|shareholder|shareholders|sikh|sikhs|sister|sisters|slave|slaves|son|sons|spouse|spouses|supervisor|supervisors|theorist|theorists|tourist|tourists|victim|victims|faculty|faculties|dean|deans|engineer|engineers|reader|readers|couple|couples|graduate|graduates)"
-    nn_cog = "(analysis|analyses|decision|decisions|experience|experiences|assessment|assessments|calculation|calculations|conclusion|conclusions|consequence|consequences|consideration|considerations|evaluation|evaluations|examination|examinations|expectation|expectations|observation|observations|recognition|recognitions|relation|relations|understanding|understandings|hypothesis|hypotheses|ability|abilities|assumption|assumptions|attention|attentions|attitude|attitudes|belief|beliefs|concentration|concentrations|concern|concerns|consciousness|consciousnesses|concept|concepts|fact|facts|idea|ideas|knowledge|knowledges|look|looks|need|needs|reason|reasons|sense|senses|view|views|theory|theories|desire|desires|emotion|emotions|feeling|feelings|judgement|judgements|memory|memories|notion|notions|opinion|opinions|perception|perceptions|perspective|perspectives|possibility|possibilities|probability|probabilities|responsibility|responsibilities|thought|thoughts)"
-    nn_concrete = "(tank|tanks|stick|sticks|target|targets|strata|stratas|telephone|telephones|string|strings|telescope|telescopes|sugar|sugars|ticket|tickets|syllabus|syllabuses|tip|tips|salt|salts|tissue|tissues|screen|screens|tooth|teeth|sculpture|sculptures|sphere|spheres|seawater|seawaters|spot|spots|ship|ships|steam|steams|silica|silicas|steel|steels|slide|slides|stem|stems|snow|snows|sodium|mud|muds|solid|solids|mushroom|mushrooms|gift|gifts|muscle|muscles|glacier|glaciers|tube|tubes|gun|guns|nail|nails|handbook|handbooks|newspaper|newspapers|handout|handouts|node|nodes|instrument|instruments|notice|notices|knot|knots|novel|novels|lava|lavas|page|pages|food|foods|transcript|transcripts|leg|legs|eye|eyes|lemon|lemons|brain|brains|magazine|magazines|device|devices|magnet|magnets|oak|oaks|manual|manuals|package|packages|marker|markers|peak|peaks|match|matches|pen|pens|metal|metals|pencil|pencils|block|blocks|pie|pies|board|boards|pipe|pipes|heart|hearts|load|loads|paper|papers|transistor|transistors|modem|modems|book|books|mole|moles|case|cases|motor|motors|computer|computers|mound|mounds|dollar|dollars|mouth|mouths|hand|hands|movie|movies|flower|flowers|object|objects|foot|feet|table|tables|frame|frames|water|waters|vessel|vessels|arm|arms|visa|visas|bar|bars|grain|grains|bed|beds|hair|hairs|body|bodies|head|heads|box|boxes|ice|ices|car|cars|item|items|card|cards|journal|journals|chain|chains|key|keys|chair|chairs|window|windows|vehicle|vehicles|leaf|leaves|copy|copies|machine|machines|document|documents|mail|mails|door|doors|map|maps|dot|dots|phone|phones|drug|drugs|picture|pictures|truck|trucks|piece|pieces|tape|tapes|note|notes|liquid|liquids|wire|wires|equipment|equipments|wood|woods|fiber|fibers|plant|plants|fig|figs|resistor|resistors|film|films|sand|sands|file|files|score|scores|seat|seats|belt|belts|sediment|sediments|boat|boats|seed|seeds|bone|bones|soil|soils|bubble|bubbles|bud|buds|water|waters|bulb|bulbs|portrait|portraits|bulletin|bulletins|step|steps|shell|shells|stone|stones|cake|cakes|tree|trees|camera|cameras|video|videos|face|faces|wall|walls|acid|acids|alcohol|alcohols|cap|caps|aluminium|aluminiums|clay|clays|artifact|artifacts|clock|clocks|rain|rains|clothing|clothings|asteroid|asteroids|club|clubs|automobile|automobiles|comet|comets|award|awards|sheet|sheets|bag|bags|branch|branches|ball|balls|copper|coppers|banana|bananas|counter|counters|band|bands|cover|covers|wheel|wheels|crop|crops|drop|drops|crystal|crystals|basin|basins|cylinder|cylinders|bell|bells|desk|desks|dinner|dinners|pole|poles|button|buttons|pot|pots|disk|disks|pottery|potteries|drain|drains|radio|radios|drink|drinks|reactor|reactors|drawing|drawings|retina|retinas|dust|dusts|ridge|ridges|edge|edges|ring|rings|engine|engines|ripple|ripples|plate|plates|game|games|cent|cents|post|posts|envelope|envelopes|rock|rocks|filter|filters|root|roots|finger|fingers|slope|slopes|fish|fish|space|spaces|fruit|fruits|statue|statues|furniture|furnitures|textbook|textbooks|gap|gaps|tool|tools|gate|gates|train|trains|gel|gels|deposit|deposits|chart|charts|mixture|mixtures)"
-    nn_technical = "(cell|cells|unit|units|gene|genes|wave|waves|ion|ions|bacteria|bacterias|electron|electrons|chromosome|chromosomes|element|elements|cloud|clouds|sample|samples|isotope|isotopes|schedule|schedules|neuron|neurons|software|softwares|nuclei|nucleus|solution|solutions|nucleus|nuclei|atom|atoms|ray|rays|margin|margins|virus|viruses|mark|marks|hydrogen|hydrogens|mineral|minerals|internet|internets|molecule|molecules|mineral|minerals|organism|organisms|message|messages|oxygen|oxygens|paragraph|paragraphs|particle|particles|sentence|sentences|play|plays|star|stars|poem|poems|thesis|theses|proton|protons|unit|units|web|webs|layer|layers|center|centers|centre|centres|matter|matters|chapter|chapters|square|squares|data|circle|circles|equation|equations|compound|compounds|exam|exams|letter|letters|bill|bills|page|pages|component|components|statement|statements|diagram|diagrams|word|words|dna|angle|angles|fire|fires|carbon|carbons|formula|formulas|graph|graphs|iron|irons|lead|leads|jury|juries|light|lights|list|lists)"
-    nn_place = "(apartment|apartments|interior|interiors|bathroom|bathrooms|moon|moons|bay|bays|museum|museums|bench|benches|neighborhood|neighborhoods|neighbourhood|neighbourhoods|bookstore|bookstores|opposite|opposites|border|borders|orbit|orbits|cave|caves|orbital|orbitals|continent|continents|outside|outsides|delta|deltas|parallel|parallels|desert|deserts|passage|passages|estuary|estuaries|pool|pools|factory|factories|prison|prisons|farm|farms|restaurant|restaurants|forest|forests|sector|sectors|habitat|habitats|shaft|shafts|hell|hells|shop|shops|hemisphere|hemispheres|southwest|hill|hills|station|stations|hole|holes|territory|territories|horizon|horizons|road|roads|bottom|bottoms|store|stores|boundary|boundaries|stream|streams|building|buildings|top|tops|campus|campuses|valley|valleys|canyon|canyons|village|villages|coast|coasts|city|cities|county|counties|country|countries|court|courts|earth|earths|front|fronts|environment|environments|district|districts|field|fields|floor|floors|market|markets|lake|lakes|office|offices|land|lands|organization|organizations|lecture|lectures|place|places|left|lefts|room|rooms|library|libraries|area|areas|location|locations|class|classes|middle|middles|classroom|classrooms|mountain|mountains|ground|grounds|north|norths|hall|halls|ocean|oceans|park|parks|planet|planets|property|properties|region|regions|residence|residences|river|rivers)"
-    nn_quant = "(cycle|cycles|rate|rates|date|dates|second|seconds|frequency|frequencies|section|sections|future|futures|semester|semesters|half|halves|temperature|temperatures|height|heights|today|todays|number|numbers|amount|amounts|week|weeks|age|ages|day|days|century|centuries|part|parts|energy|energies|lot|lots|heat|heats|term|terms|hour|hours|time|times|month|months|mile|miles|period|periods|moment|moments|morning|mornings|volume|volumes|per|weekend|weekends|percentage|percentages|weight|weights|portion|portions|minute|minutes|quantity|quantities|percent|percents|quarter|quarters|length|lengths|ratio|ratios|measure|measures|summer|summers|meter|meters|volt|volts|voltage|voltages)"
-    nn_group = "(airline|airlines|institute|institutes|colony|colonies|bank|banks|flight|flights|church|churches|hotel|hotels|firm|firms|hospital|hospitals|household|households|college|colleges|institution|institutions|house|houses|lab|labs|laboratory|laboratories|community|communities|company|companies|government|governments|university|universities|school|schools|home|homes|congress|congresses|committee|committees)"
-    nn_abstract_process = "(action|actions|activity|activities|application|applications|argument|arguments|development|developments|education|educations|effect|effects|function|functions|method|methods|research|researches|result|results|process|processes|accounting|accountings|achievement|achievements|addition|additions|administration|administrations|approach|approaches|arrangement|arrangements|assignment|assignments|competition|competitions|construction|constructions|consumption|consumptions|contribution|contributions|counseling|counselings|criticism|criticisms|definition|definitions|discrimination|discriminations|description|descriptions|discussion|discussions|distribution|distributions|division|divisions|eruption|eruptions|evolution|evolutions|exchange|exchanges|exercise|exercises|experiment|experiments|explanation|explanations|expression|expressions|formation|formations|generation|generations|graduation|graduations|management|managements|marketing|marketings|marriage|marriages|mechanism|mechanisms|meeting|meetings|operation|operations|orientation|orientations|performance|performances|practice|practices|presentation|presentations|procedure|procedures|production|productions|progress|progresses|reaction|reactions|registration|registrations|regulation|regulations|revolution|revolutions|selection|selections|session|sessions|strategy|strategies|teaching|teachings|technique|techniques|tradition|traditions|training|trainings|transition|transitions|treatment|treatments|trial|trials|act|acts|agreement|agreements|attempt|attempts|attendance|attendances|birth|births|break|breaks|claim|claims|comment|comments|comparison|comparisons|conflict|conflicts|deal|deals|death|deaths|debate|debates|demand|demands|answer|answers|control|controls|flow|flows|service|services|work|works|test|tests|use|uses|war|wars|change|changes|question|questions|study|studies|talk|talks|task|tasks|trade|trades|transfer|transfers|admission|admissions|design|designs|detail|details|dimension|dimensions|direction|directions|disorder|disorders|diversity|diversities|economy|economies|emergency|emergencies|emphasis|emphases|employment|employments|equilibrium|equilibriums|equity|equities|error|errors|expense|expenses|facility|facilities|failure|failures|fallacy|fallacies|feature|features|format|formats|freedom|freedoms|fun|funs|gender|genders|goal|goals|grammar|grammars|health|healths|heat|heats|help|helps|identity|identities|image|images|impact|impacts|importance|importances|influence|influences|input|inputs|labor|labors|leadership|leaderships|link|links|manner|manners|math|maths|matrix|matrices|meaning|meanings|music|musics|network|networks|objective|objectives|opportunity|opportunities|option|options|origin|origins|output|outputs|past|pasts|pattern|patterns|phase|phases|philosophy|philosophies|plan|plans|potential|potentials|prerequisite|prerequisites|presence|presences|principle|principles|success|successes|profile|profiles|profit|profits|proposal|proposals|psychology|psychologies|quality|qualities|quiz|quizzes|race|races|reality|realities|religion|religions|resource|resources|respect|respects|rest|rests|return|returns|risk|risks|substance|substances|scene|scenes|security|securities|series|series|set|sets|setting|settings|sex|sexes|shape|shapes|share|shares|show|shows|sign|signs|signal|signals|sort|sorts|sound|sounds|spring|springs|stage|stages|standard|standards|start|starts|stimulus|stimuli|strength|strengths|stress|stresses|style|styles|support|supports|survey|surveys|symbol|symbols|topic|topics|track|tracks|trait|traits|trouble|troubles|truth|truths|variation|variations|variety|varieties|velocity|velocities|version|versions|whole|wholes|action|actions|account|accounts|condition|conditions|culture|cultures|end|ends|factor|factors|grade|grades|interest|interests|issue|issues|job|jobs|kind|kinds|language|languages|law|laws|level|levels|life|lives|model|models|name|names|nature|natures|order|orders|policy|policies|position|positions|power|powers|pressure|pressures|relationship|relationships|requirement|requirements|role|roles|rule|rules|science|sciences|side|sides|situation|situations|skill|skills|source|sources|structure|structures|subject|subjects|type|types|information|informations|right|rights|state|states|system|systems|value|values|way|ways|address|addresses|absence|absences|advantage|advantages|aid|aids|alternative|alternatives|aspect|aspects|authority|authorities|axis|axes|background|backgrounds|balance|balances|base|bases|beginning|beginnings|benefit|benefits|bias|biases|bond|bonds|capital|capitals|care|cares|career|careers|cause|causes|characteristic|characteristics|charge|charges|check|checks|choice|choices|circuit|circuits|circumstance|circumstances|climate|climates|code|codes|color|colors|column|columns|combination|combinations|complex|complexes|connection|connections|constant|constants|constraint|constraints|contact|contacts|content|contents|contract|contracts|context|contexts|contrast|contrasts|crime|crimes|criteria|criterias|cross|crosses|current|currents|curriculum|curriculums|curve|curves|debt|debts|density|densities)"
-    advl_nonfact = "(confidentially|frankly|generally|honestly|mainly|technically|truthfully|typically|reportedly|primarily|usually)"
-    advl_att = "(amazingly|astonishingly|conveniently|curiously|hopefully|fortunately|importantly|ironically|rightly|sadly|surprisingly|unfortunately)"
-    advl_fact = "(actually|always|certainly|definitely|indeed|inevitably|never|obviously|really|undoubtedly|nodoubt|ofcourse|infact)"
-    advl_likely = "(apparently|evidently|perhaps|possibly|predictably|probably|roughly|maybe)"
-    jj_size = "(big|deep|heavy|huge|long|large|little|short|small|thin|wide|narrow)"
-    jj_time = "(annual|daily|early|late|new|old|recent|young|weekly|monthly)"
-    jj_color = "(black|white|dark|bright|blue|brown|green|gr[ae]y|red|orange|yellow|purple|pink)"
-    jj_eval = "(bad|beautiful|best|fine|good|great|lovely|nice|poor)"
-    jj_relation = "(additional|average|chief|complete|different|direct|entire|external|final|following|general|initial|internal|left|main|maximum|necessary|original|particular|previous|primary|public|similar|single|standard|top|various|same)"
-    jj_topic = "(chemical|commercial|environmental|human|industrial|legal|medical|mental|official|oral|phonetic|political|sexual|social|ventral|visual)"
-    jj_att_other = "(afraid|amazed|(un)?aware|concerned|disappointed|encouraged|glad|happy|hopeful|pleased|shocked|surprised|worried)"
-    jj_epist_other = "(apparent|certain|clear|confident|convinced|correct|evident|false|impossible|inevitable|obvious|positive|right|sure|true|well-known|doubtful|likely|possible|probable|unlikely)"
-    comm_vb_other = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
-    fact_vb_other = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
-    likely_vb_other = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
-    att_vb_other = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
-
-    # Shakir: vocabulary lists for that, wh and to clauses governed by semantic classes of verbs, nouns, adjectives
-    th_vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
-    th_vb_att = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
-    th_vb_fact = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
-    th_vb_likely = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
-    to_vb_desire = "(agreeing|agreed|agree|agrees|chooses|chosen|choose|choosing|chose|decide|deciding|decided|decides|hate|hates|hating|hated|hesitated|hesitates|hesitate|hesitating|hoped|hope|hopes|hoping|intended|intend|intending|intends|likes|liked|like|liking|loving|loves|love|loved|means|meaning|meant|mean|needs|need|needing|needed|planning|plan|planned|plans|preferred|prefer|preferring|prefers|prepares|prepare|preparing|prepared|refuses|refusing|refuse|refused|wanting|want|wants|wanted|wishes|wished|wish|wishing)"
-    to_vb_effort = "(allowing|allowed|allow|allows|attempting|attempted|attempts|attempt|enables|enabled|enabling|enable|encourages|encouraging|encouraged|encourage|fails|fail|failing|failed|help|helping|helps|helped|instructs|instructed|instruct|instructing|managing|managed|manage|manages|oblige|obligate|obliged|obligates|obliging|obligating|obliges|obligated|order|ordering|orders|ordered|permitted|permits|permit|permitting|persuaded|persuades|persuade|persuading|prompts|prompting|prompted|prompt|requiring|requisitions|requisitioning|required|requires|requisition|requisitioned|require|sought|seeking|seeks|seek|try|trying|tries|tried)"
-    to_vb_prob = "(appear|appeared|appears|appearing|happens|happened|happen|happening|seemed|seems|seem|seeming|tending|tends|tended|tend)"
-    to_vb_speech = "(asks|ask|asking|asked|claiming|claims|claim|claimed|invite|inviting|invited|invites|promising|promised|promise|promises|reminding|remind|reminded|reminds|requesting|request|requests|requested|saying|say|said|says|teaches|teaching|taught|teach|tell|tells|telling|told|urging|urges|urged|urge|warning|warn|warned|warns)"
-    to_vb_mental = "(assumed|assumes|assume|assuming|believing|believes|believe|believed|considered|considers|consider|considering|expecting|expects|expected|expect|find|found|finding|finds|forgetting|forget|forgets|forgot|forgotten|imagine|imagined|imagining|imagines|judge|adjudicates|adjudicate|judges|judged|knowing|knows|known|know|knew|learnt|learning|learns|learn|presumes|presuming|presumed|presume|pretend|pretends|pretended|pretending|remembered|remember|remembers|remembering|supposing|suppose|supposes|supposed)"
-    wh_vb_att = "(agreeing|agreed|agree|agrees|anticipates|anticipated|anticipate|anticipating|complain|complained|complaining|complains|conceded|concede|concedes|conceding|ensure|expecting|expect|expects|expected|fears|feared|fear|fearing|feel|feels|feeling|felt|forgetting|forgets|forgotten|forgot|forget|hoped|hope|hopes|hoping|minding|minded|minds|mind|preferred|prefer|preferring|prefers|pretending|pretend|pretended|pretends|requiring|required|requires|require|wishes|wished|wish|wishing|worry|worrying|worries|worried)"
-    wh_vb_fact = "(concluding|conclude|concluded|concludes|demonstrates|demonstrating|demonstrated|demonstrate|determining|determines|determine|determined|discovered|discovers|discover|discovering|finds|finding|found|find|knows|known|knowing|know|knew|learn|learns|learning|learnt|means|meaning|meant|mean|notifies|notices|notice|noticed|notify|notifying|noticing|notified|observed|observes|observing|observe|proven|prove|proving|proved|proves|reali(z|s)ed|reali(z|s)es|reali(z|s)e|reali(z|s)ing|recogni(z|s)es|recogni(z|s)e|recogni(z|s)ed|recogni(z|s)ing|remembered|remember|remembers|remembering|sees|seen|saw|seeing|see|showing|shows|shown|showed|show|understand|understands|understanding|understood)"
-    wh_vb_likely = "(assumes|assumed|assuming|assume|believe|believing|believes|believed|doubting|doubted|doubts|doubt|gathers|gathering|gathered|gather|guessed|guess|guessing|guesses|hypothesi(z|s)ing|hypothesi(z|s)ed|hypothesi(z|s)e|hypothesi(z|s)es|imagine|imagining|imagines|imagined|predict|predicted|predicting|predicts|presupposing|presupposes|presuppose|presupposed|presumes|presuming|presumed|presume|reckon|reckoning|reckoned|reckons|seemed|seems|seem|seeming|speculated|speculate|speculating|speculates|suppose|supposes|supposing|supposed|suspected|suspect|suspects|suspecting|think|thinks|thinking|thought)"
-    wh_vb_comm = "(say|says|saying|said|tell|tells|telling|told|call|calls|calling|called|ask|asks|asking|asked|write|writes|writing|wrote|written|talk|talks|talking|talked|speak|speaks|spoke|spoken|speaking|thank|thanks|thanking|thanked|describe|describing|describes|described|claim|claims|claiming|claimed|offer|offers|offering|offered|admit|admits|admitting|admitted|announce|announces|announcing|announced|answer|answers|answering|answered|argue|argues|arguing|argued|deny|denies|denying|denied|discuss|discusses|discussing|discussed|encourage|encourages|encouraging|encouraged|explain|explains|explaining|explained|express|expresses|expressing|expressed|insist|insists|insisting|insisted|mention|mentions|mentioning|mentioned|offer|offers|offering|offered|propose|proposes|proposing|proposed|quote|quotes|quoting|quoted|reply|replies|replying|replied|shout|shouts|shouting|shouted|sign|signs|signing|signed|sing|sings|singing|sang|sung|state|states|stating|stated|teach|teaches|teaching|taught|warn|warns|warning|warned|accuse|accuses|accusing|accused|acknowledge|acknowledges|acknowledging|acknowledged|address|addresses|addressing|addressed|advise|advises|advising|advised|appeal|appeals|appealing|appealed|assure|assures|assuring|assured|challenge|challenges|challenging|challenged|complain|complains|complaining|complained|consult|consults|consulting|consulted|convince|convinces|convincing|convinced|declare|declares|declaring|declared|demand|demands|demanding|demanded|emphasize|emphasizes|emphasizing|emphasized|emphasise|emphasises|emphasising|emphasised|excuse|excuses|excusing|excused|inform|informs|informing|informed|invite|invites|inviting|invited|persuade|persuades|persuading|persuaded|phone|phones|phoning|phoned|pray|prays|praying|prayed|promise|promises|promising|promised|question|questions|questioning|questioned|recommend|recommends|recommending|recommended|remark|remarks|remarking|remarked|respond|responds|responding|responded|specify|specifies|specifying|specified|swear|swears|swearing|swore|sworn|threaten|threatens|threatening|threatened|urge|urges|urging|urged|welcome|welcomes|welcoming|welcomed|whisper|whispers|whispering|whispered|suggest|suggests|suggesting|suggested|plead|pleads|pleaded|pleading|agree|agrees|agreed|agreeing|assert|asserts|asserting|asserted|beg|begs|begging|begged|confide|confides|confiding|confided|command|commands|commanding|commanded|disagree|disagreeing|disagrees|disagreed|object|objects|objected|objects|pledge|pledges|pledging|pledged|report|reports|reported|reporting|testify|testifies|testified|testifying|vow|vows|vowing|vowed|mean|means|meaning|meant)"
-    th_jj_att = "(afraid|amazed|(un)?aware|concerned|disappointed|encouraged|glad|happy|hopeful|pleased|shocked|surprised|worried)"
-    th_jj_fact = "(apparent|certain|clear|confident|convinced|correct|evident|false|impossible|inevitable|obvious|positive|right|sure|true|well-known)"
-    th_jj_likely = "(doubtful|likely|possible|probable|unlikely)"
-    th_jj_eval = "(amazing|appropriate|conceivable|crucial|essential|fortunate|imperative|inconceivable|incredible|interesting|lucky|necessary|nice|noteworthy|odd|ridiculous|strange|surprising|unacceptable|unfortunate)"
-    th_nn_nonfact = "(comment|comments|news|news|proposal|proposals|proposition|propositions|remark|remarks|report|reports|requirement|requirements)"
-    th_nn_att = "(grounds|ground|hope|hopes|reason|reasons|view|views|thought|thoughts)"
-    th_nn_fact = "(assertion|assertions|conclusion|conclusions|conviction|convictions|discovery|discoveries|doubt|doubts|fact|facts|knowledge|knowledges|observation|observations|principle|principles|realization|realizations|result|results|statement|statements)"
-    th_nn_likely = "(assumption|assumptions|belief|beliefs|claim|claims|contention|contentions|feeling|feelings|hypothesis|hypotheses|idea|ideas|implication|implications|impression|impressions|notion|notions|opinion|opinions|possibility|possibilities|presumption|presumptions|suggestion|suggestions)"
-    to_jj_certain = "(apt|certain|due|guaranteed|liable|likely|prone|unlikely|sure)"
-    to_jj_able = "(anxious|(un)?able|careful|determined|eager|eligible|hesitant|inclined|obliged|prepared|ready|reluctant|(un)?willing)"
-    to_jj_affect = "(afraid|ashamed|disappointed|embarrassed|glad|happy|pleased|proud|puzzled|relieved|sorry|surprised|worried)"
-    to_jj_ease = "(difficult|easier|easy|hard|(im)?possible|tough)"
-    to_jj_eval = "(bad|worse|(in)?appropriate|good|better|best|convenient|essential|important|interesting|necessary|nice|reasonable|silly|smart|stupid|surprising|useful|useless|unreasonable|wise|wrong)"
-    to_nn_stance_all = "(agreement|agreements|decision|decisions|desire|desires|failure|failures|inclination|inclinations|intention|intentions|obligation|obligations|opportunity|opportunities|plan|plans|promise|promises|proposal|proposals|reluctance|reluctances|responsibility|responsibilities|right|rights|tendency|tendencies|threat|threats|wish|wishes|willingness|willingnesses)"
-    nn_stance_pp = "(assertion|assertions|conclusion|conclusions|conviction|convictions|discovery|discoveries|doubt|doubts|fact|facts|knowledge|knowledges|observation|observations|principle|principles|realization|realizations|result|results|statement|statements|assumption|assumptions|belief|beliefs|claim|claims|contention|contentions|feeling|feelings|hypothesis|hypotheses|idea|ideas|implication|implications|impression|impressions|notion|notions|opinion|opinions|possibility|possibilities|presumption|presumptions|suggestion|suggestions|grounds|ground|hope|hopes|reason|reasons|view|views|thought|thoughts|comment|comments|news|news|proposal|proposals|proposition|propositions|remark|remarks|report|reports|requirement|requirements|agreement|agreements|decision|decisions|desire|desires|failure|failures|inclination|inclinations|intention|intentions|obligation|obligations|opportunity|opportunities|plan|plans|promise|promises|reluctance|reluctances|responsibility|responsibilities|right|rights|tendency|tendencies|threat|threats|wish|wishes|willingness|willingnesses)"
-
     #---------------------------------------------------
     # COMPLEX TAGS
     for j, value in enumerate(words):
@@ -1377,11 +2583,11 @@ def process_sentence_extended (words: list) -> list:
             # Shakir: Add two sub classes of attributive and predicative adjectives. 
             # The predicative counterparts should not have a TO or THSC afterwards
 
-            if (re.search("\\b(" + jj_att_other + ")_(JJAT|JJPR)", words[j], re.IGNORECASE) and not re.search("to_|_THSC", words[j+1])): 
-                words[j] = re.sub("_(\w+)", "_\\1 JJATDother", words[j])
+            if (lexicon_search(words[j], "jj_att_other", "JJAT|JJPR") and not rule_search("to_|_THSC", words[j+1])): 
+                words[j] = rule_sub("_(\w+)", "_\\1 JJATDother", words[j])
 
-            if (re.search("\\b(" + jj_epist_other + ")_(JJAT|JJPR)", words[j], re.IGNORECASE) and not re.search("to_|_THSC", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 JJEPSTother", words[j])
+            if (lexicon_search(words[j], "jj_epist_other", "JJAT|JJPR") and not rule_search("to_|_THSC", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 JJEPSTother", words[j])
 
             #---------------------------------------------------
 
@@ -1389,136 +2595,136 @@ def process_sentence_extended (words: list) -> list:
             # Tags for comparative and superlative constructions
 
             # Superlatives
-            if ((re.search("est_J|est_RB|\\bworst_|\\bbest-", words[j], re.IGNORECASE) and not re.search("\\btest|honest_|west_|\\bpest_|\\blest_|\\bguest_", words[j], re.IGNORECASE)) or # E.g., widest, furthest, worst, best-looking
-            (re.search("\\bthe_", words[j-1], re.IGNORECASE) and re.search("\\bleast_|\\bmost_", words[j]) and re.search("_J|_RB|_NN", words[j+1]))): # E.g., the most pressing, the cheapest
-                words[j] = re.sub("_(\w+)", "_\\1 SUPER", words[j])
+            if ((rule_search("est_J|est_RB|\\bworst_|\\bbest-", words[j], re.IGNORECASE) and not rule_search("\\btest|honest_|west_|\\bpest_|\\blest_|\\bguest_", words[j], re.IGNORECASE)) or # E.g., widest, furthest, worst, best-looking
+            (rule_search("\\bthe_", words[j-1], re.IGNORECASE) and rule_search("\\bleast_|\\bmost_", words[j]) and rule_search("_J|_RB|_NN", words[j+1]))): # E.g., the most pressing, the cheapest
+                words[j] = rule_sub("_(\w+)", "_\\1 SUPER", words[j])
 
             # Comparatives
-            if ((re.search("er_J|er_RB|\\bworse_|\\bbetter-", words[j], re.IGNORECASE) and not re.search("\\bafter_|never_|rather_|other_|\\bever_|either_|together_|proper_|super_|clever_|\\beager_|queer_|hyper_|\\butter_|\\binner_|bitter_|premier_|sinister_|\\bsober_|order_|over_", words[j], re.IGNORECASE)) or # E.g., wider, further, better-looking.
-            (re.search("\\bless_|\\bmore_", words[j]) and re.search("_J|_RB", words[j+1]))): # E.g., more pressing, less important.
-                words[j] = re.sub("_(\w+)", "_\\1 COMPAR", words[j])
+            if ((rule_search("er_J|er_RB|\\bworse_|\\bbetter-", words[j], re.IGNORECASE) and not rule_search("\\bafter_|never_|rather_|other_|\\bever_|either_|together_|proper_|super_|clever_|\\beager_|queer_|hyper_|\\butter_|\\binner_|bitter_|premier_|sinister_|\\bsober_|order_|over_", words[j], re.IGNORECASE)) or # E.g., wider, further, better-looking.
+            (rule_search("\\bless_|\\bmore_", words[j]) and rule_search("_J|_RB", words[j+1]))): # E.g., more pressing, less important.
+                words[j] = rule_sub("_(\w+)", "_\\1 COMPAR", words[j])
         
         #----------------------------------------------------
         # Shakir: TO and split infinitive clauses followed by vb, adj and nouns.
 
-            if ((re.search("\\b(" + to_vb_desire + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_desire + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+2])) or
-            (re.search("\\b(" + to_vb_desire + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_desire + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+2]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVDSR", words[j])
+            if ((lexicon_search(words[j-1], "to_vb_desire", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_desire", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+2])) or
+            (lexicon_search(words[j-1], "to_vb_desire", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_desire", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+2]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVDSR", words[j])
 
-            if ((re.search("\\b(" + to_vb_effort + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_effort + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+2])) or
-            (re.search("\\b(" + to_vb_effort + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_effort + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+2]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVEFRT", words[j])
+            if ((lexicon_search(words[j-1], "to_vb_effort", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_effort", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+2])) or
+            (lexicon_search(words[j-1], "to_vb_effort", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_effort", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+2]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVEFRT", words[j])
 
-            if ((re.search("\\b(" + to_vb_prob + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_prob + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+2])) or
-            (re.search("\\b(" + to_vb_prob + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_prob + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+2]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVPROB", words[j])
+            if ((lexicon_search(words[j-1], "to_vb_prob", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_prob", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+2])) or
+            (lexicon_search(words[j-1], "to_vb_prob", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_prob", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+2]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVPROB", words[j])
 
-            if ((re.search("\\b(" + to_vb_speech + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_speech + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+2])) or
-            (re.search("\\b(" + to_vb_speech + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_speech + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+2]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVSPCH", words[j])
+            if ((lexicon_search(words[j-1], "to_vb_speech", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_speech", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+2])) or
+            (lexicon_search(words[j-1], "to_vb_speech", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_speech", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+2]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVSPCH", words[j])
 
-            if ((re.search("\\b(" + to_vb_mental + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_mental + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+2])) or
-            (re.search("\\b(" + to_vb_mental + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+1])) or
-            (re.search("\\b(" + to_vb_mental + ")_V", words[j-1], re.IGNORECASE) and re.search("\\bna_TO", words[j]) and re.search("\_V", words[j+2]))):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVMNTL", words[j])
+            if ((lexicon_search(words[j-1], "to_vb_mental", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_mental", "V") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+2])) or
+            (lexicon_search(words[j-1], "to_vb_mental", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+1])) or
+            (lexicon_search(words[j-1], "to_vb_mental", "V") and rule_search("\\bna_TO", words[j]) and rule_search("\_V", words[j+2]))):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVMNTL", words[j])
 
-            if (re.search("\\b(" + to_jj_certain + ")_J", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJCRTN", words[j])
+            if (lexicon_search(words[j-1], "to_jj_certain", "J") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJCRTN", words[j])
 
-            if (re.search("\\b(" + to_jj_able + ")_J", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJABL", words[j])
+            if (lexicon_search(words[j-1], "to_jj_able", "J") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJABL", words[j])
 
-            if (re.search("\\b(" + to_jj_affect + ")_J", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJEFCT", words[j])
+            if (lexicon_search(words[j-1], "to_jj_affect", "J") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJEFCT", words[j])
 
-            if (re.search("\\b(" + to_jj_ease + ")_J", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJEASE", words[j])
+            if (lexicon_search(words[j-1], "to_jj_ease", "J") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJEASE", words[j])
 
-            if (re.search("\\b(" + to_jj_eval + ")_J", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJEVAL", words[j])
+            if (lexicon_search(words[j-1], "to_jj_eval", "J") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJEVAL", words[j])
 
             # Shakir: sums of that-clauses for vb, jj, nn and all to be used if original are too low freq
                     
-            if (re.search(" (ToVDSR|ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToVSTNCall", words[j])
+            if (rule_search(" (ToVDSR|ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToVSTNCall", words[j])
 
-            if (re.search(" (ToJCRTN|ToJABL|ToJEFCT|ToJEASE|ToJEVAL)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToJSTNCall", words[j])
+            if (rule_search(" (ToJCRTN|ToJABL|ToJEFCT|ToJEASE|ToJEVAL)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToJSTNCall", words[j])
 
         # # Shakir: all to vb stance excep verbs of desive which are frequent mainly due to want to constructions
-        # if (re.search(" (ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL)", words[j])):
-        #     words[j] = re.sub("_(\w+)", "_\\1 ToVSTNCother", words[j])
+        # if (rule_search(" (ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL)", words[j])):
+        #     words[j] = rule_sub("_(\w+)", "_\\1 ToVSTNCother", words[j])
 
-            if (re.search("\\b(" + to_nn_stance_all + ")_N", words[j-1], re.IGNORECASE) and re.search("\\bto_", words[j]) and re.search("\_V", words[j+1]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToNSTNC", words[j])
+            if (lexicon_search(words[j-1], "to_nn_stance_all", "N") and rule_search("\\bto_", words[j]) and rule_search("\_V", words[j+1]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToNSTNC", words[j])
 
-            if (re.search(" (ToVDSR|ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL|ToJCRTN|ToJABL|ToJEFCT|ToJEASE|ToJEVAL|ToNSTNC)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToSTNCall", words[j])
+            if (rule_search(" (ToVDSR|ToVEFRT|ToVPROB|ToVSPCH|ToVMNTL|ToJCRTN|ToJABL|ToJEFCT|ToJEASE|ToJEVAL|ToNSTNC)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToSTNCall", words[j])
 
             #---------------------------------------------------
             # Shakir: That complement clauses as tagged previously by THSC
-            if (re.search("\\b(" + th_vb_comm + ")_V", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThVCOMM", words[j])
+            if (lexicon_search(words[j-1], "th_vb_comm", "V") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThVCOMM", words[j])
 
-            if (re.search("\\b(" + th_vb_att + ")_V", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThVATT", words[j])
+            if (lexicon_search(words[j-1], "th_vb_att", "V") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThVATT", words[j])
 
-            if (re.search("\\b(" + th_vb_fact + ")_V", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThVFCT", words[j])
+            if (lexicon_search(words[j-1], "th_vb_fact", "V") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThVFCT", words[j])
 
-            if (re.search("\\b(" + th_vb_likely + ")_V", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThVLIK", words[j])
+            if (lexicon_search(words[j-1], "th_vb_likely", "V") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThVLIK", words[j])
 
-            if (re.search("\\b(" + th_jj_att + ")_J", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThJATT", words[j])
+            if (lexicon_search(words[j-1], "th_jj_att", "J") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThJATT", words[j])
 
-            if (re.search("\\b(" + th_jj_fact + ")_J", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThJFCT", words[j])
+            if (lexicon_search(words[j-1], "th_jj_fact", "J") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThJFCT", words[j])
 
-            if (re.search("\\b(" + th_jj_likely + ")_J", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThJLIK", words[j])
+            if (lexicon_search(words[j-1], "th_jj_likely", "J") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThJLIK", words[j])
 
-            if (re.search("\\b(" + th_jj_eval + ")_J", words[j-1], re.IGNORECASE) and re.search("_THSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThJEVL", words[j])
+            if (lexicon_search(words[j-1], "th_jj_eval", "J") and rule_search("_THSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThJEVL", words[j])
 
             # Shakir: that relative clauses related to attitude
-            if (re.search("\\b(" + th_nn_nonfact + ")_N", words[j-1], re.IGNORECASE) and re.search("_THRC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThNNFCT", words[j])
+            if (lexicon_search(words[j-1], "th_nn_nonfact", "N") and rule_search("_THRC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThNNFCT", words[j])
 
-            if (re.search("\\b(" + th_nn_att + ")_N", words[j-1], re.IGNORECASE) and re.search("_THRC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThNATT", words[j])
+            if (lexicon_search(words[j-1], "th_nn_att", "N") and rule_search("_THRC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThNATT", words[j])
 
-            if (re.search("\\b(" + th_nn_fact + ")_N", words[j-1], re.IGNORECASE) and re.search("_THRC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThNFCT", words[j])
+            if (lexicon_search(words[j-1], "th_nn_fact", "N") and rule_search("_THRC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThNFCT", words[j])
 
-            if (re.search("\\b(" + th_nn_likely + ")_N", words[j-1], re.IGNORECASE) and re.search("_THRC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThNLIK", words[j])
+            if (lexicon_search(words[j-1], "th_nn_likely", "N") and rule_search("_THRC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThNLIK", words[j])
 
             # Shakir: wh sub clauses after verb classes
-            if (re.search("\\b(" + wh_vb_att + ")_V", words[j-1], re.IGNORECASE) and re.search("_WHSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WhVATT", words[j])
+            if (lexicon_search(words[j-1], "wh_vb_att", "V") and rule_search("_WHSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 WhVATT", words[j])
 
-            if (re.search("\\b(" + wh_vb_fact + ")_V", words[j-1], re.IGNORECASE) and re.search("_WHSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WhVFCT", words[j])
+            if (lexicon_search(words[j-1], "wh_vb_fact", "V") and rule_search("_WHSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 WhVFCT", words[j])
 
-            if (re.search("\\b(" + wh_vb_likely + ")_V", words[j-1], re.IGNORECASE) and re.search("_WHSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WhVLIK", words[j])
+            if (lexicon_search(words[j-1], "wh_vb_likely", "V") and rule_search("_WHSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 WhVLIK", words[j])
 
-            if (re.search("\\b(" + wh_vb_comm + ")_V", words[j-1], re.IGNORECASE) and re.search("_WHSC", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WhVCOM", words[j])
+            if (lexicon_search(words[j-1], "wh_vb_comm", "V") and rule_search("_WHSC", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 WhVCOM", words[j])
 
             # Shakir: preposition after stance nouns
-            if (re.search("\\b(" + nn_stance_pp + ")_N", words[j-1], re.IGNORECASE) and re.search("_IN", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 PrepNSTNC", words[j])
+            if (lexicon_search(words[j-1], "nn_stance_pp", "N") and rule_search("_IN", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 PrepNSTNC", words[j])
 
     #-------------------------------------------------- 
     # Shakir: Nouns semantic classes (from Biber 2006)
@@ -1527,82 +2733,82 @@ def process_sentence_extended (words: list) -> list:
         if x != " ":
             #--------------------------------------------------------------  
             # Shakir: noun and adverb semantic categories from Biber 2006, if there is no additional tag added previously (hence the space check)
-            if (re.search("\\b(" + nn_human + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNHUMAN", words[index])
+            if (lexicon_search(words[index], "nn_human", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNHUMAN", words[index])
             
-            if (re.search("\\b(" + nn_cog + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNCOG", words[index])
+            if (lexicon_search(words[index], "nn_cog", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNCOG", words[index])
 
-            if (re.search("\\b(" + nn_concrete + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNCONC", words[index])
+            if (lexicon_search(words[index], "nn_concrete", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNCONC", words[index])
 
-            if (re.search("\\b(" + nn_place + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNPLACE", words[index])
+            if (lexicon_search(words[index], "nn_place", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNPLACE", words[index])
 
-            if (re.search("\\b(" + nn_quant + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNQUANT", words[index])
+            if (lexicon_search(words[index], "nn_quant", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNQUANT", words[index])
 
-            if (re.search("\\b(" + nn_group + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNGRP", words[index])
+            if (lexicon_search(words[index], "nn_group", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNGRP", words[index])
 
-            if (re.search("\\b(" + nn_technical + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNTECH", words[index])
+            if (lexicon_search(words[index], "nn_technical", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNTECH", words[index])
 
-            if (re.search("\\b(" + nn_abstract_process + ")_N", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 NNABSPROC", words[index])
+            if (lexicon_search(words[index], "nn_abstract_process", "N") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 NNABSPROC", words[index])
 
-            if (re.search("\\b(" + jj_size + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJSIZE", words[index])
+            if (lexicon_search(words[index], "jj_size", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJSIZE", words[index])
 
-            if (re.search("\\b(" + jj_time + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJTIME", words[index])
+            if (lexicon_search(words[index], "jj_time", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJTIME", words[index])
 
-            if (re.search("\\b(" + jj_color + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJCOLR", words[index])
+            if (lexicon_search(words[index], "jj_color", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJCOLR", words[index])
 
-            if (re.search("\\b(" + jj_eval + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJEVAL", words[index])
+            if (lexicon_search(words[index], "jj_eval", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJEVAL", words[index])
 
-            if (re.search("\\b(" + jj_relation + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJREL", words[index])
+            if (lexicon_search(words[index], "jj_relation", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJREL", words[index])
 
-            if (re.search("\\b(" + jj_topic + ")_J", words[index], re.IGNORECASE) and not re.search(" ", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 JJTOPIC", words[index])
+            if (lexicon_search(words[index], "jj_topic", "J") and not parse_token(words[index]).extra):
+                words[index] = rule_sub("_(\w+)", "_\\1 JJTOPIC", words[index])
 
             # ELF: tags activity verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or_PASS.
-            if (re.search("\\b(" + vb_act + ")_V|\\b(" + vb_act + ")_P", words[index], re.IGNORECASE) and not re.search("DOAUX", words[index])):
-                words[index] = re.sub("_(\w+)", "_\\1 ACT", words[index])
+            if (lexicon_search(words[index], "vb_act", "V|P") and not rule_search("DOAUX", words[index])):
+                words[index] = rule_sub("_(\w+)", "_\\1 ACT", words[index])
 
             # ELF: tags communication verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_comm + ")_V|\\b(" + vb_comm + ")_P", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 COMM", words[index])
+            if (lexicon_search(words[index], "vb_comm", "V|P")):
+                words[index] = rule_sub("_(\w+)", "_\\1 COMM", words[index])
 
             # ELF: tags mental verbs (including the "no" in "I dunno" and "wa" in wanna). 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_mental + ")_V|\\b(" + vb_mental + ")_P|\\bno_VB", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 MENTAL", words[index])
+            if ((lexicon_search(words[index], "vb_mental", "V|P") or rule_search("\\bno_VB", words[index], re.IGNORECASE))):
+                words[index] = rule_sub("_(\w+)", "_\\1 MENTAL", words[index])
         
             # ELF: tags causative verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_cause + ")_V|\\b(" + vb_cause + ")_P", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 CAUSE", words[index])
+            if (lexicon_search(words[index], "vb_cause", "V|P")):
+                words[index] = rule_sub("_(\w+)", "_\\1 CAUSE", words[index])
 
             # ELF: tags occur verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_occur + ")_V|\\b(" + vb_occur + ")_P", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 OCCUR", words[index])
+            if (lexicon_search(words[index], "vb_occur", "V|P")):
+                words[index] = rule_sub("_(\w+)", "_\\1 OCCUR", words[index])
 
             # ELF: tags existential verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_exist + ")_V|\\b(" + vb_exist + ")_P", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 EXIST", words[index])
+            if (lexicon_search(words[index], "vb_exist", "V|P")):
+                words[index] = rule_sub("_(\w+)", "_\\1 EXIST", words[index])
 
             # ELF: tags aspectual verbs. 
             # Note that adding _P is important to capture verbs tagged as PEAS, PROG or PASS.
-            if (re.search("\\b(" + vb_aspect + ")_V|\\b(" + vb_aspect + ")_P", words[index], re.IGNORECASE)):
-                words[index] = re.sub("_(\w+)", "_\\1 ASPECT", words[index])
+            if (lexicon_search(words[index], "vb_aspect", "V|P")):
+                words[index] = rule_sub("_(\w+)", "_\\1 ASPECT", words[index])
 
             #--------------------------------------------------------------  
 
@@ -1613,137 +2819,245 @@ def process_sentence_extended (words: list) -> list:
             #---------------------------------------------------
 
             # Shakir: Nini's (2014) implementation for nominalisations with a length check more than 5 characters, and no space means no other extra tag added
-            if (re.search("tions?_NN|ments?_NN|ness_NN|nesses_NN|ity_NN|ities_NN", words[j], re.IGNORECASE) and re.search("[a-z]{5,}", words[j], re.IGNORECASE) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 NOMZ", words[j])
+            if (rule_search("tions?_NN|ments?_NN|ness_NN|nesses_NN|ity_NN|ities_NN", words[j], re.IGNORECASE) and rule_search("[a-z]{5,}", words[j], re.IGNORECASE) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 NOMZ", words[j])
 
             # Shakir: Semantic classes of adverbs
-            if ((re.search("\\b" + advl_att + "_R", words[j], re.IGNORECASE) and not re.search(" ", words[j])) or
-            (re.search("\\b(even)_R", words[j], re.IGNORECASE) and re.search("\\b(worse)_", words[j+1], re.IGNORECASE) and not re.search(" ", words[j]))):
-                words[j] = re.sub("_(\w+)", "_\\1 RATT", words[j])
+            if ((lexicon_search(words[j], "advl_att", "R") and not parse_token(words[j]).extra) or
+            (rule_search("\\b(even)_R", words[j], re.IGNORECASE) and rule_search("\\b(worse)_", words[j+1], re.IGNORECASE) and not parse_token(words[j]).extra)):
+                words[j] = rule_sub("_(\w+)", "_\\1 RATT", words[j])
 
-            if (re.search("\\b(" + advl_nonfact + ")_R", words[j], re.IGNORECASE) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 RNONFACT", words[j])
+            if (lexicon_search(words[j], "advl_nonfact", "R") and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 RNONFACT", words[j])
 
-            if ((re.search("\\b(" + advl_fact + ")_R", words[j], re.IGNORECASE) and not re.search(" ", words[j])) or
-            (re.search("\\b(of)_", words[j-1], re.IGNORECASE) and re.search("\\b(course)_", words[j], re.IGNORECASE)) or
-            (re.search("\\b(in)_", words[j-1], re.IGNORECASE) and re.search("\\b(fact)_", words[j], re.IGNORECASE)) or
-            (re.search("\\b(without|no)_", words[j-1], re.IGNORECASE) and re.search("\\b(doubt)_", words[j], re.IGNORECASE))):
-                words[j] = re.sub("_(\w+)", "_\\1 RFACT", words[j])
+            if ((lexicon_search(words[j], "advl_fact", "R") and not parse_token(words[j]).extra) or
+            (rule_search("\\b(of)_", words[j-1], re.IGNORECASE) and rule_search("\\b(course)_", words[j], re.IGNORECASE)) or
+            (rule_search("\\b(in)_", words[j-1], re.IGNORECASE) and rule_search("\\b(fact)_", words[j], re.IGNORECASE)) or
+            (rule_search("\\b(without|no)_", words[j-1], re.IGNORECASE) and rule_search("\\b(doubt)_", words[j], re.IGNORECASE))):
+                words[j] = rule_sub("_(\w+)", "_\\1 RFACT", words[j])
 
             # Shakir: stance nouns without prep
             # check for no doubt and without doubt which are already tagged as factive adverb phrases
             # check if there is no additional tag added
-            if (re.search("\\b(" + nn_stance_pp + ")_N", words[j], re.IGNORECASE) and not re.search("_IN", words[j+1]) and not re.search(" (RFACT|HDG)\\b", words[j]) and not re.search(" ", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 NSTNCother", words[j])
+            if (lexicon_search(words[j], "nn_stance_pp", "N") and not rule_search("_IN", words[j+1]) and not rule_search(" (RFACT|HDG)\\b", words[j]) and not parse_token(words[j]).extra):
+                words[j] = rule_sub("_(\w+)", "_\\1 NSTNCother", words[j])
 
             # Shakir: Added new variable to avoid overlap in the above two sub classes and JJAT/JJPR
-            if (re.search("_JJAT$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 JJATother", words[j])
+            if (rule_search("_JJAT$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 JJATother", words[j])
 
-            if (re.search("_JJPR$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 JJPRother", words[j])
+            if (rule_search("_JJPR$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 JJPRother", words[j])
 
             # Shakir: Added new variable to avoid overlap in THSC and all above TH_J and TH_V clauses
-            if (re.search("_THSC$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 THSCother", words[j])
+            if (rule_search("_THSC$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 THSCother", words[j])
 
             # Shakir: Added new variable to avoid overlap in THRC and all above TH_N clauses
-            if (re.search("_THRC$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 THRCother", words[j])
+            if (rule_search("_THRC$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 THRCother", words[j])
 
             # Shakir: Added new variable to avoid overlap in WHSC and WH_V clauses
-            if (re.search("_WHSC$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WHSCother", words[j])
+            if (rule_search("_WHSC$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 WHSCother", words[j])
 
             # Shakir: Added new variable to avoid overlap in NN and N semantic/other sub classes
-            if (re.search("_NN$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 NNother", words[j])
+            if (rule_search("_NN$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 NNother", words[j])
 
             # Shakir: Added new variable to avoid overlap in RB and R semantic sub classes
-            if (re.search("_RB$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 RBother", words[j])
+            if (rule_search("_RB$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 RBother", words[j])
 
             # Shakir: Added new variable to avoid overlap in IN and PrepNNStance
-            if (re.search("_IN$", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 INother", words[j])
+            if (rule_search("_IN$", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 INother", words[j])
 
             # Shakir: commented due to overlap with MENTAL and COMM verbs. They are counted with that and to phrases so no need to add any additional category
             # # Shakir: verbs in contexts other than _WHSC, _THSC or to_ . Additionally not assigned to another tag.
-            # if (re.search("\\b(" + comm_vb_other + ")_V", words[j], re.IGNORECASE) and not re.search("_WHSC|_THSC|to_", words[j+1]) and not re.search(" ", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 VCOMMother", words[j])
+            # if (lexicon_search(words[j], "comm_vb_other", "V") and not rule_search("_WHSC|_THSC|to_", words[j+1]) and not parse_token(words[j]).extra):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 VCOMMother", words[j])
         
-            # if (re.search("\\b(" + att_vb_other + ")_V", words[j], re.IGNORECASE) and not re.search("_WHSC|_THSC|to_", words[j+1]) and not re.search(" ", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 VATTother", words[j])
+            # if (lexicon_search(words[j], "att_vb_other", "V") and not rule_search("_WHSC|_THSC|to_", words[j+1]) and not parse_token(words[j]).extra):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 VATTother", words[j])
         
-            # if (re.search("\\b(" + fact_vb_other + ")_V", words[j], re.IGNORECASE) and not re.search("_WHSC|_THSC|to_", words[j+1]) and not re.search(" ", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 VFCTother", words[j])
+            # if (lexicon_search(words[j], "fact_vb_other", "V") and not rule_search("_WHSC|_THSC|to_", words[j+1]) and not parse_token(words[j]).extra):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 VFCTother", words[j])
         
-            # if (re.search("\\b(" + likely_vb_other + ")_V", words[j], re.IGNORECASE) and not re.search("_WHSC|_THSC|to_", words[j+1]) and not re.search(" ", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 VLIKother", words[j])
+            # if (lexicon_search(words[j], "likely_vb_other", "V") and not rule_search("_WHSC|_THSC|to_", words[j+1]) and not parse_token(words[j]).extra):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 VLIKother", words[j])
 
             # Shakir: sums of that clauses for vb, jj, nn and all to be used if original are too low freq
-            if (re.search(" (ThVCOMM|ThVATT|ThVFCT|ThVLIK)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThVSTNCall", words[j])
+            if (rule_search(" (ThVCOMM|ThVATT|ThVFCT|ThVLIK)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThVSTNCall", words[j])
 
             # # Shakir: sums of that clauses for vb other than comm verbs
-            # if (re.search(" (ThVATT|ThVFCT|ThVLIK)", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 ThVSTNCother", words[j])
+            # if (rule_search(" (ThVATT|ThVFCT|ThVLIK)", words[j])):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 ThVSTNCother", words[j])
 
-            if (re.search(" (ThJATT|ThJFCT|ThJLIK|ThJEVL)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThJSTNCall", words[j])
+            if (rule_search(" (ThJATT|ThJFCT|ThJLIK|ThJEVL)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThJSTNCall", words[j])
 
-            if (re.search(" (ThNNFCT|ThNATT|ThNFCT|ThNLIK)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThNSTNCall", words[j])
+            if (rule_search(" (ThNNFCT|ThNATT|ThNFCT|ThNLIK)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThNSTNCall", words[j])
 
-            if (re.search(" (ThVCOMM|ThVATT|ThVFCT|ThVLIK|ThJATT|ThJFCT|ThJLIK|ThJEVL|ThNNFCT|ThNATT|ThNFCT|ThNLIK)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ThSTNCall", words[j])
+            if (rule_search(" (ThVCOMM|ThVATT|ThVFCT|ThVLIK|ThJATT|ThJFCT|ThJLIK|ThJEVL|ThNNFCT|ThNATT|ThNFCT|ThNLIK)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ThSTNCall", words[j])
 
             # Shakir: wh vb stance all
-            if (re.search(" (WhVATT|WhVFCT|WhVLIK|WhVCOM)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 WhVSTNCall", words[j])
+            if (rule_search(" (WhVATT|WhVFCT|WhVLIK|WhVCOM)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 WhVSTNCall", words[j])
 
             # Shakir: adverb stance all
-            if (re.search(" (RATT|RNONFACT|RFACT|RLIKELY)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 RSTNCall", words[j])
+            if (rule_search(" (RATT|RNONFACT|RFACT|RLIKELY)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 RSTNCall", words[j])
 
             # # Shakir: adverb stance other than RFACT
-            # if (re.search(" (RATT|RNONFACT|RLIKELY)", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 RSTNCother", words[j])
+            # if (rule_search(" (RATT|RNONFACT|RLIKELY)", words[j])):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 RSTNCother", words[j])
 
             # Shakir: all possibility modals as in Biber 1988
-            if (re.search("(MDCA|MDCO|MDMM)", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 MDPOSSCall", words[j])
+            if (rule_search("(MDCA|MDCO|MDMM)", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 MDPOSSCall", words[j])
 
             # Shakir: all prediction modals as in Biber 1988 + "Going to + infinitive"
-            if (re.search("(MDWS|MDWO|GTO)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 MDPREDall", words[j])
+            if (rule_search("(MDWS|MDWO|GTO)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 MDPREDall", words[j])
 
             # Shakir: all passive voice (sum of PASS and PGET)
-            if (re.search("(PASS|PGET)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 PASSall", words[j])
+            if (rule_search("(PASS|PGET)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 PASSall", words[j])
 
             # Shakir: all stance noun complements (To + Th)
-            if (re.search("(ToNSTNC|ThNSTNCall)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 ToThNSTNCall", words[j])
+            if (rule_search("(ToNSTNC|ThNSTNCall)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 ToThNSTNCall", words[j])
 
             # # Shakir: consolidate description adjectives
-            # if (re.search("(JJSIZE|JJCOLR)\\b", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 JJDESCall", words[j])
+            # if (rule_search("(JJSIZE|JJCOLR)\\b", words[j])):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 JJDESCall", words[j])
 
             # # Shakir: consolidate stance adjectives
-            # if (re.search("(JJEPSTother|JJATDother)\\b", words[j])):
-            #     words[j] = re.sub("_(\w+)", "_\\1 JJEpstAtdOther", words[j])
+            # if (rule_search("(JJEPSTother|JJATDother)\\b", words[j])):
+            #     words[j] = rule_sub("_(\w+)", "_\\1 JJEpstAtdOther", words[j])
 
             # Shakir: All 1st person references in one tag (equivalent of FPP1 in Biber 1988)
-            if (re.search("_(PP1P|PP1S)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 PP1all", words[j])
+            if (rule_search("_(PP1P|PP1S)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 PP1all", words[j])
 
             # Shakir: All 3rd person references to 1 tag (equivalent of TPP3 in Biber 1988)
-            if (re.search("_(PP3t|PP3f|PP3m)\\b", words[j])):
-                words[j] = re.sub("_(\w+)", "_\\1 PP3all", words[j])
+            if (rule_search("_(PP3t|PP3f|PP3m)\\b", words[j])):
+                words[j] = rule_sub("_(\w+)", "_\\1 PP3all", words[j])
 
     return words
 
+# SENTENCE SCHEDULING
+# No tagging rule reads or writes further than rule_window words away from the current word (words[j-16] and words[j+16] being the furthest back and ahead),
+# and every sentence is surrounded by buffer_size spaces which the rules skip and never modify. A sentence is therefore never affected by its neighbours,
+# and all passes of process_sentence and process_sentence_extended are run over one sentence before moving on to the next.
+# Each sentence stays small enough to be kept in the CPU cache across all passes instead of every pass sweeping through the whole file,
+# while the rules keep being applied in the same order as before.
+rule_window = 16
+buffer_size = 20 # must be larger than rule_window, before and after each sentence
+assert buffer_size > rule_window, "sentences must be buffered by more than rule_window spaces on each side"
+buffer_spaces = [' '] * buffer_size
+
+def get_sentences (text: str) -> list:
+    """Returns the sentences of a POS-tagged text as lists of words
+    Args:
+        text (str): POS-tagged text with one sentence per line
+    Returns:
+        sentences (list): list of lists of words
+    """
+    sentences = re.split("[\r\n]+", text) # split on new line or carriage return to get sentences
+    return [re.split(' ', s) for s in sentences] # split ind. sentences on space (now it is a list of lists)
+
+def add_buffer_spaces (sentences: list) -> list:
+    """Returns one list of words with a buffer of spaces before and after every sentence
+    Args:
+        sentences (list): list of lists of words
+    Returns:
+        sentences_with_buffer_spaces (list): list of words as expected by process_sentence
+    """
+    sentences_with_buffer_spaces = list(buffer_spaces)
+    for sentence in sentences:
+        # add a buffer of 20 empty strings to avoid IndexError which will break the loop and cause below if conditions not to be applied in process_sentence
+        # the list is extended in place: concatenating it would copy every preceding sentence again and make long files quadratic
+        sentences_with_buffer_spaces.extend(sentence)
+        sentences_with_buffer_spaces.extend(buffer_spaces)
+    return sentences_with_buffer_spaces
+
+def tag_sentence (sentence: list, extended: bool = True) -> list:
+    """Returns the words of one sentence after running all passes of process_sentence (and process_sentence_extended) on it
+    Args:
+        sentence (list): list of POS-tagged words of one sentence
+        extended (bool): If extended semantic categories should be tagged
+    Returns:
+        words_tagged (list): list of words after MD tagging, without buffer spaces
+    """
+    words_tagged = process_sentence(buffer_spaces + sentence + buffer_spaces, extended)
+    if extended:
+        words_tagged = process_sentence_extended(words_tagged)
+    return words_tagged[buffer_size:-buffer_size]
+
+def read_sentences (file: str) -> Iterator[list]:
+    """Reads a POS-tagged file line by line and yields its sentences as lists of words, exactly as get_sentences splits the whole text
+    Args:
+        file (str): text file path that is to be opened
+    Yields:
+        sentence (list): list of words of one sentence
+    """
+    with open(file=file, encoding='utf-8', errors='ignore') as f:
+        ends_with_new_line = True # an empty file is one empty sentence
+        for index, line in enumerate(f):
+            ends_with_new_line = line.endswith('\n')
+            if ends_with_new_line:
+                line = line[:-1]
+            # runs of new lines separate sentences, so empty lines only count at the start and at the end of the file
+            if line or index == 0:
+                yield re.split(' ', line)
+        if ends_with_new_line:
+            yield ['']
+
+def stream_process_sentence (file: str, extended: bool = True) -> Iterator[str]:
+    """Streaming version of run_process_sentence: reads, tags and yields one sentence at a time, so that memory use does not grow with file size
+    Sentences never affect each other (see SENTENCE SCHEDULING), so no neighbouring sentences need to be kept. Constituency based tags need the whole file and are not available here.
+    Args:
+        file (str): text file path that is to be opened
+        extended (bool): If extended semantic categories should be tagged
+    Yields:
+        word (str): word after MD tagging
+    """
+    for sentence in read_sentences(file):
+        yield from tag_sentence(sentence, extended)
+
+def write_tagged_words (words_tagged: Iterator[str], file: str, counter: "FeatureCounter" = None) -> None:
+    """Writes MD-tagged words one per line as they come, with the same output as writing "\n".join(words_tagged).strip()
+    Args:
+        words_tagged (Iterator[str]): words after MD tagging, e.g. from stream_process_sentence
+        file (str): output file path
+        counter (FeatureCounter, optional): counter fed with every line written, see FEATURE COUNTS. Defaults to None.
+    """
+    with open(file=file, mode='w', encoding='UTF-8') as f:
+        last_word = None # last word with non-whitespace characters, held back until it is known whether it is the last one of the file
+        blank_words = [] # whitespace-only words that followed last_word
+        for word in words_tagged:
+            if word.strip() == '':
+                if last_word is not None:
+                    blank_words.append(word)
+            elif last_word is None:
+                last_word = word.lstrip()
+            else:
+                f.write(last_word + "".join(["\n" + blank_word for blank_word in blank_words]) + "\n")
+                if counter is not None:
+                    for line in [last_word] + blank_words:
+                        counter.add_line(line)
+                last_word = word
+                blank_words = []
+        if last_word is not None:
+            f.write(last_word.rstrip())
+            if counter is not None:
+                counter.add_line(last_word.rstrip())
+
 def run_process_sentence(file: str, extended: bool = True, extended_constituency: bool = False) -> list:
     """Returns list of words after running process_sentence on it
     Args:
@@ -1755,20 +3069,13 @@ def run_process_sentence(file: str, extended: bool = True, extended_constituency
         words_tagged (list): list of words after MD tagging
     """
     text = open(file=file, encoding='utf-8', errors='ignore').read()
-    sentences = re.split("[\r\n]+", text) # split on new line or carriage return to get sentences
-    sentences = [re.split(' ', s) for s in sentences] # split ind. sentences on space (now it is a list of lists)
-    sentences_with_buffer_spaces = ([' '] * 20)
-    for sentence in sentences:
-        # add a buffer of 20 empty strings to avoid IndexError which will break the loop and cause below if conditions not to be applied in process_sentence
-        sentences_with_buffer_spaces = sentences_with_buffer_spaces + sentence + ([' '] * 20)
-    words_tagged = process_sentence(sentences_with_buffer_spaces, extended)
-    if extended:
-        words_tagged = process_sentence_extended(words_tagged)
+    sentences_tagged = [tag_sentence(sentence, extended) for sentence in get_sentences(text)]
     #Shakir: add constituency based tags
     if extended_constituency:
-        words_tagged = Constituency_tags.tag_constituency(words_tagged, file)
-
-    words_tagged = [word for word in words_tagged if word != " "] # remove white space elements added prior to process_sentence
+        words_tagged = Constituency_tags.tag_constituency(add_buffer_spaces(sentences_tagged), file)
+        words_tagged = [word for word in words_tagged if word != " "] # remove white space elements added prior to process_sentence
+    else:
+        words_tagged = [word for sentence in sentences_tagged for word in sentence]
     return words_tagged
 
 
@@ -1784,55 +3091,100 @@ def process_file (file_dir_pair: tuple) -> None:
     extended = file_dir_pair[2]
     extended_constituency = file_dir_pair[3]
     file_name = os.path.basename(file)
-    words_tagged = run_process_sentence(file, extended, extended_constituency)
-    with open(file=output_dir+file_name, mode='w', encoding='UTF-8') as f:
-        f.write("\n".join(words_tagged).strip())
+    if extended_constituency:
+        words_tagged = run_process_sentence(file, extended, extended_constituency)
+    else:
+        words_tagged = stream_process_sentence(file, extended)
+    counter = FeatureCounter()
+    write_tagged_words(words_tagged, output_dir+file_name, counter)
+    write_feature_counts(counter, output_dir+file_name)
     print("MD tagger tagged: " + file)
     return  "MD tagger tagged: " + file
 
-def tag_MD_parallel (input_dir: str, output_dir: str, extended: bool = True, extended_constituency: bool = False) -> None:
+def get_md_fingerprints (files: list, extended: bool = True, extended_constituency: bool = False) -> dict:
+    """Returns the fingerprints of the MFTE_Tagged outputs of POS-tagged files for the build manifest (see BUILD MANIFEST)
+    Args:
+        files (list): POS-tagged files
+        extended (bool): If extended MFTE tagset should be tagged
+        extended_constituency (bool): If constituency tree based tags are on, the constituency trees are inputs too
+    Returns:
+        fingerprints (dict): file -> fingerprint
+    """
+    fingerprints = {}
+    for file in files:
+        input_paths = [file]
+        if extended_constituency:
+            input_paths.append(file.replace('POS_Tagged', 'Constituency_Trees')) # as read by Constituency_tags.tag_constituency
+        fingerprints[file] = get_fingerprint(input_paths, {'extended': extended, 'extended_constituency': extended_constituency}, {'MFTE': mfte_version})
+    return fingerprints
+
+def tag_MD_parallel (input_dir: str, output_dir: str, extended: bool = True, extended_constituency: bool = False, workers: int = None, manifest: dict = None) -> None:
     """Tags POS-tagged output files and writes in an MFTE directory
     Args:
         input_dir (str): dir with POS-tagged files
         output_dir (str): dir to write MFTE-tagged files
         extended (bool): If extended MFTE tagset should be tagged
         extended_constituency (bool): If constituency tree based tags are on
+        workers (int, optional): number of worker processes. Defaults to None, i.e. half of the CPUs.
+        manifest (dict, optional): build manifest (see BUILD MANIFEST); without it, files are tagged only if their output does not exist yet. Defaults to None.
     """
-    from random import shuffle
     # check if dir exists, otherwise make one
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     files = glob.glob(os.path.join(input_dir, "*.txt"))
-    #detect existing files and remove from list
-    files = check_already_tagged_files_mfte(files, output_dir)
-    shuffle(files) #randomize files to distribute bigger files more evenly among workers
+    if manifest is None:
+        #detect existing files and remove from list
+        files = check_already_tagged_files_mfte(files, output_dir)
+    else:
+        stage = manifest.setdefault("MFTE_Tagged", {})
+        fingerprints = get_md_fingerprints(files, extended, extended_constituency)
+        files = check_outdated_files(files, [output_dir], stage, fingerprints)
+        mtimes_before = {file: get_output_mtimes(file, [output_dir]) for file in files}
+    files.sort(key=os.path.getsize, reverse=True) #largest files first, so that no worker is left with a big file at the end while the others are idle
     file_with_dir = [(file, output_dir, extended, extended_constituency) for file in files]
-    cpu_count = int(multiprocessing.cpu_count() / 2) #run half cpus
-    with multiprocessing.Pool(cpu_count) as pool:
-	    # call the function for each item in parallel
-        results = list(tqdm.tqdm(pool.map(process_file, file_with_dir), total=len(file_with_dir)))
-        for s in results:
-            print(s)
-
-def tag_MD (input_dir: str, output_dir: str, extended: bool = True, extended_constituency: bool = False) -> None:
+    if workers is None:
+        workers = max(1, int(multiprocessing.cpu_count() / 2)) #run half cpus
+    # files are handed out a few at a time: one by one for small corpora, in small chunks of similarly sized files to save inter-process communication for large ones
+    chunksize = max(1, len(files) // (workers * 16))
+    with multiprocessing.Pool(workers) as pool:
+        # files are reported as soon as they are tagged, in whichever order they finish
+        for s in tqdm.tqdm(pool.imap_unordered(process_file, file_with_dir, chunksize=chunksize), total=len(file_with_dir)):
+            pass
+    if manifest is not None:
+        record_tagged_files(files, [output_dir], stage, fingerprints, mtimes_before)
+
+def tag_MD (input_dir: str, output_dir: str, extended: bool = True, extended_constituency: bool = False, manifest: dict = None) -> None:
     """Tags POS-tagged output files and writes in an MFTE directory
     Args:
         input_dir (str): dir with POS-tagged files
         output_dir (str): dir to write MFTE-tagged files
         extended (bool): If extended MFTE tagset should be tagged
         extended_constituency (bool): If constituency tree based tags are on
+        manifest (dict, optional): build manifest (see BUILD MANIFEST); without it, files are tagged only if their output does not exist yet. Defaults to None.
     """
     # check if dir exists, otherwise make one
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     files = glob.glob(os.path.join(input_dir, "*.txt"))
-    #detect existing files and remove from list
-    files = check_already_tagged_files_mfte(files, output_dir)    
+    if manifest is None:
+        #detect existing files and remove from list
+        files = check_already_tagged_files_mfte(files, output_dir)
+    else:
+        stage = manifest.setdefault("MFTE_Tagged", {})
+        fingerprints = get_md_fingerprints(files, extended, extended_constituency)
+        files = check_outdated_files(files, [output_dir], stage, fingerprints)
+        mtimes_before = {file: get_output_mtimes(file, [output_dir]) for file in files}
     for file in files:
         print("Tagging MFTE features:", file)
         file_name = os.path.basename(file)
-        words_tagged = run_process_sentence(file, extended, extended_constituency)
-        with open(file=output_dir+file_name, mode='w', encoding='UTF-8') as f:
-            f.write("\n".join(words_tagged).strip())
+        if extended_constituency:
+            words_tagged = run_process_sentence(file, extended, extended_constituency)
+        else:
+            words_tagged = stream_process_sentence(file, extended)
+        counter = FeatureCounter()
+        write_tagged_words(words_tagged, output_dir+file_name, counter)
+        write_feature_counts(counter, output_dir+file_name)
         # break
+    if manifest is not None:
+        record_tagged_files(files, [output_dir], stage, fingerprints, mtimes_before)
 
 def get_ttr(tokens: list, n: int) -> float:
     """Retuns type token ratio (TTR) based on the first n words as specified in user input number of tokens n
@@ -1846,11 +3198,11 @@ def get_ttr(tokens: list, n: int) -> float:
         # take first n tokens from tokens list
         temp_tokens = tokens[:n]
         # Shakir: use tokens list passed from below, split word_TAG, keep word, convert to lower case, make a list, convert to set (i.e. unique values only), find length
-        n_types = len(set([word.split('_')[0].lower() for word in temp_tokens]))
+        n_types = len(set([parse_token(word).lower for word in temp_tokens]))
         tt_ratio = n_types/n
     else: # otherwise use the whole tokens
         # Shakir: use tokens list passed from below, split word_TAG, keep word, convert to lower case, make a list, convert to set (i.e. unique values only), find length
-        n_types = len(set([word.split('_')[0].lower() for word in tokens]))
+        n_types = len(set([parse_token(word).lower for word in tokens]))
         tt_ratio = n_types/len(tokens)
     return tt_ratio
 
@@ -1924,74 +3276,362 @@ def sort_df_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df_sorted
 
 
-def do_counts(dir_in: str, dir_out: str, n_tokens: int) -> None:
+
+# FEATURE COUNTS
+# The counts behind the Statistics tables are collected while MFTE_Tagged files are written, one word at a time, and saved next to them
+# in a Counts folder, so that do_counts can build its tables without reading and searching every tagged file again.
+# Each word is a space-separated element of the tagged file, i.e. extra tags such as BEMA in "is_VPRT BEMA" are counted as words of their own, as do_counts always did.
+function_word_rule = re.compile(r"\b" + function_words + r"_", re.IGNORECASE)
+function_word_set = frozenset([word.lower() for word in expand_word_list(function_words)])
+token_exclusion_rule = re.compile(r"(_\s)|(\[\w+\])|(.+_\W+)|_-LRB-|_-RRB-|.+_SYM|_POS|_FPUH|_HYPH")
+word_length_exclusion_rule = re.compile(r"(_\s)|(\[\w+\])|(.+_\W+)|_-LRB-|_-RRB-|.+_SYM|_POS|_FPUH|_HYPH|_AFX|_NFP")
+word_tag_rule = re.compile(r"^\S+_\S+$")
+noun_rule = re.compile(r"_NN\b")
+finite_verb_rule = re.compile(r"(_VPRT|_VBD|_VIMP|_MDCA|_MDCO|_MDMM|_MDNE|_MDWO|_MDWS)\b")
+# ELF: The list of tags for which no counts will be returned can be found here.
+# The following tags are excluded by default because they are "bin" tags designed to remove problematic tokens from other categories: LIKE and SO
+# Note: if interested in counts of punctuation marks, "|_\W+" should be deleted in this line.
+# Note: _WQ are removed because they are duplicates of WHQU (WHQU are tagged onto the WH-words whereas QUWU onto the question marks themselves).
+# Note: BEAUX are not counted because they would replicate the PROG, PASS, QUTAG and GTO counts. They only serve to identify BEMA occurences.
+tag_exclusion_rule = re.compile(r"_LS|_\W+|_WP\\b|_FW|_SYM|_MD\\b|_VB\\b|_WQ|_LIKE|_SO|_BEAUX")
+tag_rule = re.compile(r"^.*_")
+
+def is_function_word (word: str) -> bool:
+    """Set lookup equivalent to function_word_rule.search(word), i.e. a function word starting at a word boundary and followed by _
+    Args:
+        word (str): word_TAG string
+    Returns:
+        bool: True if word is counted as a function word
+    """
+    if not word.isascii():
+        # re.IGNORECASE and \b follow Unicode rules for such words, so they keep using the regular expression
+        return function_word_rule.search(word) is not None
+    underscore = word.find('_')
+    while underscore != -1:
+        segment = word[:underscore]
+        if segment.isalnum():
+            # no word boundary inside the segment, so the function word can only start at its beginning
+            if segment.lower() in function_word_set:
+                return True
+        else:
+            for start in range(len(segment)):
+                is_boundary = (segment[start].isalnum() or segment[start] == '_') != (start > 0 and (segment[start-1].isalnum() or segment[start-1] == '_'))
+                if is_boundary and segment[start:].lower() in function_word_set:
+                    return True
+        underscore = word.find('_', underscore + 1)
+    return False
+
+word_features_max = 20000 # the least recently used words are dropped beyond this many distinct words; the frequent ones stay cached
+
+@functools.lru_cache(maxsize=word_features_max)
+def get_word_features (word: str) -> tuple:
+    """Returns what FeatureCounter counts for a word, working it out on first use and caching it, since the same words occur over and over again
+    Args:
+        word (str): space-separated word of an MD-tagged file, i.e. word_TAG string or extra tag
+    Returns:
+        has_word_character (bool): True if word has a word character
+        is_function_word (bool): True if word is a function word
+        token (str): lowercased word if word is a token for the word count, TTR and lexical density, otherwise None
+        is_noun (bool): True if word counts towards Ntotal
+        is_finite_verb (bool): True if word counts towards VBtotal
+        word_length (int): length of the word if it counts towards the average word length, otherwise None
+        tag (str): tag to be counted, otherwise None
+    """
+    is_word_tag = word_tag_rule.search(word) is not None
+    parsed = parse_token(word)
+    return (rule_search(r"\w+", word) is not None,
+        is_function_word(word),
+        parsed.lower if is_word_tag and not token_exclusion_rule.search(word) else None,
+        noun_rule.search(word) is not None,
+        finite_verb_rule.search(word) is not None,
+        len(parsed.word) if is_word_tag and not word_length_exclusion_rule.search(word) else None,
+        tag_rule.sub("", word) if not tag_exclusion_rule.search(word) else None)
+
+class FeatureCounter:
+    """Counts tags, tokens, word lengths, function words and types of one MD-tagged file in a single pass over its words"""
+
+    def __init__(self) -> None:
+        self.has_word = False # False if the file has no word characters at all, in which case it is left out of the tables
+        self.n_functionwords = 0
+        self.n_tokens = 0
+        self.n_nouns = 0
+        self.n_verbs = 0
+        self.wordlengths_sum = 0
+        self.n_wordlengths = 0
+        self.types = set()
+        self.type_positions = [] # token index at which each type first occurs, so that the TTR of the first n tokens can be calculated for any n
+        self.tag_freq = collections.Counter()
+
+    def add_word (self, word: str) -> None:
+        """Counts one space-separated word of an MD-tagged file
+        Args:
+            word (str): word_TAG string or extra tag
+        """
+        has_word_character, is_function_word, token, is_noun, is_finite_verb, word_length, tag = get_word_features(word)
+        if has_word_character:
+            self.has_word = True
+        if is_function_word:
+            self.n_functionwords += 1
+        if token is not None:
+            if token not in self.types:
+                self.types.add(token)
+                self.type_positions.append(self.n_tokens)
+            self.n_tokens += 1
+        if is_noun:
+            self.n_nouns += 1
+        if is_finite_verb:
+            self.n_verbs += 1
+        if word_length is not None:
+            self.wordlengths_sum += word_length
+            self.n_wordlengths += 1
+        if tag is not None:
+            self.tag_freq[tag] += 1
+
+    def add_line (self, line: str) -> None:
+        """Counts the words of one line of an MD-tagged file as it is written
+        Args:
+            line (str): line of the MD-tagged file, i.e. one tagged word with its extra tags
+        """
+        for word in line.split(' '):
+            if word: # runs of spaces do not make empty words in do_counts
+                self.add_word(word)
+
+    def get_counts (self) -> dict:
+        """Returns the counts in a form that can be saved as JSON
+        Returns:
+            counts (dict): counts of the file
+        """
+        return {'has_word': self.has_word, 'n_functionwords': self.n_functionwords, 'n_tokens': self.n_tokens, 'n_nouns': self.n_nouns, 'n_verbs': self.n_verbs,
+            'wordlengths_sum': self.wordlengths_sum, 'n_wordlengths': self.n_wordlengths, 'type_positions': self.type_positions, 'tag_freq': dict(sorted(self.tag_freq.items()))}
+
+def get_feature_counts_path (tagged_file: str) -> str:
+    """Returns the path of the saved feature counts of an MD-tagged file
+    Args:
+        tagged_file (str): MD-tagged file path
+    Returns:
+        str: path of the JSON file in the Counts folder next to the tagged file
+    """
+    return os.path.join(os.path.dirname(tagged_file), "Counts", os.path.basename(tagged_file) + ".json")
+
+def write_feature_counts (counter: FeatureCounter, tagged_file: str) -> None:
+    """Saves the counts collected while writing an MD-tagged file, with the size and modification time of that file so that outdated counts are detected
+    Args:
+        counter (FeatureCounter): counter fed by write_tagged_words
+        tagged_file (str): MD-tagged file path
+    """
+    counts_file = get_feature_counts_path(tagged_file)
+    Path(os.path.dirname(counts_file)).mkdir(parents=True, exist_ok=True)
+    stat = os.stat(tagged_file)
+    counts = counter.get_counts()
+    counts.update({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+    with open(file=counts_file, mode='w', encoding='UTF-8') as f:
+        json.dump(counts, f)
+
+def read_feature_counts (tagged_file: str) -> dict:
+    """Returns the feature counts of an MD-tagged file, from the Counts folder if they are up to date, otherwise by counting the file
+    Args:
+        tagged_file (str): MD-tagged file path
+    Returns:
+        counts (dict): counts as returned by FeatureCounter.get_counts
+    """
+    counts_file = get_feature_counts_path(tagged_file)
+    if os.path.exists(counts_file):
+        stat = os.stat(tagged_file)
+        try:
+            with open(file=counts_file, encoding='UTF-8') as f:
+                counts = json.load(f)
+            if counts['size'] == stat.st_size and counts['mtime_ns'] == stat.st_mtime_ns:
+                return counts
+        except (ValueError, KeyError):
+            pass # unreadable counts are recounted below
+    return count_tagged_file(tagged_file)
+
+def count_tagged_file (tagged_file: str) -> dict:
+    """Returns the feature counts of an MD-tagged file by reading and counting it
+    Args:
+        tagged_file (str): MD-tagged file path
+    Returns:
+        counts (dict): counts as returned by FeatureCounter.get_counts
+    """
+    counter = FeatureCounter()
+    text = open(file=tagged_file, encoding='utf-8', errors='ignore').read()
+    text = re.sub(r"\n", r" ", text) #converts end of line in space
+    for word in re.split(r" +", text):
+        counter.add_word(word)
+    return counter.get_counts()
+
+def get_counts_row (counts: dict, file_name: str, n_tokens: int) -> dict:
+    """Returns the row of the raw counts table for one file
+    Args:
+        counts (dict): counts as returned by read_feature_counts
+        file_name (str): name of the file
+        n_tokens (int): number of tokens to calculate the TTR on
+    Returns:
+        temp_dict (dict): Filename, Words, AWL, TTR, LDE, Ntotal, VBtotal and tag frequencies
+    """
+    # ELF: Corrected an error in the MAT which did NOT ignore punctuation in token count (although comments said it did). Also decided to remove possessive s's, symbols, filled pauses and interjections (FPUH) from this count.
+    n_words = counts['n_tokens']
+    # EFL: Counting total nouns for per 100 noun normalisation
+    Ntotal = n_words if counts['n_nouns'] == 0 else counts['n_nouns'] #Shakir replace 0 to avoid infinity in division
+    # EFL: Approximate counting of total finite verbs for the per 100 finite verb normalisation
+    VBtotal = n_words if counts['n_verbs'] == 0 else counts['n_verbs'] #Shakir replace 0 to avoid infinity in division (more likely for verbs)
+    # Shakir: total length of characters / length of the list which represents the length of each word, i.e. tokens just as above
+    average_wl = counts['wordlengths_sum'] / counts['n_wordlengths'] # average word length
+    lex_density = (n_words - counts['n_functionwords']) / n_words # ELF: lexical density
+    # Shakir calculate type token ratio on the first n_tokens tokens, or on all tokens if the text is shorter (see get_ttr)
+    if n_words >= n_tokens:
+        ttr = bisect.bisect_left(counts['type_positions'], n_tokens) / n_tokens
+    else:
+        ttr = len(counts['type_positions']) / n_words
+    temp_dict = {'Filename': file_name, 'Words': n_words, 'AWL': average_wl, 'TTR': ttr, 'LDE': lex_density, 'Ntotal': Ntotal, 'VBtotal': VBtotal}
+    # update temp dict with tag freq
+    temp_dict.update(counts['tag_freq'])
+    return temp_dict
+
+# STATISTICS STORE
+# do_counts keeps the row of the raw counts table of every file in an SQLite database in the Statistics folder, with the size and
+# modification time of the MD-tagged file, the TTR setting and the MFTE version it was computed with. On the next run, only the rows of
+# new, re-tagged or edited files are computed again, rows of files that are gone are removed, and the tables are rebuilt from the stored rows.
+counts_rows_file_name = "counts_rows.sqlite"
+
+def open_counts_rows_store (dir_out: str) -> sqlite3.Connection:
+    """Opens (and creates if needed) the store of raw counts rows in the Statistics folder
+    Args:
+        dir_out (str): Statistics folder
+    Returns:
+        store (sqlite3.Connection): connection to the store
+    """
+    store = sqlite3.connect(os.path.join(dir_out, counts_rows_file_name))
+    store.execute("CREATE TABLE IF NOT EXISTS counts_rows (file_name TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, ttr_tokens INTEGER, mfte_version TEXT, row TEXT)")
+    return store
+
+# BINARY TABLES
+# Besides (or instead of) the CSV files, do_counts can write the three tables as Parquet or Feather files (pyarrow is needed, without it the CSV files are written instead), with
+# typed columns: integer counts in the raw table, floats in the normed tables, and no rounding. The raw table keeps the Ntotal and VBtotal
+# columns, so that the normed tables can also be derived from it when it is read (see read_counts_table).
+binary_formats = {'parquet': '.parquet', 'feather': '.feather'}
+
+def get_typed_counts_table (df: pd.DataFrame, integer_counts: bool) -> pd.DataFrame:
+    """Returns a counts table with typed columns for the binary formats
+    Args:
+        df (pd.DataFrame): counts table
+        integer_counts (bool): True for the raw table, whose tag counts are integers, False for the normed tables
+    Returns:
+        pd.DataFrame: table with a string Filename, integer Words, Ntotal and VBtotal, float AWL, TTR and LDE, and integer or float tag columns
+    """
+    dtypes = {}
+    for col in df.columns:
+        if col == "Filename":
+            dtypes[col] = "string"
+        elif col in ["Words", "Ntotal", "VBtotal"] or (integer_counts and col not in ["AWL", "TTR", "LDE"]):
+            dtypes[col] = "int64"
+        else:
+            dtypes[col] = "float64"
+    return df.astype(dtypes).reset_index(drop=True)
+
+def is_pyarrow_available () -> bool:
+    """Checks whether pyarrow, which pandas needs for the binary formats, can be imported
+    Returns:
+        bool: True if pyarrow can be imported
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+    return True
+
+def write_binary_counts_tables (df: pd.DataFrame, dir_out: str, output_format: str) -> None:
+    """Writes the raw, mixed normed and word-based normed tables as Parquet or Feather files
+    Args:
+        df (pd.DataFrame): raw counts table with the Ntotal and VBtotal columns, as built by do_counts
+        dir_out (str): Statistics folder
+        output_format (str): 'parquet' or 'feather'
+    """
+    tables = {
+        "counts_raw": get_typed_counts_table(df, True),
+        "counts_mixed_normed": get_typed_counts_table(get_complex_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']), False),
+        "counts_word-based_normed": get_typed_counts_table(get_wordbased_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']), False),
+    }
+    for table_name, table in tables.items():
+        if output_format == 'parquet':
+            table.to_parquet(dir_out+table_name+binary_formats[output_format], index=False)
+        else:
+            table.to_feather(dir_out+table_name+binary_formats[output_format])
+
+def read_counts_table (dir_out: str, table: str = "raw", output_format: str = "parquet") -> pd.DataFrame:
+    """Reads a counts table written by write_binary_counts_tables; the normed tables are derived from the raw table
+    Args:
+        dir_out (str): Statistics folder
+        table (str, optional): "raw", "mixed_normed" or "word-based_normed". Defaults to "raw".
+        output_format (str, optional): 'parquet' or 'feather'. Defaults to "parquet".
+    Returns:
+        pd.DataFrame: counts table (the raw table with its Ntotal and VBtotal columns)
+    """
+    if output_format == 'parquet':
+        df = pd.read_parquet(dir_out+"counts_raw"+binary_formats[output_format])
+    else:
+        df = pd.read_feather(dir_out+"counts_raw"+binary_formats[output_format])
+    if table == "mixed_normed":
+        return get_complex_normed_counts(df).drop(columns=['Ntotal', 'VBtotal'])
+    if table == "word-based_normed":
+        return get_wordbased_normed_counts(df).drop(columns=['Ntotal', 'VBtotal'])
+    return df
+
+def do_counts(dir_in: str, dir_out: str, n_tokens: int, output_formats: list = None) -> None:
     """Read files and count tags added by process_sentence
+    Rows of files that did not change since the previous run are taken from the store in the Statistics folder (see STATISTICS STORE)
     Args:
         input_dir (str): dir where MFTE-tagged files are
         output_dir (str): dir where statistics files to be created
         ttr (int): number of tokens to consider as given by the user
+        output_formats (list, optional): formats of the tables, any of 'csv', 'parquet' and 'feather' (see BINARY TABLES). Defaults to None, i.e. ['csv'].
     """
+    if output_formats is None:
+        output_formats = ['csv']
+    missing_formats = [output_format for output_format in output_formats if output_format in binary_formats]
+    if missing_formats and not is_pyarrow_available():
+        output_formats = [output_format for output_format in output_formats if output_format not in binary_formats] or ['csv'] # never end up without any table
+        print("Could not write the", " and ".join(missing_formats), "tables: pyarrow is needed, install it with: pip install pyarrow. Writing", " and ".join(output_formats), "tables only.")
     features_to_be_removed_from_final_table = ['NFP', 'GW', 'HYPH', 'ADD', 'AFX', 'FW', 'VB', 'LIKE', 'SO', 'PPother', "MDother"]
     Path(dir_out).mkdir(parents=True, exist_ok=True)
-    function_words_re = "(a|about|above|after|again|ago|ai|all|almost|along|already|also|although|always|am|among|an|and|another|any|anybody|anything|anywhere|are|are|around|as|at|back|be|been|before|being|below|beneath|beside|between|beyond|billion|billionth|both|but|by|can|can|could|cos|cuz|did|do|does|doing|done|down|during|each|eight|eighteen|eighteenth|eighth|eightieth|eighty|either|eleven|eleventh|else|enough|even|ever|every|everybody|everyone|everything|everywhere|except|far|few|fewer|fifteen|fifteenth|fifth|fiftieth|fifty|first|five|for|fortieth|forty|four|fourteen|fourteenth|fourth|from|get|gets|getting|got|had|has|have|having|he|hence|her|here|hers|herself|him|himself|his|hither|how|however|hundred|hundredth|i|if|in|into|is|it|its|itself|just|last|less|many|may|me|might|million|millionth|mine|more|most|much|must|my|myself|near|near|nearby|nearly|neither|never|next|nine|nineteen|nineteenth|ninetieth|ninety|ninth|no|nobody|none|noone|nor|not|nothing|now|nowhere|of|off|often|on|once|one|only|or|other|others|ought|our|ours|ourselves|out|over|quite|rather|round|second|seven|seventeen|seventeenth|seventh|seventieth|seventy|shall|sha|she|should|since|six|sixteen|sixteenth|sixth|sixtieth|sixty|so|some|somebody|someone|something|sometimes|somewhere|soon|still|such|ten|tenth|than|that|that|the|their|theirs|them|themselves|then|thence|there|therefore|these|they|third|thirteen|thirteenth|thirtieth|thirty|this|thither|those|though|thousand|thousandth|three|thrice|through|thus|till|to|today|tomorrow|too|towards|twelfth|twelve|twentieth|twenty|twice|two|under|underneath|unless|until|up|us|very|was|we|were|what|when|whence|where|whereas|which|while|whither|who|whom|whose|why|will|with|within|without|wo|would|yes|yesterday|yet|you|your|yours|yourself|yourselves|'re|'ve|n't|'ll|'twas|'em|y'|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|a|b|c|d|e|f|g|h|i|j|k|l|m|n|o|p|q|r|s|t|u|v|w|x|y|z|1|2|3|4|5|6|7|8|9|0)"
     files = glob.glob(dir_in+"*.txt")
     if len(files) > 0:
         list_of_dicts = list()
+        store = open_counts_rows_store(dir_out)
+        stored_rows = {file_name: (size, mtime_ns, ttr_tokens, version, row) for file_name, size, mtime_ns, ttr_tokens, version, row in store.execute("SELECT file_name, size, mtime_ns, ttr_tokens, mfte_version, row FROM counts_rows")}
+        new_rows = []
         for file in files:
-            print(r"Tag counting file:", file)
             file_name = os.path.basename(file)
-            text = open(file=file, encoding='utf-8', errors='ignore').read()
-            text = re.sub(r"\n", r" ", text) #converts end of line in space
-            words = re.split(r" +", text)
-            #check if file is not empty
-            if re.search(r"\w+", text):
-                # ELF: Corrected an error in the MAT which did NOT ignore punctuation in token count (although comments said it did). Also decided to remove possessive s's, symbols, filled pauses and interjections (FPUH) from this count.
-                # Shakir: list of words that match the given regex, then take its length as function words
-                n_functionwords = len([word for word in words if re.search(r"\b" + function_words_re + r"_", word, re.IGNORECASE)])
-                #print(n_functionwords)
-                # EFL: Counting function words for lexical density
-                # Shakir: list of words that do not containt SYM etc. + only if it is a word_TAG combination
-                tokens = [word for word in words if not re.search(r"(_\s)|(\[\w+\])|(.+_\W+)|_-LRB-|_-RRB-|.+_SYM|_POS|_FPUH|_HYPH", word) if re.search(r"^\S+_\S+$", word)]
-                # EFL: Counting total nouns for per 100 noun normalisation
-                # Shakir: list of words that match the given regex, then take its length as total nouns 
-                Ntotal = len([word for word in words if re.search(r"_NN\b", word)])
-                Ntotal = len(tokens) if Ntotal == 0 else Ntotal #Shakir replace 0 to avoid infinity in division
-                # EFL: Approximate counting of total finite verbs for the per 100 finite verb normalisation
-                # Shakir: list of words that match the given regex, then take its length as total verbs
-                VBtotal = len([word for word in words if re.search(r"(_VPRT|_VBD|_VIMP|_MDCA|_MDCO|_MDMM|_MDNE|_MDWO|_MDWS)\b", word)])
-                VBtotal = len(tokens) if VBtotal == 0 else VBtotal #Shakir replace 0 to avoid infinity in division (more likely for verbs)
-                # ELF: I've decided to exclude all of these for the word length variable (i.e., possessive s's, symbols, punctuation, brackets, filled pauses and interjections (FPUH)):
-                # Shakir: get the len of each word after splitting it from TAG, and making sure the regex punctuation does not match + only if it is a word_TAG combination
-                list_of_wordlengths = [len(word.split('_')[0]) for word in words if not re.search(r"(_\s)|(\[\w+\])|(.+_\W+)|_-LRB-|_-RRB-|.+_SYM|_POS|_FPUH|_HYPH|_AFX|_NFP", word) if re.search(r"^\S+_\S+$", word)]
-                # Shakir: total length of characters / length of the list which represents the length of each word, i.e. tokens just as above
-                average_wl = sum(list_of_wordlengths) / len(list_of_wordlengths) # average word length
-                lex_density = (len(tokens) - n_functionwords) / len(tokens) # ELF: lexical density
-                #print(len(tokens), lex_density)
-                ttr = get_ttr(tokens, n_tokens) # Shakir calculate type token ratio
-                # Shakir: get tags only, remove words and exclude certain (non-meaningful) tags from count
-                # ELF: The list of tags for which no counts will be returned can be found here.
-                # The following tags are excluded by default because they are "bin" tags designed to remove problematic tokens from other categories: LIKE and SO
-                # Note: if interested in counts of punctuation marks, "|_\W+" should be deleted in this line.
-                # Note: _WQ are removed because they are duplicates of WHQU (WHQU are tagged onto the WH-words whereas QUWU onto the question marks themselves).
-                # Note: BEAUX are not counted because they would replicate the PROG, PASS, QUTAG and GTO counts. They only serve to identify BEMA occurences.
-                tags = [re.sub(r"^.*_", "", word) for word in words if not re.search(r"_LS|_\W+|_WP\\b|_FW|_SYM|_MD\\b|_VB\\b|_WQ|_LIKE|_SO|_BEAUX", word)]
-                # Shakir: get a dictionary of tags and frequency of each tag using collections.Counter on tags list
-                tag_freq = dict(collections.Counter(tags))
-                # Shakir: sort tag_freq
-                tag_freq = dict(sorted(tag_freq.items()))
-                temp_dict = {'Filename': file_name, 'Words': len(tokens), 'AWL': average_wl, 'TTR': ttr, 'LDE': lex_density, 'Ntotal': Ntotal, 'VBtotal': VBtotal}
-                # update temp dict with tag freq
-                temp_dict.update(tag_freq)
-                list_of_dicts.append(temp_dict)
+            stat = os.stat(file)
+            stored_row = stored_rows.pop(file_name, None)
+            if stored_row is not None and stored_row[:4] == (stat.st_size, stat.st_mtime_ns, n_tokens, mfte_version):
+                row = stored_row[4]
+            else:
+                print(r"Tag counting file:", file)
+                counts = read_feature_counts(file) # counted while the file was MD-tagged, or counted now
+                #check if file is not empty
+                row = json.dumps(get_counts_row(counts, file_name, n_tokens)) if counts['has_word'] else None
+                new_rows.append((file_name, stat.st_size, stat.st_mtime_ns, n_tokens, mfte_version, row))
+            if row is not None:
+                list_of_dicts.append(json.loads(row))
+        store.executemany("INSERT OR REPLACE INTO counts_rows VALUES (?, ?, ?, ?, ?, ?)", new_rows)
+        store.executemany("DELETE FROM counts_rows WHERE file_name = ?", [(file_name,) for file_name in stored_rows]) # files that are gone
+        store.commit()
+        store.close()
+        print(len(new_rows), "files counted,", len(files) - len(new_rows), "unchanged files taken from", counts_rows_file_name)
         print("writing statistics...")
         df = pd.DataFrame(list_of_dicts).fillna(0)
         features_to_be_removed_from_final_table_existing = [f for f in features_to_be_removed_from_final_table if f in df.columns]
         df = df.drop(columns=features_to_be_removed_from_final_table_existing) #drop unnecessary features
         df = sort_df_columns(df).sort_values(by=['Filename']) #sort df columns
-        df.round(4).drop(columns=['Ntotal', 'VBtotal']).to_csv(dir_out+"counts_raw.csv", index=False)
-        #df = pd.read_excel(dir_out+"counts_raw.csv")
-        get_complex_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']).round(4).to_csv(dir_out+"counts_mixed_normed.csv", index=False)
-        get_wordbased_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']).round(4).to_csv(dir_out+"counts_word-based_normed.csv", index=False)
+        if 'csv' in output_formats:
+            df.round(4).drop(columns=['Ntotal', 'VBtotal']).to_csv(dir_out+"counts_raw.csv", index=False)
+            #df = pd.read_excel(dir_out+"counts_raw.csv")
+            get_complex_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']).round(4).to_csv(dir_out+"counts_mixed_normed.csv", index=False)
+            get_wordbased_normed_counts(df).drop(columns=['Ntotal', 'VBtotal']).round(4).to_csv(dir_out+"counts_word-based_normed.csv", index=False)
+        for output_format in output_formats:
+            if output_format in binary_formats:
+                write_binary_counts_tables(df, dir_out, output_format)
         print("finished!")
     else:
         print("It appears there are no files to count tags from. Maybe you did not input the correct path?")
@@ -2013,19 +3653,35 @@ def call_MFTE(args) -> None:
     output_MD = output_main + "MFTE_Tagged/"
     output_stats = output_main + "Statistics/"
     ttr = args.ttr
-    const_tagging_temp: bool = False
+    const_tagging_temp: bool = args.constituency_tagging
+    manifest = read_manifest(output_main) # stages are only re-run for files that changed, see BUILD MANIFEST
     t_0 = timeit.default_timer()
-    tag_stanford_stanza(input_dir, output_stanford, output_constituency, extended_constituency=const_tagging_temp)
+    tag_stanford_stanza(input_dir, output_stanford, output_constituency, extended_constituency=const_tagging_temp, pos_workers=args.pos_workers, pos_batch_tokens=args.pos_batch_tokens, pos_cache=args.pos_cache, pos_sentence_cache=args.pos_sentence_cache, manifest=manifest, tree_format=args.tree_format, selective_parsing=args.selective_parsing, parse_workers=args.parse_workers)
+    write_manifest(manifest, output_main)
     t_1 = timeit.default_timer()
     elapsed_time = round((t_1 - t_0) * 10 ** 6, 3)
     print("Time spent on tagging process (micro seconds):", elapsed_time)
     
     if args.parallel_md_tagging == True:
-        tag_MD_parallel(output_stanford, output_MD, extended=args.extended, extended_constituency=const_tagging_temp)
+        tag_MD_parallel(output_stanford, output_MD, extended=args.extended, extended_constituency=const_tagging_temp, workers=args.workers, manifest=manifest)
     else:
-        tag_MD(output_stanford, output_MD, extended=args.extended, extended_constituency=const_tagging_temp)
+        tag_MD(output_stanford, output_MD, extended=args.extended, extended_constituency=const_tagging_temp, manifest=manifest)
+    write_manifest(manifest, output_main)
+
+    do_counts(output_MD, output_stats, ttr, args.output_format)
 
-    do_counts(output_MD, output_stats, ttr)
+def str2bool (value: str) -> bool:
+    """Converts a True or False command line value to a boolean (argparse's type=bool turns any non-empty string, even "False", into True)
+    Args:
+        value (str): command line value, e.g. True, False, yes, no, 1 or 0
+    Returns:
+        bool: the value as a boolean
+    """
+    if value.lower() in ('true', 'yes', 't', 'y', '1'):
+        return True
+    if value.lower() in ('false', 'no', 'f', 'n', '0'):
+        return False
+    raise argparse.ArgumentTypeError("True or False expected, got " + value)
 
 def mfte(argv=sys.argv):
     """Entry point for setup tools
@@ -2037,10 +3693,21 @@ def mfte(argv=sys.argv):
     parser = argparse.ArgumentParser(description='Optional command line arguments to run the software from terminal.')
     parser.add_argument('--path', type=str, help='path to the text files folder')
     parser.add_argument('--ttr', type=int, default=400, help='Number of words to calculate type token ratio; default is 400')
-    parser.add_argument('--extended', default=True, type=bool, help='enable extended mode True or False; default is True')
-    parser.add_argument('--parallel_md_tagging', default=False, type=bool, help='enable parallel MD tagging True or False; default is False')
-    parser.add_argument('--constituency_tagging', default=False, type=bool, help='enable constituency tree based additional tags True or False; default is False')
+    parser.add_argument('--extended', default=True, type=str2bool, help='enable extended mode True or False; default is True')
+    parser.add_argument('--parallel_md_tagging', default=False, type=str2bool, help='enable parallel MD tagging True or False; default is False')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes for parallel MD tagging; default is half of the CPUs')
+    parser.add_argument('--pos_workers', type=int, default=1, help='number of processes for POS tagging on the CPU; default is 1 (a single stanza pipeline, on the GPU if available)')
+    parser.add_argument('--pos_cache', type=str, default=None, help='folder of a POS tagging cache shared between runs and corpora; documents already tagged with the same stanza version are not tagged again; default is no cache')
+    parser.add_argument('--pos_sentence_cache', type=int, default=0, help='number of most recently used sentences whose POS tags are reused instead of tagging them again, for corpora with many repeated sentences; saved in --pos_cache if given; default is 0 (no sentence cache)')
+    parser.add_argument('--pos_batch_tokens', '--pos-batch-tokens', type=int, default=20000, help='maximum number of words per batch of files sent to stanza, longer files are cut into pieces of this size; default is 20000')
+    parser.add_argument('--output_format', type=str, nargs='+', choices=['csv', 'parquet', 'feather'], default=['csv'], help='formats of the tables in the Statistics folder, one or more of csv, parquet and feather (parquet and feather need pyarrow); default is csv')
+    parser.add_argument('--parse_workers', type=int, default=1, help='number of processes for constituency parsing on the CPU, sharing one parser model; with more than 1, sentences are parsed after POS tagging (which keeps its own --pos_workers); default is 1 (parsed together with POS tagging)')
+    parser.add_argument('--selective_parsing', default=False, type=str2bool, help='with --constituency_tagging, send only the sentences with a VBG, VBN, CC or WH word after a preposition to the constituency parser, which gives the same tags much faster on the CPU True or False; default is False')
+    parser.add_argument('--tree_format', type=str, choices=['text', 'binary'], default='text', help='format of the constituency trees; binary also writes a compact .trees file next to each bracketed text file, which MD tagging loads without re-parsing; default is text')
+    parser.add_argument('--constituency_tagging', default=False, type=str2bool, help='enable constituency tree based additional tags True or False; default is False')
     args = parser.parse_args(argv[1:])
+    if any(output_format in binary_formats for output_format in args.output_format) and not is_pyarrow_available():
+        parser.error("--output_format parquet and feather need pyarrow, install it with: pip install pyarrow")
     if args.path:
         call_MFTE(args)
     else:
@@ -0,0 +1,60 @@
+"""Tests of the constituency workers of MFTE (see CONSTITUENCY WORKERS), with a stand-in for the stanza parser
+"""
+import multiprocessing
+import os
+import sys
+
+import pytest
+import stanza
+from stanza.models.constituency.parse_tree import Tree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+import MFTE
+
+class FlatParser:
+    """Stands in for a stanza pipeline with the constituency processor: gives every sentence the tree (ROOT (S (xpos word) ...))
+    and records the words it was given
+    """
+    def __init__ (self):
+        self.words = []
+
+    def __call__ (self, doc, processors: str = None):
+        assert processors == 'constituency'
+        for sentence in doc.sentences:
+            self.words.append([(word.text, word.upos, word.xpos) for word in sentence.words])
+            sentence.constituency = Tree('ROOT', [Tree('S', [Tree(word.xpos, [Tree(word.text)]) for word in sentence.words])])
+        return doc
+
+def test_read_pos_tagged_sentences_keeps_multi_word_tokens (tmp_path):
+    pos_file = tmp_path / "a.txt"
+    pos_file.write_text("I_PRP live_VBP in_IN New York_NNP ._.\n\nIt_PRP is_VBZ 1 000_CD a_b_NN\n", encoding='utf-8')
+    assert MFTE.read_pos_tagged_sentences(str(pos_file)) == [
+        [('I', 'PRP'), ('live', 'VBP'), ('in', 'IN'), ('New York', 'NNP'), ('.', '.')],
+        [('It', 'PRP'), ('is', 'VBZ'), ('1 000', 'CD'), ('a_b', 'NN')],
+    ]
+
+def test_parse_tagged_sentences_gives_parser_xpos_and_upos ():
+    nlp = FlatParser()
+    trees, parsed, skipped = MFTE.parse_tagged_sentences([[('New York', 'NNP'), ('grows', 'VBZ'), ('.', '.')]], nlp)
+    assert nlp.words == [[('New York', 'PROPN', 'NNP'), ('grows', 'VERB', 'VBZ'), ('.', 'PUNCT', '.')]]
+    assert trees == ["(ROOT (S (NNP New York) (VBZ grows) (. .)))"]
+    assert (parsed, skipped) == (1, 0)
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="constituency workers are forked")
+def test_parse_constituency_files_with_forked_workers (tmp_path, monkeypatch):
+    dir_pos = str(tmp_path / "POS_Tagged") + "/"
+    dir_constituency = str(tmp_path / "Constituency_Trees") + "/"
+    os.makedirs(dir_pos)
+    os.makedirs(dir_constituency)
+    sentences = ["I_PRP live_VBP in_IN New York_NNP ._.", "It_PRP rains_VBZ ._."] * (MFTE.constituency_task_sentences + 1) # two tasks
+    with open(dir_pos + "a.txt", encoding='utf-8', mode='w') as f:
+        f.write("\n".join(sentences))
+    with open(dir_pos + "b.txt", encoding='utf-8', mode='w') as f:
+        f.write("")
+    monkeypatch.setattr(MFTE, "get_stanza_pipeline", lambda tagging_layers, use_gpu=True: FlatParser())
+    MFTE.parse_constituency_files(["a.txt", "b.txt"], dir_pos, dir_constituency, 'constituency', parse_workers=2)
+    trees = open(dir_constituency + "a.txt", encoding='utf-8').read().split("\n")
+    assert len(trees) == len(sentences)
+    assert trees[0] == "(ROOT (S (PRP I) (VBP live) (IN in) (NNP New York) (. .)))"
+    assert trees[-1] == "(ROOT (S (PRP It) (VBZ rains) (. .)))"
+    assert open(dir_constituency + "b.txt", encoding='utf-8').read() == ""